@@ -0,0 +1,638 @@
+"""
+동등성 검사 (기준 구현 ↔ 최적화 구현)
+같은 입력으로 기준 코드(git 리비전, 기본 HEAD)와 비교 대상 코드(기본: 현재 작업 트리)를 각각 실행하고
+결과 워크북을 셀 단위로 비교하여 불일치 보고서를 작성
+- Tab 1: Step 1-7 결과 DCR 워크북 (vendor / DE requirement / Input check pin / Judge / DCR 시트)
+- Tab 2: Form measurement 결과 (create_form_measurement_file → fill_impedance_data_from_files → fill_dimension_data)
+- Tab 3: calculate_lsl_usl_full 결과 워크북 (tinh LCLUCL, Calculate USL LSL 등) + 갱신된 DCR 파일 (L-O열)
+- 기준 코드는 git archive로 임시 폴더에 풀어서 실행, 양쪽 모두 별도 프로세스에서 실행 (import 충돌 없음)
+- 숫자는 상대/절대 허용 오차로 비교, 수식은 수식 문자열로 비교 (openpyxl은 수식을 계산하지 않음)
+- tinh LCLUCL 시트는 A열 머리글로 행을 맞춰서 비교 (추가된 행은 비교하지 않고 따로 보고, 수식의 행 참조도 맞춤)
+- 기준 시트보다 오른쪽에 추가된 열은 비교하지 않고 따로 보고 (새 기능 열)
+- Cover Page 시트(실행 시각 등)는 비교하지 않음, 한쪽에만 있는 시트는 참고 사항으로 표시 (새 기능 시트)
+- 입력: synthetic_data.py 데이터 세트 (--dataset 폴더, 없으면 임시 폴더에 생성)
+  합성 DK 파일(.xlsx)은 경로 목록으로 전달 (Manual mode), --etching-dir을 주면 폴더 스캔 (Auto mode, .xls)
+  기준/비교 대상 코드가 .xlsx DK 파일을 읽지 못하면 Tab 2는 샘플 .xls DK 폴더(301_3sigma CAL/etching) 사용
+- 단계 결과 메시지도 비교 (한쪽만 "Error"이면 불일치, 양쪽이 같은 오류면 참고 사항)
+- 보고서: output/equivalence/equivalence_<시각>.txt / .csv, 불일치가 있으면 종료 코드 1 (실행 실패는 2)
+
+사용 예:
+    python equivalence_check.py
+    python equivalence_check.py --reference 493335c
+    python equivalence_check.py --reference 493335c --etching-dir "301_3sigma CAL/etching"
+    python equivalence_check.py --dataset output/benchmarks/datasets/x10 --tabs 3 --rel-tol 1e-6
+"""
+import argparse
+import csv
+import inspect
+import io
+import json
+import math
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+from datetime import datetime
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+REPORT_DIR = os.path.join(APP_DIR, "output", "equivalence")
+
+# 기준 리비전 (git rev) - 비교 대상은 기본으로 현재 작업 트리
+DEFAULT_REFERENCE = "HEAD"
+
+# 숫자 비교 허용 오차 (math.isclose)
+DEFAULT_REL_TOL = 1e-9
+DEFAULT_ABS_TOL = 1e-9
+
+# 비교하지 않는 시트 (실행 시각, 작업자, 단계 시간 등 실행마다 달라지는 값)
+SKIP_SHEETS = ("Cover Page",)
+
+# A열 머리글로 행을 맞춰서 비교하는 시트 (이름 접두어 - Method별 시트 포함)
+# 같은 머리글끼리 비교하고 머리글이 없는 데이터 행은 순서대로 대응 (리비전 사이에 통계 행이 추가되어도 비교 가능)
+ROW_LABEL_SHEETS = ("tinh LCLUCL",)
+
+# 보고서에 표시하는 추가된 행 머리글 수
+PRINT_INSERTED_LABELS = 5
+
+# 수식의 셀 참조 (열 문자 + 행 번호, 함수 이름 LOG10( 등 제외)
+CELL_REF_PATTERN = re.compile(r"(?<![A-Za-z0-9_.])(\$?[A-Z]{1,3}\$?)(\d+)(?![\d(])")
+
+# 기준/비교 대상 코드가 합성 .xlsx DK 파일을 읽지 못할 때 Tab 2에 쓰는 샘플 .xls DK 폴더
+SAMPLE_ETCHING_DIR = os.path.join(APP_DIR, "301_3sigma CAL", "etching")
+
+# 합성 입력 (--dataset이 없을 때): 이상치를 섞어서 필터 경로까지 검사
+# (비숫자 값은 --non-numeric-rate로 추가 - dimension 파일의 비숫자 값은 fill_dimension_data가 처리하지 못함)
+DATASET_SCALE = 1.0
+DATASET_OUTLIER_RATE = 0.01
+DATASET_NON_NUMERIC_RATE = 0.0
+DATASET_SEED = 0
+
+# 화면에 표시하는 불일치 수 (보고서 파일에는 전체 기록)
+PRINT_MISMATCHES = 30
+
+# 기준 리비전을 풀 때 제외하는 파일 (문서)
+ARCHIVE_EXCLUDES = (":(exclude)*.pdf", ":(exclude)*.pptx")
+
+CHECK_OPERATOR = "CHECK"
+RUN_RESULT_FILE = "run.json"
+
+
+# ==================== 실행 (각 코드 트리에서 별도 프로세스로) ====================
+
+def _message(result) -> str:
+    """로직 함수 결과 메시지 첫 줄 (dict 결과는 "message")"""
+    message = result.get("message", "") if isinstance(result, dict) else result
+    return str(message).splitlines()[0] if message else ""
+
+
+def _call(fn, *args, **kwargs):
+    """이 코드 트리의 함수가 받는 키워드 인자만 전달 (기준 리비전에 없는 옵션 제외)"""
+    params = inspect.signature(fn).parameters
+    return fn(*args, **{k: v for k, v in kwargs.items() if k in params})
+
+
+def run_tab1(files: dict, work_dir: str, steps: dict) -> dict:
+    """Tab 1 Step 1-7 실행 (표지/플롯 제외)"""
+    from logic.makevendor import make_vendor_sheet
+    from logic.make_de_requirement import make_de_requirement_sheet
+    from logic.make_input_check_pin import make_input_check_pin_sheet
+    from logic.make_int_med import make_int_med_file, make_input_check_pin_final
+    from logic.make_judge_check_pin import make_judge_check_pin_sheet
+    from logic.make_dcr import make_dcr_sheet
+
+    outfile = os.path.join(work_dir, "tab1_DCR_format_yamaha.xlsx")
+    int_med = os.path.join(work_dir, "int_med.xlsx")
+    for name, fn, args in (
+        ("make_vendor_sheet", make_vendor_sheet, (files["vendorspec_file"], outfile)),
+        ("make_de_requirement_sheet", make_de_requirement_sheet, (files["partpin_file"], outfile)),
+        ("make_input_check_pin_sheet", make_input_check_pin_sheet, (outfile, files["net_file"])),
+        ("make_int_med_file", make_int_med_file, (files["net_file"], int_med)),
+        ("make_input_check_pin_final", make_input_check_pin_final, (outfile, int_med)),
+        ("make_judge_check_pin_sheet", make_judge_check_pin_sheet, (outfile,)),
+        ("make_dcr_sheet", make_dcr_sheet, (outfile,)),
+    ):
+        steps[f"Tab 1/{name}"] = _message(fn(*args))
+    return {"Tab 1 DCR workbook": outfile, "Tab 1 int_med": int_med}
+
+
+def run_tab2(files: dict, work_dir: str, steps: dict) -> dict:
+    """Tab 2 Form measurement 결과 파일 생성 (템플릿 → TDR → 치수)"""
+    from logic.make_form_measurement import (create_form_measurement_file, fill_dimension_data,
+                                             fill_impedance_data, fill_impedance_data_from_files)
+
+    outfile = os.path.join(work_dir, "tab2_Form_measurement_result.xlsx")
+    steps["Tab 2/create_form_measurement_file"] = _message(create_form_measurement_file(outfile))
+    if files.get("dk_files"):
+        steps["Tab 2/fill_impedance_data"] = _message(fill_impedance_data_from_files(outfile, files["dk_files"]))
+    else:
+        steps["Tab 2/fill_impedance_data"] = _message(fill_impedance_data(outfile, files["etching_dir"]))
+    steps["Tab 2/fill_dimension_data"] = _message(fill_dimension_data(outfile, files["dimension_file"]))
+    return {"Tab 2 Form measurement": outfile}
+
+
+def run_tab3(files: dict, work_dir: str, steps: dict) -> dict:
+    """Tab 3 calculate_lsl_usl_full 실행 (DCR 파일은 복사본을 갱신)"""
+    from logic.calculate_lsl_usl import calculate_lsl_usl_full
+
+    dcr_file = os.path.join(work_dir, "tab3_DCR_format_yamaha.xlsx")
+    shutil.copy2(files["dcr_file"], dcr_file)
+    outfile = os.path.join(work_dir, "tab3_Calculate_3Sigma_LSLUSL.xlsx")
+    steps["Tab 3/calculate_lsl_usl_full"] = _message(
+        _call(calculate_lsl_usl_full, files["merged_file"], dcr_file, outfile,
+              operator=CHECK_OPERATOR, output_dir=work_dir))
+    return {"Tab 3 LSL/USL workbook": outfile, "Tab 3 updated DCR": dcr_file}
+
+
+TAB_RUNNERS = {1: run_tab1, 2: run_tab2, 3: run_tab3}
+
+
+def _use_code_tree(code_dir: str):
+    """이 스크립트 폴더(작업 트리)의 logic 대신 code_dir의 logic을 import하도록 설정 (하위 프로세스에서 호출)"""
+    sys.path[:] = [code_dir] + [p for p in sys.path if os.path.abspath(p or ".") != APP_DIR]
+    import logic
+    if not os.path.abspath(logic.__file__).startswith(os.path.abspath(code_dir)):
+        raise RuntimeError(f"logic imported from {logic.__file__}, expected {code_dir}")
+
+
+def run_side(code_dir: str, inputs_path: str, work_dir: str) -> int:
+    """
+    code_dir의 logic 패키지로 탭을 실행하고 결과 파일 목록을 work_dir/run.json에 기록 (하위 프로세스에서 호출)
+
+    Returns:
+        종료 코드 (0: 실행 완료 - 각 단계 성공 여부는 run.json 메시지로 판단)
+    """
+    _use_code_tree(code_dir)
+
+    with open(inputs_path, 'r', encoding='utf-8') as f:
+        inputs = json.load(f)
+    steps = {}
+    outputs = {}
+    for tab in inputs["tabs"]:
+        outputs.update(TAB_RUNNERS[tab](inputs["files"], work_dir, steps))
+    with open(os.path.join(work_dir, RUN_RESULT_FILE), 'w', encoding='utf-8') as f:
+        json.dump({"code_dir": code_dir, "steps": steps, "outputs": outputs}, f, indent=2)
+
+    try:
+        from logic.visualizer import shutdown_render_pool
+        shutdown_render_pool()
+    except ImportError:
+        pass
+    return 0
+
+
+def probe_dk_reader(code_dir: str, dk_file: str) -> int:
+    """
+    code_dir 코드가 DK 파일 목록(Manual mode)으로 이 DK 파일을 읽을 수 있는지 확인 (하위 프로세스에서 호출)
+
+    Returns:
+        종료 코드 (0: 읽을 수 있음, 1: 읽을 수 없음)
+    """
+    _use_code_tree(code_dir)
+    import logic.make_form_measurement as make_form_measurement
+    if not hasattr(make_form_measurement, "fill_impedance_data_from_files"):
+        return 1
+    return 0 if make_form_measurement.read_tdr_data_from_dk_file(dk_file) else 1
+
+
+# ==================== 워크북 비교 ====================
+
+def _is_number(val) -> bool:
+    return isinstance(val, (int, float)) and not isinstance(val, bool)
+
+
+def _normalize(val):
+    """빈 문자열은 빈 셀과 같게, 문자열은 앞뒤 공백 제거 (수식은 공백 제거 후 대문자)"""
+    if isinstance(val, str):
+        val = val.strip()
+        if not val:
+            return None
+        if val.startswith("="):
+            return "".join(val.split()).upper()
+    return val
+
+
+def compare_cells(ref, cand, rel_tol: float, abs_tol: float):
+    """
+    셀 값 비교
+
+    Returns:
+        일치하면 None, 다르면 불일치 종류 ("numeric" / "type" / "formula" / "value")
+    """
+    ref, cand = _normalize(ref), _normalize(cand)
+    if _is_number(ref) and _is_number(cand):
+        if math.isnan(ref) and math.isnan(cand):
+            return None
+        return None if math.isclose(ref, cand, rel_tol=rel_tol, abs_tol=abs_tol) else "numeric"
+    if ref == cand:
+        return None
+    if type(ref) is not type(cand) and ref is not None and cand is not None and not (
+            _is_number(ref) and _is_number(cand)):
+        return "type"
+    if isinstance(ref, str) and isinstance(cand, str) and (ref.startswith("=") or cand.startswith("=")):
+        return "formula"
+    return "value"
+
+
+def _cell_name(row: int, col: int) -> str:
+    from openpyxl.utils import get_column_letter
+    return f"{get_column_letter(col)}{row}"
+
+
+def _used_width(rows: list) -> int:
+    """시트에서 값이 있는 마지막 열 번호 (빈 시트는 0)"""
+    width = 0
+    for row in rows:
+        for col_idx in range(len(row), width, -1):
+            if _normalize(row[col_idx - 1]) is not None:
+                width = col_idx
+                break
+    return width
+
+
+def _span_text(numbers: list, fmt=str) -> str:
+    """연속 번호를 구간으로 표시 (예: [21, 22, 23, 40] → "21-23, 40")"""
+    spans = []
+    for n in sorted(numbers):
+        if spans and n == spans[-1][1] + 1:
+            spans[-1][1] = n
+        else:
+            spans.append([n, n])
+    return ", ".join(fmt(a) if a == b else f"{fmt(a)}-{fmt(b)}" for a, b in spans)
+
+
+def _row_keys(rows: list) -> list:
+    """행 정렬 키: (A열 머리글, 같은 머리글 안의 순번) - 머리글이 없는 데이터 행은 ("", 순번)"""
+    keys = []
+    seen = {}
+    for row in rows:
+        label = _normalize(row[0]) if row else None
+        label = "" if label is None else str(label)
+        seen[label] = seen.get(label, 0) + 1
+        keys.append((label, seen[label]))
+    return keys
+
+
+def align_rows(ref_rows: list, cand_rows: list) -> tuple:
+    """
+    A열 머리글로 두 시트의 행 대응
+
+    Returns:
+        (행 쌍 리스트 [(기준 행 번호 또는 None, 비교 대상 행 번호 또는 None)], {기준 행 번호: 비교 대상 행 번호})
+        비교 대상 행 순서대로, 기준에만 있는 행은 마지막에 추가
+    """
+    ref_index = {key: row_idx for row_idx, key in enumerate(_row_keys(ref_rows), start=1)}
+    pairs = []
+    row_map = {}
+    for cand_idx, key in enumerate(_row_keys(cand_rows), start=1):
+        ref_idx = ref_index.pop(key, None)
+        pairs.append((ref_idx, cand_idx))
+        if ref_idx is not None:
+            row_map[ref_idx] = cand_idx
+    pairs.extend((ref_idx, None) for ref_idx in sorted(ref_index.values()))
+    return pairs, row_map
+
+
+def _shift_formula_rows(formula: str, row_map: dict) -> str:
+    """수식의 행 참조를 비교 대상 행 번호로 바꿈 (대응하는 행이 없는 참조는 그대로)"""
+    return CELL_REF_PATTERN.sub(lambda m: f"{m.group(1)}{row_map.get(int(m.group(2)), m.group(2))}", formula)
+
+
+def compare_workbooks(ref_path: str, cand_path: str, output: str, rel_tol: float, abs_tol: float) -> tuple:
+    """
+    두 워크북의 공통 시트를 셀 단위로 비교
+    - ROW_LABEL_SHEETS 시트는 A열 머리글로 행을 맞춤 (비교 대상에만 있는 행은 추가된 행으로 따로 보고)
+    - 기준 시트의 마지막 열보다 오른쪽에 있는 비교 대상 열은 추가된 열로 따로 보고
+
+    Args:
+        ref_path: 기준 결과 파일
+        cand_path: 비교 대상 결과 파일
+        output: 보고서에 표시할 결과 이름
+
+    Returns:
+        (불일치 리스트, 참고 사항 리스트, 추가된 행/열 리스트, 비교한 셀 수)
+    """
+    import openpyxl
+    from openpyxl.utils import get_column_letter
+
+    mismatches = []
+    notes = []
+    insertions = []
+    for path, side in ((ref_path, "reference"), (cand_path, "candidate")):
+        if not os.path.exists(path):
+            mismatches.append({"output": output, "sheet": "", "cell": "", "kind": "missing file",
+                               "reference": "", "candidate": "", "diff": ""})
+            notes.append(f"{output}: {side} file not created ({path})")
+    if mismatches:
+        return mismatches, notes, insertions, 0
+
+    wb_ref = openpyxl.load_workbook(ref_path, read_only=True)
+    wb_cand = openpyxl.load_workbook(cand_path, read_only=True)
+    compared = 0
+    try:
+        ref_sheets = [s for s in wb_ref.sheetnames if s not in SKIP_SHEETS]
+        cand_sheets = [s for s in wb_cand.sheetnames if s not in SKIP_SHEETS]
+        for name in ref_sheets:
+            if name not in cand_sheets:
+                notes.append(f"{output}: sheet '{name}' only in reference")
+        for name in cand_sheets:
+            if name not in ref_sheets:
+                notes.append(f"{output}: sheet '{name}' only in candidate")
+
+        for name in [s for s in ref_sheets if s in cand_sheets]:
+            ref_rows = list(wb_ref[name].iter_rows(values_only=True))
+            cand_rows = list(wb_cand[name].iter_rows(values_only=True))
+
+            if name.startswith(ROW_LABEL_SHEETS):
+                pairs, row_map = align_rows(ref_rows, cand_rows)
+                inserted = [cand_idx for ref_idx, cand_idx in pairs if ref_idx is None]
+                if inserted:
+                    labels = [str(cand_rows[i - 1][0]) for i in inserted if cand_rows[i - 1]
+                              and _normalize(cand_rows[i - 1][0]) is not None]
+                    label_text = ", ".join(labels[:PRINT_INSERTED_LABELS])
+                    if len(labels) > PRINT_INSERTED_LABELS:
+                        label_text += f", ... ({len(labels)} labels)"
+                    insertions.append(f"{output} / {name}: {len(inserted)} inserted row(s) "
+                                      f"{_span_text(inserted)}" + (f" ({label_text})" if label_text else ""))
+            else:
+                pairs = [(i, i) for i in range(1, max(len(ref_rows), len(cand_rows)) + 1)]
+                row_map = {}
+
+            # 기준에 없던 오른쪽 열은 새 기능 열 - 비교하지 않고 보고
+            ref_width = _used_width(ref_rows)
+            cand_width = _used_width(cand_rows)
+            if cand_width > ref_width:
+                insertions.append(f"{output} / {name}: {cand_width - ref_width} inserted column(s) "
+                                  f"{_span_text(range(ref_width + 1, cand_width + 1), get_column_letter)}")
+
+            for ref_idx, cand_idx in pairs:
+                if ref_idx is None:
+                    continue
+                ref_row = ref_rows[ref_idx - 1] if ref_idx <= len(ref_rows) else ()
+                cand_row = cand_rows[cand_idx - 1] if cand_idx is not None and cand_idx <= len(cand_rows) else ()
+                for col_idx in range(1, ref_width + 1):
+                    ref = ref_row[col_idx - 1] if col_idx <= len(ref_row) else None
+                    cand = cand_row[col_idx - 1] if col_idx <= len(cand_row) else None
+                    if row_map and isinstance(ref, str) and ref.startswith("="):
+                        ref = _shift_formula_rows(ref, row_map)
+                    compared += 1
+                    kind = compare_cells(ref, cand, rel_tol, abs_tol)
+                    if kind is None:
+                        continue
+                    diff = cand - ref if kind == "numeric" else ""
+                    mismatch = {"output": output, "sheet": name, "cell": _cell_name(cand_idx or ref_idx, col_idx),
+                                "kind": kind if cand_idx is not None else "missing row",
+                                "reference": ref, "candidate": cand, "diff": diff}
+                    if cand_idx is not None and cand_idx != ref_idx:
+                        mismatch["reference_cell"] = _cell_name(ref_idx, col_idx)
+                    mismatches.append(mismatch)
+    finally:
+        wb_ref.close()
+        wb_cand.close()
+    return mismatches, notes, insertions, compared
+
+
+# ==================== 실행 준비 / 보고서 ====================
+
+def extract_revision(ref: str, dest: str) -> str:
+    """
+    git 리비전의 파일을 dest 폴더에 풀기 (문서 파일 제외)
+
+    Returns:
+        리비전 커밋 해시 (짧은 형식)
+
+    Raises:
+        RuntimeError: 리비전을 찾을 수 없거나 git archive가 실패한 경우
+    """
+    rev = subprocess.run(["git", "rev-parse", "--short", "--verify", f"{ref}^{{commit}}"], cwd=APP_DIR,
+                         capture_output=True, text=True)
+    if rev.returncode != 0:
+        raise RuntimeError(f"Unknown git revision: {ref}")
+    archive = subprocess.run(["git", "archive", "--format=tar", ref, "--", ".", *ARCHIVE_EXCLUDES],
+                             cwd=APP_DIR, capture_output=True)
+    if archive.returncode != 0:
+        raise RuntimeError(f"git archive failed: {archive.stderr.decode(errors='replace').strip()}")
+    with tarfile.open(fileobj=io.BytesIO(archive.stdout)) as tar:
+        tar.extractall(dest, filter="data")
+    return rev.stdout.strip()
+
+
+def prepare_inputs(args, temp_root: str) -> dict:
+    """입력 파일 목록 (--dataset manifest, 없으면 합성 데이터 생성)"""
+    if args.dataset:
+        with open(os.path.join(args.dataset, "manifest.json"), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    else:
+        from synthetic_data import SAMPLE_NETS, generate_dataset
+        manifest = generate_dataset(os.path.join(temp_root, "dataset"),
+                                    nets=max(2, int(round(SAMPLE_NETS * args.scale))),
+                                    outlier_rate=DATASET_OUTLIER_RATE,
+                                    non_numeric_rate=args.non_numeric_rate, seed=DATASET_SEED)
+    files = dict(manifest["files"])
+    if args.etching_dir:
+        files["etching_dir"] = os.path.abspath(args.etching_dir)
+        files.pop("dk_files", None)
+    return files
+
+
+def reads_dk_file(code_dir: str, dk_file: str) -> bool:
+    """code_dir 코드가 DK 파일을 읽을 수 있는지 하위 프로세스에서 확인 (probe_dk_reader)"""
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--probe-dk", code_dir, dk_file],
+                          cwd=os.path.dirname(dk_file), capture_output=True, text=True)
+    return proc.returncode == 0
+
+
+def run_code_tree(label: str, code_dir: str, inputs_path: str, work_dir: str) -> dict:
+    """
+    하위 프로세스에서 code_dir 코드로 탭 실행
+
+    Returns:
+        run.json 내용 (실행 실패 시 "error" 포함)
+    """
+    os.makedirs(work_dir, exist_ok=True)
+    print(f"Running {label} ({code_dir})...")
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--run-side", code_dir, inputs_path,
+                           work_dir], cwd=work_dir, capture_output=True, text=True)
+    result_path = os.path.join(work_dir, RUN_RESULT_FILE)
+    if proc.returncode != 0 or not os.path.exists(result_path):
+        return {"error": (proc.stderr or proc.stdout).strip().splitlines()[-20:], "steps": {}, "outputs": {}}
+    with open(result_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_report(report_base: str, header: list, mismatches: list) -> tuple:
+    """
+    보고서 저장
+
+    Returns:
+        (.txt 경로, .csv 경로)
+    """
+    os.makedirs(os.path.dirname(report_base), exist_ok=True)
+    text_path = report_base + ".txt"
+    csv_path = report_base + ".csv"
+    with open(text_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(header) + "\n\n")
+        for m in mismatches:
+            f.write(format_mismatch(m) + "\n")
+    with open(csv_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=["output", "sheet", "cell", "reference_cell", "kind", "reference",
+                                               "candidate", "diff"], restval="")
+        writer.writeheader()
+        writer.writerows(mismatches)
+    return text_path, csv_path
+
+
+def format_mismatch(m: dict) -> str:
+    """불일치 한 줄 (예: "Tab 3 LSL/USL workbook!tinh LCLUCL!C17 numeric: 1.2 != 1.21 (diff 0.01)")
+    행을 맞춘 시트에서 기준 행 번호가 다르면 "C34 (reference C17)"처럼 함께 표시"""
+    cell = m["cell"] + (f" (reference {m['reference_cell']})" if m.get("reference_cell") else "")
+    text = f"{m['output']}!{m['sheet']}!{cell} {m['kind']}: {m['reference']!r} != {m['candidate']!r}"
+    if m["diff"] != "":
+        text += f" (diff {m['diff']:.3g})"
+    return text
+
+
+def summarize_mismatches(mismatches: list) -> list:
+    """결과/시트별 불일치 수와 열 범위 요약"""
+    from openpyxl.utils import column_index_from_string
+
+    groups = {}
+    for m in mismatches:
+        groups.setdefault((m["output"], m["sheet"]), []).append(m)
+    lines = []
+    for (output, sheet), items in groups.items():
+        columns = sorted({"".join(c for c in m["cell"] if c.isalpha()) for m in items if m["cell"]},
+                         key=column_index_from_string)
+        kinds = sorted({m["kind"] for m in items})
+        lines.append(f"  {output} / {sheet or '-'}: {len(items)} cell(s), columns {','.join(columns) or '-'} "
+                     f"({', '.join(kinds)})")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Tab 1-3 output workbooks between a reference git "
+                                                 "revision and the optimized code")
+    parser.add_argument("--reference", default=DEFAULT_REFERENCE, help="reference git revision (default: HEAD)")
+    parser.add_argument("--candidate", default="",
+                        help="candidate git revision (default: the working tree)")
+    parser.add_argument("--tabs", type=int, nargs="+", choices=sorted(TAB_RUNNERS), default=sorted(TAB_RUNNERS),
+                        help="tabs to compare (default: all)")
+    parser.add_argument("--dataset", default="", help="synthetic_data.py dataset folder (with manifest.json)")
+    parser.add_argument("--scale", type=float, default=DATASET_SCALE,
+                        help="size of the generated dataset when --dataset is not given")
+    parser.add_argument("--non-numeric-rate", type=float, default=DATASET_NON_NUMERIC_RATE,
+                        help="share of non-numeric cells in the generated dataset (default: 0)")
+    parser.add_argument("--etching-dir", default="", help="DK file folder for Tab 2 (overrides the dataset)")
+    parser.add_argument("--rel-tol", type=float, default=DEFAULT_REL_TOL, help="relative numeric tolerance")
+    parser.add_argument("--abs-tol", type=float, default=DEFAULT_ABS_TOL, help="absolute numeric tolerance")
+    parser.add_argument("--keep", action="store_true", help="keep the work folder with both result sets")
+    parser.add_argument("--run-side", nargs=3, metavar=("CODE_DIR", "INPUTS", "WORK_DIR"),
+                        help=argparse.SUPPRESS)
+    parser.add_argument("--probe-dk", nargs=2, metavar=("CODE_DIR", "DK_FILE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_side:
+        return run_side(*args.run_side)
+    if args.probe_dk:
+        return probe_dk_reader(*args.probe_dk)
+
+    sys.path.insert(0, APP_DIR)
+    temp_root = tempfile.mkdtemp(prefix="dcr_equivalence_")
+    try:
+        ref_dir = os.path.join(temp_root, "reference_code")
+        ref_rev = extract_revision(args.reference, ref_dir)
+        if args.candidate:
+            cand_dir = os.path.join(temp_root, "candidate_code")
+            cand_rev = extract_revision(args.candidate, cand_dir)
+        else:
+            cand_dir, cand_rev = APP_DIR, "working tree"
+
+        files = prepare_inputs(args, temp_root)
+        dk_input = f"folder {files['etching_dir']}"
+        if 2 in args.tabs and files.get("dk_files"):
+            unreadable = [label for label, code_dir in (("reference", ref_dir), ("candidate", cand_dir))
+                          if not reads_dk_file(code_dir, files["dk_files"][0])]
+            if unreadable:
+                # .xlsx DK 파일을 지원하기 전 리비전 - 양쪽 모두 샘플 .xls DK 폴더로 비교
+                files.pop("dk_files")
+                files["etching_dir"] = SAMPLE_ETCHING_DIR
+                dk_input = (f"sample folder {SAMPLE_ETCHING_DIR} "
+                            f"({' and '.join(unreadable)} cannot read the generated .xlsx DK files)")
+            else:
+                dk_input = f"{len(files['dk_files'])} generated .xlsx files (Manual mode)"
+
+        inputs_path = os.path.join(temp_root, "inputs.json")
+        with open(inputs_path, 'w', encoding='utf-8') as f:
+            json.dump({"tabs": args.tabs, "files": files}, f, indent=2)
+
+        ref_run = run_code_tree(f"reference {args.reference} ({ref_rev})", ref_dir, inputs_path,
+                                os.path.join(temp_root, "reference_out"))
+        cand_run = run_code_tree(f"candidate {cand_rev}", cand_dir, inputs_path,
+                                 os.path.join(temp_root, "candidate_out"))
+
+        header = [
+            "DCR Format Converter - Equivalence check",
+            f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Reference: {args.reference} ({ref_rev})",
+            f"Candidate: {args.candidate or cand_rev}" + (f" ({cand_rev})" if args.candidate else ""),
+            f"Tabs: {', '.join(str(t) for t in args.tabs)}",
+            f"Tolerance: rel {args.rel_tol:g}, abs {args.abs_tol:g}",
+        ]
+        if 2 in args.tabs:
+            header.append(f"Tab 2 DK input: {dk_input}")
+        run_errors = [f"{label} run failed:\n    " + "\n    ".join(run["error"])
+                      for label, run in (("reference", ref_run), ("candidate", cand_run)) if run.get("error")]
+
+        mismatches = []
+        notes = []
+        insertions = []
+        compared = 0
+        # 단계 결과: 양쪽이 같은 오류면 동일한 동작(참고), 한쪽만 실패하거나 오류가 다르면 불일치
+        for step, ref_message in ref_run["steps"].items():
+            cand_message = cand_run["steps"].get(step, "")
+            ref_failed, cand_failed = ref_message.startswith("Error"), cand_message.startswith("Error")
+            if ref_failed and cand_failed and ref_message == cand_message:
+                notes.append(f"{step}: both failed - {ref_message}")
+            elif ref_failed or cand_failed:
+                mismatches.append({"output": step, "sheet": "", "cell": "", "kind": "step result",
+                                   "reference": ref_message, "candidate": cand_message, "diff": ""})
+        for output, ref_path in ref_run["outputs"].items():
+            cand_path = cand_run["outputs"].get(output)
+            if cand_path is None:
+                continue
+            m, n, i, c = compare_workbooks(ref_path, cand_path, output, args.rel_tol, args.abs_tol)
+            mismatches.extend(m)
+            notes.extend(n)
+            insertions.extend(i)
+            compared += c
+
+        header.append(f"Compared cells: {compared}, mismatches: {len(mismatches)}")
+        header.extend(["", "Run errors:"] + [f"  {e}" for e in run_errors] if run_errors else [])
+        header.extend(["", "Notes:"] + [f"  {n}" for n in notes] if notes else [])
+        header.extend(["", "Inserted rows/columns (candidate only, not compared):"] + [f"  {i}" for i in insertions]
+                      if insertions else [])
+        header.extend(["", "Mismatches by sheet:"] + summarize_mismatches(mismatches) if mismatches else [])
+        report_base = os.path.join(REPORT_DIR, f"equivalence_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        text_path, csv_path = write_report(report_base, header, mismatches)
+
+        print("\n" + "\n".join(header))
+        for m in mismatches[:PRINT_MISMATCHES]:
+            print("  " + format_mismatch(m))
+        if len(mismatches) > PRINT_MISMATCHES:
+            print(f"  ... {len(mismatches) - PRINT_MISMATCHES} more")
+        print(f"\nReport: {text_path}\n        {csv_path}")
+        if args.keep:
+            print(f"Work folder kept: {temp_root}")
+    finally:
+        if not args.keep:
+            shutil.rmtree(temp_root, ignore_errors=True)
+
+    if run_errors:
+        return 2
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+부트스트랩 신뢰구간 모듈
+NET별 측정값을 복원 추출(bootstrap)해서 AverageIfs / Stdev ifs / LSL / USL의 신뢰구간 계산
+- NET 묶음(chunk)마다 모든 NET x 재표본 x 측정값 인덱스를 한 번에 뽑아서
+  이상치 필터(logic.outlier_filters)와 통계를 재표본 전체에 벡터 연산으로 적용
+- NET 수가 많으면 묶음을 프로세스 풀에서 병렬 처리
+- 시드가 고정되어 있고 묶음마다 (시드, 묶음 번호)로 난수를 만들므로 병렬/순차 결과가 같음
+"""
+
+import multiprocessing
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from logic.cancellation import OperationCancelled, check_cancelled
+from logic.outlier_filters import DEFAULT_OUTLIER_FILTER, apply_outlier_filter
+
+
+# 기본 재표본 수 / 신뢰 수준 / 시드
+BOOTSTRAP_RESAMPLES = 1000
+BOOTSTRAP_CONFIDENCE = 0.95
+BOOTSTRAP_SEED = 20240601
+
+# 한 묶음에서 만드는 재표본 값 개수 상한 (NET 수 x 재표본 수 x 측정 수, 메모리 사용량 제한)
+BOOTSTRAP_CHUNK_ELEMENTS = 2_000_000
+
+# NET 수가 이 이상이면 프로세스 풀 사용 (None이면 CPU 코어 수, 1이면 순차 처리)
+BOOTSTRAP_PARALLEL_MIN_NETS = 2000
+BOOTSTRAP_MAX_WORKERS = None
+
+# 신뢰구간을 계산하는 최소 유효 측정값 개수 (미만이면 NaN)
+BOOTSTRAP_MIN_VALUES = 2
+
+# 신뢰구간을 구하는 통계량 (워크북 행/열 순서)
+BOOTSTRAP_STATS = ("AverageIfs", "Stdev ifs", "LSL", "USL")
+
+
+def bootstrap_labels(confidence=BOOTSTRAP_CONFIDENCE) -> list:
+    """신뢰구간 행/열 레이블 [(통계량, "L"/"U", 레이블), ...] (예: "AverageIfs CI95 L")"""
+    level = f"{confidence * 100:g}"
+    return [(stat_name, side, f"{stat_name} CI{level} {side}")
+            for stat_name in BOOTSTRAP_STATS for side in ("L", "U")]
+
+
+def _pack_valid(matrix: np.ndarray):
+    """행별 유효 값을 앞으로 모은 배열과 유효 값 개수"""
+    valid = ~np.isnan(matrix)
+    order = np.argsort(~valid, axis=1, kind='stable')
+    return np.take_along_axis(matrix, order, axis=1), valid.sum(axis=1)
+
+
+def _bootstrap_chunk(packed: np.ndarray, counts: np.ndarray, chunk_idx: int, n_resamples: int,
+                     seed: int, sigma_k: float, outlier_filter: str, filter_threshold,
+                     confidence: float) -> dict:
+    """
+    NET 묶음 1개의 부트스트랩 (워커 또는 호출한 스레드에서 실행)
+
+    Returns:
+        {통계량: (하한 배열, 상한 배열)}
+    """
+    rng = np.random.default_rng([seed, chunk_idx])
+    n_nets, n_measure = packed.shape
+
+    # 모든 NET x 재표본 x 측정 위치의 추출 인덱스를 한 번에 생성 (NET별 유효 값 개수 범위)
+    idx = (rng.random((n_nets, n_resamples, n_measure)) * counts[:, None, None]).astype(np.int64)
+    resampled = packed[np.arange(n_nets)[:, None, None], idx]
+    beyond = np.arange(n_measure)[None, None, :] >= counts[:, None, None]
+    resampled[np.broadcast_to(beyond, resampled.shape)] = np.nan
+
+    filtered = apply_outlier_filter(resampled.reshape(n_nets * n_resamples, n_measure),
+                                    outlier_filter, filter_threshold)
+    avg_ifs = filtered["avg_ifs"].reshape(n_nets, n_resamples)
+    std_ifs = filtered["std_ifs"].reshape(n_nets, n_resamples)
+    samples = {
+        "AverageIfs": avg_ifs,
+        "Stdev ifs": std_ifs,
+        "LSL": np.floor(np.maximum(0, avg_ifs - sigma_k * std_ifs) * 1000) / 1000,
+        "USL": np.ceil((avg_ifs + sigma_k * std_ifs) * 1000) / 1000,
+    }
+
+    # 백분위수는 NaN인 재표본을 빼고 계산 (모든 재표본이 NaN인 NET은 NaN)
+    too_few = counts < BOOTSTRAP_MIN_VALUES
+    tail = (1 - confidence) / 2 * 100
+    result = {}
+    for stat_name, values in samples.items():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            low, high = np.nanpercentile(values, [tail, 100 - tail], axis=1)
+        low[too_few] = np.nan
+        high[too_few] = np.nan
+        result[stat_name] = (low, high)
+    return result
+
+
+def _worker_count() -> int:
+    """부트스트랩 프로세스 수"""
+    return BOOTSTRAP_MAX_WORKERS or os.cpu_count() or 1
+
+
+def bootstrap_limits(matrix, sigma_k: float, outlier_filter: str = DEFAULT_OUTLIER_FILTER,
+                     filter_threshold=None, n_resamples: int = BOOTSTRAP_RESAMPLES,
+                     confidence: float = BOOTSTRAP_CONFIDENCE, seed: int = BOOTSTRAP_SEED,
+                     cancel_token=None) -> dict:
+    """
+    모든 NET의 AverageIfs / Stdev ifs / LSL / USL 부트스트랩 신뢰구간 (백분위수 방법)
+
+    Args:
+        matrix: NET x 측정값 2차원 배열 (빈 값은 NaN)
+        sigma_k: LSL/USL 시그마 배수
+        outlier_filter: AverageIfs/Stdev ifs 이상치 필터
+        filter_threshold: 필터 임계값 (None이면 필터 기본값)
+        n_resamples: NET별 재표본 수
+        confidence: 신뢰 수준 (0~1)
+        seed: 난수 시드 (같은 입력과 시드면 같은 결과)
+        cancel_token: 취소 요청 토큰 (묶음마다 확인, None이면 확인 안 함)
+
+    Returns:
+        {통계량: (하한 배열, 상한 배열)} - BOOTSTRAP_STATS 순서,
+        유효 측정값이 BOOTSTRAP_MIN_VALUES개 미만이거나 모든 재표본이 NaN인 NET은 NaN
+    """
+    packed, counts = _pack_valid(np.asarray(matrix, dtype=float))
+    n_nets, n_measure = packed.shape
+    chunk_size = max(1, BOOTSTRAP_CHUNK_ELEMENTS // max(1, n_resamples * n_measure))
+    chunks = [(packed[start:start + chunk_size], counts[start:start + chunk_size], chunk_idx,
+               n_resamples, seed, sigma_k, outlier_filter, filter_threshold, confidence)
+              for chunk_idx, start in enumerate(range(0, n_nets, chunk_size))]
+
+    chunk_results = None
+    if n_nets >= BOOTSTRAP_PARALLEL_MIN_NETS and _worker_count() > 1 and len(chunks) > 1:
+        try:
+            # Qt 스레드가 있는 프로세스에서도 안전하도록 spawn 사용 (visualizer 렌더링 풀과 동일)
+            pool = ProcessPoolExecutor(max_workers=_worker_count(),
+                                       mp_context=multiprocessing.get_context("spawn"))
+            try:
+                chunk_results = []
+                for result in pool.map(_bootstrap_chunk, *zip(*chunks)):
+                    check_cancelled(cancel_token)
+                    chunk_results.append(result)
+            except OperationCancelled:
+                # 아직 시작하지 않은 묶음은 취소하고 기다리지 않음
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            pool.shutdown()
+        except (BrokenProcessPool, OSError):
+            # 워커 프로세스를 띄울 수 없는 환경이면 순차 처리
+            chunk_results = None
+    if chunk_results is None:
+        chunk_results = []
+        for chunk in chunks:
+            check_cancelled(cancel_token)
+            chunk_results.append(_bootstrap_chunk(*chunk))
+
+    empty = np.full(0, np.nan)
+    return {stat_name: (np.concatenate([r[stat_name][0] for r in chunk_results] or [empty]),
+                        np.concatenate([r[stat_name][1] for r in chunk_results] or [empty]))
+            for stat_name in BOOTSTRAP_STATS}
@@ -6,13 +6,195 @@ merged_file에서 데이터를 읽어 통계 계산 후 출력 파일 생성
 import pandas as pd
 import numpy as np
 import openpyxl
+from openpyxl.packaging.custom import FloatProperty, IntProperty, StringProperty
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 import os
 
+from logic.capability import (
+    CAPABILITY_INDICES, calculate_capability, capability_cell_value, count_out_of_spec,
+)
+from logic.cancellation import check_cancelled
+from logic.instrumentation import StageSequence, stage
+from logic.columnar_export import ColumnarExport, descriptive_statistics, statistics_columns
+from logic.sheet_shards import NetColumnSheets, create_shard_sheets, plan_shards
+from logic.bootstrap import (
+    BOOTSTRAP_CONFIDENCE, BOOTSTRAP_RESAMPLES, BOOTSTRAP_SEED, BOOTSTRAP_STATS, bootstrap_labels, bootstrap_limits,
+)
+from logic.outlier_filters import (
+    DEFAULT_OUTLIER_FILTER, OUTLIER_FILTERS, apply_outlier_filter, default_filter_threshold,
+    outlier_filter_label,
+)
 from logic.visualizer import save_lslusl_plots_from_data
 
 
+# ERS 스펙(vendor 시트)은 mΩ 단위 → 측정값 단위로 환산할 때 나누는 값 (Judgement 열과 동일한 기준)
+ERS_UNIT_SCALE = 1000
+
+# tinh LCLUCL 시트: 공정 능력 지수 행 (Row 21~28), 필터 후 사용 개수 행 (Row 29),
+# 부트스트랩 신뢰구간 행 (Row 30~37, 부트스트랩을 실행하지 않으면 빈 행) 다음부터 측정값
+TINH_CAPABILITY_START_ROW = 21
+TINH_RETAINED_ROW = TINH_CAPABILITY_START_ROW + 2 * len(CAPABILITY_INDICES)
+TINH_CI_START_ROW = TINH_RETAINED_ROW + 1
+TINH_DATA_START_ROW = TINH_CI_START_ROW + 2 * len(BOOTSTRAP_STATS)
+
+# Calculate USL LSL 시트: 공정 능력 지수 시작 열 (U열), NG 개수 시작 열 (AC열)
+CALC_CAPABILITY_START_COL = 21
+CALC_NG_START_COL = CALC_CAPABILITY_START_COL + 2 * len(CAPABILITY_INDICES)
+# 부트스트랩 신뢰구간 시작 열 (AG열, 부트스트랩 실행 시에만 작성)
+CALC_CI_START_COL = CALC_NG_START_COL + 4
+
+# NG index 시트: 측정 번호 범위 문자열 최대 길이 (Excel 셀 한도 32,767자 이내), 데이터 시작 행 (Row 3 헤더)
+NG_INDEX_MAX_CHARS = 2000
+NG_INDEX_DATA_START_ROW = 4
+
+# LSL/USL 계산 파라미터 기본값 (what-if 시뮬레이터에서 바꿔서 적용 가능)
+# (AverageIfs/Stdev ifs 이상치 필터는 logic.outlier_filters, 기본 Q1 - 4×IQR ~ Q3 + 4×IQR)
+SIGMA_K = 3              # LSL/USL = (A)AverageIfs ∓ k × (B)Stdev ifs
+GUARD_BAND_MOHM = 5      # On machine 규격(mΩ) = 계산 규격 × 1000 ∓ guard band
+
+# 결과 파일 사용자 지정 문서 속성 이름 앞부분 (적용한 파라미터를 what-if 시뮬레이터가 다시 읽음)
+RESULT_PROPERTY_PREFIX = "DCR "
+
+# 마지막 NET (GND-SUS) 고정 규격 (mΩ)
+LAST_NET_LIMITS_MOHM = (0, 50)
+
+# Sap xep 시트: Row 1-12 헤더/메타데이터, Row 13부터 측정값
+SAP_DATA_START_ROW = 13
+
+# merged file: Method 열 (D열), 측정값 시작 열 (G열)
+# Calculate USL LSL / DCR 규격 / 플롯은 PRIMARY_METHOD 기준, 다른 Method는 별도 tinh LCLUCL 시트
+METHOD_COL = 3
+DATA_COL_START = 6
+PRIMARY_METHOD = 3
+
+
+def format_parameter(val) -> str:
+    """파라미터 표시용 문자열 (3.0 → "3", 2.5 → "2.5")"""
+    return f"{float(val):g}"
+
+
+def limit_parameter_text(sigma_k, filter_threshold, guard_band,
+                         outlier_filter: str = DEFAULT_OUTLIER_FILTER) -> str:
+    """Calculate USL LSL 시트에 기록하는 파라미터 설명"""
+    return (f"k={format_parameter(sigma_k)}σ, {outlier_filter_label(outlier_filter, filter_threshold)}, "
+            f"guard band ±{format_parameter(guard_band)} mΩ")
+
+
+def write_result_properties(wb, values: dict) -> None:
+    """결과 워크북 사용자 지정 문서 속성 기록 (같은 이름은 교체, 정수/실수/문자열)"""
+    props = wb.custom_doc_props
+    for key, val in values.items():
+        name = RESULT_PROPERTY_PREFIX + key
+        if name in props.names:
+            del props[name]
+        if isinstance(val, (int, np.integer)) and not isinstance(val, bool):
+            props.append(IntProperty(name=name, value=int(val)))
+        elif isinstance(val, (float, np.floating)):
+            props.append(FloatProperty(name=name, value=float(val)))
+        else:
+            props.append(StringProperty(name=name, value=str(val)))
+
+
+def read_result_properties(wb) -> dict:
+    """결과 워크북 사용자 지정 문서 속성 {키: 값} (read_only 가능, 기록이 없는 이전 결과 파일은 빈 딕셔너리)"""
+    return {prop.name[len(RESULT_PROPERTY_PREFIX):]: prop.value for prop in wb.custom_doc_props
+            if prop.name.startswith(RESULT_PROPERTY_PREFIX)}
+
+
+def write_limit_parameters(wb, sigma_k, filter_threshold, guard_band,
+                           outlier_filter: str = DEFAULT_OUTLIER_FILTER) -> None:
+    """적용한 LSL/USL 파라미터를 결과 워크북 문서 속성으로 기록 (Calculate USL LSL Q2 설명과 같은 값)"""
+    write_result_properties(wb, {"sigma_k": sigma_k, "filter_threshold": filter_threshold,
+                                 "guard_band": guard_band, "outlier_filter": outlier_filter})
+
+
+def read_limit_parameters(wb) -> dict:
+    """
+    결과 워크북에 기록된 LSL/USL 파라미터
+
+    Returns:
+        {"sigma_k", "filter_threshold", "guard_band", "outlier_filter"}
+        (기록이 없거나 알 수 없는 값은 기본값)
+    """
+    props = read_result_properties(wb)
+    outlier_filter = props.get("outlier_filter")
+    if outlier_filter not in OUTLIER_FILTERS:
+        outlier_filter = DEFAULT_OUTLIER_FILTER
+    parameters = {"sigma_k": SIGMA_K, "filter_threshold": default_filter_threshold(outlier_filter),
+                  "guard_band": GUARD_BAND_MOHM, "outlier_filter": outlier_filter}
+    for key in ("sigma_k", "filter_threshold", "guard_band"):
+        if isinstance(props.get(key), (int, float)) and not isinstance(props[key], bool):
+            parameters[key] = props[key]
+    return parameters
+
+
+def limit_row_labels(sigma_k, filter_threshold, outlier_filter: str = DEFAULT_OUTLIER_FILTER) -> dict:
+    """tinh LCLUCL 파라미터 의존 행 레이블 {행 번호: 레이블}"""
+    k = format_parameter(sigma_k)
+    if outlier_filter == "iqr":
+        f = format_parameter(filter_threshold)
+        lower_label, upper_label = f"1stQuat-{f}IQR", f"3rdQuat+{f}IQR"
+    else:
+        filter_label = outlier_filter_label(outlier_filter, filter_threshold)
+        lower_label, upper_label = f"{filter_label} L", f"{filter_label} U"
+    return {
+        15: lower_label,
+        16: upper_label,
+        19: f"LSL(A-{k}B)",
+        20: f"USL(A+{k}B)",
+    }
+
+
+def limit_formulas(col_letter: str, data_range: str, sigma_k, filter_threshold,
+                   outlier_filter: str = DEFAULT_OUTLIER_FILTER) -> dict:
+    """
+    tinh LCLUCL 파라미터 의존 수식 {행 번호: 수식} (Row 15-16 이상치 범위, Row 19-20 LSL/USL)
+    IQR 이외의 필터와 data_range가 없는 경우 (측정값이 여러 시트로 나뉜 시트)는
+    Row 15-16 수식이 없으므로 필터 범위 값을 따로 기록
+    """
+    k = format_parameter(sigma_k)
+    formulas = {
+        19: f"=ROUNDDOWN(IF({col_letter}17-({k}*{col_letter}18)<0,0,{col_letter}17-({k}*{col_letter}18)),3)",
+        20: f"=ROUNDUP({col_letter}17+({k}*{col_letter}18),3)",
+    }
+    if outlier_filter == "iqr" and data_range:
+        f = format_parameter(filter_threshold)
+        formulas[15] = (f"=IF(QUARTILE({data_range},1)-({f}*{col_letter}14)<0,0,"
+                        f"QUARTILE({data_range},1)-({f}*{col_letter}14))")
+        formulas[16] = f"=QUARTILE({data_range},3)+({f}*{col_letter}14)"
+    return formulas
+
+
+def filter_bound_value(val):
+    """필터 범위 값을 셀 값으로 변환 (NaN/무한대는 빈 셀)"""
+    if val is None or not np.isfinite(val):
+        return None
+    return float(val)
+
+
+def retained_summary(filter_result: dict, total_counts) -> str:
+    """필터 후 사용한 측정값 개수 요약 한 줄"""
+    total = int(np.sum(total_counts))
+    retained = int(filter_result["retained"].sum())
+    ratio = f"{retained / total * 100:.2f}%" if total else "N/A"
+    return (f"Outlier filter ({outlier_filter_label(filter_result['method'], filter_result['threshold'])}): "
+            f"retained {retained}/{total} measurements ({ratio})\n")
+
+
+def guard_band_formulas(row_idx: int, guard_band) -> tuple:
+    """Calculate USL LSL N-O열 (Internal raw) 수식: (S*1000 - guard, T*1000 + guard)"""
+    g = format_parameter(guard_band)
+    return f"=S{row_idx}-{g}", f"=T{row_idx}+{g}"
+
+
+def machine_limits_mohm(avg_ifs: float, std_ifs: float, sigma_k=SIGMA_K, guard_band=GUARD_BAND_MOHM) -> tuple:
+    """DCR 시트 3 sigma spec / On machine 규격 (mΩ 정수): int(LSL×1000) - guard, int(USL×1000) + guard"""
+    lsl_calculated = max(0, avg_ifs - sigma_k * std_ifs)
+    usl_calculated = avg_ifs + sigma_k * std_ifs
+    return int(lsl_calculated * 1000) - guard_band, int(usl_calculated * 1000) + guard_band
+
+
 def convert_to_number_if_possible(val):
     """
     값을 숫자로 변환 가능하면 숫자로, 아니면 원래 값 반환
@@ -48,6 +230,105 @@ def convert_to_number_if_possible(val):
     return val
 
 
+def build_net_matrix(data_df, x: int, num_sets: int) -> np.ndarray:
+    """
+    Method=3 데이터(행 = 세트 x NET, 열 = piece)를 NET x 측정값 행렬로 재배열
+    측정 순서는 Sap xep / tinh LCLUCL 시트와 동일 (세트 → piece 순)
+
+    Args:
+        data_df: G열 이후 데이터 DataFrame
+        x: NET 수
+        num_sets: piece별 세트 수
+
+    Returns:
+        (x, num_sets * piece 수) float 배열 (숫자가 아닌 값은 NaN)
+    """
+    raw = data_df.iloc[:num_sets * x].to_numpy(dtype=object)
+    num_pieces = raw.shape[1]
+    values = pd.to_numeric(pd.Series(raw.ravel()), errors='coerce').to_numpy(dtype=float)
+    values = values.reshape(num_sets, x, num_pieces)
+    return values.transpose(1, 0, 2).reshape(x, num_sets * num_pieces)
+
+
+def build_measurement_grid(data_df, x: int, num_sets: int) -> list:
+    """
+    merged file 데이터(행=세트×NET, 열=piece)를 측정값 x NET 2차원 리스트로 재배열
+    (숫자로 변환 가능한 것은 숫자로, 문자열은 그대로, 빈 값은 None)
+    
+    Args:
+        data_df: G열 이후 데이터
+        x: NET 수
+        num_sets: 세트 수
+        
+    Returns:
+        [측정 1의 NET별 값 리스트, ...] (측정 순서: 세트 → piece)
+    """
+    values = data_df.values
+    num_rows, num_cols = values.shape
+    grid = []
+    for set_idx in range(num_sets):  # 각 세트
+        for piece_idx in range(num_cols):  # 각 piece
+            row_values = [None] * x
+            for net_idx in range(x):
+                row_in_merged = set_idx * x + net_idx  # merged_file에서의 행 위치
+                if row_in_merged < num_rows:
+                    val = values[row_in_merged, piece_idx]
+                    if pd.notna(val):
+                        row_values[net_idx] = convert_to_number_if_possible(val)
+            grid.append(row_values)
+    return grid
+
+
+def split_by_method(df, methods=None) -> dict:
+    """
+    merged file 행(헤더 제외)을 Method 값별로 한 번에 나눔
+    
+    Args:
+        df: merged file 전체 (header=None으로 읽은 DataFrame)
+        methods: 분석할 Method 값 목록 (None이면 모든 Method, PRIMARY_METHOD는 항상 포함)
+        
+    Returns:
+        {Method 값: 해당 행 DataFrame (원래 순서)} - PRIMARY_METHOD가 먼저
+    """
+    body = df.iloc[1:]
+    keys = body.iloc[:, METHOD_COL].map(convert_to_number_if_possible)
+    groups = {key: group for key, group in body.groupby(keys, sort=True)}
+    if methods is not None:
+        selected = {convert_to_number_if_possible(m) for m in methods} | {PRIMARY_METHOD}
+        groups = {key: group for key, group in groups.items() if key in selected}
+    ordered = {PRIMARY_METHOD: groups.pop(PRIMARY_METHOD, body.iloc[0:0])}
+    ordered.update(groups)
+    return ordered
+
+
+def method_label(method_value) -> str:
+    """Method 값의 시트/파일 이름용 문자열 (3.0 → "3", 시트 이름에 쓸 수 없는 문자는 "_")"""
+    label = format_parameter(method_value) if isinstance(method_value, (int, float)) else str(method_value)
+    for ch in '[]:*?/\\':
+        label = label.replace(ch, "_")
+    return label
+
+
+def method_sheet_name(method_value) -> str:
+    """Method별 통계 시트 이름 (PRIMARY_METHOD는 기존 tinh LCLUCL)"""
+    if method_value == PRIMARY_METHOD:
+        return "tinh LCLUCL"
+    return f"tinh LCLUCL M{method_label(method_value)}"[:31]
+
+
+def method_summary(method_value, tinh: dict) -> str:
+    """Method별 요약 한 줄 (측정값 개수, 필터 후 사용 비율, 3σ 최소 Cpk)"""
+    total = int(tinh["counts"].sum())
+    retained = int(tinh["filter"]["retained"].sum())
+    cpk = tinh["capability"]["Cpk"]
+    cpk = cpk[~np.isnan(cpk)]
+    min_cpk = f"{cpk.min():.3f}" if len(cpk) else "N/A"
+    ratio = f"{retained / total * 100:.2f}%" if total else "N/A"
+    return (f"Method {format_parameter(method_value) if isinstance(method_value, (int, float)) else method_value}: "
+            f"{total} measurements, retained {ratio}, min Cpk (3σ) {min_cpk} "
+            f"- see '{method_sheet_name(method_value)}'\n")
+
+
 def get_x_from_dcr(dcr_file: str) -> int:
     """
     DCR 파일의 DCR sheet에서 C열의 마지막 숫자(x)를 가져옴
@@ -290,27 +571,487 @@ def calculate_lsl_usl(merged_file: str, dcr_file: str, output_file: str) -> str:
         return f"Error: {str(e)}\n{traceback.format_exc()}"
 
 
-def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, operator: str = "") -> str:
+def write_capability_rows(sheets: NetColumnSheets, capability: dict, start_row: int, fill=None) -> None:
+    """
+    tinh LCLUCL 시트에 공정 능력 지수 행 작성 (B열부터 NET 순서)
+
+    Args:
+        sheets: tinh LCLUCL 시트 묶음 (분할된 경우 NET별 시트)
+        capability: calculate_capability() 결과
+        start_row: Cp 행 번호 (Cpk, Pp, Ppk가 차례로 아래 행)
+        fill: 셀 배경색
+    """
+    for offset, index_name in enumerate(CAPABILITY_INDICES):
+        for net_idx, val in enumerate(capability[index_name]):
+            cell = sheets.cell(row=start_row + offset, net_idx=net_idx, value=capability_cell_value(val))
+            if fill is not None:
+                cell.fill = fill
+
+
+def write_bootstrap_rows(sheets: NetColumnSheets, ci: dict, start_row: int = TINH_CI_START_ROW,
+                         fill=None) -> None:
+    """
+    tinh LCLUCL 시트에 부트스트랩 신뢰구간 행 작성 (B열부터 NET 순서)
+
+    Args:
+        sheets: tinh LCLUCL 시트 묶음 (분할된 경우 NET별 시트)
+        ci: bootstrap_limits() 결과
+        start_row: 첫 행 번호 (AverageIfs L, AverageIfs U, Stdev ifs L, ... 순서)
+        fill: 셀 배경색
+    """
+    for offset, (stat_name, side, _) in enumerate(bootstrap_labels()):
+        values = ci[stat_name][0 if side == "L" else 1]
+        for net_idx, val in enumerate(values):
+            cell = sheets.cell(row=start_row + offset, net_idx=net_idx, value=filter_bound_value(val))
+            if fill is not None:
+                cell.fill = fill
+
+
+def write_bootstrap_columns(ws, ci: dict, data_start_row: int, row_count: int,
+                            confidence=BOOTSTRAP_CONFIDENCE, header_fill=None, write_header: bool = True) -> None:
+    """
+    Calculate USL LSL 시트에 부트스트랩 신뢰구간 열 작성 (AG열부터, Row 3-4 헤더)
+
+    Args:
+        ws: Calculate USL LSL 워크시트
+        ci: bootstrap_limits() 결과
+        data_start_row: 데이터 시작 행
+        row_count: NET 행 수
+        confidence: 신뢰 수준 (헤더 표시)
+        header_fill: 헤더 배경색
+        write_header: False면 값만 갱신 (이미 헤더가 있는 시트)
+    """
+    labels = bootstrap_labels(confidence)
+    first_col = CALC_CI_START_COL
+    last_col = first_col + len(labels) - 1
+    if write_header:
+        cell = ws.cell(row=3, column=first_col, value=f"Bootstrap CI ({confidence * 100:g}%)")
+        cell.font = Font(bold=True)
+        if header_fill is not None:
+            cell.fill = header_fill
+        ws.merge_cells(f"{get_column_letter(first_col)}3:{get_column_letter(last_col)}3")
+    for offset, (stat_name, side, _) in enumerate(labels):
+        col = first_col + offset
+        if write_header:
+            ws.cell(row=4, column=col, value=f"{stat_name} {side}")
+            ws.column_dimensions[get_column_letter(col)].width = 12
+        values = ci[stat_name][0 if side == "L" else 1]
+        for net_idx in range(min(row_count, len(values))):
+            ws.cell(row=data_start_row + net_idx, column=col, value=filter_bound_value(values[net_idx]))
+
+
+def write_bootstrap_parameters(wb, n_resamples: int, confidence=BOOTSTRAP_CONFIDENCE,
+                               seed: int = BOOTSTRAP_SEED) -> None:
+    """신뢰구간 계산 설정을 결과 워크북 문서 속성으로 기록 (what-if 적용 시 같은 설정으로 다시 계산)"""
+    write_result_properties(wb, {"bootstrap_resamples": int(n_resamples),
+                                 "bootstrap_confidence": float(confidence), "bootstrap_seed": int(seed)})
+
+
+def read_bootstrap_parameters(wb) -> dict:
+    """
+    결과 워크북에 기록된 신뢰구간 계산 설정
+
+    Returns:
+        {"n_resamples", "confidence", "seed"} (bootstrap_limits 인자, 기록이 없는 항목은 기본값)
+    """
+    props = read_result_properties(wb)
+    parameters = {"n_resamples": BOOTSTRAP_RESAMPLES, "confidence": BOOTSTRAP_CONFIDENCE, "seed": BOOTSTRAP_SEED}
+    for key, prop_name, value_type in (("n_resamples", "bootstrap_resamples", int),
+                                       ("confidence", "bootstrap_confidence", float),
+                                       ("seed", "bootstrap_seed", int)):
+        val = props.get(prop_name)
+        if isinstance(val, (int, float)) and not isinstance(val, bool):
+            parameters[key] = value_type(val)
+    return parameters
+
+
+def bootstrap_summary(ci: dict, n_resamples: int, confidence=BOOTSTRAP_CONFIDENCE) -> str:
+    """부트스트랩 요약 한 줄 (LSL/USL 신뢰구간 폭 중앙값)"""
+    widths = {name: ci[name][1] - ci[name][0] for name in ("LSL", "USL")}
+    text = ", ".join(f"median {name} CI width {np.nanmedian(w):.4f}" if np.isfinite(w).any()
+                     else f"{name} CI N/A" for name, w in widths.items())
+    return (f"Bootstrap ({n_resamples} resamples, {confidence * 100:g}% CI, seed {BOOTSTRAP_SEED}): "
+            f"{text}\n")
+
+
+def format_index_ranges(numbers: np.ndarray, max_chars: int = NG_INDEX_MAX_CHARS) -> str:
+    """
+    오름차순 번호 배열을 연속 구간 문자열로 압축 (예: [1, 2, 3, 7, 9, 10] → "1-3, 7, 9-10")
+
+    Args:
+        numbers: 오름차순 정수 배열
+        max_chars: 최대 길이 (넘으면 뒤를 생략하고 "..." 표시)
+    """
+    if len(numbers) == 0:
+        return ""
+    breaks = np.nonzero(np.diff(numbers) != 1)[0]
+    starts = numbers[np.r_[0, breaks + 1]]
+    ends = numbers[np.r_[breaks, len(numbers) - 1]]
+
+    parts = []
+    length = 0
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        part = str(start) if start == end else f"{start}-{end}"
+        length += len(part) + 2
+        if length > max_chars:
+            parts.append("...")
+            break
+        parts.append(part)
+    return ", ".join(parts)
+
+
+def write_ng_index_sheet(wb, matrix: np.ndarray, ng_results: dict) -> int:
+    """
+    규격 이탈 측정값 목록 시트(NG index) 작성
+    NET/규격/방향(Under/Over)마다 한 행: NG 개수, 최악 값, 측정 번호 구간
+    (행 한도를 넘으면 "NG index (2)" ... 시트로 이어서 작성, logic.sheet_shards)
+
+    Args:
+        wb: 출력 워크북
+        matrix: NET x 측정값 행렬
+        ng_results: {규격 이름: count_out_of_spec() 결과}
+
+    Returns:
+        작성한 NG 행 수
+    """
+    rows = []
+    for spec_name, ng in ng_results.items():
+        for side, mask_key, limit_key in (("Under", "under", "lsl"), ("Over", "over", "usl")):
+            mask = ng[mask_key]
+            net_ids, measure_ids = np.nonzero(mask)  # NET 순, NET 안에서 측정 순
+            if len(net_ids) == 0:
+                continue
+            # NET별 구간 경계
+            group_starts = np.r_[0, np.nonzero(np.diff(net_ids))[0] + 1]
+            group_ends = np.r_[group_starts[1:], len(net_ids)]
+            values = matrix[net_ids, measure_ids]
+            for start, end in zip(group_starts.tolist(), group_ends.tolist()):
+                net_idx = int(net_ids[start])
+                group_values = values[start:end]
+                worst = group_values.min() if side == "Under" else group_values.max()
+                rows.append((spec_name, net_idx + 1, side, end - start, float(ng[limit_key][net_idx]),
+                             float(worst), format_index_ranges(measure_ids[start:end] + 1)))
+
+    header_font = Font(bold=True)
+    header_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
+    title = f"NG measurements (tinh LCLUCL row = Measurement No + {TINH_DATA_START_ROW - 1})"
+    headers = ["Spec", "NET no", "Side", "NG count", "Limit", "Worst value", "Measurement No"]
+    shards = plan_shards("NG index", len(rows), NG_INDEX_DATA_START_ROW, repeat_header=True)
+    for ws, shard in zip(create_shard_sheets(wb, shards), shards):
+        ws.cell(row=1, column=1, value=title).font = header_font
+        for col, header in enumerate(headers, start=1):
+            cell = ws.cell(row=NG_INDEX_DATA_START_ROW - 1, column=col, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+        for row_idx, row in enumerate(rows[shard["row_start"]:shard["row_end"]], start=NG_INDEX_DATA_START_ROW):
+            for col, val in enumerate(row, start=1):
+                ws.cell(row=row_idx, column=col, value=val)
+        for col, width in enumerate([8, 8, 8, 10, 12, 12, 60], start=1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+        ws.freeze_panes = f"A{NG_INDEX_DATA_START_ROW}"
+    return len(rows)
+
+
+def capability_summary(capability: dict, spec_name: str) -> str:
+    """공정 능력 지수 요약 한 줄 (Cpk 기준 NET 수)"""
+    cpk = capability["Cpk"]
+    valid = cpk[~np.isnan(cpk)]
+    if len(valid) == 0:
+        return f"Capability ({spec_name}): no NET with both data and limits\n"
+    return (f"Capability ({spec_name}): {len(valid)} NETs, min Cpk {valid.min():.3f}, "
+            f"Cpk<1.0: {int((valid < 1.0).sum())}, Cpk<1.33: {int((valid < 1.33).sum())}\n")
+
+
+def write_tinh_sheet(wb, sheet_name: str, grid: list, net_matrix: np.ndarray, meta_pina, meta_pinb, method_value,
+                     sigma_k=SIGMA_K, filter_threshold=None, outlier_filter: str = DEFAULT_OUTLIER_FILTER,
+                     bootstrap_resamples: int = 0, cancel_token=None) -> dict:
+    """
+    tinh LCLUCL 레이아웃 시트 작성 (Method마다 같은 레이아웃)
+    Row 1-20 통계/수식, Row 21-24 3σ 공정 능력, Row 29 사용 개수, Row 30-37 부트스트랩, Row 38~ 측정값
+    Excel 시트 한도를 넘으면 "<시트> (2)" ... 시트로 나누어 작성 (logic.sheet_shards)
+    - NET 열이 넘치면 NET 범위마다 같은 레이아웃 시트
+    - 측정값 행이 넘치면 이어지는 시트에 계속 작성하고 Row 9-16은 수식 대신 같은 값
+    
+    Args:
+        wb: 출력 워크북
+        sheet_name: 시트 이름
+        grid: 측정값 x NET 2차원 리스트 (build_measurement_grid 결과, 문자열 포함)
+        net_matrix: NET x 측정값 행렬 (숫자만, 빈 값은 NaN)
+        meta_pina: NET별 PinA
+        meta_pinb: NET별 PinB
+        method_value: Row 4에 기록할 Method 값
+        sigma_k: LSL/USL 시그마 배수
+        filter_threshold: 이상치 필터 임계값 (None이면 필터 기본값)
+        outlier_filter: AverageIfs/Stdev ifs 이상치 필터
+        bootstrap_resamples: 부트스트랩 재표본 수 (0이면 계산 안 함)
+        cancel_token: 취소 요청 토큰 (NET 열마다 확인, None이면 확인 안 함)
+        
+    Returns:
+        {"lsl", "usl": 3σ 규격, "filter": apply_outlier_filter 결과, "counts": NET별 측정 개수,
+         "capability": 3σ 공정 능력, "ng": 3σ NG 개수, "bootstrap": 신뢰구간 (없으면 None),
+         "sheets": 작성한 시트 묶음 (NetColumnSheets), "debug": 메시지}
+    """
+    debug_info = []
+    x = net_matrix.shape[0]
+    if filter_threshold is None:
+        filter_threshold = default_filter_threshold(outlier_filter)
+    
+    # 스타일 정의
+    yellow_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
+    gray_fill = PatternFill(start_color="C0C0C0", end_color="C0C0C0", fill_type="solid")
+    capability_fill = PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid")
+    header_font = Font(bold=True)
+    
+    # A열 헤더 (행 레이블)
+    row_labels = [
+        "NET no",           # Row 1
+        "PinA",             # Row 2
+        "PinB",             # Row 3
+        "Method",           # Row 4
+        "Threshold L",      # Row 5
+        "Threshold U",      # Row 6
+        "UnderNG",          # Row 7
+        "OverNG",           # Row 8
+        "Min",              # Row 9
+        "Max",              # Row 10
+        "Average",          # Row 11
+        "Median",           # Row 12
+        "Stdev",            # Row 13
+        "IQR",              # Row 14
+        "1stQuat-4IQR",     # Row 15
+        "3rdQuat+4IQR",     # Row 16
+        "(A)AverageIfs",    # Row 17
+        "(B)Stdev ifs",     # Row 18
+        "LSL(A-3B)",        # Row 19
+        "USL(A+3B)",        # Row 20
+    ]
+    for row_idx, label in limit_row_labels(sigma_k, filter_threshold, outlier_filter).items():
+        row_labels[row_idx - 1] = label
+    # Row 21-28: 공정 능력 지수 (3σ 규격 LSL/USL, ERS 규격)
+    for spec_name in ("3σ", "ERS"):
+        for index_name in CAPABILITY_INDICES:
+            row_labels.append(f"{index_name} ({spec_name})")
+    # Row 29: AverageIfs/Stdev ifs 계산에 사용한 측정값 개수
+    row_labels.append("Retained n")
+    # Row 30-37: 부트스트랩 신뢰구간 (AverageIfs, Stdev ifs, LSL, USL 하한/상한)
+    row_labels.extend(label for _, _, label in bootstrap_labels())
+    
+    # 데이터 끝 행 계산 (Row 38부터 데이터 시작)
+    total_cal_rows = len(grid)
+    data_start_row = TINH_DATA_START_ROW
+    data_end_row = data_start_row + total_cal_rows - 1
+    sheets = NetColumnSheets.create(wb, sheet_name, x, total_cal_rows, data_start_row)
+    
+    for ws_tinh, _ in sheets.header_sheets():
+        for row_idx, label in enumerate(row_labels, start=1):
+            cell = ws_tinh.cell(row=row_idx, column=1, value=label)
+            cell.font = header_font
+            # A열에도 색상 적용 (Row 9-16: 회색, Row 17-20, 29-37: 노란색, Row 21-28: 하늘색)
+            if 9 <= row_idx <= 16:
+                cell.fill = gray_fill
+            elif 17 <= row_idx <= 20 or row_idx >= TINH_RETAINED_ROW:
+                cell.fill = yellow_fill
+            elif row_idx >= TINH_CAPABILITY_START_ROW:
+                cell.fill = capability_fill
+    
+    # Row 17-18: 이상치 필터를 모든 NET에 한 번에 적용한 AverageIfs / Stdev ifs
+    with stage("stats"):
+        filter_result = apply_outlier_filter(net_matrix, outlier_filter, filter_threshold)
+        net_counts = (~np.isnan(net_matrix)).sum(axis=1)
+        # 측정값이 여러 시트로 나뉘면 시트를 넘는 범위 수식을 쓸 수 없으므로 Row 9-14는 같은 값으로 저장
+        descriptive = descriptive_statistics(net_matrix) if sheets.row_sharded else None
+    
+    # 3σ 규격 (Row 19-20 수식과 같은 값, 공정 능력 계산용)
+    calc_lsl = np.full(x, np.nan)
+    calc_usl = np.full(x, np.nan)
+    
+    # 각 NET 열에 대해 처리
+    for net_idx in range(x):
+        check_cancelled(cancel_token)
+        ws_tinh, col = sheets.locate(net_idx)  # B열부터 시작 (분할된 경우 NET 범위의 시트)
+        col_letter = get_column_letter(col)
+        
+        # Row 1: NET 번호
+        ws_tinh.cell(row=1, column=col, value=net_idx + 1)
+        
+        # Row 2-3: 메타데이터 (숫자로 변환 가능한 것은 숫자로)
+        if net_idx < len(meta_pina):
+            val = meta_pina[net_idx]
+            if pd.notna(val):
+                converted_val = convert_to_number_if_possible(val)
+                ws_tinh.cell(row=2, column=col, value=converted_val if converted_val is not None else "")
+        if net_idx < len(meta_pinb):
+            val = meta_pinb[net_idx]
+            if pd.notna(val):
+                converted_val = convert_to_number_if_possible(val)
+                ws_tinh.cell(row=3, column=col, value=converted_val if converted_val is not None else "")
+        
+        # Row 4: Method, Row 5-6: 빈 값 (Row 7-8 UnderNG/OverNG는 3σ 규격 계산 후 작성)
+        ws_tinh.cell(row=4, column=col, value=method_value)
+        
+        # Row 38~: 측정값을 그대로 복사 (문자열 포함, 행 한도를 넘으면 이어지는 시트의 Row 2부터)
+        for ws_data, shard in sheets.data_shards(net_idx):
+            row_offset = shard["data_start_row"] - shard["row_start"]
+            for measure_idx in range(shard["row_start"], shard["row_end"]):
+                val = grid[measure_idx][net_idx]
+                # 모든 값 저장 (None이 아닌 경우, 문자열 포함)
+                if val is not None:
+                    ws_data.cell(row=measure_idx + row_offset, column=col, value=val)
+        
+        if descriptive is None:
+            # 데이터 범위 문자열 생성
+            data_range = f"{col_letter}${data_start_row}:{col_letter}${data_end_row}"
+            
+            # Row 9-14: Excel 수식 (회색 배경)
+            stat_cells = {
+                9: f"=MIN({data_range})",       # Row 9: Min
+                10: f"=MAX({data_range})",      # Row 10: Max
+                11: f"=AVERAGE({data_range})",  # Row 11: Average
+                12: f"=MEDIAN({data_range})",   # Row 12: Median
+                13: f"=STDEV({data_range})",    # Row 13: Stdev
+                14: f"=QUARTILE({data_range},3)-QUARTILE({data_range},1)",  # Row 14: IQR = Q3 - Q1
+            }
+        else:
+            # Row 9-14: 수식과 같은 값 (회색 배경, Row 15-16도 아래에서 값으로 저장)
+            data_range = ""
+            stat_cells = {row_idx: filter_bound_value(descriptive[name][net_idx]) for row_idx, name in
+                          zip(range(9, 15), ("min", "max", "mean", "median", "stdev", "iqr"))}
+        for row_idx, value in stat_cells.items():
+            cell = ws_tinh.cell(row=row_idx, column=col, value=value)
+            cell.fill = gray_fill
+        
+        # Row 15-16: 이상치 필터 범위 (IQR 필터는 1stQuat-4IQR / 3rdQuat+4IQR 수식, 그 외는 값)
+        formulas = limit_formulas(col_letter, data_range, sigma_k, filter_threshold, outlier_filter)
+        for row_idx, bound in ((15, filter_result["lower"]), (16, filter_result["upper"])):
+            cell = ws_tinh.cell(row=row_idx, column=col,
+                                value=formulas.get(row_idx, filter_bound_value(bound[net_idx])))
+            cell.fill = gray_fill
+        
+        # Row 17-18: Python에서 직접 계산한 값 (노란색 배경)
+        # Row 19-20: Excel 수식 (Row 17, 18 참조하므로 자동 계산)
+        # Row 29: 필터 후 사용한 측정값 개수
+        cell = ws_tinh.cell(row=TINH_RETAINED_ROW, column=col, value=int(filter_result["retained"][net_idx]))
+        cell.fill = yellow_fill
+        
+        if net_counts[net_idx] > 0:
+            avg_ifs = float(filter_result["avg_ifs"][net_idx])
+            std_ifs = float(filter_result["std_ifs"][net_idx])
+            
+            # Row 17: (A)AverageIfs - 값으로 저장
+            cell = ws_tinh.cell(row=17, column=col, value=avg_ifs)
+            cell.fill = yellow_fill
+            
+            # Row 18: (B)Stdev ifs - 값으로 저장
+            cell = ws_tinh.cell(row=18, column=col, value=std_ifs)
+            cell.fill = yellow_fill
+            
+            calc_lsl[net_idx] = np.floor(max(0, avg_ifs - sigma_k * std_ifs) * 1000) / 1000
+            calc_usl[net_idx] = np.ceil((avg_ifs + sigma_k * std_ifs) * 1000) / 1000
+        else:
+            # 데이터가 없는 경우 빈 셀
+            cell = ws_tinh.cell(row=17, column=col, value="")
+            cell.fill = yellow_fill
+            cell = ws_tinh.cell(row=18, column=col, value="")
+            cell.fill = yellow_fill
+        
+        # Row 19: LSL(A-3B), Row 20: USL(A+3B) - 수식으로 저장 (Row 17, 18 참조)
+        for row_idx in (19, 20):
+            cell = ws_tinh.cell(row=row_idx, column=col, value=formulas[row_idx])
+            cell.fill = yellow_fill
+    
+    debug_info.append(f"{sheet_name}: {x} NETs, {total_cal_rows} measurements each "
+                      f"({'values' if sheets.row_sharded else 'formulas'} applied)")
+    if len(sheets.pairs) > 1:
+        debug_info.append(f"{sheet_name}: split into {len(sheets.pairs)} sheets (Excel grid limit)")
+    
+    # Row 21-24: 3σ 규격 기준 공정 능력 지수 (모든 NET 한 번에 계산)
+    with stage("capability"):
+        capability_sigma = calculate_capability(net_matrix, calc_lsl, calc_usl)
+    write_capability_rows(sheets, capability_sigma, TINH_CAPABILITY_START_ROW, capability_fill)
+    
+    # Row 7-8: UnderNG/OverNG - 3σ 규격을 벗어난 측정값 개수 (전체 행렬 한 번에 비교)
+    ng = count_out_of_spec(net_matrix, calc_lsl, calc_usl)
+    for net_idx in range(x):
+        sheets.cell(row=7, net_idx=net_idx, value=int(ng["under_count"][net_idx]))
+        sheets.cell(row=8, net_idx=net_idx, value=int(ng["over_count"][net_idx]))
+    
+    # Row 30-37: 부트스트랩 신뢰구간 (선택 사항, 같은 필터/시그마 배수를 재표본마다 적용)
+    bootstrap_ci = None
+    if bootstrap_resamples > 0:
+        with stage("bootstrap", resamples=bootstrap_resamples):
+            bootstrap_ci = bootstrap_limits(net_matrix, sigma_k, outlier_filter, filter_threshold,
+                                            n_resamples=bootstrap_resamples, cancel_token=cancel_token)
+        write_bootstrap_rows(sheets, bootstrap_ci, TINH_CI_START_ROW, yellow_fill)
+        debug_info.append(f"Bootstrap CI: {bootstrap_resamples} resamples × {x} NETs")
+    
+    # 열 너비 조정
+    for ws_tinh, shard in sheets.pairs:
+        ws_tinh.column_dimensions['A'].width = 15
+        for col in range(2, shard["net_end"] - shard["net_start"] + 2):
+            ws_tinh.column_dimensions[get_column_letter(col)].width = 12
+    
+    return {
+        "lsl": calc_lsl,
+        "usl": calc_usl,
+        "filter": filter_result,
+        "counts": net_counts,
+        "capability": capability_sigma,
+        "ng": ng,
+        "bootstrap": bootstrap_ci,
+        "sheets": sheets,
+        "debug": debug_info,
+    }
+
+
+def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, operator: str = "",
+                           output_dir: str = "", sigma_k=SIGMA_K, filter_threshold=None,
+                           guard_band=GUARD_BAND_MOHM, outlier_filter: str = DEFAULT_OUTLIER_FILTER,
+                           bootstrap_resamples: int = 0, methods=None, columnar_format: str = "",
+                           write_sap_xep: bool = True, cancel_token=None) -> str:
     """
     merged_file의 모든 데이터를 처리하여 통계 계산
     
     처리 과정:
-    1. merged file 시트: 원본 데이터 추출 (G열부터, Row 4부터)
+    1. merged file 읽기: 원본 데이터 추출 (G열부터, Row 4부터) → NET x 측정값 행렬
     2. Sap xep 시트: 데이터 재배열 (N개씩 잘라서 옆으로)
-    3. tinh LCLUCL 시트: 통계 계산
+    3. tinh LCLUCL 시트: 통계 계산 + 공정 능력 지수 (3σ 규격 / ERS 규격)
+       다른 Method는 같은 레이아웃의 tinh LCLUCL M<Method> 시트
+    4. Calculate USL LSL 시트: 규격 비교 + 공정 능력 지수 열
+    Sap xep / tinh LCLUCL / NG index가 Excel 시트 한도를 넘으면 번호가 붙은 시트로 나누고
+    Shard index 시트에 범위 기록 (logic.sheet_shards)
     
     Args:
         merged_file: merged_file.xlsx 경로
         dcr_file: DCR_format_yamaha.xlsx 경로
         output_file: 출력 파일 경로
+        operator: 작업자 이름 (플롯 파일명)
+        output_dir: 플롯 출력 디렉토리
+        sigma_k: LSL/USL 시그마 배수
+        filter_threshold: 이상치 필터 임계값 (None이면 필터 기본값, IQR 필터는 IQR 배수)
+        guard_band: On machine 규격 guard band (mΩ)
+        outlier_filter: AverageIfs/Stdev ifs 이상치 필터 ("iqr", "mad", "sigma_clip", "esd")
+        bootstrap_resamples: 부트스트랩 재표본 수 (0이면 신뢰구간 계산 안 함)
+        methods: 통계를 낼 Method 값 목록 (None이면 파일에 있는 모든 Method)
+            Method 3(PRIMARY_METHOD)은 항상 포함되어 Calculate USL LSL / DCR 규격에 사용
+        columnar_format: 측정값 행렬/NET별 통계를 결과 파일 옆에 컬럼 형식으로도 저장 ("npz", "parquet", "csv",
+            빈 문자열이면 저장 안 함, 다른 Method는 Method마다 "_M<Method>" 파일, logic.columnar_export)
+        write_sap_xep: Sap xep 시트(측정값 행렬 복사본) 작성 여부 - 컬럼 형식 파일로 대신할 때 False
+        cancel_token: 취소 요청 토큰 (logic.cancellation.CancelToken, None이면 확인 안 함)
+            취소되면 에러 메시지 대신 OperationCancelled 발생
         
     Returns:
         결과 메시지
     """
+    # 단계별 실행 시간/메모리 기록 (logic.instrumentation, 기록 중이 아니면 아무것도 하지 않음)
+    phases = StageSequence()
+    columnar = None
     try:
         debug_info = []
+        if filter_threshold is None:
+            filter_threshold = default_filter_threshold(outlier_filter)
         
         # 1. DCR 파일에서 x (N) 값 가져오기
+        phases.next("read")
         x = get_x_from_dcr(dcr_file)
         if x == 0:
             return "Error: Could not get x value from DCR file"
@@ -322,21 +1063,18 @@ def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, op
             return f"Error: Merged file not found: {merged_file}"
         
         df = pd.read_excel(merged_file, sheet_name=0, header=None)
+        check_cancelled(cancel_token)
         debug_info.append(f"Merged file original shape: {df.shape}")
         
-        # Method=3인 행만 필터링 (Column D = index 3)
-        # Row 0은 헤더이므로 Row 1부터 필터링
-        method_col = 3  # Column D (0-indexed)
-        data_col_start = 6  # Column G (0-indexed)
+        # Method 값별로 행 나누기 (Column D, Row 0은 헤더) - 파일은 한 번만 읽고 한 번에 그룹화
+        data_col_start = DATA_COL_START
+        phases.next("filter")
+        method_groups = split_by_method(df, methods)
+        debug_info.append("Method rows: " + ", ".join(
+            f"{method_value}={len(group_df)}" for method_value, group_df in method_groups.items()))
         
-        # Method=3인 행의 인덱스 찾기 (헤더 제외)
-        method_3_mask = df.iloc[1:, method_col] == 3
-        method_3_indices = method_3_mask[method_3_mask].index.tolist()
-        
-        debug_info.append(f"Method=3 rows: {len(method_3_indices)}")
-        
-        # Method=3인 행만 추출
-        df_filtered = df.iloc[method_3_indices]
+        # Method=3인 행 (Calculate USL LSL / DCR 규격 기준)
+        df_filtered = method_groups[PRIMARY_METHOD]
         
         # 메타데이터 추출 (Method=3인 행들의 PinA, PinB)
         meta_pina = df_filtered.iloc[:, 0].values  # A열 (PinA)
@@ -352,303 +1090,134 @@ def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, op
         debug_info.append(f"Data rows: {num_rows}, cols: {num_cols}")
         debug_info.append(f"Sets per column: {num_sets_per_col}")
         
-        # 출력 워크북 생성
-        wb_out = openpyxl.Workbook()
-        
-        # ============================================
-        # Sheet 1: merged file (원본 데이터 추출)
-        # G열부터, Row 4부터의 데이터만 추출
-        # ============================================
-        ws_merged = wb_out.active
-        ws_merged.title = "merged file"
-        
-        # 데이터를 복사 (숫자로 변환 가능한 것은 숫자로, 아니면 문자로)
-        for row_idx in range(num_rows):
-            for col_idx in range(num_cols):
-                val = data_df.iloc[row_idx, col_idx]
-                if pd.notna(val):
-                    converted_val = convert_to_number_if_possible(val)
-                    if converted_val is not None:
-                        ws_merged.cell(row=row_idx + 1, column=col_idx + 1, value=converted_val)
-        
-        debug_info.append(f"merged file sheet: {num_rows} rows × {num_cols} cols")
+        # NET x 측정값 행렬 (통계/공정 능력/플롯 공용), 측정값 x NET 값 목록 (시트 작성용)
+        phases.next("reshape", nets=x)
+        net_matrix = build_net_matrix(data_df, x, num_sets_per_col)
+        measurement_grid = build_measurement_grid(data_df, x, num_sets_per_col)
         
-        # ============================================
-        # Sheet 2: Cal_merged (데이터 재배열 - transpose)
-        # Excel 열 한계(16,384)를 피하기 위해 transpose해서 저장
-        # - 행: 각 측정값 (piece × set)
-        # - 열: 각 NET (1~x)
-        # 문자열 데이터도 그대로 포함
-        # ============================================
-        ws_cal = wb_out.create_sheet("Cal_merged")
-        
-        # 원본 데이터 사용 (숫자 변환 없음, 문자열도 포함)
-        total_measurements = num_cols * num_sets_per_col  # 총 측정 횟수
-        
-        # 각 측정(행)에 대해 모든 NET의 값을 열로 나열
-        current_row = 1
-        
-        for set_idx in range(num_sets_per_col):  # 각 세트
-            for piece_idx in range(num_cols):  # 각 piece
-                # 이 측정의 각 NET 값을 열로 쓰기
-                for net_idx in range(x):
-                    row_in_merged = set_idx * x + net_idx  # merged_file에서의 행 위치
-                    
-                    if row_in_merged < data_df.shape[0]:
-                        val = data_df.iloc[row_in_merged, piece_idx]
-                        # 숫자로 변환 가능한 것은 숫자로, 아니면 문자로
-                        if pd.notna(val):
-                            converted_val = convert_to_number_if_possible(val)
-                            if converted_val is not None:
-                                ws_cal.cell(row=current_row, column=net_idx + 1, value=converted_val)
-                
-                current_row += 1
+        # 컬럼 형식 내보내기 (선택 사항): 측정값 파일은 아래 시트를 작성하는 동안 워커 스레드에서 저장
+        if columnar_format:
+            columnar = ColumnarExport(output_file, columnar_format)
+            columnar.start(net_matrix, meta_pina, meta_pinb, PRIMARY_METHOD)
         
-        total_cal_rows = current_row - 1
-        debug_info.append(f"Cal_merged: {total_cal_rows} measurement rows × {x} NET cols")
+        # 출력 워크북 생성 (기본 시트는 쓰지 않음)
+        wb_out = openpyxl.Workbook()
+        wb_out.remove(wb_out.active)
+        total_cal_rows = len(measurement_grid)
         
         # ============================================
-        # Sheet 3: Sap xep (메타데이터 + 데이터)
-        # Cal_merged와 같은 구조 (행=측정값, 열=NET) + 메타데이터
+        # Sheet 1: Sap xep (메타데이터 + 데이터)
+        # 행=측정값, 열=NET + 메타데이터 (Excel 시트 한도를 넘으면 "Sap xep (2)" ... 로 분할)
         # ============================================
-        ws_sap = wb_out.create_sheet("Sap xep")
-        
-        # 헤더 정보 (Row 1-5)
-        ws_sap.cell(row=1, column=1, value="Input data")
-        ws_sap.cell(row=1, column=2, value="NET count")
-        ws_sap.cell(row=1, column=3, value=x)
-        ws_sap.cell(row=2, column=2, value="Piece count")
-        ws_sap.cell(row=2, column=3, value=num_cols)
-        ws_sap.cell(row=3, column=2, value="Sets per piece")
-        ws_sap.cell(row=3, column=3, value=num_sets_per_col)
-        ws_sap.cell(row=4, column=2, value="Total measurements")
-        ws_sap.cell(row=4, column=3, value=total_cal_rows)
-        
-        # Row 6: NET 번호 헤더
-        ws_sap.cell(row=6, column=1, value="NET No")
-        for net_idx in range(x):
-            ws_sap.cell(row=6, column=net_idx + 2, value=net_idx + 1)
-        
-        # Row 7-12: 메타데이터 (PinA, PinB 등)
-        ws_sap.cell(row=7, column=1, value="PinA")
-        ws_sap.cell(row=8, column=1, value="PinB")
-        ws_sap.cell(row=9, column=1, value="StatementID")
-        ws_sap.cell(row=10, column=1, value="Method")
-        ws_sap.cell(row=11, column=1, value="Threshold L")
-        ws_sap.cell(row=12, column=1, value="Threshold U")
-        
-        # PinA, PinB 데이터 채우기 (숫자로 변환 가능한 것은 숫자로)
-        for net_idx in range(x):
-            if net_idx < len(meta_pina):
-                val = meta_pina[net_idx]
-                if pd.notna(val):
-                    converted_val = convert_to_number_if_possible(val)
-                    if converted_val is not None:
-                        ws_sap.cell(row=7, column=net_idx + 2, value=converted_val)
-            if net_idx < len(meta_pinb):
-                val = meta_pinb[net_idx]
-                if pd.notna(val):
-                    converted_val = convert_to_number_if_possible(val)
-                    if converted_val is not None:
-                        ws_sap.cell(row=8, column=net_idx + 2, value=converted_val)
-        
-        # Row 13~: Cal_merged 데이터를 복사 (문자열 포함)
-        # Cal_merged: 행=측정값, 열=NET (이미 같은 구조)
-        data_start_excel_row = 13
         total_data_rows = total_cal_rows
-        
-        for measure_idx in range(total_cal_rows):
-            excel_row = data_start_excel_row + measure_idx
-            for net_idx in range(x):
-                val = ws_cal.cell(row=measure_idx + 1, column=net_idx + 1).value
-                # 모든 값 복사 (None이 아닌 경우, 문자열 포함)
-                if val is not None:
-                    ws_sap.cell(row=excel_row, column=net_idx + 2, value=val)
-        
-        debug_info.append(f"Sap xep: {total_data_rows} data rows × {x} NET columns")
-        
-        # ============================================
-        # Sheet 4: tinh LCLUCL (통계 계산 - Excel 수식 사용)
-        # ============================================
-        ws_tinh = wb_out.create_sheet("tinh LCLUCL")
-        
-        # 스타일 정의
-        yellow_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-        gray_fill = PatternFill(start_color="C0C0C0", end_color="C0C0C0", fill_type="solid")
-        header_font = Font(bold=True)
-        
-        # A열 헤더 (행 레이블)
-        row_labels = [
-            "NET no",           # Row 1
-            "PinA",             # Row 2
-            "PinB",             # Row 3
-            "Method",           # Row 4
-            "Threshold L",      # Row 5
-            "Threshold U",      # Row 6
-            "UnderNG",          # Row 7
-            "OverNG",           # Row 8
-            "Min",              # Row 9
-            "Max",              # Row 10
-            "Average",          # Row 11
-            "Median",           # Row 12
-            "Stdev",            # Row 13
-            "IQR",              # Row 14
-            "1stQuat-4IQR",     # Row 15
-            "3rdQuat+4IQR",     # Row 16
-            "(A)AverageIfs",    # Row 17
-            "(B)Stdev ifs",     # Row 18
-            "LSL(A-3B)",        # Row 19
-            "USL(A+3B)",        # Row 20
-        ]
-        
-        for row_idx, label in enumerate(row_labels, start=1):
-            cell = ws_tinh.cell(row=row_idx, column=1, value=label)
-            cell.font = header_font
-            # A열에도 색상 적용 (Row 9-16: 회색, Row 17-20: 노란색)
-            if 9 <= row_idx <= 16:
-                cell.fill = gray_fill
-            elif 17 <= row_idx <= 20:
-                cell.fill = yellow_fill
-        
-        # 데이터 끝 행 계산 (Row 21부터 데이터 시작)
-        data_start_row = 21
-        data_end_row = data_start_row + total_cal_rows - 1
-        
-        # 각 NET 열에 대해 처리
-        for net_idx in range(x):
-            col = net_idx + 2  # B열부터 시작 (tinh LCLUCL 시트)
-            col_letter = get_column_letter(col)
-            
-            # Row 1: NET 번호
-            ws_tinh.cell(row=1, column=col, value=net_idx + 1)
-            
-            # Row 2-3: 메타데이터 (숫자로 변환 가능한 것은 숫자로)
-            if net_idx < len(meta_pina):
-                val = meta_pina[net_idx]
-                if pd.notna(val):
-                    converted_val = convert_to_number_if_possible(val)
-                    ws_tinh.cell(row=2, column=col, value=converted_val if converted_val is not None else "")
-            if net_idx < len(meta_pinb):
-                val = meta_pinb[net_idx]
-                if pd.notna(val):
-                    converted_val = convert_to_number_if_possible(val)
-                    ws_tinh.cell(row=3, column=col, value=converted_val if converted_val is not None else "")
-            
-            # Row 4-6: 빈 값
-            ws_tinh.cell(row=7, column=col, value=0)  # UnderNG
-            ws_tinh.cell(row=8, column=col, value=0)  # OverNG
+        if write_sap_xep:
+            phases.next("sheet Sap xep")
+            sap_sheets = NetColumnSheets.create(wb_out, "Sap xep", x, total_cal_rows, SAP_DATA_START_ROW)
             
-            # Row 21~: Cal_merged에서 모든 값을 그대로 복사 (문자열 포함)
-            for measure_row in range(1, total_cal_rows + 1):
-                val = ws_cal.cell(row=measure_row, column=net_idx + 1).value
-                # 모든 값 저장 (None이 아닌 경우, 문자열 포함)
-                if val is not None:
-                    ws_tinh.cell(row=data_start_row + measure_row - 1, column=col, value=val)
-            
-            # 데이터 범위 문자열 생성
-            data_range = f"{col_letter}${data_start_row}:{col_letter}${data_end_row}"
-            
-            # Row 9-16: Excel 수식 (회색 배경)
-            # Row 9: Min
-            cell = ws_tinh.cell(row=9, column=col, value=f"=MIN({data_range})")
-            cell.fill = gray_fill
-            
-            # Row 10: Max
-            cell = ws_tinh.cell(row=10, column=col, value=f"=MAX({data_range})")
-            cell.fill = gray_fill
-            
-            # Row 11: Average
-            cell = ws_tinh.cell(row=11, column=col, value=f"=AVERAGE({data_range})")
-            cell.fill = gray_fill
-            
-            # Row 12: Median
-            cell = ws_tinh.cell(row=12, column=col, value=f"=MEDIAN({data_range})")
-            cell.fill = gray_fill
-            
-            # Row 13: Stdev
-            cell = ws_tinh.cell(row=13, column=col, value=f"=STDEV({data_range})")
-            cell.fill = gray_fill
-            
-            # Row 14: IQR = Q3 - Q1
-            cell = ws_tinh.cell(row=14, column=col, 
-                value=f"=QUARTILE({data_range},3)-QUARTILE({data_range},1)")
-            cell.fill = gray_fill
-            
-            # Row 15: 1stQuat-4IQR
-            cell = ws_tinh.cell(row=15, column=col, 
-                value=f"=IF(QUARTILE({data_range},1)-(4*{col_letter}14)<0,0,QUARTILE({data_range},1)-(4*{col_letter}14))")
-            cell.fill = gray_fill
-            
-            # Row 16: 3rdQuat+4IQR
-            cell = ws_tinh.cell(row=16, column=col, 
-                value=f"=QUARTILE({data_range},3)+(4*{col_letter}14)")
-            cell.fill = gray_fill
-            
-            # Row 17-18: Python에서 직접 계산한 값 (노란색 배경)
-            # Row 19-20: Excel 수식 (Row 17, 18 참조하므로 자동 계산)
-            
-            # Cal_merged에서 해당 NET의 숫자 값만 수집
-            net_values = []
-            for measure_row in range(1, total_cal_rows + 1):
-                val = ws_cal.cell(row=measure_row, column=net_idx + 1).value
-                if val is not None and isinstance(val, (int, float)):
-                    net_values.append(float(val))
-            
-            if len(net_values) > 0:
-                net_arr = np.array(net_values)
+            for ws_sap, _ in sap_sheets.header_sheets():
+                # 헤더 정보 (Row 1-5)
+                ws_sap.cell(row=1, column=1, value="Input data")
+                ws_sap.cell(row=1, column=2, value="NET count")
+                ws_sap.cell(row=1, column=3, value=x)
+                ws_sap.cell(row=2, column=2, value="Piece count")
+                ws_sap.cell(row=2, column=3, value=num_cols)
+                ws_sap.cell(row=3, column=2, value="Sets per piece")
+                ws_sap.cell(row=3, column=3, value=num_sets_per_col)
+                ws_sap.cell(row=4, column=2, value="Total measurements")
+                ws_sap.cell(row=4, column=3, value=total_cal_rows)
                 
-                # IQR 범위 계산 (Row 15, 16의 값)
-                q1 = np.percentile(net_arr, 25)
-                q3 = np.percentile(net_arr, 75)
-                iqr = q3 - q1
-                lower_bound = max(0, q1 - 4 * iqr)  # 1stQuat-4IQR
-                upper_bound = q3 + 4 * iqr          # 3rdQuat+4IQR
+                # Row 6: NET 번호 헤더
+                ws_sap.cell(row=6, column=1, value="NET No")
                 
-                # 범위 내의 값만 필터링
-                filtered = net_arr[(net_arr > lower_bound) & (net_arr < upper_bound)]
-                
-                if len(filtered) > 0:
-                    avg_ifs = np.mean(filtered)
-                    std_ifs = np.std(filtered, ddof=1) if len(filtered) > 1 else 0
-                else:
-                    avg_ifs = np.mean(net_arr)
-                    std_ifs = np.std(net_arr, ddof=1) if len(net_arr) > 1 else 0
-                
-                # Row 17: (A)AverageIfs - 값으로 저장
-                cell = ws_tinh.cell(row=17, column=col, value=avg_ifs)
-                cell.fill = yellow_fill
-                
-                # Row 18: (B)Stdev ifs - 값으로 저장
-                cell = ws_tinh.cell(row=18, column=col, value=std_ifs)
-                cell.fill = yellow_fill
-            else:
-                # 데이터가 없는 경우 빈 셀
-                cell = ws_tinh.cell(row=17, column=col, value="")
-                cell.fill = yellow_fill
-                cell = ws_tinh.cell(row=18, column=col, value="")
-                cell.fill = yellow_fill
+                # Row 7-12: 메타데이터 (PinA, PinB 등)
+                ws_sap.cell(row=7, column=1, value="PinA")
+                ws_sap.cell(row=8, column=1, value="PinB")
+                ws_sap.cell(row=9, column=1, value="StatementID")
+                ws_sap.cell(row=10, column=1, value="Method")
+                ws_sap.cell(row=11, column=1, value="Threshold L")
+                ws_sap.cell(row=12, column=1, value="Threshold U")
             
-            # Row 19: LSL(A-3B) - 수식으로 저장 (Row 17, 18 참조)
-            cell = ws_tinh.cell(row=19, column=col, 
-                value=f"=ROUNDDOWN(IF({col_letter}17-(3*{col_letter}18)<0,0,{col_letter}17-(3*{col_letter}18)),3)")
-            cell.fill = yellow_fill
+            # NET 번호, PinA, PinB 데이터 채우기 (숫자로 변환 가능한 것은 숫자로)
+            for net_idx in range(x):
+                sap_sheets.cell(row=6, net_idx=net_idx, value=net_idx + 1)
+                if net_idx < len(meta_pina):
+                    val = meta_pina[net_idx]
+                    if pd.notna(val):
+                        converted_val = convert_to_number_if_possible(val)
+                        if converted_val is not None:
+                            sap_sheets.cell(row=7, net_idx=net_idx, value=converted_val)
+                if net_idx < len(meta_pinb):
+                    val = meta_pinb[net_idx]
+                    if pd.notna(val):
+                        converted_val = convert_to_number_if_possible(val)
+                        if converted_val is not None:
+                            sap_sheets.cell(row=8, net_idx=net_idx, value=converted_val)
             
-            # Row 20: USL(A+3B) - 수식으로 저장 (Row 17, 18 참조)
-            cell = ws_tinh.cell(row=20, column=col, 
-                value=f"=ROUNDUP({col_letter}17+(3*{col_letter}18),3)")
-            cell.fill = yellow_fill
-        
-        debug_info.append(f"tinh LCLUCL: {x} NETs, {total_cal_rows} measurements each (formulas applied)")
+            # Row 13~: 측정값 복사 (문자열 포함, 행=측정값, 열=NET)
+            for ws_sap, shard in sap_sheets.pairs:
+                net_start, net_end = shard["net_start"], shard["net_end"]
+                for excel_row, row_values in enumerate(measurement_grid[shard["row_start"]:shard["row_end"]],
+                                                       start=shard["data_start_row"]):
+                    check_cancelled(cancel_token)
+                    for col_idx, val in enumerate(row_values[net_start:net_end], start=2):
+                        # 모든 값 복사 (None이 아닌 경우, 문자열 포함)
+                        if val is not None:
+                            ws_sap.cell(row=excel_row, column=col_idx, value=val)
+            
+            debug_info.append(f"Sap xep: {total_data_rows} data rows × {x} NET columns")
+            if len(sap_sheets.pairs) > 1:
+                debug_info.append(f"Sap xep: split into {len(sap_sheets.pairs)} sheets (Excel grid limit)")
+        else:
+            debug_info.append("Sap xep: skipped")
         
-        # 열 너비 조정
-        ws_tinh.column_dimensions['A'].width = 15
-        for col in range(2, x + 2):
-            ws_tinh.column_dimensions[get_column_letter(col)].width = 12
+        # ============================================
+        # Sheet 2: tinh LCLUCL (통계 계산 - Excel 수식 사용)
+        # ============================================
+        phases.next("sheet tinh LCLUCL", nets=x, measurements=len(measurement_grid))
+        tinh = write_tinh_sheet(wb_out, "tinh LCLUCL", measurement_grid, net_matrix, meta_pina, meta_pinb,
+                                PRIMARY_METHOD, sigma_k, filter_threshold, outlier_filter, bootstrap_resamples,
+                                cancel_token)
+        debug_info.extend(tinh["debug"])
+        calc_lsl, calc_usl = tinh["lsl"], tinh["usl"]
+        filter_result, net_counts = tinh["filter"], tinh["counts"]
+        capability_sigma = tinh["capability"]
+        # Calculate USL LSL / DCR 규격에 쓰는 AverageIfs, Stdev ifs (tinh LCLUCL Row 17-18 값, 데이터가 없으면 None)
+        avg_ifs_values = [float(v) if n > 0 else None for v, n in zip(filter_result["avg_ifs"], net_counts)]
+        std_ifs_values = [float(v) if n > 0 else None for v, n in zip(filter_result["std_ifs"], net_counts)]
+        capability_ers = None
+        ers_limits = None
+        ng_results = {"3σ": tinh["ng"]}
+        bootstrap_ci = tinh["bootstrap"]
+        capability_fill = PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid")
+        
+        # 다른 Method: 같은 레이아웃의 "tinh LCLUCL M<Method>" 시트 (3σ 통계/공정 능력까지)
+        method_summaries = []
+        for method_value, group_df in method_groups.items():
+            if method_value == PRIMARY_METHOD:
+                continue
+            phases.next(f"sheet {method_sheet_name(method_value)}")
+            method_data = group_df.iloc[:, data_col_start:]
+            method_sets = method_data.shape[0] // x
+            method_matrix = build_net_matrix(method_data, x, method_sets)
+            method_pina, method_pinb = group_df.iloc[:, 0].values, group_df.iloc[:, 1].values
+            method_tinh = write_tinh_sheet(wb_out, method_sheet_name(method_value),
+                                           build_measurement_grid(method_data, x, method_sets),
+                                           method_matrix, method_pina, method_pinb,
+                                           method_value, sigma_k, filter_threshold, outlier_filter,
+                                           cancel_token=cancel_token)
+            debug_info.extend(method_tinh["debug"])
+            method_summaries.append(method_summary(method_value, method_tinh))
+            if columnar is not None:
+                # Method별 측정값/통계 파일 (워커 스레드에서 저장)
+                columnar.add_method(method_label(method_value), method_matrix, method_pina, method_pinb,
+                                    method_value,
+                                    statistics_columns(method_matrix, method_pina, method_pinb, method_tinh))
         
         # ============================================
-        # Sheet 5: Calculate USL LSL
+        # Sheet 3: Calculate USL LSL
         # 참조: Calculator LSL,USL 1.xlsm의 "Calculate USL, LSL " 시트
         # ============================================
+        phases.next("sheet Calculate USL LSL")
         ws_calc = wb_out.create_sheet("Calculate USL LSL")
         
         # 색상 정의
@@ -699,6 +1268,9 @@ def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, op
                 # ===== Row 1-2: 상단 텍스트 =====
                 ws_calc.cell(row=1, column=2, value="Yamaha: ± ( 5mohm)")
                 ws_calc.cell(row=2, column=2, value="Taiyo: ± ( 10mohm)")
+                ws_calc.cell(row=1, column=17, value="Limit parameters").font = header_font
+                ws_calc.cell(row=2, column=17,
+                             value=limit_parameter_text(sigma_k, filter_threshold, guard_band, outlier_filter))
                 
                 # ===== Row 3: 헤더 1 (병합 셀 포함) =====
                 # A: No
@@ -776,6 +1348,31 @@ def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, op
                 ws_calc.cell(row=4, column=19, value="LSL")
                 ws_calc.cell(row=4, column=20, value="USL")
                 
+                # U-X, Y-AB: 공정 능력 지수 (3σ 규격, ERS 규격)
+                for group_idx, spec_name in enumerate(("3σ", "ERS")):
+                    first_col = CALC_CAPABILITY_START_COL + group_idx * len(CAPABILITY_INDICES)
+                    last_col = first_col + len(CAPABILITY_INDICES) - 1
+                    cell = ws_calc.cell(row=3, column=first_col, value=f"Capability ({spec_name})")
+                    cell.font = header_font
+                    cell.fill = light_blue_fill
+                    ws_calc.merge_cells(f"{get_column_letter(first_col)}3:{get_column_letter(last_col)}3")
+                    for offset, index_name in enumerate(CAPABILITY_INDICES):
+                        ws_calc.cell(row=4, column=first_col + offset, value=index_name)
+                
+                # AC-AD, AE-AF: NG 개수 (3σ 규격, ERS 규격)
+                for group_idx, spec_name in enumerate(("3σ", "ERS")):
+                    first_col = CALC_NG_START_COL + group_idx * 2
+                    cell = ws_calc.cell(row=3, column=first_col, value=f"NG count ({spec_name})")
+                    cell.font = header_font
+                    cell.fill = yellow_fill
+                    ws_calc.merge_cells(f"{get_column_letter(first_col)}3:{get_column_letter(first_col + 1)}3")
+                    ws_calc.cell(row=4, column=first_col, value="Under")
+                    ws_calc.cell(row=4, column=first_col + 1, value="Over")
+                
+                # ERS 규격 (측정값 단위로 환산, 공정 능력 계산용)
+                ers_lsl_arr = np.full(x, np.nan)
+                ers_usl_arr = np.full(x, np.nan)
+                
                 # ===== DCR에서 데이터 가져오기 =====
                 # DCR 시트 구조: Row 2-3 헤더, Row 4부터 데이터
                 # DCR 열: C=No, D=Net name, E-F=pin1(BtoB), G-H=pin2(ACF), 
@@ -783,8 +1380,8 @@ def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, op
                 dcr_data_start = 4  # DCR 데이터 시작 행
                 
                 for net_idx in range(min(x, data_count)):
+                    check_cancelled(cancel_token)
                     row_idx = data_start_row + net_idx  # 출력 행 (Row 5부터)
-                    tinh_col = net_idx + 2  # tinh LCLUCL의 B열부터
                     dcr_row = dcr_data_start + net_idx  # DCR 시트의 Row 4부터
                     
                     # A: No (DCR C열)
@@ -821,10 +1418,16 @@ def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, op
                     ws_calc.cell(row=row_idx, column=7, value=ers_nominal)  # ERS Nominal
                     ws_calc.cell(row=row_idx, column=8, value=ers_lsl)      # ERS LSL
                     ws_calc.cell(row=row_idx, column=9, value=ers_usl)      # ERS USL
+                    ers_lsl_num = convert_to_number_if_possible(ers_lsl)
+                    ers_usl_num = convert_to_number_if_possible(ers_usl)
+                    if isinstance(ers_lsl_num, (int, float)):
+                        ers_lsl_arr[net_idx] = ers_lsl_num / ERS_UNIT_SCALE
+                    if isinstance(ers_usl_num, (int, float)):
+                        ers_usl_arr[net_idx] = ers_usl_num / ERS_UNIT_SCALE
                     
-                    # 계산된 LSL/USL 값 (tinh LCLUCL에서)
-                    avg_ifs = ws_tinh.cell(row=17, column=tinh_col).value
-                    std_ifs = ws_tinh.cell(row=18, column=tinh_col).value
+                    # 계산된 LSL/USL 값 (tinh LCLUCL Row 17-18 값)
+                    avg_ifs = avg_ifs_values[net_idx]
+                    std_ifs = std_ifs_values[net_idx]
                     
                     lsl_val = None
                     usl_val = None
@@ -835,9 +1438,9 @@ def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, op
                             std_ifs = float(std_ifs)
                             
                             # Calculated LSL/USL (소수점)
-                            lsl_val = max(0, avg_ifs - 3 * std_ifs)
+                            lsl_val = max(0, avg_ifs - sigma_k * std_ifs)
                             lsl_val = np.floor(lsl_val * 1000) / 1000
-                            usl_val = avg_ifs + 3 * std_ifs
+                            usl_val = avg_ifs + sigma_k * std_ifs
                             usl_val = np.ceil(usl_val * 1000) / 1000
                         except:
                             pass
@@ -853,8 +1456,9 @@ def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, op
                         value=f'=IF(I{row_idx}="","",IF(K{row_idx}>I{row_idx},"NG","OK"))')
                     
                     # N-O: Internal raw (LSL*1000-5, USL*1000+5)
-                    ws_calc.cell(row=row_idx, column=14, value=f"=S{row_idx}-5")  # LSL
-                    ws_calc.cell(row=row_idx, column=15, value=f"=T{row_idx}+5")  # USL
+                    raw_lsl_formula, raw_usl_formula = guard_band_formulas(row_idx, guard_band)
+                    ws_calc.cell(row=row_idx, column=14, value=raw_lsl_formula)  # LSL
+                    ws_calc.cell(row=row_idx, column=15, value=raw_usl_formula)  # USL
                     
                     # Q-R: Calculated LSL, USL (값)
                     ws_calc.cell(row=row_idx, column=17, value=lsl_val)
@@ -864,6 +1468,31 @@ def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, op
                     ws_calc.cell(row=row_idx, column=19, value=f"=Q{row_idx}*1000")
                     ws_calc.cell(row=row_idx, column=20, value=f"=R{row_idx}*1000")
                 
+                # ERS 규격 기준 공정 능력 지수 → tinh LCLUCL Row 25-28
+                capability_ers = calculate_capability(net_matrix, ers_lsl_arr, ers_usl_arr)
+                ers_limits = (ers_lsl_arr, ers_usl_arr)
+                write_capability_rows(tinh["sheets"], capability_ers,
+                                      TINH_CAPABILITY_START_ROW + len(CAPABILITY_INDICES), capability_fill)
+                ng_results["ERS"] = count_out_of_spec(net_matrix, ers_lsl_arr, ers_usl_arr)
+                
+                # U-AB: 공정 능력 지수 열, AC-AF: NG 개수 열
+                for net_idx in range(min(x, data_count)):
+                    row_idx = data_start_row + net_idx
+                    for group_idx, capability in enumerate((capability_sigma, capability_ers)):
+                        first_col = CALC_CAPABILITY_START_COL + group_idx * len(CAPABILITY_INDICES)
+                        for offset, index_name in enumerate(CAPABILITY_INDICES):
+                            ws_calc.cell(row=row_idx, column=first_col + offset,
+                                         value=capability_cell_value(capability[index_name][net_idx]))
+                    for group_idx, ng in enumerate((ng_results["3σ"], ng_results["ERS"])):
+                        first_col = CALC_NG_START_COL + group_idx * 2
+                        ws_calc.cell(row=row_idx, column=first_col, value=int(ng["under_count"][net_idx]))
+                        ws_calc.cell(row=row_idx, column=first_col + 1, value=int(ng["over_count"][net_idx]))
+                
+                # AG-AN: 부트스트랩 신뢰구간 열
+                if bootstrap_ci is not None:
+                    write_bootstrap_columns(ws_calc, bootstrap_ci, data_start_row, min(x, data_count),
+                                            header_fill=yellow_fill)
+                
                 # 마지막 행 (GND-SUS): 모든 LSL/USL 값을 0, 50으로 고정
                 last_data_row = data_start_row + min(x, data_count) - 1
                 # J-K: Internal (반올림 값)
@@ -902,6 +1531,10 @@ def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, op
                     19: 12,  # S: *1000 LSL
                     20: 12,  # T: *1000 USL
                 }
+                for offset in range(2 * len(CAPABILITY_INDICES)):
+                    col_widths[CALC_CAPABILITY_START_COL + offset] = 9  # U-AB: 공정 능력 지수
+                for offset in range(4):
+                    col_widths[CALC_NG_START_COL + offset] = 8  # AC-AF: NG 개수
                 for col_idx, width in col_widths.items():
                     ws_calc.column_dimensions[get_column_letter(col_idx)].width = width
                 
@@ -914,14 +1547,17 @@ def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, op
             import traceback
             debug_info.append(f"Warning: Could not create Calculate USL LSL: {str(e)}")
         
-        # 중간 과정 시트 삭제 (merged file, Cal_merged)
-        sheets_to_delete = ["merged file", "Cal_merged"]
-        for sheet_name in sheets_to_delete:
-            if sheet_name in wb_out.sheetnames:
-                del wb_out[sheet_name]
-                debug_info.append(f"Deleted intermediate sheet: {sheet_name}")
-        
-        # 파일 저장
+        # NG index 시트: 규격을 벗어난 측정값 위치
+        phases.next("sheet NG index")
+        ng_rows = write_ng_index_sheet(wb_out, net_matrix, ng_results)
+        debug_info.append(f"NG index: {ng_rows} rows ({', '.join(ng_results)})")
+        
+        # 파일 저장 (적용한 파라미터는 문서 속성으로도 기록)
+        check_cancelled(cancel_token)
+        phases.next("save")
+        write_limit_parameters(wb_out, sigma_k, filter_threshold, guard_band, outlier_filter)
+        if bootstrap_ci is not None:
+            write_bootstrap_parameters(wb_out, bootstrap_resamples)
         wb_out.save(output_file)
         wb_out.close()
         
@@ -929,6 +1565,7 @@ def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, op
         # DCR_format_yamaha.xlsx 파일 업데이트
         # 계산된 LSL/USL 값을 3 sigma spec (L-M) 및 On machine (N-O) 열에 복사
         # ============================================
+        phases.next("DCR update")
         try:
             wb_dcr_update = openpyxl.load_workbook(dcr_file)
             if 'DCR' in wb_dcr_update.sheetnames:
@@ -937,36 +1574,28 @@ def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, op
                 
                 updated_count = 0
                 for net_idx in range(x):
+                    check_cancelled(cancel_token)
                     row_idx = dcr_data_start + net_idx
-                    tinh_col = net_idx + 2  # tinh LCLUCL의 B열부터
                     
                     # 마지막 행 (GND-SUS): 고정값 0, 50 사용
                     if net_idx == x - 1:
-                        # L-M열: 3 sigma spec (LSL=0, USL=50)
-                        ws_dcr_update.cell(row=row_idx, column=12, value=0)
-                        ws_dcr_update.cell(row=row_idx, column=13, value=50)
-                        # N-O열: On machine (LSL=0, USL=50)
-                        ws_dcr_update.cell(row=row_idx, column=14, value=0)
-                        ws_dcr_update.cell(row=row_idx, column=15, value=50)
+                        # L-M열: 3 sigma spec, N-O열: On machine (LSL=0, USL=50)
+                        for col_idx, val in zip((12, 13, 14, 15), LAST_NET_LIMITS_MOHM * 2):
+                            ws_dcr_update.cell(row=row_idx, column=col_idx, value=val)
                         updated_count += 1
                         continue
                     
-                    # tinh LCLUCL에서 AverageIfs, StdevIfs 값 가져오기
-                    avg_ifs = ws_tinh.cell(row=17, column=tinh_col).value
-                    std_ifs = ws_tinh.cell(row=18, column=tinh_col).value
+                    # tinh LCLUCL Row 17-18의 AverageIfs, StdevIfs 값
+                    avg_ifs = avg_ifs_values[net_idx]
+                    std_ifs = std_ifs_values[net_idx]
                     
                     if avg_ifs is not None and std_ifs is not None:
                         try:
                             avg_ifs = float(avg_ifs)
                             std_ifs = float(std_ifs)
                             
-                            # LSL/USL 계산
-                            lsl_calculated = max(0, avg_ifs - 3 * std_ifs)
-                            usl_calculated = avg_ifs + 3 * std_ifs
-                            
                             # Internal raw 계산: (LSL * 1000) - 5, (USL * 1000) + 5
-                            internal_lsl = int(lsl_calculated * 1000) - 5
-                            internal_usl = int(usl_calculated * 1000) + 5
+                            internal_lsl, internal_usl = machine_limits_mohm(avg_ifs, std_ifs, sigma_k, guard_band)
                             
                             # L-M열: 3 sigma spec (LSL, USL)
                             ws_dcr_update.cell(row=row_idx, column=12, value=internal_lsl)
@@ -980,6 +1609,7 @@ def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, op
                         except:
                             pass
                 
+                check_cancelled(cancel_token)
                 wb_dcr_update.save(dcr_file)
                 wb_dcr_update.close()
                 debug_info.append(f"Updated DCR file: {updated_count} rows with 3 sigma spec & On machine values")
@@ -988,56 +1618,60 @@ def calculate_lsl_usl_full(merged_file: str, dcr_file: str, output_file: str, op
         except Exception as e:
             debug_info.append(f"Warning: Could not update DCR file: {str(e)}")
         
+        # 컬럼 형식 내보내기: NET별 통계 파일 저장 + 측정값 파일 저장 완료 대기
+        columnar_result = ""
+        if columnar is not None:
+            phases.next("columnar export", format=columnar.format)
+            try:
+                columnar_files = columnar.finish(statistics_columns(
+                    net_matrix, meta_pina, meta_pinb, tinh, ers_limits, capability_ers, ng_results.get("ERS")))
+                columnar_result = columnar.summary(columnar_files)
+            except Exception as e:
+                debug_info.append(f"Warning: Columnar export failed - {str(e)}")
+        
         result = f"Success: Created {output_file}\n"
-        result += f"Sheet 'Sap xep': {total_data_rows} rows × {x} NET columns\n"
+        if write_sap_xep:
+            result += f"Sheet 'Sap xep': {total_data_rows} rows × {x} NET columns\n"
         result += f"Sheet 'tinh LCLUCL': {x} NETs × {total_data_rows} measurements\n"
         result += f"Sheet 'Calculate USL LSL': DCR data with calculated ERS values\n"
         result += f"Updated DCR_format_yamaha.xlsx: 3 sigma spec & On machine columns\n"
-        result += "Debug:\n  " + "\n  ".join(debug_info)
+        result += columnar_result
+        result += retained_summary(filter_result, net_counts)
+        if bootstrap_ci is not None:
+            result += bootstrap_summary(bootstrap_ci, bootstrap_resamples)
+        result += "".join(method_summaries)
+        result += capability_summary(capability_sigma, "3σ")
+        if capability_ers is not None:
+            result += capability_summary(capability_ers, "ERS")
+        for spec_name, ng in ng_results.items():
+            result += (f"NG ({spec_name}): Under {int(ng['under_count'].sum())}, "
+                       f"Over {int(ng['over_count'].sum())} measurements - see 'NG index' sheet\n")
         # ============================================
         # Visualization (Top NETs + Control 스타일)
+        # 3σ 규격과 위에서 계산한 공정 능력 지수를 그대로 사용
         # ============================================
+        phases.next("plots")
         try:
-            # NET별 데이터프레임 구성 (행=NET, 열=측정값)
-            data_by_net = []
-            for net_idx in range(x):
-                net_rows = data_df.iloc[net_idx::x, :]
-                flat_vals = []
-                for col in range(net_rows.shape[1]):
-                    col_vals = net_rows.iloc[:, col].tolist()
-                    for v in col_vals:
-                        cv = convert_to_number_if_possible(v)
-                        if cv is not None and not (isinstance(cv, float) and np.isnan(cv)):
-                            flat_vals.append(cv)
-                data_by_net.append(flat_vals)
-
-            data_by_net_df = pd.DataFrame(data_by_net)
-
-            # Python 기준 LSL/USL 계산
-            lsl_list = []
-            usl_list = []
-            for vals in data_by_net:
-                series = pd.Series([v for v in vals if pd.notna(v)])
-                avg = series.mean() if not series.empty else None
-                std = series.std() if not series.empty else None
-                if avg is None or std is None:
-                    lsl_list.append(None)
-                    usl_list.append(None)
-                else:
-                    lsl = max(0, avg - 3 * std)
-                    usl = avg + 3 * std
-                    lsl_list.append(lsl)
-                    usl_list.append(usl)
-
-            plots = save_lslusl_plots_from_data(data_by_net_df, lsl_list, usl_list, operator)
+            lsl_list = [None if np.isnan(v) else float(v) for v in calc_lsl]
+            usl_list = [None if np.isnan(v) else float(v) for v in calc_usl]
+            plots = save_lslusl_plots_from_data(pd.DataFrame(net_matrix), lsl_list, usl_list, operator,
+                                                output_dir=output_dir, capability=capability_sigma,
+                                                cancel_token=cancel_token)
             for p in plots:
                 debug_info.append(f"Plot saved: {p}")
         except Exception as e:
             debug_info.append(f"Warning: Plot generation failed - {str(e)}")
+        phases.close()
 
+        result += "Debug:\n  " + "\n  ".join(debug_info)
         return result
         
     except Exception as e:
         import traceback
+        phases.close("error")
         return f"Error: {str(e)}\n{traceback.format_exc()}"
+    finally:
+        phases.close()
+        if columnar is not None:
+            columnar.close()
 
@@ -0,0 +1,143 @@
+"""
+작업 취소 모듈
+UI의 Cancel 버튼 요청을 워커 스레드에서 실행 중인 단계 함수에 전달 (협조적 취소)
+- 단계 함수는 cancel_token 인자를 받아 단계 사이와 큰 반복문 안에서 check_cancelled() 호출
+- 취소되면 OperationCancelled 발생 → OutputRollback으로 출력 파일을 실행 전 상태로 복원
+"""
+
+import glob
+import os
+import shutil
+import tempfile
+import threading
+
+
+class OperationCancelled(BaseException):
+    """
+    사용자 취소 예외
+    단계 함수의 except Exception(에러 메시지 반환)에 잡히지 않도록 BaseException 상속
+    (asyncio.CancelledError와 같은 방식)
+    """
+
+
+class CancelToken:
+    """취소 요청 플래그 (GUI 스레드에서 cancel(), 워커 스레드에서 확인)"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """취소 요청"""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """취소 요청 여부"""
+        return self._event.is_set()
+
+
+def check_cancelled(cancel_token=None):
+    """
+    취소 요청이 있으면 OperationCancelled 발생
+
+    Args:
+        cancel_token: CancelToken (None이면 확인하지 않음)
+    """
+    if cancel_token is not None and cancel_token.cancelled:
+        raise OperationCancelled()
+
+
+class OutputRollback:
+    """
+    실행 중 생성/수정되는 출력 파일을 실행 전에 백업하고, 취소 시 실행 전 상태로 복원
+
+    사용 예:
+        rollback = OutputRollback()
+        rollback.protect_file(output_file)
+        rollback.protect_dir(plots_dir)
+        try:
+            ...
+        except OperationCancelled:
+            rollback.rollback()
+            raise
+        rollback.discard()
+    """
+
+    def __init__(self):
+        self._backup_dir = None
+        self._files = {}  # 경로 → 백업 경로 (None이면 실행 전에 없던 파일)
+        self._dirs = {}  # 디렉토리 → 실행 전 파일 이름 집합
+        self._patterns = []  # glob 패턴 (실행 중 새로 생긴 파일은 취소 시 삭제)
+
+    def protect_file(self, path: str):
+        """파일 백업 (실행 전에 없던 파일이면 취소 시 삭제)"""
+        if not path:
+            return
+        path = os.path.abspath(path)
+        if path in self._files:
+            return
+        if os.path.isfile(path):
+            if self._backup_dir is None:
+                self._backup_dir = tempfile.mkdtemp(prefix="dcr_rollback_")
+            backup = os.path.join(self._backup_dir, f"{len(self._files)}_{os.path.basename(path)}")
+            shutil.copy2(path, backup)
+            self._files[path] = backup
+        else:
+            self._files[path] = None
+
+    def protect_dir(self, directory: str):
+        """디렉토리에 새로 생기는 파일(플롯 등) 기록 - 취소 시 새 파일만 삭제"""
+        if not directory:
+            return
+        directory = os.path.abspath(directory)
+        if directory not in self._dirs:
+            self._dirs[directory] = set(os.listdir(directory)) if os.path.isdir(directory) else set()
+
+    def protect_pattern(self, pattern: str):
+        """glob 패턴에 맞는 파일 보호 (실행 전 파일은 백업, 실행 중 새로 생긴 파일은 취소 시 삭제)"""
+        if not pattern:
+            return
+        pattern = os.path.abspath(pattern)
+        for path in glob.glob(pattern):
+            self.protect_file(path)
+        self._patterns.append(pattern)
+
+    def rollback(self) -> list:
+        """
+        실행 전 상태로 복원하고 백업 삭제
+
+        Returns:
+            복원하거나 삭제한 파일 경로 리스트
+        """
+        restored = []
+        for path, backup in self._files.items():
+            if backup is not None:
+                shutil.copy2(backup, path)
+                restored.append(path)
+            elif os.path.isfile(path):
+                os.remove(path)
+                restored.append(path)
+        for directory, before in self._dirs.items():
+            if not os.path.isdir(directory):
+                continue
+            for name in sorted(set(os.listdir(directory)) - before):
+                path = os.path.join(directory, name)
+                if os.path.isfile(path):
+                    os.remove(path)
+                    restored.append(path)
+        for pattern in self._patterns:
+            for path in sorted(glob.glob(pattern)):
+                if path not in self._files and path not in restored and os.path.isfile(path):
+                    os.remove(path)
+                    restored.append(path)
+        self.discard()
+        return restored
+
+    def discard(self):
+        """백업 삭제 (정상 완료)"""
+        if self._backup_dir is not None:
+            shutil.rmtree(self._backup_dir, ignore_errors=True)
+        self._backup_dir = None
+        self._files = {}
+        self._dirs = {}
+        self._patterns = []
@@ -0,0 +1,150 @@
+"""
+공정 능력 지수 계산 모듈
+NET x 측정값 행렬에서 모든 NET의 Cp/Cpk/Pp/Ppk와 규격 이탈(NG) 개수를 한 번에(벡터 연산) 계산
+- Cp/Cpk: 단기(군내) 표준편차 = 이동 범위 평균 / d2 (측정 순서 기준)
+- Pp/Ppk: 전체 표준편차 (표본 표준편차, ddof=1)
+"""
+
+import numpy as np
+
+
+# 이동 범위(n=2)의 d2 상수
+D2_MOVING_RANGE = 1.128
+
+# 능력 지수 이름 (워크북 행/열 순서)
+CAPABILITY_INDICES = ("Cp", "Cpk", "Pp", "Ppk")
+
+
+def limits_to_array(values, n: int) -> np.ndarray:
+    """
+    LSL/USL 리스트를 길이 n의 float 배열로 변환
+
+    Args:
+        values: 값 리스트 (None/빈 값/숫자가 아닌 값은 NaN)
+        n: NET 수
+
+    Returns:
+        float 배열 (부족한 길이는 NaN)
+    """
+    arr = np.full(n, np.nan)
+    if values is None:
+        return arr
+    if isinstance(values, np.ndarray) and values.dtype.kind == 'f':
+        arr[:min(n, len(values))] = values[:n]
+        return arr
+    for idx, val in enumerate(list(values)[:n]):
+        try:
+            arr[idx] = float(val)
+        except (TypeError, ValueError):
+            pass
+    return arr
+
+
+def _moving_range_sigma(matrix: np.ndarray, valid: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """NET별 단기 표준편차 (NaN을 건너뛴 연속 측정값의 이동 범위 평균 / d2)"""
+    # 유효 값을 측정 순서를 유지한 채 앞으로 모음
+    order = np.argsort(~valid, axis=1, kind='stable')
+    packed = np.take_along_axis(matrix, order, axis=1)
+    diffs = np.abs(np.diff(packed, axis=1))
+    pair_valid = np.arange(diffs.shape[1])[None, :] < (counts - 1)[:, None]
+    mr_sum = np.where(pair_valid, diffs, 0.0).sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return mr_sum / (counts - 1) / D2_MOVING_RANGE
+
+
+def _index_pair(mean, sigma, lsl, usl):
+    """(양측 지수, 편측 최솟값 지수) - 한쪽 규격만 있으면 그쪽 값만 사용"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sigma = np.where(sigma > 0, sigma, np.nan)
+        spread = (usl - lsl) / (6 * sigma)
+        upper = (usl - mean) / (3 * sigma)
+        lower = (mean - lsl) / (3 * sigma)
+    return spread, np.fmin(upper, lower)
+
+
+def calculate_capability(matrix, lsl_values, usl_values) -> dict:
+    """
+    모든 NET의 공정 능력 지수를 벡터 연산으로 계산
+
+    Args:
+        matrix: NET x 측정값 2차원 배열 (측정 순서대로, 빈 값은 NaN)
+        lsl_values: NET별 LSL (리스트 또는 배열, 없는 값은 None/NaN)
+        usl_values: NET별 USL
+
+    Returns:
+        NET별 배열 딕셔너리
+        {"count", "mean", "std", "sigma_within", "lsl", "usl", "Cp", "Cpk", "Pp", "Ppk"}
+        (측정값이 2개 미만이거나 표준편차가 0이면 지수는 NaN)
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.ndim != 2:
+        matrix = matrix.reshape(len(matrix), -1)
+    n = matrix.shape[0]
+    lsl = limits_to_array(lsl_values, n)
+    usl = limits_to_array(usl_values, n)
+
+    valid = ~np.isnan(matrix)
+    counts = valid.sum(axis=1)
+    filled = np.where(valid, matrix, 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = filled.sum(axis=1) / counts
+        dev = np.where(valid, matrix - mean[:, None], 0.0)
+        std = np.sqrt((dev * dev).sum(axis=1) / (counts - 1))
+    sigma_within = _moving_range_sigma(matrix, valid, counts)
+
+    few = counts < 2
+    std[few] = np.nan
+    sigma_within[few] = np.nan
+
+    cp, cpk = _index_pair(mean, sigma_within, lsl, usl)
+    pp, ppk = _index_pair(mean, std, lsl, usl)
+
+    return {
+        "count": counts,
+        "mean": mean,
+        "std": std,
+        "sigma_within": sigma_within,
+        "lsl": lsl,
+        "usl": usl,
+        "Cp": cp,
+        "Cpk": cpk,
+        "Pp": pp,
+        "Ppk": ppk,
+    }
+
+
+def capability_cell_value(val):
+    """지수 값을 셀 값으로 변환 (NaN/무한대는 빈 셀, 소수점 4자리)"""
+    if val is None or not np.isfinite(val):
+        return None
+    return round(float(val), 4)
+
+
+def count_out_of_spec(matrix, lsl_values, usl_values) -> dict:
+    """
+    모든 측정값을 NET별 LSL/USL과 한 번에 비교 (브로드캐스트)
+
+    Args:
+        matrix: NET x 측정값 2차원 배열 (빈 값은 NaN → 판정 제외)
+        lsl_values: NET별 LSL (없는 값은 None/NaN → 해당 쪽 판정 제외)
+        usl_values: NET별 USL
+
+    Returns:
+        {"under": LSL 미만 마스크, "over": USL 초과 마스크,
+         "under_count": NET별 개수, "over_count": NET별 개수, "lsl", "usl"}
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    n = matrix.shape[0]
+    lsl = limits_to_array(lsl_values, n)
+    usl = limits_to_array(usl_values, n)
+    with np.errstate(invalid='ignore'):
+        under = matrix < lsl[:, None]
+        over = matrix > usl[:, None]
+    return {
+        "under": under,
+        "over": over,
+        "under_count": under.sum(axis=1),
+        "over_count": over.sum(axis=1),
+        "lsl": lsl,
+        "usl": usl,
+    }
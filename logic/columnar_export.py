@@ -0,0 +1,303 @@
+"""
+컬럼 형식 내보내기 모듈
+Tab 3의 NET x 측정값 행렬(PinA/PinB/NET 메타데이터 포함)과 NET별 통계를 SPC 도구가 바로 읽을 수 있는
+컬럼 형식 파일로 저장 (xlsx 시트를 다시 파싱하지 않아도 되고 Excel 행/열 한도에 걸리지 않음)
+- npz: numpy 압축 파일 (측정값은 NET x 측정값 2차원 배열 그대로)
+- parquet: pyarrow 또는 fastparquet가 설치된 경우만 (없으면 csv로 저장)
+- csv: 의존성 없는 대체 형식
+- 측정값 파일은 워커 스레드에서 xlsx 시트 작성과 동시에 저장 (ColumnarExport)
+- 기준 Method(3) 외의 Method는 Method마다 "<결과 파일 이름>_M<Method>_measurements" / "_statistics" 파일
+  (tinh LCLUCL M<Method> 시트와 같은 기준)
+"""
+
+import glob
+import importlib.util
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from logic.bootstrap import bootstrap_labels
+from logic.capability import CAPABILITY_INDICES
+
+
+# 지원 형식 (calculate_lsl_usl_full columnar_format 값)
+COLUMNAR_FORMATS = ("npz", "parquet", "csv")
+
+# parquet 저장에 사용할 수 있는 엔진 (pandas.DataFrame.to_parquet)
+PARQUET_ENGINES = ("pyarrow", "fastparquet")
+
+# 출력 파일 이름: <결과 파일 이름>_measurements.<ext>, <결과 파일 이름>_statistics.<ext>
+MEASUREMENTS_SUFFIX = "_measurements"
+STATISTICS_SUFFIX = "_statistics"
+
+
+def parquet_available() -> bool:
+    """parquet 엔진(pyarrow / fastparquet) 설치 여부"""
+    return any(importlib.util.find_spec(engine) is not None for engine in PARQUET_ENGINES)
+
+
+def resolve_columnar_format(columnar_format: str) -> str:
+    """
+    실제로 저장할 형식 (parquet 엔진이 없으면 csv)
+
+    Raises:
+        ValueError: 지원하지 않는 형식인 경우
+    """
+    fmt = columnar_format.strip().lower().lstrip(".")
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unknown columnar format: {columnar_format} (available: {', '.join(COLUMNAR_FORMATS)})")
+    if fmt == "parquet" and not parquet_available():
+        return "csv"
+    return fmt
+
+
+def columnar_paths(output_file: str, fmt: str, method_label: str = "") -> dict:
+    """
+    결과 파일 옆에 저장할 측정값/통계 파일 경로 {"measurements", "statistics"}
+
+    Args:
+        method_label: 기준 Method 이외의 Method 이름 (파일 이름에 "_M<Method>" 추가, 빈 문자열이면 기준 Method)
+    """
+    base = os.path.splitext(output_file)[0]
+    if method_label:
+        base += f"_M{method_label}"
+    return {
+        "measurements": f"{base}{MEASUREMENTS_SUFFIX}.{fmt}",
+        "statistics": f"{base}{STATISTICS_SUFFIX}.{fmt}",
+    }
+
+
+def method_columnar_pattern(output_file: str, fmt: str) -> str:
+    """기준 Method 이외의 Method 측정값/통계 파일 glob 패턴 (취소 시 복원 대상)"""
+    return f"{glob.escape(os.path.splitext(output_file)[0])}_M*.{fmt}"
+
+
+def _meta_strings(values, n: int) -> np.ndarray:
+    """NET별 메타데이터(PinA/PinB)를 길이 n의 문자열 배열로 (빈 값은 빈 문자열)"""
+    out = np.full(n, "", dtype=object)
+    for idx, val in enumerate(list(values)[:n]):
+        if pd.notna(val):
+            out[idx] = str(val).strip()
+    return out.astype(str)
+
+
+def write_measurements(path: str, fmt: str, net_matrix: np.ndarray, meta_pina, meta_pinb, method_value) -> str:
+    """
+    NET x 측정값 행렬 저장 (숫자 측정값만, 문자열 값은 빈 값)
+
+    npz는 2차원 배열 "values"(NET x 측정값, 빈 값 NaN)와 NET별 "net"/"pin_a"/"pin_b",
+    parquet/csv는 빈 값을 뺀 긴 형식 (net, pin_a, pin_b, method, measurement, value) - measurement는
+    tinh LCLUCL 측정값 행 순서 (1부터)
+
+    Returns:
+        저장한 파일 경로
+    """
+    x = net_matrix.shape[0]
+    nets = np.arange(1, x + 1)
+    pin_a = _meta_strings(meta_pina, x)
+    pin_b = _meta_strings(meta_pinb, x)
+    if fmt == "npz":
+        np.savez_compressed(path, values=net_matrix, net=nets, pin_a=pin_a, pin_b=pin_b,
+                            method=np.array(method_value))
+        return path
+
+    net_idx, measure_idx = np.nonzero(~np.isnan(net_matrix))
+    df = pd.DataFrame({
+        "net": nets[net_idx],
+        "pin_a": pin_a[net_idx],
+        "pin_b": pin_b[net_idx],
+        "method": method_value,
+        "measurement": measure_idx + 1,
+        "value": net_matrix[net_idx, measure_idx],
+    })
+    _write_frame(df, path, fmt)
+    return path
+
+
+def _write_frame(df: pd.DataFrame, path: str, fmt: str):
+    if fmt == "parquet":
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def descriptive_statistics(net_matrix: np.ndarray) -> dict:
+    """
+    NET별 기술 통계 (tinh LCLUCL Row 9-14 수식 MIN/MAX/AVERAGE/MEDIAN/STDEV/QUARTILE과 같은 값)
+
+    Returns:
+        {"min", "max", "mean", "median", "stdev", "q1", "q3", "iqr": NET 수 길이 배열 (측정값이 없으면 NaN)}
+    """
+    x = net_matrix.shape[0]
+    has_data = (~np.isnan(net_matrix)).any(axis=1)
+    descriptive = np.full((7, x), np.nan)
+    if has_data.any():
+        valid = net_matrix[has_data]
+        with warnings.catch_warnings():
+            # 측정값이 1개인 NET의 표본 표준편차 (Excel STDEV의 #DIV/0!과 같이 NaN)
+            warnings.simplefilter("ignore", RuntimeWarning)
+            descriptive[0, has_data] = np.nanmin(valid, axis=1)
+            descriptive[1, has_data] = np.nanmax(valid, axis=1)
+            descriptive[2, has_data] = np.nanmean(valid, axis=1)
+            descriptive[3, has_data] = np.nanmedian(valid, axis=1)
+            descriptive[4, has_data] = np.nanstd(valid, axis=1, ddof=1)
+            descriptive[5:7, has_data] = np.nanpercentile(valid, [25, 75], axis=1)
+    stats = dict(zip(("min", "max", "mean", "median", "stdev", "q1", "q3"), descriptive))
+    stats["iqr"] = stats["q3"] - stats["q1"]
+    return stats
+
+
+def statistics_columns(net_matrix: np.ndarray, meta_pina, meta_pinb, tinh: dict,
+                       ers_limits: tuple = None, capability_ers: dict = None, ng_ers: dict = None) -> dict:
+    """
+    NET별 통계 열 (tinh LCLUCL / Calculate USL LSL 시트 값과 같은 기준)
+
+    Args:
+        net_matrix: NET x 측정값 행렬 (빈 값 NaN)
+        meta_pina: NET별 PinA
+        meta_pinb: NET별 PinB
+        tinh: write_tinh_sheet 반환값 (3σ 규격, 필터 결과, 공정 능력, NG 개수, 부트스트랩)
+        ers_limits: (ERS LSL 배열, ERS USL 배열) - 측정값 단위 (없으면 None)
+        capability_ers: ERS 규격 공정 능력 (없으면 None)
+        ng_ers: ERS 규격 NG 개수 (없으면 None)
+
+    Returns:
+        {열 이름: NET 수 길이 배열} (순서 유지)
+    """
+    x = net_matrix.shape[0]
+    counts = np.asarray(tinh["counts"])
+    has_data = counts > 0
+    columns = {
+        "net": np.arange(1, x + 1),
+        "pin_a": _meta_strings(meta_pina, x),
+        "pin_b": _meta_strings(meta_pinb, x),
+        "n": counts,
+    }
+    columns.update(descriptive_statistics(net_matrix))
+
+    filter_result = tinh["filter"]
+    columns["filter_lower"] = np.asarray(filter_result["lower"], dtype=float)
+    columns["filter_upper"] = np.asarray(filter_result["upper"], dtype=float)
+    columns["retained"] = np.asarray(filter_result["retained"])
+    columns["avg_ifs"] = np.where(has_data, filter_result["avg_ifs"], np.nan)
+    columns["std_ifs"] = np.where(has_data, filter_result["std_ifs"], np.nan)
+    columns["lsl"] = tinh["lsl"]
+    columns["usl"] = tinh["usl"]
+    for index_name in CAPABILITY_INDICES:
+        columns[f"{index_name.lower()}_3s"] = tinh["capability"][index_name]
+    columns["under_ng_3s"] = tinh["ng"]["under_count"]
+    columns["over_ng_3s"] = tinh["ng"]["over_count"]
+
+    if ers_limits is not None:
+        columns["ers_lsl"], columns["ers_usl"] = ers_limits
+    if capability_ers is not None:
+        for index_name in CAPABILITY_INDICES:
+            columns[f"{index_name.lower()}_ers"] = capability_ers[index_name]
+    if ng_ers is not None:
+        columns["under_ng_ers"] = ng_ers["under_count"]
+        columns["over_ng_ers"] = ng_ers["over_count"]
+
+    if tinh.get("bootstrap") is not None:
+        for stat_name, side, _ in bootstrap_labels():
+            name = f"{stat_name.lower().replace(' ', '_')}_ci_{side.lower()}"
+            columns[name] = tinh["bootstrap"][stat_name][0 if side == "L" else 1]
+    return columns
+
+
+def write_statistics(path: str, fmt: str, columns: dict) -> str:
+    """
+    NET별 통계 저장 (npz는 열 이름별 배열, parquet/csv는 NET당 한 행)
+
+    Returns:
+        저장한 파일 경로
+    """
+    if fmt == "npz":
+        np.savez_compressed(path, **columns)
+    else:
+        _write_frame(pd.DataFrame(columns), path, fmt)
+    return path
+
+
+class ColumnarExport:
+    """
+    Tab 3 컬럼 형식 내보내기 (측정값 파일은 워커 스레드에서 xlsx 시트 작성과 동시에 저장)
+
+    사용 예:
+        export = ColumnarExport(output_file, "npz")
+        export.start(net_matrix, meta_pina, meta_pinb, method_value)
+        export.add_method("1", method_matrix, meta_pina, meta_pinb, 1, statistics_columns(...))
+        ...  # xlsx 시트 작성
+        files = export.finish(statistics_columns(...))
+        export.close()  # finally에서 호출 (저장 중인 스레드 종료 대기)
+    """
+
+    def __init__(self, output_file: str, columnar_format: str):
+        """
+        Args:
+            output_file: Tab 3 결과 파일 경로 (같은 폴더에 같은 이름으로 저장)
+            columnar_format: "npz" / "parquet" / "csv"
+
+        Raises:
+            ValueError: 지원하지 않는 형식인 경우
+        """
+        self.requested_format = columnar_format
+        self.output_file = output_file
+        self.format = resolve_columnar_format(columnar_format)
+        self.paths = columnar_paths(output_file, self.format)
+        self._executor = None
+        self._futures = []  # 워커 스레드 저장 작업 (제출 순서)
+
+    def _submit(self, fn, *args):
+        """워커 스레드에 저장 작업 추가 (한 번에 하나씩 순서대로 저장)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="columnar_export")
+        self._futures.append(self._executor.submit(fn, *args))
+
+    def start(self, net_matrix: np.ndarray, meta_pina, meta_pinb, method_value):
+        """기준 Method 측정값 파일 저장 시작 (워커 스레드)"""
+        self._submit(write_measurements, self.paths["measurements"], self.format,
+                     net_matrix, list(meta_pina), list(meta_pinb), method_value)
+
+    def add_method(self, method_label: str, net_matrix: np.ndarray, meta_pina, meta_pinb, method_value,
+                   columns: dict):
+        """
+        기준 Method 이외의 Method 측정값/통계 파일 저장 시작 (워커 스레드)
+
+        Args:
+            method_label: 파일 이름에 붙일 Method 이름 ("<결과 파일 이름>_M<Method>_measurements" ...)
+            columns: 해당 Method의 statistics_columns() 결과
+        """
+        paths = columnar_paths(self.output_file, self.format, method_label)
+        self._submit(write_measurements, paths["measurements"], self.format,
+                     net_matrix, list(meta_pina), list(meta_pinb), method_value)
+        self._submit(write_statistics, paths["statistics"], self.format, columns)
+
+    def finish(self, columns: dict) -> list:
+        """
+        기준 Method 통계 파일 저장 후 워커 스레드 저장 완료 대기
+
+        Returns:
+            저장한 파일 경로 리스트 (기준 Method 측정값/통계, 다른 Method 순서)
+
+        Raises:
+            워커 스레드에서 저장 중 발생한 예외
+        """
+        files = [future.result() for future in self._futures]
+        files.insert(1 if files else 0, write_statistics(self.paths["statistics"], self.format, columns))
+        return files
+
+    def close(self):
+        """워커 스레드 종료 (저장 중이면 완료까지 대기)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def summary(self, files: list) -> str:
+        """결과 메시지 줄 (parquet 엔진이 없어 csv로 저장한 경우 표시)"""
+        fallback = ""
+        if self.format != self.requested_format.strip().lower().lstrip("."):
+            fallback = f" (parquet engine not installed: {' / '.join(PARQUET_ENGINES)})"
+        return f"Columnar export ({self.format}){fallback}: " + ", ".join(os.path.basename(f) for f in files) + "\n"
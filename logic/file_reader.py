@@ -3,6 +3,10 @@
 .NET 파일 및 .xlsx 파일을 읽어서 문자열로 반환
 """
 
+import os
+import zipfile
+import xml.etree.ElementTree as ET
+
 from openpyxl import load_workbook
 
 
@@ -208,3 +212,69 @@ def read_xlsx_file(file_path: str) -> str:
     except Exception as e:
         return f"Error reading .xlsx file: {str(e)}"
 
+
+def list_excel_sheet_names(file_path: str) -> list:
+    """
+    Excel 파일의 시트 이름 목록을 시트를 파싱하지 않고 읽음
+    .xlsx/.xlsm: 패키지 안의 xl/workbook.xml 메타데이터만 읽음
+    .xls: xlrd on_demand 모드로 시트 목록만 읽음
+    
+    Args:
+        file_path: Excel 파일 경로
+        
+    Returns:
+        시트 이름 리스트 (워크북 순서)
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    
+    if ext in ('.xlsx', '.xlsm') and zipfile.is_zipfile(file_path):
+        with zipfile.ZipFile(file_path) as zf:
+            root = ET.fromstring(zf.read('xl/workbook.xml'))
+        # 네임스페이스와 관계없이 <sheets>/<sheet name="..."> 요소 찾기
+        return [el.get('name') for el in root.iter()
+                if el.tag.rsplit('}', 1)[-1] == 'sheet' and el.get('name') is not None]
+    
+    if ext == '.xls':
+        import xlrd
+        book = xlrd.open_workbook(file_path, on_demand=True)
+        try:
+            return book.sheet_names()
+        finally:
+            book.release_resources()
+    
+    import pandas as pd
+    with pd.ExcelFile(file_path) as xl:
+        return list(xl.sheet_names)
+
+
+def resolve_sheet_name(sheet_names: list, sheet_name: str, default: str = None):
+    """
+    요청한 시트 이름을 실제 시트 이름으로 변환
+    정확히 일치하지 않으면 대소문자/앞뒤 공백을 무시하고 비교
+    
+    Args:
+        sheet_names: list_excel_sheet_names()로 읽은 시트 이름 목록
+        sheet_name: 요청한 시트 이름 (빈 문자열이면 default 또는 첫 번째 시트)
+        default: sheet_name이 비어 있을 때 우선 사용할 시트 이름
+        
+    Returns:
+        실제 시트 이름 (찾지 못하면 None)
+    """
+    if not sheet_names:
+        return None
+    
+    if not sheet_name:
+        if default:
+            resolved = resolve_sheet_name(sheet_names, default)
+            if resolved is not None:
+                return resolved
+        return sheet_names[0]
+    
+    if sheet_name in sheet_names:
+        return sheet_name
+    
+    key = sheet_name.strip().upper()
+    for name in sheet_names:
+        if name.strip().upper() == key:
+            return name
+    return None
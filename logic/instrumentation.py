@@ -0,0 +1,341 @@
+"""
+단계별 계측 모듈
+탭 실행 단계(Tab 1 Step, Tab 2 fill, Tab 3 단계, 플롯)마다 실행 시간 / CPU 시간 / 최대 메모리(tracemalloc)를 기록
+- stage("이름"): with 블록 하나를 단계로 기록 (기록 중이 아니면 아무것도 하지 않음)
+- StageSequence: 긴 함수 안에서 next("이름")으로 차례로 이어지는 단계 기록 (블록 들여쓰기 없이)
+- 기록은 로그 파일 옆 JSONL 파일에 단계가 끝날 때마다 한 줄씩 추가
+- 최대 메모리는 track_memory=True일 때만 기록 (tracemalloc 부담이 커서 기본은 시간만)
+  켜는 방법: UI "Track memory" 체크박스, 실행 옵션 --track-memory, 환경 변수 DCR_TRACK_MEMORY=1
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+from logic.cancellation import OperationCancelled
+
+
+# tracemalloc으로 단계별 최대 메모리 기록 - 기본은 끔
+# (할당이 많은 matplotlib 렌더링 등이 3배 이상 느려짐, 시간 기록만 하면 부담 거의 없음)
+STAGE_TRACK_MEMORY = False
+
+# 메모리 기록을 켜는 실행 옵션 / 환경 변수 (값이 1, true, yes, on이면 켬)
+TRACK_MEMORY_FLAG = "--track-memory"
+TRACK_MEMORY_ENV_VAR = "DCR_TRACK_MEMORY"
+
+# 요약(UI 로그, 표지)에 표시하는 단계 수 (실행 시간 순)
+STAGE_SUMMARY_TOP = 10
+
+_active_recorder = None
+_active_lock = threading.Lock()
+
+
+def memory_tracking_requested(argv: list = None) -> bool:
+    """
+    실행 옵션 또는 환경 변수로 단계별 메모리 기록이 요청되었는지 확인
+
+    Args:
+        argv: 실행 인자 리스트 (None이면 확인하지 않음)
+    """
+    if argv is not None and TRACK_MEMORY_FLAG in argv:
+        return True
+    if os.environ.get(TRACK_MEMORY_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on"):
+        return True
+    return STAGE_TRACK_MEMORY
+
+
+def pop_track_memory_option(argv: list) -> bool:
+    """argv에서 --track-memory 옵션을 제거하고 메모리 기록 요청 여부 반환 (환경 변수 포함)"""
+    requested = memory_tracking_requested(argv)
+    while TRACK_MEMORY_FLAG in argv:
+        argv.remove(TRACK_MEMORY_FLAG)
+    return requested
+
+
+class StageRecorder:
+    """
+    단계 기록 저장소 (start_recording()으로 활성화)
+    중첩된 단계는 "상위/하위" 경로로 기록, 스레드마다 별도의 단계 스택 사용
+    """
+
+    def __init__(self, path: str = "", track_memory: bool = STAGE_TRACK_MEMORY):
+        self.path = path
+        self.track_memory = track_memory
+        self.records = []
+        self._file = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started_tracemalloc = False
+        self.run_started = datetime.now().isoformat(timespec='seconds')
+
+    def open(self):
+        """JSONL 파일 열기 / tracemalloc 시작 (OSError는 호출한 쪽에서 처리)"""
+        if self.path:
+            self._file = open(self.path, 'w', encoding='utf-8')
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def close(self):
+        """JSONL 파일 닫기 / 이 기록기가 시작한 tracemalloc 중지"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def begin(self, name: str, fields: dict) -> dict:
+        """단계 시작 (열린 단계 항목 반환)"""
+        stack = self._stack()
+        entry = {
+            "name": name,
+            "path": "/".join([e["name"] for e in stack] + [name]),
+            "fields": fields,
+            "started": datetime.now().isoformat(timespec='milliseconds'),
+            "wall": time.perf_counter(),
+            "cpu": time.process_time(),
+            "mem_start": 0,
+            "mem_peak": 0,
+        }
+        if self.track_memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                # 상위 단계의 최대값을 보존한 뒤 하위 단계 측정을 위해 최대값 초기화
+                stack[-1]["mem_peak"] = max(stack[-1]["mem_peak"], peak)
+            tracemalloc.reset_peak()
+            entry["mem_start"] = current
+            entry["mem_peak"] = current
+        stack.append(entry)
+        return entry
+
+    def end(self, entry: dict, status: str = "ok") -> dict:
+        """단계 종료 후 기록 (begin()의 역순으로 호출)"""
+        stack = self._stack()
+        if entry in stack:
+            # 예외로 닫히지 않은 하위 단계가 있으면 함께 닫음
+            while stack and stack[-1] is not entry:
+                self.end(stack[-1], status)
+            stack.pop()
+        record = {
+            "run": self.run_started,
+            "stage": entry["path"],
+            "name": entry["name"],
+            "depth": entry["path"].count("/"),
+            "start": entry["started"],
+            "wall_s": round(time.perf_counter() - entry["wall"], 4),
+            "cpu_s": round(time.process_time() - entry["cpu"], 4),
+            "peak_mb": None,
+            "status": status,
+        }
+        if self.track_memory and tracemalloc.is_tracing():
+            peak = max(entry["mem_peak"], tracemalloc.get_traced_memory()[1])
+            record["peak_mb"] = round((peak - entry["mem_start"]) / (1024 * 1024), 3)
+            if stack:
+                stack[-1]["mem_peak"] = max(stack[-1]["mem_peak"], peak)
+        record.update(entry["fields"])
+        self.add(record)
+        return record
+
+    def add(self, record: dict):
+        """기록 추가 (JSONL 파일에 한 줄 추가)"""
+        with self._lock:
+            self.records.append(record)
+            if self._file is not None:
+                self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                self._file.flush()
+
+    def current_root(self) -> str:
+        """현재 스레드에서 열려 있는 최상위 단계 이름 (없으면 빈 문자열)"""
+        stack = self._stack()
+        return stack[0]["name"] if stack else ""
+
+    def summary_lines(self, root: str = "", top: int = STAGE_SUMMARY_TOP) -> list:
+        """
+        실행 시간이 긴 단계 요약 (최상위 단계 제외, 하위 단계가 있어도 모두 포함)
+
+        Args:
+            root: 이 최상위 단계 아래의 기록만 (빈 문자열이면 전체)
+            top: 표시할 단계 수
+        """
+        return [format_stage_record(r) for r in top_stage_records(self.records, root, top)]
+
+
+def top_stage_records(records: list, root: str = "", top: int = STAGE_SUMMARY_TOP) -> list:
+    """실행 시간 순 상위 단계 기록 (최상위 단계 자체는 제외)"""
+    prefix = f"{root}/" if root else ""
+    selected = [r for r in records if r["depth"] > 0 and r["stage"].startswith(prefix)]
+    return sorted(selected, key=lambda r: r["wall_s"], reverse=True)[:top]
+
+
+def format_stage_record(record: dict) -> str:
+    """단계 기록 한 줄 (예: "Tab 3/calculate/save: 1.23 s wall, 1.20 s CPU, peak 35.2 MB")"""
+    return f"{record['stage']}: {format_stage_values(record)}"
+
+
+def format_stage_values(record: dict) -> str:
+    """단계 기록 측정값 (예: "1.23 s wall, 1.20 s CPU, peak 35.2 MB")"""
+    text = f"{record['wall_s']:.2f} s wall"
+    if record.get("cpu_s") is not None:
+        text += f", {record['cpu_s']:.2f} s CPU"
+    if record.get("peak_mb") is not None:
+        text += f", peak {record['peak_mb']:.1f} MB"
+    if record.get("status", "ok") != "ok":
+        text += f" ({record['status']})"
+    return text
+
+
+def start_recording(path: str = "", track_memory: bool = STAGE_TRACK_MEMORY) -> StageRecorder:
+    """
+    단계 기록 시작 (이전 기록은 종료)
+
+    Args:
+        path: JSONL 파일 경로 (빈 문자열이면 메모리에만 기록)
+        track_memory: tracemalloc 최대 메모리 기록 여부
+
+    Raises:
+        OSError: JSONL 파일을 열 수 없는 경우
+    """
+    global _active_recorder
+    stop_recording()
+    recorder = StageRecorder(path, track_memory)
+    recorder.open()
+    with _active_lock:
+        _active_recorder = recorder
+    return recorder
+
+
+def stop_recording():
+    """단계 기록 종료 (기록 중이던 StageRecorder 반환, 없으면 None)"""
+    global _active_recorder
+    with _active_lock:
+        recorder, _active_recorder = _active_recorder, None
+    if recorder is not None:
+        recorder.close()
+    return recorder
+
+
+def _exception_status(exc) -> str:
+    """예외로 끝난 단계의 상태 ("cancelled" / "error", 예외가 없으면 "ok")"""
+    if exc is None:
+        return "ok"
+    return "cancelled" if isinstance(exc, OperationCancelled) else "error"
+
+
+def active_recorder():
+    """기록 중인 StageRecorder (없으면 None)"""
+    return _active_recorder
+
+
+@contextmanager
+def stage(name: str, **fields):
+    """
+    with 블록을 단계로 기록 (기록 중이 아니면 아무것도 하지 않음)
+
+    Args:
+        name: 단계 이름
+        **fields: JSONL 기록에 추가할 값 (NET 수 등)
+    """
+    recorder = _active_recorder
+    if recorder is None:
+        yield
+        return
+    entry = recorder.begin(name, fields)
+    status = "ok"
+    try:
+        yield
+    except BaseException as e:
+        status = _exception_status(e)
+        raise
+    finally:
+        recorder.end(entry, status)
+
+
+class StageSequence:
+    """
+    차례로 이어지는 단계 기록 (긴 함수 본문을 with 블록으로 나누지 않고 사용)
+
+    사용 예:
+        phases = StageSequence()
+        phases.next("read")
+        ...
+        phases.next("save")
+        ...
+        phases.close()  # finally에서 호출 (예외로 끝나면 마지막 단계는 "error" / "cancelled")
+    """
+
+    def __init__(self):
+        self._recorder = _active_recorder
+        self._entry = None
+
+    def next(self, name: str, **fields):
+        """이전 단계를 끝내고 다음 단계 시작"""
+        self.close("ok")
+        if self._recorder is not None:
+            self._entry = self._recorder.begin(name, fields)
+
+    def close(self, status: str = None):
+        """열린 단계 종료 (status가 None이면 처리 중인 예외로 판단 - finally에서 호출 가능)"""
+        if self._entry is not None:
+            if status is None:
+                status = _exception_status(sys.exc_info()[1])
+            self._recorder.end(self._entry, status)
+            self._entry = None
+
+
+def record_stage(name: str, wall_s: float, cpu_s: float = None, **fields):
+    """
+    다른 곳(워커 프로세스 등)에서 측정한 단계 기록 추가 (현재 스레드에서 열린 단계의 하위로)
+
+    Args:
+        name: 단계 이름
+        wall_s: 실행 시간 (초)
+        cpu_s: CPU 시간 (초, 측정한 프로세스 기준)
+        **fields: JSONL 기록에 추가할 값
+    """
+    recorder = _active_recorder
+    if recorder is None:
+        return
+    parent = "/".join(e["name"] for e in recorder._stack())
+    path = f"{parent}/{name}" if parent else name
+    record = {
+        "run": recorder.run_started,
+        "stage": path,
+        "name": name,
+        "depth": path.count("/"),
+        "start": None,
+        "wall_s": round(wall_s, 4),
+        "cpu_s": round(cpu_s, 4) if cpu_s is not None else None,
+        "peak_mb": None,
+        "status": "ok",
+    }
+    record.update(fields)
+    recorder.add(record)
+
+
+def current_stage_summary(top: int = STAGE_SUMMARY_TOP) -> list:
+    """
+    현재 스레드에서 열려 있는 최상위 단계(예: "Tab 3") 아래에서 지금까지 끝난 단계 기록 (표지용)
+
+    Returns:
+        실행 시간 순 단계 기록 리스트 (기록 중이 아니면 빈 리스트)
+    """
+    recorder = _active_recorder
+    if recorder is None:
+        return []
+    root = recorder.current_root()
+    with recorder._lock:
+        records = list(recorder.records)
+    return top_stage_records(records, root, top)
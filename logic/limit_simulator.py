@@ -0,0 +1,572 @@
+"""
+LSL/USL what-if 시뮬레이터 모듈
+Tab 3 결과 파일(tinh LCLUCL 측정값)을 한 번 읽어서 메모리에 유지하고,
+시그마 배수 / 이상치 필터와 임계값 / guard band를 바꿨을 때의
+AverageIfs, Stdev ifs, LSL/USL, 수율을 모든 NET에 대해 즉시 다시 계산한다.
+- NET별 정렬된 측정값 + 누적합 + 제곱 누적합을 미리 만들어 두고
+  범위 경계는 행 단위 이진 탐색으로 찾으므로 재계산은 O(NET 수 × log 측정 수)
+- IQR 이외의 필터는 logic.outlier_filters로 전체 행렬을 한 번에 처리하고
+  (필터, 임계값)별 AverageIfs/Stdev ifs를 저장해 두어 시그마 배수/guard band 변경 시 재사용
+- commit()에서 선택한 파라미터를 결과 파일과 DCR 파일에 기록
+  (Method별 tinh LCLUCL 시트도 같은 파라미터로 각 Method의 측정값에서 다시 계산)
+- 적용한 파라미터는 결과 파일 문서 속성에 기록하고 load()에서 다시 읽어 현재 값으로 사용
+- Excel 시트 한도를 넘어 나뉜 결과 파일은 Shard index 시트의 범위로 시트를 모아서 읽고 씀 (logic.sheet_shards)
+"""
+
+import os
+import time
+
+import numpy as np
+import openpyxl
+from openpyxl.utils import get_column_letter
+
+from logic.capability import (
+    CAPABILITY_INDICES, calculate_capability, capability_cell_value, count_out_of_spec,
+)
+from logic.bootstrap import bootstrap_limits
+from logic.calculate_lsl_usl import (
+    ERS_UNIT_SCALE, GUARD_BAND_MOHM, LAST_NET_LIMITS_MOHM, SIGMA_K,
+    CALC_CAPABILITY_START_COL, CALC_CI_START_COL, CALC_NG_START_COL, TINH_CAPABILITY_START_ROW,
+    TINH_CI_START_ROW, TINH_DATA_START_ROW, TINH_RETAINED_ROW, filter_bound_value, guard_band_formulas,
+    limit_formulas, limit_parameter_text, limit_row_labels, machine_limits_mohm, read_bootstrap_parameters,
+    read_limit_parameters,
+    write_bootstrap_columns, write_bootstrap_rows, write_capability_rows, write_limit_parameters,
+    write_ng_index_sheet,
+)
+from logic.outlier_filters import (
+    DEFAULT_OUTLIER_FILTER, apply_outlier_filter, default_filter_threshold, sorted_row_quantile,
+)
+from logic.sheet_shards import NetColumnSheets, content_shards, read_shard_index, remove_content_sheets
+
+
+TINH_SHEET_NAME = "tinh LCLUCL"
+# Method별 tinh LCLUCL 시트 이름 앞부분 (calculate_lsl_usl.method_sheet_name)
+METHOD_SHEET_PREFIX = "tinh LCLUCL M"
+CALC_SHEET_NAME = "Calculate USL LSL"
+NG_INDEX_SHEET_NAME = "NG index"
+
+# Calculate USL LSL / DCR 시트 데이터 시작 행
+CALC_DATA_START_ROW = 5
+DCR_DATA_START_ROW = 4
+
+
+def _row_searchsorted(sorted_vals: np.ndarray, counts: np.ndarray, targets: np.ndarray,
+                      side: str = 'left') -> np.ndarray:
+    """
+    행마다 np.searchsorted를 한 번에 수행 (행별 이진 탐색을 벡터로 진행)
+
+    Args:
+        sorted_vals: 행별 오름차순 정렬 배열 (NaN은 행 끝)
+        counts: 행별 유효 값 개수
+        targets: 행별 찾을 값
+        side: 'left' (target 미만 개수) / 'right' (target 이하 개수)
+
+    Returns:
+        행별 삽입 위치
+    """
+    rows = np.arange(len(counts))
+    lo = np.zeros(len(counts), dtype=np.int64)
+    hi = counts.astype(np.int64)
+    max_col = max(sorted_vals.shape[1] - 1, 0)
+    while True:
+        active = lo < hi
+        if not active.any():
+            return lo
+        mid = (lo + hi) // 2
+        vals = sorted_vals[rows, np.minimum(mid, max_col)]
+        with np.errstate(invalid='ignore'):
+            go_right = (vals < targets) if side == 'left' else (vals <= targets)
+        lo = np.where(active & go_right, mid + 1, lo)
+        hi = np.where(active & ~go_right, mid, hi)
+
+
+def _read_tinh_shards(wb, shards: list) -> np.ndarray:
+    """
+    나뉜 tinh LCLUCL 시트들의 측정값을 NET x 측정값 행렬로 모음
+
+    Args:
+        wb: 결과 워크북 (read_only 가능)
+        shards: Shard index의 tinh LCLUCL 시트 목록 (content_shards 결과)
+    """
+    net_count = max(shard["net_end"] for shard in shards)
+    matrix = np.full((net_count, max(shard["row_end"] for shard in shards)), np.nan)
+    for shard in shards:
+        net_start, row_start = shard["net_start"], shard["row_start"]
+        rows = wb[shard["sheet"]].iter_rows(min_row=shard["data_start_row"],
+                                            max_row=shard["data_start_row"] + shard["row_end"] - row_start - 1,
+                                            min_col=2, max_col=shard["net_end"] - net_start + 1, values_only=True)
+        for measure_idx, row in enumerate(rows, start=row_start):
+            for net_idx, val in enumerate(row, start=net_start):
+                if isinstance(val, (int, float)) and not isinstance(val, bool):
+                    matrix[net_idx, measure_idx] = val
+    return matrix
+
+
+def _read_tinh_matrix(wb, sheet_name: str) -> tuple:
+    """
+    tinh LCLUCL 레이아웃 시트의 측정값 (나뉜 시트는 Shard index 범위로 모음)
+
+    Args:
+        wb: 결과 워크북 (read_only 가능)
+        sheet_name: 시트 이름 (tinh LCLUCL 또는 Method별 시트)
+
+    Returns:
+        (NET x 측정값 행렬, 첫 측정값 행 번호) - 측정값이 없으면 (None, 0)
+    """
+    shards = content_shards(wb, sheet_name)
+    if shards:
+        # Excel 시트 한도를 넘어 나뉜 결과 파일
+        matrix = _read_tinh_shards(wb, shards)
+        if matrix.shape[0] == 0 or matrix.shape[1] == 0:
+            return None, 0
+        return matrix, shards[0]["data_start_row"]
+
+    rows = list(wb[sheet_name].iter_rows(values_only=True))
+    net_count = 0
+    for val in (rows[0][1:] if rows else []):
+        if not isinstance(val, (int, float)):
+            break
+        net_count += 1
+
+    # A열 레이블이 끝난 다음 행부터 측정값
+    data_start = 0
+    while data_start < len(rows) and rows[data_start] and rows[data_start][0] is not None:
+        data_start += 1
+
+    if net_count == 0 or data_start >= len(rows):
+        return None, 0
+
+    matrix = np.full((net_count, len(rows) - data_start), np.nan)
+    for measure_idx, row in enumerate(rows[data_start:]):
+        for net_idx, val in enumerate(row[1:net_count + 1]):
+            if isinstance(val, (int, float)) and not isinstance(val, bool):
+                matrix[net_idx, measure_idx] = val
+    return matrix, data_start + 1
+
+
+def method_sheet_names(wb) -> list:
+    """결과 파일의 Method별 tinh LCLUCL 시트 이름 (나뉜 시트의 이어지는 시트 제외, 파일 순서)"""
+    continuation = {shard["sheet"] for shard in read_shard_index(wb) if shard["sheet"] != shard["content"]}
+    return [name for name in wb.sheetnames
+            if name.startswith(METHOD_SHEET_PREFIX) and name not in continuation]
+
+
+class LimitSimulationSession:
+    """
+    LSL/USL what-if 세션
+
+    사용 예:
+        session = LimitSimulationSession(output_file, dcr_file)
+        session.load()
+        result = session.simulate(sigma_k=3.5, filter_threshold=3, guard_band=5)
+        print(session.summary(result))
+        session.commit(3.5, 3, 5)
+        session.commit(3, 3.5, 5, outlier_filter="mad")
+    """
+
+    def __init__(self, output_file: str, dcr_file: str = ""):
+        self.output_file = output_file
+        self.dcr_file = dcr_file
+        self.matrix = None       # NET x 측정값 (측정 순서)
+        self.sorted_vals = None  # NET별 오름차순 정렬 (NaN은 뒤)
+        self.counts = None
+        self.center = None       # 누적합 정밀도 유지를 위한 NET별 기준값
+        self.prefix_sum = None
+        self.prefix_sq = None
+        self.q1 = None
+        self.q3 = None
+        self.ers_lsl = None      # ERS 규격 (측정값 단위)
+        self.ers_usl = None
+        self.data_start_row = TINH_DATA_START_ROW
+        self.parameters = None   # 결과 파일에 기록된 LSL/USL 파라미터 (read_limit_parameters, 기록이 없으면 기본값)
+        self.bootstrap_parameters = None  # 신뢰구간 계산 설정 (read_bootstrap_parameters, commit 때 재사용)
+        self.method_sessions = {}  # Method별 시트 이름 → 같은 방식으로 읽은 세션 (commit 때 함께 갱신)
+        self._filter_cache = {}  # (필터, 임계값) → apply_outlier_filter 결과 (IQR 이외)
+
+    @property
+    def net_count(self) -> int:
+        return 0 if self.matrix is None else self.matrix.shape[0]
+
+    def load(self) -> str:
+        """
+        결과 파일의 tinh LCLUCL 측정값과 Calculate USL LSL의 ERS 규격을 읽어 분석 배열 생성
+        (Method별 tinh LCLUCL 시트가 있으면 시트마다 세션을 만들어 method_sessions에 보관,
+        결과 파일에 적용된 파라미터는 parameters에 보관)
+
+        Returns:
+            결과 메시지
+        """
+        try:
+            if not os.path.exists(self.output_file):
+                return f"Error: Output file not found: {self.output_file}"
+
+            wb = openpyxl.load_workbook(self.output_file, read_only=True, data_only=True)
+            try:
+                if TINH_SHEET_NAME not in wb.sheetnames:
+                    return f"Error: Sheet '{TINH_SHEET_NAME}' not found in {self.output_file}"
+
+                matrix, data_start_row = _read_tinh_matrix(wb, TINH_SHEET_NAME)
+                if matrix is None:
+                    return f"Error: No measurement data in '{TINH_SHEET_NAME}'"
+                net_count = matrix.shape[0]
+                parameters = read_limit_parameters(wb)
+                bootstrap_parameters = read_bootstrap_parameters(wb)
+
+                method_sessions = {}
+                for sheet_name in method_sheet_names(wb):
+                    method_matrix, method_start_row = _read_tinh_matrix(wb, sheet_name)
+                    if method_matrix is None:
+                        continue
+                    method_session = LimitSimulationSession(self.output_file)
+                    method_session._build(method_matrix)
+                    method_session.data_start_row = method_start_row
+                    method_sessions[sheet_name] = method_session
+
+                ers_lsl = np.full(net_count, np.nan)
+                ers_usl = np.full(net_count, np.nan)
+                if CALC_SHEET_NAME in wb.sheetnames:
+                    ws_calc = wb[CALC_SHEET_NAME]
+                    for net_idx, row in enumerate(ws_calc.iter_rows(min_row=CALC_DATA_START_ROW,
+                                                                    max_row=CALC_DATA_START_ROW + net_count - 1,
+                                                                    min_col=8, max_col=9, values_only=True)):
+                        if isinstance(row[0], (int, float)):
+                            ers_lsl[net_idx] = row[0] / ERS_UNIT_SCALE
+                        if isinstance(row[1], (int, float)):
+                            ers_usl[net_idx] = row[1] / ERS_UNIT_SCALE
+            finally:
+                wb.close()
+
+            self._build(matrix)
+            self.data_start_row = data_start_row
+            self.ers_lsl = ers_lsl
+            self.ers_usl = ers_usl
+            self.method_sessions = method_sessions
+            self.parameters = parameters
+            self.bootstrap_parameters = bootstrap_parameters
+
+            result_msg = (f"Success: Loaded {net_count} NETs × {matrix.shape[1]} measurements "
+                          f"from '{TINH_SHEET_NAME}'")
+            if method_sessions:
+                result_msg += f" (+ {len(method_sessions)} Method sheets)"
+            result_msg += "\nApplied: " + limit_parameter_text(**parameters)
+            return result_msg
+        except Exception as e:
+            import traceback
+            return f"Error: {str(e)}\n{traceback.format_exc()}"
+
+    def _build(self, matrix: np.ndarray):
+        """정렬 배열, 누적합, 사분위수 준비 (로드 시 1회)"""
+        self.matrix = matrix
+        valid = ~np.isnan(matrix)
+        self.counts = valid.sum(axis=1)
+        self.sorted_vals = np.sort(matrix, axis=1)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            center = np.where(valid, matrix, 0.0).sum(axis=1) / self.counts
+        self.center = np.nan_to_num(center)
+
+        # 기준값을 뺀 값의 누적합 (큰 값끼리 빼면서 생기는 오차 방지)
+        shifted = np.nan_to_num(self.sorted_vals - self.center[:, None])
+        zeros = np.zeros((len(matrix), 1))
+        self.prefix_sum = np.hstack([zeros, np.cumsum(shifted, axis=1)])
+        self.prefix_sq = np.hstack([zeros, np.cumsum(shifted * shifted, axis=1)])
+
+        self.q1 = sorted_row_quantile(self.sorted_vals, self.counts, 0.25)
+        self.q3 = sorted_row_quantile(self.sorted_vals, self.counts, 0.75)
+        self._filter_cache = {}
+
+    def _range_stats(self, start: np.ndarray, end: np.ndarray):
+        """정렬 배열 [start, end) 구간의 (개수, 평균, 표본 표준편차) - 누적합으로 O(1)"""
+        rows = np.arange(len(start))
+        n = end - start
+        s1 = self.prefix_sum[rows, end] - self.prefix_sum[rows, start]
+        s2 = self.prefix_sq[rows, end] - self.prefix_sq[rows, start]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = s1 / n
+            var = (s2 - s1 * mean) / (n - 1)
+        std = np.where(n > 1, np.sqrt(np.maximum(var, 0.0)), 0.0)
+        return n, self.center + mean, std
+
+    def _iqr_window_stats(self, iqr_factor):
+        """IQR 필터: 1stQuat-fIQR (0 미만이면 0) < 값 < 3rdQuat+fIQR 범위 → 정렬 배열의 [a, b) 구간 통계"""
+        counts = self.counts
+        iqr = self.q3 - self.q1
+        lower = np.maximum(0, self.q1 - iqr_factor * iqr)
+        upper = self.q3 + iqr_factor * iqr
+        a = _row_searchsorted(self.sorted_vals, counts, lower, side='right')
+        b = np.maximum(_row_searchsorted(self.sorted_vals, counts, upper, side='left'), a)
+
+        # 범위 안 값이 없으면 전체 값 사용
+        empty = (b - a) == 0
+        a = np.where(empty, 0, a)
+        b = np.where(empty, counts, b)
+        retained, avg_ifs, std_ifs = self._range_stats(a, b)
+        return {"lower": lower, "upper": upper, "retained": retained,
+                "avg_ifs": avg_ifs, "std_ifs": std_ifs}
+
+    def _filter_stats(self, outlier_filter: str, filter_threshold) -> dict:
+        """IQR 이외 필터: 전체 행렬 마스크 연산 결과를 (필터, 임계값)별로 저장해 재사용"""
+        key = (outlier_filter, float(filter_threshold))
+        if key not in self._filter_cache:
+            if len(self._filter_cache) >= 16:
+                self._filter_cache.clear()
+            filter_result = apply_outlier_filter(self.matrix, outlier_filter, filter_threshold,
+                                                 sorted_vals=self.sorted_vals)
+            filter_result.pop("keep")
+            self._filter_cache[key] = filter_result
+        return self._filter_cache[key]
+
+    def simulate(self, sigma_k=SIGMA_K, filter_threshold=None, guard_band=GUARD_BAND_MOHM,
+                 outlier_filter: str = DEFAULT_OUTLIER_FILTER) -> dict:
+        """
+        파라미터로 모든 NET의 AverageIfs/Stdev ifs, LSL/USL, On machine 규격, 수율 재계산
+
+        Args:
+            sigma_k: LSL/USL 시그마 배수
+            filter_threshold: 이상치 필터 임계값 (None이면 필터 기본값, IQR 필터는 IQR 배수)
+            guard_band: On machine 규격 guard band (mΩ)
+            outlier_filter: 이상치 필터 ("iqr", "mad", "sigma_clip", "esd")
+
+        Returns:
+            NET별 배열 + 전체 수율 딕셔너리
+            {"avg_ifs", "std_ifs", "retained", "filter_lower", "filter_upper", "lsl", "usl",
+             "machine_lsl", "machine_usl", "in_spec", "yield", "total_yield", "ng_nets",
+             "elapsed_ms", 파라미터}
+        """
+        start_time = time.perf_counter()
+        counts = self.counts
+        if filter_threshold is None:
+            filter_threshold = default_filter_threshold(outlier_filter)
+
+        if outlier_filter == "iqr":
+            filter_stats = self._iqr_window_stats(filter_threshold)
+        else:
+            filter_stats = self._filter_stats(outlier_filter, filter_threshold)
+        avg_ifs = filter_stats["avg_ifs"].copy()
+        std_ifs = filter_stats["std_ifs"].copy()
+        no_data = counts == 0
+        avg_ifs[no_data] = np.nan
+        std_ifs[no_data] = np.nan
+
+        # Calculated LSL/USL (소수점 3자리 내림/올림)
+        lsl = np.floor(np.maximum(0, avg_ifs - sigma_k * std_ifs) * 1000) / 1000
+        usl = np.ceil((avg_ifs + sigma_k * std_ifs) * 1000) / 1000
+
+        # On machine 규격 (mΩ 정수, DCR 파일에 기록되는 값)
+        with np.errstate(invalid='ignore'):
+            machine_lsl = np.trunc(np.maximum(0, avg_ifs - sigma_k * std_ifs) * 1000) - guard_band
+            machine_usl = np.trunc((avg_ifs + sigma_k * std_ifs) * 1000) + guard_band
+        if self.net_count:
+            machine_lsl[-1], machine_usl[-1] = LAST_NET_LIMITS_MOHM
+
+        # 수율: On machine 규격 안의 측정값 비율
+        in_spec = (_row_searchsorted(self.sorted_vals, counts, machine_usl / 1000, side='right')
+                   - _row_searchsorted(self.sorted_vals, counts, machine_lsl / 1000, side='left'))
+        in_spec = np.where(no_data, 0, np.maximum(in_spec, 0))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            net_yield = in_spec / counts
+        total = int(counts.sum())
+
+        return {
+            "sigma_k": sigma_k,
+            "filter_threshold": filter_threshold,
+            "guard_band": guard_band,
+            "outlier_filter": outlier_filter,
+            "avg_ifs": avg_ifs,
+            "std_ifs": std_ifs,
+            "retained": filter_stats["retained"],
+            "filter_lower": filter_stats["lower"],
+            "filter_upper": filter_stats["upper"],
+            "lsl": lsl,
+            "usl": usl,
+            "machine_lsl": machine_lsl,
+            "machine_usl": machine_usl,
+            "in_spec": in_spec,
+            "yield": net_yield,
+            "total_yield": float(in_spec.sum()) / total if total else float('nan'),
+            "ng_nets": int(((in_spec < counts) & ~no_data).sum()),
+            "elapsed_ms": (time.perf_counter() - start_time) * 1000,
+        }
+
+    def summary(self, result: dict) -> str:
+        """시뮬레이션 결과 한 줄 요약"""
+        net_yield = result["yield"][~np.isnan(result["yield"])]
+        worst = f"{net_yield.min() * 100:.2f}%" if len(net_yield) else "N/A"
+        parameter_text = limit_parameter_text(result["sigma_k"], result["filter_threshold"],
+                                              result["guard_band"], result["outlier_filter"])
+        return (f"{parameter_text}: "
+                f"yield {result['total_yield'] * 100:.3f}%, worst NET {worst}, "
+                f"NETs with NG {result['ng_nets']}/{self.net_count} "
+                f"({result['elapsed_ms']:.1f} ms)")
+
+    def _write_tinh_limits(self, wb, sheet_name: str, result: dict, ng: dict, capability: dict) -> NetColumnSheets:
+        """
+        tinh LCLUCL 레이아웃 시트의 파라미터 의존 행 갱신
+        (레이블, Row 7-8 NG 개수, Row 15-20, Row 21-24 3σ 공정 능력, Row 29 사용 개수)
+
+        Args:
+            wb: 결과 워크북
+            sheet_name: 시트 이름 (tinh LCLUCL 또는 Method별 시트, 이 세션이 읽은 시트)
+            result: 이 세션의 simulate() 결과
+            ng: 3σ 규격 count_out_of_spec() 결과
+            capability: 3σ 규격 calculate_capability() 결과
+
+        Returns:
+            갱신한 시트 묶음
+        """
+        sigma_k = result["sigma_k"]
+        filter_threshold = result["filter_threshold"]
+        outlier_filter = result["outlier_filter"]
+        x = self.net_count
+        data_start_row = self.data_start_row
+        data_end_row = data_start_row + self.matrix.shape[1] - 1
+        # 나뉜 결과 파일은 NET별 시트/열 (측정값 행이 나뉘었으면 Row 15-16 범위 수식 대신 값)
+        sheets = NetColumnSheets.open(wb, sheet_name, x, data_start_row)
+
+        for ws_tinh, _ in sheets.header_sheets():
+            for row_idx, label in limit_row_labels(sigma_k, filter_threshold, outlier_filter).items():
+                ws_tinh.cell(row=row_idx, column=1).value = label
+        for net_idx in range(x):
+            ws_tinh, col = sheets.locate(net_idx)
+            col_letter = get_column_letter(col)
+            data_range = "" if sheets.row_sharded else f"{col_letter}${data_start_row}:{col_letter}${data_end_row}"
+            formulas = limit_formulas(col_letter, data_range, sigma_k, filter_threshold, outlier_filter)
+            formulas.setdefault(15, filter_bound_value(result["filter_lower"][net_idx]))
+            formulas.setdefault(16, filter_bound_value(result["filter_upper"][net_idx]))
+            for row_idx, formula in formulas.items():
+                ws_tinh.cell(row=row_idx, column=col).value = formula
+            if data_start_row > TINH_RETAINED_ROW:  # 사용 개수 행이 없는 이전 결과 파일은 건너뜀
+                ws_tinh.cell(row=TINH_RETAINED_ROW, column=col).value = int(result["retained"][net_idx])
+            if self.counts[net_idx] > 0:
+                ws_tinh.cell(row=17, column=col).value = float(result["avg_ifs"][net_idx])
+                ws_tinh.cell(row=18, column=col).value = float(result["std_ifs"][net_idx])
+            ws_tinh.cell(row=7, column=col).value = int(ng["under_count"][net_idx])
+            ws_tinh.cell(row=8, column=col).value = int(ng["over_count"][net_idx])
+        write_capability_rows(sheets, capability, TINH_CAPABILITY_START_ROW)
+        return sheets
+
+    def commit(self, sigma_k=SIGMA_K, filter_threshold=None, guard_band=GUARD_BAND_MOHM,
+               outlier_filter: str = DEFAULT_OUTLIER_FILTER) -> str:
+        """
+        선택한 파라미터로 결과 파일(tinh LCLUCL, Method별 tinh LCLUCL, Calculate USL LSL, NG index)과
+        DCR 파일(3 sigma spec / On machine 열)을 갱신
+
+        Returns:
+            결과 메시지
+        """
+        try:
+            if self.matrix is None:
+                return "Error: Session is not loaded"
+
+            result = self.simulate(sigma_k, filter_threshold, guard_band, outlier_filter)
+            filter_threshold = result["filter_threshold"]
+            parameter_text = limit_parameter_text(sigma_k, filter_threshold, guard_band, outlier_filter)
+            x = self.net_count
+            debug_info = []
+
+            capability = calculate_capability(self.matrix, result["lsl"], result["usl"])
+            ng_results = {"3σ": count_out_of_spec(self.matrix, result["lsl"], result["usl"]),
+                          "ERS": count_out_of_spec(self.matrix, self.ers_lsl, self.ers_usl)}
+
+            wb = openpyxl.load_workbook(self.output_file)
+            sheets = self._write_tinh_limits(wb, TINH_SHEET_NAME, result, ng_results["3σ"], capability)
+            debug_info.append(f"{TINH_SHEET_NAME}: {x} NETs updated")
+
+            # Method별 tinh LCLUCL 시트: 같은 파라미터로 각 Method의 측정값에서 다시 계산
+            for sheet_name, method_session in self.method_sessions.items():
+                if sheet_name not in wb.sheetnames:
+                    continue
+                method_result = method_session.simulate(sigma_k, filter_threshold, guard_band, outlier_filter)
+                method_session._write_tinh_limits(
+                    wb, sheet_name, method_result,
+                    count_out_of_spec(method_session.matrix, method_result["lsl"], method_result["usl"]),
+                    calculate_capability(method_session.matrix, method_result["lsl"], method_result["usl"]))
+                debug_info.append(f"{sheet_name}: {method_session.net_count} NETs updated")
+            data_start_row = self.data_start_row
+
+            # 부트스트랩 신뢰구간이 있던 결과 파일이면 새 파라미터로 다시 계산 (이전 값이 남지 않도록,
+            # 재표본 수 / 신뢰 수준 / 시드는 결과 파일에 기록된 설정 그대로)
+            bootstrap_ci = None
+            bootstrap_parameters = self.bootstrap_parameters
+            if data_start_row > TINH_CI_START_ROW and sheets.cell(row=TINH_CI_START_ROW, net_idx=0).value is not None:
+                bootstrap_ci = bootstrap_limits(self.matrix, sigma_k, outlier_filter, filter_threshold,
+                                                **bootstrap_parameters)
+                write_bootstrap_rows(sheets, bootstrap_ci, TINH_CI_START_ROW)
+                debug_info.append(f"Bootstrap CI: {bootstrap_parameters['n_resamples']} resamples recalculated "
+                                  f"({bootstrap_parameters['confidence'] * 100:g}% CI, "
+                                  f"seed {bootstrap_parameters['seed']})")
+
+            # Calculate USL LSL: 파라미터, Q-R 계산 규격, N-O guard band, U-X 공정 능력, AC-AD NG 개수
+            if CALC_SHEET_NAME in wb.sheetnames:
+                ws_calc = wb[CALC_SHEET_NAME]
+                ws_calc.cell(row=2, column=17).value = parameter_text
+                calc_rows = 0
+                for net_idx in range(x):
+                    row_idx = CALC_DATA_START_ROW + net_idx
+                    if ws_calc.cell(row=row_idx, column=1).value is None:
+                        break
+                    if net_idx < x - 1:  # 마지막 행 (GND-SUS)은 고정값 유지
+                        lsl_val = result["lsl"][net_idx]
+                        usl_val = result["usl"][net_idx]
+                        ws_calc.cell(row=row_idx, column=17).value = None if np.isnan(lsl_val) else float(lsl_val)
+                        ws_calc.cell(row=row_idx, column=18).value = None if np.isnan(usl_val) else float(usl_val)
+                        raw_lsl_formula, raw_usl_formula = guard_band_formulas(row_idx, guard_band)
+                        ws_calc.cell(row=row_idx, column=14).value = raw_lsl_formula
+                        ws_calc.cell(row=row_idx, column=15).value = raw_usl_formula
+                    for offset, index_name in enumerate(CAPABILITY_INDICES):
+                        ws_calc.cell(row=row_idx, column=CALC_CAPABILITY_START_COL + offset).value = (
+                            capability_cell_value(capability[index_name][net_idx]))
+                    ng = ng_results["3σ"]
+                    ws_calc.cell(row=row_idx, column=CALC_NG_START_COL).value = int(ng["under_count"][net_idx])
+                    ws_calc.cell(row=row_idx, column=CALC_NG_START_COL + 1).value = int(ng["over_count"][net_idx])
+                    calc_rows += 1
+                if bootstrap_ci is not None and ws_calc.cell(row=3, column=CALC_CI_START_COL).value is not None:
+                    write_bootstrap_columns(ws_calc, bootstrap_ci, CALC_DATA_START_ROW, calc_rows,
+                                            bootstrap_parameters["confidence"], write_header=False)
+                debug_info.append(f"{CALC_SHEET_NAME}: {calc_rows} rows updated")
+
+            # NG index: 새 규격으로 다시 작성 (나뉜 시트와 Shard index 기록 포함)
+            remove_content_sheets(wb, NG_INDEX_SHEET_NAME)
+            ng_rows = write_ng_index_sheet(wb, self.matrix, ng_results)
+            debug_info.append(f"{NG_INDEX_SHEET_NAME}: {ng_rows} rows")
+
+            write_limit_parameters(wb, sigma_k, filter_threshold, guard_band, outlier_filter)
+            wb.save(self.output_file)
+            wb.close()
+            self.parameters = {"sigma_k": sigma_k, "filter_threshold": filter_threshold,
+                               "guard_band": guard_band, "outlier_filter": outlier_filter}
+
+            # DCR 파일: L-M (3 sigma spec), N-O (On machine)
+            if self.dcr_file and os.path.exists(self.dcr_file):
+                wb_dcr = openpyxl.load_workbook(self.dcr_file)
+                if 'DCR' in wb_dcr.sheetnames:
+                    ws_dcr = wb_dcr['DCR']
+                    updated_count = 0
+                    for net_idx in range(x):
+                        row_idx = DCR_DATA_START_ROW + net_idx
+                        if net_idx == x - 1:
+                            limits = LAST_NET_LIMITS_MOHM
+                        elif self.counts[net_idx] > 0:
+                            limits = machine_limits_mohm(float(result["avg_ifs"][net_idx]),
+                                                         float(result["std_ifs"][net_idx]), sigma_k, guard_band)
+                        else:
+                            continue
+                        for col_idx, val in zip((12, 13, 14, 15), limits * 2):
+                            ws_dcr.cell(row=row_idx, column=col_idx, value=val)
+                        updated_count += 1
+                    wb_dcr.save(self.dcr_file)
+                    debug_info.append(f"DCR file: {updated_count} rows updated")
+                else:
+                    debug_info.append("Warning: DCR sheet not found for update")
+                wb_dcr.close()
+            else:
+                debug_info.append("Warning: DCR file not found - skipped")
+
+            result_msg = f"Success: Applied {parameter_text}\n"
+            result_msg += self.summary(result) + "\n"
+            result_msg += "Debug:\n  " + "\n  ".join(debug_info)
+            return result_msg
+
+        except Exception as e:
+            import traceback
+            return f"Error: {str(e)}\n{traceback.format_exc()}"
@@ -10,6 +10,8 @@ from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
 from copy import copy
 import os
 
+from logic.cancellation import check_cancelled
+
 
 def get_de_requirement_data(wb) -> tuple:
     """
@@ -98,7 +100,7 @@ def get_input_check_pin_data(wb) -> tuple:
     return group_data, num_groups
 
 
-def make_dcr_sheet(outfile_path: str) -> str:
+def make_dcr_sheet(outfile_path: str, cancel_token=None) -> str:
     """
     DCR 시트를 outfile에 생성합니다.
     
@@ -110,6 +112,7 @@ def make_dcr_sheet(outfile_path: str) -> str:
     
     Args:
         outfile_path: 출력 파일 경로
+        cancel_token: 취소 요청 토큰 (logic.cancellation.CancelToken, None이면 확인 안 함)
     
     Returns:
         결과 메시지
@@ -240,6 +243,7 @@ def make_dcr_sheet(outfile_path: str) -> str:
         data_start_row = 4
         
         for idx, (net, part1, pin1, part2, pin2, part_pin1, part_pin2) in enumerate(de_data):
+            check_cancelled(cancel_token)
             row = data_start_row + idx
             
             # A열: =Q{row}&S{row} (Gr1의 2,4번째 값 결합)
@@ -304,6 +308,7 @@ def make_dcr_sheet(outfile_path: str) -> str:
             ws.column_dimensions[get_column_letter(col)].width = 8
         
         # 파일 저장
+        check_cancelled(cancel_token)
         wb.save(outfile_path)
         wb.close()
         
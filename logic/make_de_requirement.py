@@ -8,6 +8,8 @@ from openpyxl.utils import get_column_letter
 from openpyxl.styles import PatternFill, Font
 import os
 
+from logic.cancellation import check_cancelled
+
 
 def auto_adjust_column_width(worksheet):
     """
@@ -51,7 +53,7 @@ def apply_header_style(worksheet, row_number, fill_color="4472C4"):
         cell.font = white_font
 
 
-def make_de_requirement_sheet(partpin_path: str, outfile_path: str) -> str:
+def make_de_requirement_sheet(partpin_path: str, outfile_path: str, cancel_token=None) -> str:
     """
     partpin 파일의 sheet2에서 continuity 데이터를 읽어서
     outfile의 'DE requirement' sheet로 저장
@@ -59,6 +61,7 @@ def make_de_requirement_sheet(partpin_path: str, outfile_path: str) -> str:
     Args:
         partpin_path: partpin 파일 경로
         outfile_path: 출력 파일 경로
+        cancel_token: 취소 요청 토큰 (logic.cancellation.CancelToken, None이면 확인 안 함)
         
     Returns:
         결과 메시지
@@ -86,6 +89,7 @@ def make_de_requirement_sheet(partpin_path: str, outfile_path: str) -> str:
         continuity_col = None  # continuity 셀의 column 번호 (1-based)
         
         for row_idx in range(1, sheet2.max_row + 1):
+            check_cancelled(cancel_token)
             for col_idx in range(1, sheet2.max_column + 1):
                 cell_val = sheet2.cell(row=row_idx, column=col_idx).value
                 if cell_val and str(cell_val).lower() == "continuity":
@@ -115,6 +119,7 @@ def make_de_requirement_sheet(partpin_path: str, outfile_path: str) -> str:
         prev_net_name = ""  # 이전 행의 NET 이름 저장
         
         for row_idx in range(header_row + 1, sheet2.max_row + 1):
+            check_cancelled(cancel_token)
             # NET 컬럼 (continuity_col + 1)
             net_name = sheet2.cell(row=row_idx, column=continuity_col + 1).value
             
@@ -166,6 +171,7 @@ def make_de_requirement_sheet(partpin_path: str, outfile_path: str) -> str:
         address_image_col = None
         
         for row_idx in range(1, sheet1.max_row + 1):
+            check_cancelled(cancel_token)
             for col_idx in range(1, sheet1.max_column + 1):
                 cell_val = sheet1.cell(row=row_idx, column=col_idx).value
                 if cell_val:
@@ -258,6 +264,7 @@ def make_de_requirement_sheet(partpin_path: str, outfile_path: str) -> str:
         
         # 데이터 작성 (3행부터)
         for row_idx, row_data in enumerate(data_rows, 3):
+            check_cancelled(cancel_token)
             # 기존 8개 컬럼 데이터
             for col_idx, value in enumerate(row_data, 1):
                 ws_de.cell(row=row_idx, column=col_idx, value=value)
@@ -315,6 +322,7 @@ def make_de_requirement_sheet(partpin_path: str, outfile_path: str) -> str:
         apply_header_style(ws_de, 2)
         
         # 파일 저장
+        check_cancelled(cancel_token)
         wb_out.save(outfile_path)
         wb_out.close()
         
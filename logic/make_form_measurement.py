@@ -12,9 +12,28 @@ from copy import copy
 import os
 import sys
 import re
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+import xlrd
 
-from logic.visualizer import save_form_plots_from_workbook
+from logic.cancellation import OperationCancelled, check_cancelled
+from logic.cover_page import write_cover_page
+from logic.file_reader import list_excel_sheet_names, resolve_sheet_name
+from logic.parse_cache import (load_parse_cache, get_cached_entry, set_cached_entry,
+                               save_parse_cache, file_signature, to_json_value)
+
+
+# Form Measurement Result 결과 시트 이름
+FORM_SHEET_NAME = "Physical Analysis"
+
+# DK 파일 'Form kq' 시트의 TDR 영역 (0-indexed)
+TDR_HEADER_ROW = 10      # STT/TDR 헤더 행
+TDR_DATA_START_ROW = 12  # TDR 데이터 시작 행
+TDR_DATA_END_ROW = 44    # TDR 데이터 끝 행 (미포함, 32개)
+
+# Dimension 시트의 DK 섹션 영역 (0-indexed)
+DIM_HEADER_ROW = 5       # DK 헤더 행
+DIM_DATA_START_ROW = 34  # 1번 데이터 행
+DIM_DATA_END_ROW = 43    # 10번 데이터 행 (포함)
 
 
 def get_template_path() -> str:
@@ -39,6 +58,72 @@ def get_template_path() -> str:
     return template_path
 
 
+def _build_form_workbook(template_path: str, debug_info: list):
+    """
+    템플릿의 구조(값, 스타일, 병합 셀, 열 너비, 행 높이)를 하드카피한 새 워크북 생성
+    
+    Args:
+        template_path: 템플릿 파일 경로
+        debug_info: 디버그 메시지 리스트 (append됨)
+        
+    Returns:
+        openpyxl Workbook 객체 (저장하지 않은 상태)
+    """
+    # 템플릿 파일 열기
+    wb_template = load_workbook(template_path)
+    ws_template = wb_template.active
+    
+    debug_info.append(f"Template: {ws_template.title}")
+    debug_info.append(f"Size: {ws_template.max_row} rows x {ws_template.max_column} cols")
+    
+    # 새 워크북 생성
+    wb_out = Workbook()
+    ws_out = wb_out.active
+    ws_out.title = FORM_SHEET_NAME
+    
+    # === Row 1-2 (헤더) 하드카피 ===
+    # 병합 셀 정보 먼저 복사
+    for merged_range in ws_template.merged_cells.ranges:
+        ws_out.merge_cells(str(merged_range))
+    
+    debug_info.append(f"Merged cells: {len(list(ws_template.merged_cells.ranges))}")
+    
+    # 모든 데이터 및 스타일 복사
+    for row in range(1, ws_template.max_row + 1):
+        for col in range(1, ws_template.max_column + 1):
+            source_cell = ws_template.cell(row=row, column=col)
+            target_cell = ws_out.cell(row=row, column=col)
+            
+            try:
+                # 값 복사
+                target_cell.value = source_cell.value
+                
+                # 스타일 복사
+                if source_cell.has_style:
+                    target_cell.font = copy(source_cell.font)
+                    target_cell.fill = copy(source_cell.fill)
+                    target_cell.border = copy(source_cell.border)
+                    target_cell.alignment = copy(source_cell.alignment)
+                    target_cell.number_format = source_cell.number_format
+            except AttributeError:
+                # MergedCell인 경우 스킵
+                pass
+    
+    # 컬럼 너비 복사
+    for col in range(1, ws_template.max_column + 1):
+        col_letter = get_column_letter(col)
+        if ws_template.column_dimensions[col_letter].width:
+            ws_out.column_dimensions[col_letter].width = ws_template.column_dimensions[col_letter].width
+    
+    # 행 높이 복사
+    for row in range(1, ws_template.max_row + 1):
+        if ws_template.row_dimensions[row].height:
+            ws_out.row_dimensions[row].height = ws_template.row_dimensions[row].height
+    
+    wb_template.close()
+    return wb_out
+
+
 def create_form_measurement_file(output_path: str) -> str:
     """
     Form measurement result 파일을 생성합니다.
@@ -56,59 +141,8 @@ def create_form_measurement_file(output_path: str) -> str:
         if not os.path.exists(template_path):
             return f"Error: Template file not found: {template_path}"
         
-        # 템플릿 파일 열기
-        wb_template = load_workbook(template_path)
-        ws_template = wb_template.active
-        
         debug_info = []
-        debug_info.append(f"Template: {ws_template.title}")
-        debug_info.append(f"Size: {ws_template.max_row} rows x {ws_template.max_column} cols")
-        
-        # 새 워크북 생성
-        wb_out = Workbook()
-        ws_out = wb_out.active
-        ws_out.title = "Physical Analysis"
-        
-        # === Row 1-2 (헤더) 하드카피 ===
-        # 병합 셀 정보 먼저 복사
-        for merged_range in ws_template.merged_cells.ranges:
-            ws_out.merge_cells(str(merged_range))
-        
-        debug_info.append(f"Merged cells: {len(list(ws_template.merged_cells.ranges))}")
-        
-        # 모든 데이터 및 스타일 복사
-        for row in range(1, ws_template.max_row + 1):
-            for col in range(1, ws_template.max_column + 1):
-                source_cell = ws_template.cell(row=row, column=col)
-                target_cell = ws_out.cell(row=row, column=col)
-                
-                try:
-                    # 값 복사
-                    target_cell.value = source_cell.value
-                    
-                    # 스타일 복사
-                    if source_cell.has_style:
-                        target_cell.font = copy(source_cell.font)
-                        target_cell.fill = copy(source_cell.fill)
-                        target_cell.border = copy(source_cell.border)
-                        target_cell.alignment = copy(source_cell.alignment)
-                        target_cell.number_format = source_cell.number_format
-                except AttributeError:
-                    # MergedCell인 경우 스킵
-                    pass
-        
-        # 컬럼 너비 복사
-        for col in range(1, ws_template.max_column + 1):
-            col_letter = get_column_letter(col)
-            if ws_template.column_dimensions[col_letter].width:
-                ws_out.column_dimensions[col_letter].width = ws_template.column_dimensions[col_letter].width
-        
-        # 행 높이 복사
-        for row in range(1, ws_template.max_row + 1):
-            if ws_template.row_dimensions[row].height:
-                ws_out.row_dimensions[row].height = ws_template.row_dimensions[row].height
-        
-        wb_template.close()
+        wb_out = _build_form_workbook(template_path, debug_info)
         
         # 파일 저장
         wb_out.save(output_path)
@@ -124,6 +158,38 @@ def create_form_measurement_file(output_path: str) -> str:
         return f"Error: {str(e)}\n{traceback.format_exc()}"
 
 
+def _build_inner_index(ws) -> dict:
+    """
+    결과 시트의 B열(Inner)을 한 번 스캔하여 Inner→행 매핑 생성
+    
+    Args:
+        ws: 결과 워크시트
+        
+    Returns:
+        {"impedance": {inner: row}, "inner": {INNER(대문자): row}}
+        - impedance: Impedance NET resistance 행 (DK TDR 데이터용)
+        - inner: 각 Inner 그룹의 시작 행 (Dimension/LSLUSL용)
+    """
+    impedance_rows = {}
+    inner_rows = {}
+    
+    for row in range(3, ws.max_row + 1):
+        inner_val = ws.cell(row=row, column=2).value  # B열 (Inner)
+        if not inner_val:
+            continue
+        
+        inner_rows[str(inner_val).strip().upper()] = row
+        
+        content_val = ws.cell(row=row, column=4).value  # D열 (Contents)
+        if content_val:
+            content_str = str(content_val).lower()
+            # Impedance NET resistance 행 찾기
+            if 'impedance' in content_str and 'resistance' in content_str:
+                impedance_rows[str(inner_val).strip()] = row
+    
+    return {"impedance": impedance_rows, "inner": inner_rows}
+
+
 def get_inner_value_from_filename(filename: str) -> str:
     """
     파일명에서 inner 값 추출
@@ -135,9 +201,41 @@ def get_inner_value_from_filename(filename: str) -> str:
     return value
 
 
+def _find_tdr_window(header_row: list, rows: list) -> list:
+    """
+    Row 10 헤더에서 TDR 컬럼을 찾아 Row 12-43의 숫자 값만 반환
+
+    Args:
+        header_row: Row 10 (0-indexed) 값 리스트
+        rows: Row 12-43 (0-indexed) 각 행의 값 리스트
+
+    Returns:
+        TDR 값 리스트 (TDR 컬럼이 없으면 빈 리스트)
+    """
+    tdr_col = None
+    for col, val in enumerate(header_row):
+        if val is not None and str(val).upper() == 'TDR':
+            tdr_col = col
+            break
+
+    if tdr_col is None:
+        return []
+
+    tdr_data = []
+    for row_values in rows:
+        val = row_values[tdr_col] if tdr_col < len(row_values) else None
+        # NaN(val != val) 제외
+        if isinstance(val, (int, float)) and not isinstance(val, bool) and val == val:
+            tdr_data.append(val)
+    return tdr_data
+
+
 def read_tdr_data_from_dk_file(file_path: str) -> list:
     """
     DK 파일의 'Form kq' 시트에서 TDR 데이터를 읽음
+    시트 전체가 아니라 필요한 범위(Row 10 헤더, Row 12-43 데이터)만 읽는다.
+    - .xls: xlrd on_demand로 'Form kq' 시트만 로드
+    - 그 외(.xlsx 등): pandas로 앞쪽 44행만 읽음
     
     Args:
         file_path: DK 파일 경로 (.xls)
@@ -146,33 +244,103 @@ def read_tdr_data_from_dk_file(file_path: str) -> list:
         TDR 값 리스트 (1-32)
     """
     try:
-        df = pd.read_excel(file_path, sheet_name='Form kq', header=None)
-        
-        # STT와 TDR 컬럼 찾기 (Row 10에서)
-        tdr_col = None
-        for col in range(df.shape[1]):
-            val = df.iloc[10, col] if 10 < df.shape[0] else None
-            if pd.notna(val) and str(val).upper() == 'TDR':
-                tdr_col = col
-                break
-        
-        if tdr_col is None:
-            return []
-        
-        # TDR 데이터 추출 (Row 12부터 32개)
-        tdr_data = []
-        for row in range(12, min(44, df.shape[0])):  # Row 12-43 (32개)
-            val = df.iloc[row, tdr_col]
-            if pd.notna(val) and isinstance(val, (int, float)):
-                tdr_data.append(val)
+        if file_path.lower().endswith('.xls'):
+            book = xlrd.open_workbook(file_path, on_demand=True)
+            try:
+                sheet = book.sheet_by_name('Form kq')
+                if sheet.nrows <= TDR_HEADER_ROW:
+                    return []
+                header_row = sheet.row_values(TDR_HEADER_ROW)
+                rows = []
+                for row in range(TDR_DATA_START_ROW, min(TDR_DATA_END_ROW, sheet.nrows)):
+                    # 숫자 셀만 값으로, 나머지는 None 처리
+                    rows.append([
+                        sheet.cell_value(row, col) if sheet.cell_type(row, col) == xlrd.XL_CELL_NUMBER else None
+                        for col in range(sheet.row_len(row))
+                    ])
+            finally:
+                book.release_resources()
+        else:
+            import pandas as pd
+            df = pd.read_excel(file_path, sheet_name='Form kq', header=None, nrows=TDR_DATA_END_ROW)
+            if df.shape[0] <= TDR_HEADER_ROW:
+                return []
+            header_row = [v if pd.notna(v) else None for v in df.iloc[TDR_HEADER_ROW].tolist()]
+            rows = [df.iloc[row].tolist() for row in range(TDR_DATA_START_ROW, min(TDR_DATA_END_ROW, df.shape[0]))]
         
-        return tdr_data
+        return _find_tdr_window(header_row, rows)
         
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
         return []
 
 
+def read_tdr_data_from_dk_files(file_paths: list, max_workers: int = None,
+                                use_cache: bool = True, cancel_token=None) -> dict:
+    """
+    여러 DK 파일의 TDR 데이터를 워커 풀로 병렬 읽기
+    use_cache가 True이면 파싱 캐시(logic.parse_cache)에서 변경되지 않은 파일은
+    다시 읽지 않고, 새로 읽은 파일만 캐시에 추가한다.
+    
+    Args:
+        file_paths: DK 파일 경로 리스트
+        max_workers: 최대 워커 수 (None이면 파일 수와 CPU 수 기준으로 자동 결정)
+        use_cache: 파싱 캐시 사용 여부
+        cancel_token: 취소 요청 토큰 (파일마다 확인)
+        
+    Returns:
+        {file_path: [TDR 값...]} 딕셔너리 (입력 순서 유지)
+    """
+    if not file_paths:
+        return {}
+    
+    results = {}
+    cache = load_parse_cache() if use_cache else None
+    
+    # 캐시 조회 (변경/신규 파일만 읽기 대상)
+    to_read = []
+    for fp in file_paths:
+        cached = get_cached_entry(cache, fp, "tdr") if cache is not None else None
+        if cached is not None:
+            results[fp] = cached
+        else:
+            to_read.append(fp)
+    
+    if to_read:
+        # 캐시 검증 정보는 읽기 전에 구함 (읽는 동안 바뀐 파일은 다음 실행에서 다시 읽도록)
+        signatures = {fp: file_signature(fp) for fp in to_read} if cache is not None else {}
+        if max_workers is None:
+            max_workers = min(len(to_read), (os.cpu_count() or 1) + 4, 16)
+        
+        read_results = []
+        if max_workers <= 1 or len(to_read) == 1:
+            for fp in to_read:
+                check_cancelled(cancel_token)
+                read_results.append(read_tdr_data_from_dk_file(fp))
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(read_tdr_data_from_dk_file, fp) for fp in to_read]
+                try:
+                    for future in futures:
+                        check_cancelled(cancel_token)
+                        read_results.append(future.result())
+                except OperationCancelled:
+                    # 아직 시작하지 않은 읽기는 취소 (읽는 중인 파일만 마저 끝남)
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+        
+        for fp, tdr_data in zip(to_read, read_results):
+            results[fp] = tdr_data
+            # 읽기 실패(빈 리스트)는 캐시하지 않음
+            if cache is not None and tdr_data:
+                set_cached_entry(cache, fp, "tdr", [to_json_value(v) for v in tdr_data], signatures[fp])
+    
+    if cache is not None:
+        save_parse_cache(cache)
+    
+    return {fp: results[fp] for fp in file_paths}
+
+
 def get_dk_files_in_directory(etching_dir: str) -> list:
     """
     etching 디렉토리에서 DK 파일들의 목록 반환
@@ -197,7 +365,83 @@ def get_dk_files_in_directory(etching_dir: str) -> list:
     return dk_files
 
 
-def _process_dk_files_into_workbook(ws, dk_files: list, debug_info: list):
+def snapshot_dk_files(etching_dir: str) -> dict:
+    """
+    etching 디렉토리의 DK 파일 상태(mtime, 크기) 스냅샷
+    
+    Args:
+        etching_dir: etching 디렉토리 경로
+        
+    Returns:
+        {file_path: (mtime, size)} 딕셔너리
+    """
+    snapshot = {}
+    for _, file_path in get_dk_files_in_directory(etching_dir):
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            continue
+        snapshot[file_path] = (st.st_mtime, st.st_size)
+    return snapshot
+
+
+def find_changed_dk_files(ingested: dict, previous: dict, current: dict) -> list:
+    """
+    Watch 모드용: 반영 이후 새로 생기거나 수정된 DK 파일 찾기
+    측정기가 파일을 쓰는 도중일 수 있으므로, 직전 폴링(previous)과
+    현재 폴링(current)의 상태가 같은(쓰기가 끝난) 파일만 반환한다.
+    
+    Args:
+        ingested: 마지막으로 반영한 시점의 스냅샷 {file_path: (mtime, size)}
+        previous: 직전 폴링 스냅샷
+        current: 현재 폴링 스냅샷
+        
+    Returns:
+        반영할 파일 경로 리스트
+    """
+    changed = []
+    for file_path, state in current.items():
+        if ingested.get(file_path) == state:
+            continue
+        if previous.get(file_path) != state:
+            # 아직 쓰는 중 (다음 폴링에서 다시 확인)
+            continue
+        changed.append(file_path)
+    return sorted(changed)
+
+
+def update_impedance_data(output_path: str, file_list: list, cancel_token=None) -> dict:
+    """
+    Watch 모드용 증분 업데이트
+    기존 Form Measurement Result 파일에서 주어진 DK 파일에 해당하는
+    Impedance 행과 요약 수식(Min/Max/Average/Judge)만 갱신한다.
+    (템플릿 복사, Dimension, LSL/USL 등 나머지 단계는 다시 실행하지 않음)
+    
+    Args:
+        output_path: 기존 출력 파일 경로
+        file_list: 새로 생기거나 수정된 DK 파일 경로 리스트
+        cancel_token: 취소 요청 토큰 (파일마다, 저장 전 확인)
+        
+    Returns:
+        {"message": 결과 메시지, "tdr_map": {inner: [TDR 값...]}} (갱신된 Inner만)
+        오류 시 에러 메시지 문자열
+    """
+    session = FormMeasurementSession(output_path, cancel_token=cancel_token)
+    result = session.load()
+    if _is_error(result):
+        return result
+    
+    result = session.fill_impedance_from_files(file_list, mode_label="Watch mode", update=True)
+    if isinstance(result, dict):
+        save_result = session.save()
+        if _is_error(save_result):
+            return save_result
+    session.close()
+    return result
+
+
+def _process_dk_files_into_workbook(ws, dk_files: list, debug_info: list, inner_to_row: dict = None,
+                                    cancel_token=None, use_cache: bool = True):
     """
     DK 파일 리스트를 받아서 워크시트에 TDR 데이터를 채우는 공통 로직
     
@@ -205,33 +449,28 @@ def _process_dk_files_into_workbook(ws, dk_files: list, debug_info: list):
         ws: openpyxl 워크시트 객체
         dk_files: [(inner_value, file_path), ...] 리스트
         debug_info: 디버그 메시지 리스트 (append됨)
+        inner_to_row: Impedance NET resistance 행 매핑 (None이면 시트를 스캔해서 생성)
+        cancel_token: 취소 요청 토큰 (파일마다 확인)
+        use_cache: 파싱 캐시 사용 여부
         
     Returns:
         (processed_count, tdr_map) 튜플
     """
-    # Inner 값과 행 매핑 찾기
-    inner_to_row = {}  # inner_value -> row_number (Impedance NET resistance 행)
-    
-    for row in range(3, ws.max_row + 1):
-        inner_val = ws.cell(row=row, column=2).value  # B열 (Inner)
-        content_val = ws.cell(row=row, column=4).value  # D열 (Contents)
-        
-        if inner_val and content_val:
-            inner_str = str(inner_val).strip()
-            content_str = str(content_val).lower()
-            
-            # Impedance NET resistance 행 찾기
-            if 'impedance' in content_str and 'resistance' in content_str:
-                inner_to_row[inner_str] = row
+    # Inner 값과 행 매핑 (inner_value -> Impedance NET resistance 행)
+    if inner_to_row is None:
+        inner_to_row = _build_inner_index(ws)["impedance"]
     
     debug_info.append(f"Inner mappings: {list(inner_to_row.keys())}")
     
-    # 각 DK 파일 처리
+    # 각 DK 파일 처리 (읽기는 병렬로 먼저 수행)
     processed = 0
     tdr_map = {}
+    tdr_by_file = read_tdr_data_from_dk_files([file_path for _, file_path in dk_files],
+                                              use_cache=use_cache, cancel_token=cancel_token)
     
     for inner_val, file_path in dk_files:
-        tdr_data = read_tdr_data_from_dk_file(file_path)
+        check_cancelled(cancel_token)
+        tdr_data = tdr_by_file.get(file_path, [])
         
         if not tdr_data:
             debug_info.append(f"No TDR data in {os.path.basename(file_path)}")
@@ -241,6 +480,10 @@ def _process_dk_files_into_workbook(ws, dk_files: list, debug_info: list):
         target_row = inner_to_row.get(inner_val)
         
         if target_row:
+            # 이전 값 지우기 (watch 모드에서 파일이 갱신되어 값 개수가 줄어든 경우 대비)
+            for col in range(5, 37):  # E ~ AJ
+                ws.cell(row=target_row, column=col).value = None
+            
             # E열(5)부터 데이터 채우기 (Impedance NET resistance 행)
             for idx, val in enumerate(tdr_data):
                 col = 5 + idx  # E=5, F=6, ...
@@ -255,6 +498,10 @@ def _process_dk_files_into_workbook(ws, dk_files: list, debug_info: list):
             for row_offset in range(4):  # 0, 1, 2, 3
                 row = target_row + row_offset
                 
+                # 이미 수식/조건부 서식이 있는 행은 건너뜀 (증분 업데이트 시 중복 방지)
+                if ws.cell(row=row, column=40).value is not None:
+                    continue
+                
                 ws.cell(row=row, column=40, value=f"=MIN(E{row}:AJ{row})")
                 ws.cell(row=row, column=41, value=f"=MAX(E{row}:AJ{row})")
                 ws.cell(row=row, column=42, value=f"=AVERAGE(E{row}:AJ{row})")
@@ -280,6 +527,30 @@ def _process_dk_files_into_workbook(ws, dk_files: list, debug_info: list):
     return processed, tdr_map
 
 
+def _is_error(result) -> bool:
+    """결과 메시지가 에러인지 확인 (문자열이고 'Error'로 시작)"""
+    return isinstance(result, str) and result.startswith("Error")
+
+
+def _run_on_existing_file(output_path: str, fill) -> str:
+    """
+    기존 출력 파일을 열어 fill(session)을 적용하고, 성공한 경우에만 저장
+    (개별 fill_* 함수용 공통 래퍼)
+    """
+    session = FormMeasurementSession(output_path)
+    result = session.load()
+    if _is_error(result):
+        return result
+    
+    result = fill(session)
+    if not _is_error(result):
+        save_result = session.save()
+        if _is_error(save_result):
+            return save_result
+    session.close()
+    return result
+
+
 def fill_impedance_data(output_path: str, etching_dir: str) -> str:
     """
     DK 파일들에서 TDR 데이터를 읽어서 
@@ -293,40 +564,7 @@ def fill_impedance_data(output_path: str, etching_dir: str) -> str:
     Returns:
         결과 메시지 (dict)
     """
-    try:
-        if not os.path.exists(output_path):
-            return f"Error: Output file not found: {output_path}"
-        
-        if not os.path.exists(etching_dir):
-            return f"Error: Etching directory not found: {etching_dir}"
-        
-        debug_info = []
-        
-        # DK 파일 목록 가져오기
-        dk_files = get_dk_files_in_directory(etching_dir)
-        if not dk_files:
-            return f"Error: No DK files found in {etching_dir}"
-        
-        debug_info.append(f"Found {len(dk_files)} DK files")
-        
-        # 출력 파일 열기
-        wb = load_workbook(output_path)
-        ws = wb.active
-        
-        # 공통 처리 로직 호출
-        processed, tdr_map = _process_dk_files_into_workbook(ws, dk_files, debug_info)
-        
-        # 파일 저장
-        wb.save(output_path)
-        wb.close()
-        
-        result_msg = f"Success: Filled Impedance data from {processed} DK files\n"
-        result_msg += "Debug:\n  " + "\n  ".join(debug_info)
-        return {"message": result_msg, "tdr_map": tdr_map}
-        
-    except Exception as e:
-        import traceback
-        return f"Error: {str(e)}\n{traceback.format_exc()}"
+    return _run_on_existing_file(output_path, lambda session: session.fill_impedance(etching_dir))
 
 
 def fill_impedance_data_from_files(output_path: str, file_list: list) -> str:
@@ -342,46 +580,181 @@ def fill_impedance_data_from_files(output_path: str, file_list: list) -> str:
     Returns:
         결과 메시지 (dict)
     """
-    try:
-        if not os.path.exists(output_path):
-            return f"Error: Output file not found: {output_path}"
+    return _run_on_existing_file(output_path, lambda session: session.fill_impedance_from_files(file_list))
+
+
+def _cell_value(row: list, col: int):
+    """행 리스트에서 열 값 가져오기 (범위 밖이거나 빈 셀이면 None)"""
+    if col >= len(row):
+        return None
+    val = row[col]
+    if val is None or (isinstance(val, str) and val == ""):
+        return None
+    if isinstance(val, float) and val != val:  # NaN
+        return None
+    return to_json_value(val)
+
+
+def _read_dimension_window(dimension_file: str, sheet: str, debug_info: list):
+    """
+    Dimension 시트에서 헤더 행(Row 5)과 DK 섹션의 데이터 창(Row 34-43)만 읽음
+    파일은 한 번만 열고, 데이터 창은 마지막 DK 섹션 열까지만 읽음
+    
+    Args:
+        dimension_file: dimension 파일 경로
+        sheet: 실제 시트 이름
+        debug_info: 디버그 메시지 리스트 (append됨)
+        
+    Returns:
+        (dk_columns, data_rows) - dk_columns: {inner_value: BOTTOM 열 index},
+        data_rows: 데이터 창 10개 행의 값 리스트
+    """
+    ext = os.path.splitext(dimension_file)[1].lower()
+    data_rows = [[] for _ in range(DIM_DATA_END_ROW - DIM_DATA_START_ROW + 1)]
+    
+    if ext in ('.xlsx', '.xlsm'):
+        # read_only 모드: 필요한 행까지만 스트리밍하고 나머지는 파싱하지 않음
+        wb = load_workbook(dimension_file, read_only=True, data_only=True)
+        try:
+            ws = wb[sheet]
+            # 잘못 기록된 dimension 태그 때문에 열이 잘리지 않도록 초기화
+            ws.reset_dimensions()
+            header_row = []
+            for row in ws.iter_rows(min_row=DIM_HEADER_ROW + 1, max_row=DIM_HEADER_ROW + 1,
+                                    values_only=True):
+                header_row = list(row)
+            dk_columns = _find_dimension_sections(header_row, debug_info)
+            if dk_columns:
+                max_col = max(dk_columns.values()) + 1  # 마지막 CIRCUIT HIGHT 열
+                for idx, row in enumerate(ws.iter_rows(min_row=DIM_DATA_START_ROW + 1,
+                                                       max_row=DIM_DATA_END_ROW + 1,
+                                                       max_col=max_col + 1, values_only=True)):
+                    data_rows[idx] = list(row)
+        finally:
+            wb.close()
+    elif ext == '.xls':
+        # on_demand 모드: 선택한 시트만 로드
+        book = xlrd.open_workbook(dimension_file, on_demand=True)
+        try:
+            sh = book.sheet_by_name(sheet)
+            header_row = sh.row_values(DIM_HEADER_ROW) if sh.nrows > DIM_HEADER_ROW else []
+            dk_columns = _find_dimension_sections(header_row, debug_info)
+            if dk_columns:
+                max_col = max(dk_columns.values()) + 1
+                for idx, r in enumerate(range(DIM_DATA_START_ROW, min(DIM_DATA_END_ROW + 1, sh.nrows))):
+                    data_rows[idx] = sh.row_values(r, 0, min(max_col + 1, sh.row_len(r)))
+        finally:
+            book.release_resources()
+    else:
+        # 기타 형식: 데이터 창 끝 행까지만 읽음
+        import pandas as pd
+        df = pd.read_excel(dimension_file, sheet_name=sheet, header=None,
+                           nrows=DIM_DATA_END_ROW + 1)
+        rows = df.values.tolist()
+        header_row = rows[DIM_HEADER_ROW] if len(rows) > DIM_HEADER_ROW else []
+        dk_columns = _find_dimension_sections(header_row, debug_info)
+        for idx, r in enumerate(range(DIM_DATA_START_ROW, min(DIM_DATA_END_ROW + 1, len(rows)))):
+            data_rows[idx] = rows[r]
+    
+    return dk_columns, data_rows
+
+
+def _find_dimension_sections(header_row: list, debug_info: list) -> dict:
+    """
+    헤더 행(Row 5)에서 DK로 시작하는 셀을 찾아 섹션별 BOTTOM 열 위치 반환
+    
+    Args:
+        header_row: 헤더 행 값 리스트
+        debug_info: 디버그 메시지 리스트 (append됨)
         
-        if not file_list:
-            return f"Error: No DK files selected"
+    Returns:
+        {inner_value: BOTTOM 열 index (0-indexed)} 딕셔너리
+    """
+    dk_columns = {}  # inner_value -> column_index (BOTTOM 열)
+    for col, val in enumerate(header_row):
+        if _cell_value(header_row, col) is not None and 'DK' in str(val).upper():
+            # DK 값에서 inner 추출 (DK 1.5 -> 1.5, DK CENTER -> CENTER)
+            inner_val = str(val).replace('DK', '').strip().upper()
+            # BOTTOM 열은 DK 헤더 열 + 1, CIRCUIT HIGHT 열은 + 2
+            dk_columns[inner_val] = col + 1  # BOTTOM 열
+            debug_info.append(f"Found DK section: {val} at col {col}")
+    return dk_columns
+
+
+def _extract_dimension_sections(dk_columns: dict, data_rows: list) -> dict:
+    """
+    데이터 창(Row 34-43)에서 DK 섹션별 width/thickness 데이터 추출
+    
+    Args:
+        dk_columns: {inner_value: BOTTOM 열 index} 딕셔너리
+        data_rows: 데이터 창 10개 행의 값 리스트
         
-        debug_info = []
-        debug_info.append(f"Manual mode: {len(file_list)} files selected")
-        
-        # 파일 리스트를 (inner_value, file_path) 형태로 변환
-        dk_files = []
-        for file_path in file_list:
-            if os.path.exists(file_path):
-                inner_val = get_inner_value_from_filename(file_path)
-                dk_files.append((inner_val, file_path))
-            else:
-                debug_info.append(f"File not found: {file_path}")
-        
-        if not dk_files:
-            return f"Error: No valid DK files found"
-        
-        # 출력 파일 열기
-        wb = load_workbook(output_path)
-        ws = wb.active
+    Returns:
+        {inner_value: {"width": [10개], "thickness": [10개]}} 딕셔너리
+    """
+    sections = {}
+    for inner_val, bottom_col in dk_columns.items():
+        circuit_hight_col = bottom_col + 1  # CIRCUIT HIGHT 열
         
-        # 공통 처리 로직 호출
-        processed, tdr_map = _process_dk_files_into_workbook(ws, dk_files, debug_info)
+        # 1-10번 데이터: BOTTOM 열 (Circuit width), CIRCUIT HIGHT 열 (thickness)
+        circuit_width_data = [_cell_value(row, bottom_col) for row in data_rows]
+        thickness_data = [_cell_value(row, circuit_hight_col) for row in data_rows]
         
-        # 파일 저장
-        wb.save(output_path)
-        wb.close()
+        sections[inner_val] = {"width": circuit_width_data, "thickness": thickness_data}
+    
+    return sections
+
+
+def read_dimension_sections(dimension_file: str, sheet_name: str = "",
+                            debug_info: list = None, use_cache: bool = True) -> dict:
+    """
+    Dimension 파일에서 DK 섹션별 width/thickness 데이터를 읽음
+    시트 이름은 파일 메타데이터에서 찾고, 시트 전체가 아니라
+    헤더 행(Row 5)과 DK 섹션의 데이터 창(Row 34-43)만 읽음
+    파싱 결과는 (파일, 시트) 단위로 캐시되어 파일이 바뀌지 않았으면 다시 읽지 않음
+    
+    Args:
+        dimension_file: dimension 파일 경로
+        sheet_name: 사용할 시트 이름 (빈 문자열이면 B2 또는 첫 번째 시트)
+        debug_info: 디버그 메시지 리스트 (append됨)
+        use_cache: 파싱 캐시 사용 여부
         
-        result_msg = f"Success: Filled Impedance data from {processed} DK files (Manual mode)\n"
-        result_msg += "Debug:\n  " + "\n  ".join(debug_info)
-        return {"message": result_msg, "tdr_map": tdr_map}
+    Returns:
+        {inner_value: {"width": [10개], "thickness": [10개]}} 딕셔너리
         
-    except Exception as e:
-        import traceback
-        return f"Error: {str(e)}\n{traceback.format_exc()}"
+    Raises:
+        ValueError: 지정한 시트가 없는 경우
+    """
+    if debug_info is None:
+        debug_info = []
+    
+    cache_kind = f"dimension:{sheet_name}"
+    cache = load_parse_cache() if use_cache else None
+    if cache is not None:
+        cached = get_cached_entry(cache, dimension_file, cache_kind)
+        if cached is not None:
+            debug_info.append(f"Using cached dimension data (sheet: {sheet_name or 'auto'})")
+            return cached
+    
+    # 캐시 검증 정보는 읽기 전에 구함 (읽는 동안 바뀐 파일은 다음 실행에서 다시 읽도록)
+    signature = file_signature(dimension_file) if cache is not None else None
+    
+    # 시트 이름이 지정되지 않으면 B2 또는 첫 번째 시트 사용
+    sheet = resolve_sheet_name(list_excel_sheet_names(dimension_file), sheet_name, default='B2')
+    if sheet is None:
+        if sheet_name:
+            raise ValueError(f"Sheet '{sheet_name}' not found in dimension file")
+        raise ValueError("No sheets found in dimension file")
+    debug_info.append(f"Using sheet: {sheet}")
+    
+    dk_columns, data_rows = _read_dimension_window(dimension_file, sheet, debug_info)
+    sections = _extract_dimension_sections(dk_columns, data_rows)
+    
+    if cache is not None and sections:
+        set_cached_entry(cache, dimension_file, cache_kind, sections, signature)
+        save_parse_cache(cache)
+    
+    return sections
 
 
 def fill_dimension_data(output_path: str, dimension_file: str, sheet_name: str = "") -> str:
@@ -405,131 +778,7 @@ def fill_dimension_data(output_path: str, dimension_file: str, sheet_name: str =
     Returns:
         결과 메시지
     """
-    try:
-        if not os.path.exists(output_path):
-            return f"Error: Output file not found: {output_path}"
-        
-        if not os.path.exists(dimension_file):
-            return f"Error: Dimension file not found: {dimension_file}"
-        
-        debug_info = []
-        
-        # Dimension 파일 읽기
-        if sheet_name:
-            # 지정된 시트 사용
-            try:
-                df = pd.read_excel(dimension_file, sheet_name=sheet_name, header=None)
-                debug_info.append(f"Using sheet: {sheet_name}")
-            except:
-                return f"Error: Sheet '{sheet_name}' not found in dimension file"
-        else:
-            # 시트 이름이 지정되지 않으면 B2 또는 첫 번째 시트 사용
-            try:
-                df = pd.read_excel(dimension_file, sheet_name='B2', header=None)
-                debug_info.append("Using sheet: B2")
-            except:
-                df = pd.read_excel(dimension_file, sheet_name=0, header=None)
-                debug_info.append("Using first sheet")
-        
-        debug_info.append(f"Dimension file shape: {df.shape}")
-        
-        # DK 섹션 위치 찾기 (Row 5에서 DK로 시작하는 셀 찾기)
-        dk_sections = {}  # inner_value -> column_index (BOTTOM 열)
-        for col in range(df.shape[1]):
-            val = df.iloc[5, col] if 5 < df.shape[0] else None
-            if pd.notna(val) and 'DK' in str(val).upper():
-                # DK 값에서 inner 추출 (DK 1.5 -> 1.5, DK CENTER -> CENTER)
-                inner_val = str(val).replace('DK', '').strip().upper()
-                # BOTTOM 열은 DK 헤더 열 + 1, CIRCUIT HIGHT 열은 + 2
-                dk_sections[inner_val] = col + 1  # BOTTOM 열
-                debug_info.append(f"Found DK section: {val} at col {col}")
-        
-        if not dk_sections:
-            return f"Error: No DK sections found in dimension file"
-        
-        # 출력 파일 열기
-        wb = load_workbook(output_path)
-        ws = wb.active
-        
-        # Inner 값과 시작 행 매핑 찾기
-        inner_to_row = {}
-        for row in range(3, ws.max_row + 1):
-            inner_val = ws.cell(row=row, column=2).value  # B열 (Inner)
-            if inner_val:
-                inner_str = str(inner_val).strip().upper()
-                inner_to_row[inner_str] = row
-        
-        debug_info.append(f"Output file inner mappings: {list(inner_to_row.keys())}")
-        
-        # 데이터 행 범위 (Row 34-43 = 1-10번 데이터)
-        data_start_row = 34
-        data_end_row = 43
-        
-        processed = 0
-        dim_map = {}
-        
-        for inner_val, bottom_col in dk_sections.items():
-            # 해당 Inner의 시작 행 찾기
-            target_base_row = inner_to_row.get(inner_val)
-            if target_base_row is None:
-                debug_info.append(f"No output row for inner={inner_val}")
-                continue
-            
-            circuit_hight_col = bottom_col + 1  # CIRCUIT HIGHT 열
-            
-            # 1-10번 데이터 읽기
-            circuit_width_data = []  # BOTTOM 열 데이터
-            thickness_data = []  # CIRCUIT HIGHT 열 데이터
-            
-            for data_row in range(data_start_row, data_end_row + 1):
-                # BOTTOM 열 (Circuit width)
-                width_val = df.iloc[data_row, bottom_col] if data_row < df.shape[0] and bottom_col < df.shape[1] else None
-                circuit_width_data.append(width_val if pd.notna(width_val) else None)
-                
-                # CIRCUIT HIGHT 열 (thickness)
-                height_val = df.iloc[data_row, circuit_hight_col] if data_row < df.shape[0] and circuit_hight_col < df.shape[1] else None
-                thickness_data.append(height_val if pd.notna(height_val) else None)
-            
-            # Circuit width 데이터 채우기 (Row: target_base_row + 1)
-            target_row_width = target_base_row + 1
-            for idx, val in enumerate(circuit_width_data):
-                if val is not None:
-                    ws.cell(row=target_row_width, column=5 + idx, value=val)  # E=5
-            
-            # Thickness 데이터 채우기 (Row: target_base_row + 2)
-            target_row_thickness = target_base_row + 2
-            for idx, val in enumerate(thickness_data):
-                if val is not None:
-                    ws.cell(row=target_row_thickness, column=5 + idx, value=val)  # E=5
-            
-            # Minimum Circuit width = Circuit width와 같은 값 (Row: target_base_row + 3)
-            target_row_minimum = target_base_row + 3
-            for idx, val in enumerate(circuit_width_data):
-                if val is not None:
-                    ws.cell(row=target_row_minimum, column=5 + idx, value=val)  # E=5
-            
-            processed += 1
-            debug_info.append(f"Inner {inner_val}: filled width/thickness/minimum data")
-
-            # 시각화용 평균값 저장
-            valid_widths = [v for v in circuit_width_data if v is not None]
-            valid_thicks = [v for v in thickness_data if v is not None]
-            width_avg = float(pd.Series(valid_widths).mean()) if valid_widths else None
-            thick_avg = float(pd.Series(valid_thicks).mean()) if valid_thicks else None
-            if width_avg is not None and thick_avg is not None:
-                dim_map[inner_val] = (width_avg, thick_avg)
-        
-        # 파일 저장
-        wb.save(output_path)
-        wb.close()
-        
-        result_msg = f"Success: Filled dimension data from {processed} DK sections\n"
-        result_msg += "Debug:\n  " + "\n  ".join(debug_info)
-        return {"message": result_msg, "dim_map": dim_map}
-        
-    except Exception as e:
-        import traceback
-        return f"Error: {str(e)}\n{traceback.format_exc()}"
+    return _run_on_existing_file(output_path, lambda session: session.fill_dimension(dimension_file, sheet_name))
 
 
 def fill_lslusl_data(output_path: str, lslusl_file: str) -> str:
@@ -544,95 +793,379 @@ def fill_lslusl_data(output_path: str, lslusl_file: str) -> str:
     Returns:
         결과 메시지
     """
-    try:
-        if not os.path.exists(output_path):
-            return f"Error: Output file not found: {output_path}"
-        
-        if not os.path.exists(lslusl_file):
-            return f"Error: LSLUSL file not found: {lslusl_file}"
-        
-        debug_info = []
+    return _run_on_existing_file(output_path, lambda session: session.fill_lslusl(lslusl_file))
+
+
+class FormMeasurementSession:
+    """
+    Tab 2 단일 세션
+    템플릿에서 워크북을 한 번 만들고(또는 기존 파일을 한 번 열고),
+    Inner→행 인덱스를 한 번만 만든 뒤 모든 fill 단계를 메모리에서 적용하고
+    save()에서 한 번만 저장한다.
+    
+    cancel_token을 넘기면 각 fill 단계의 파일/행 반복문과 save()에서 취소 요청을 확인
+    (취소되면 OperationCancelled 발생, 저장 전이므로 출력 파일은 바뀌지 않음)
+    use_cache=False이면 DK/Dimension 파일을 파싱 캐시 없이 항상 다시 읽음 (벤치마크용)
+    
+    사용 예:
+        session = FormMeasurementSession(output_path)
+        session.create_from_template()
+        session.fill_impedance(etching_dir)
+        session.fill_dimension(dimension_file, sheet_name)
+        session.fill_lslusl(lslusl_file)
+        session.save()
+    """
+    
+    def __init__(self, output_path: str, cancel_token=None, use_cache: bool = True):
+        self.output_path = output_path
+        self.cancel_token = cancel_token
+        self.use_cache = use_cache
+        self.wb = None
+        self.ws = None
+        self.inner_index = None
+    
+    def _attach(self, wb):
+        """워크북 연결 및 Inner→행 인덱스 생성 (세션당 1회)"""
+        self.wb = wb
+        # Cover Page가 추가된 파일일 수 있으므로 active 대신 결과 시트를 직접 지정
+        self.ws = wb[FORM_SHEET_NAME] if FORM_SHEET_NAME in wb.sheetnames else wb.active
+        self.inner_index = _build_inner_index(self.ws)
+    
+    def create_from_template(self) -> str:
+        """
+        템플릿을 하드카피하여 메모리에 새 워크북 생성 (저장은 save()에서)
         
-        # LSLUSL 파일 읽기
+        Returns:
+            결과 메시지
+        """
         try:
-            df_lslusl = pd.read_excel(lslusl_file, sheet_name='LSLUSL', header=None)
-        except:
-            df_lslusl = pd.read_excel(lslusl_file, sheet_name=0, header=None)
-        
-        debug_info.append(f"LSLUSL sheet: {df_lslusl.shape}")
-        
-        # 출력 파일 열기
-        wb = load_workbook(output_path)
-        ws = wb.active
+            template_path = get_template_path()
+            
+            if not os.path.exists(template_path):
+                return f"Error: Template file not found: {template_path}"
+            
+            debug_info = []
+            self._attach(_build_form_workbook(template_path, debug_info))
+            
+            result_msg = f"Success: Created Form Measurement Result workbook\n"
+            result_msg += f"Output: {self.output_path}\n"
+            result_msg += "Debug: " + " | ".join(debug_info)
+            return result_msg
+            
+        except Exception as e:
+            import traceback
+            return f"Error: {str(e)}\n{traceback.format_exc()}"
+    
+    def load(self) -> str:
+        """
+        기존 출력 파일 열기
         
-        # Inner 값과 시작 행 매핑 찾기
-        inner_to_row = {}
-        for row in range(3, ws.max_row + 1):
-            inner_val = ws.cell(row=row, column=2).value  # B열 (Inner)
-            if inner_val:
-                inner_str = str(inner_val).strip().upper()
-                inner_to_row[inner_str] = row
-        
-        debug_info.append(f"Output file inner mappings: {list(inner_to_row.keys())}")
-        
-        processed_lslusl = 0
-        
-        # LSLUSL 데이터 처리
-        # Row 0: 헤더 (LSL, Center, USL, inner)
-        # Column 0: LSL, Column 1: Center, Column 2: USL, Column 3: inner
-        current_inner = None
-        for lsl_row in range(2, len(df_lslusl)):
-            # inner 열(column 3) 확인
-            inner_cell = df_lslusl.iloc[lsl_row, 3] if df_lslusl.shape[1] > 3 else None
-            if pd.notna(inner_cell):
-                current_inner = str(inner_cell).strip().upper()
-            
-            if current_inner is None:
-                continue
-            
-            # 해당 Inner의 시작 행 찾기
-            target_base_row = inner_to_row.get(current_inner)
-            if target_base_row is None:
-                continue
-            
-            # LSLUSL의 행 순서: resistance, width, thickness, minimum (4행 단위)
-            row_offset_in_group = (lsl_row - 2) % 4
-            target_row = target_base_row + row_offset_in_group
-            
-            # LSL, CENTER, USL 값 가져오기
-            lsl_val = df_lslusl.iloc[lsl_row, 0]
-            center_val = df_lslusl.iloc[lsl_row, 1]
-            usl_val = df_lslusl.iloc[lsl_row, 2]
-            
-            # AK(37): LSL, AL(38): Center, AM(39): USL
-            if pd.notna(lsl_val):
-                ws.cell(row=target_row, column=37, value=lsl_val)  # AK
-            if pd.notna(center_val):
-                ws.cell(row=target_row, column=38, value=center_val)  # AL
-            if pd.notna(usl_val):
-                ws.cell(row=target_row, column=39, value=usl_val)  # AM
-            
-            processed_lslusl += 1
-        
-        debug_info.append(f"LSLUSL data: {processed_lslusl} rows filled")
-        
-        # E열부터 마지막 열까지 AutoFilter 추가
-        last_col_letter = get_column_letter(ws.max_column)
-        filter_range = f"E1:{last_col_letter}{ws.max_row}"
-        ws.auto_filter.ref = filter_range
-        debug_info.append(f"AutoFilter added: {filter_range}")
+        Returns:
+            결과 메시지
+        """
+        try:
+            if not os.path.exists(self.output_path):
+                return f"Error: Output file not found: {self.output_path}"
+            
+            self._attach(load_workbook(self.output_path))
+            return f"Success: Loaded {self.output_path}"
+            
+        except Exception as e:
+            import traceback
+            return f"Error: {str(e)}\n{traceback.format_exc()}"
+    
+    def fill_impedance(self, etching_dir: str):
+        """
+        DK 파일들에서 TDR 데이터를 읽어서 Impedance NET resistance 행에 채움
+        (자동 모드: 디렉토리 스캔)
         
-        # 파일 저장
-        wb.save(output_path)
-        wb.close()
+        Args:
+            etching_dir: etching 디렉토리 경로
+            
+        Returns:
+            {"message": 결과 메시지, "tdr_map": {...}} 또는 에러 메시지
+        """
+        try:
+            if not os.path.exists(etching_dir):
+                return f"Error: Etching directory not found: {etching_dir}"
+            
+            debug_info = []
+            
+            # DK 파일 목록 가져오기
+            dk_files = get_dk_files_in_directory(etching_dir)
+            if not dk_files:
+                return f"Error: No DK files found in {etching_dir}"
+            
+            debug_info.append(f"Found {len(dk_files)} DK files")
+            
+            # 공통 처리 로직 호출
+            processed, tdr_map = _process_dk_files_into_workbook(
+                self.ws, dk_files, debug_info, self.inner_index["impedance"], self.cancel_token,
+                self.use_cache)
+            
+            result_msg = f"Success: Filled Impedance data from {processed} DK files\n"
+            result_msg += "Debug:\n  " + "\n  ".join(debug_info)
+            return {"message": result_msg, "tdr_map": tdr_map}
+            
+        except Exception as e:
+            import traceback
+            return f"Error: {str(e)}\n{traceback.format_exc()}"
+    
+    def fill_impedance_from_files(self, file_list: list, mode_label: str = "Manual mode",
+                                  update: bool = False):
+        """
+        사용자가 직접 선택한 DK 파일들에서 TDR 데이터를 읽어서 채움
+        (수동 모드 / watch 모드)
+        
+        Args:
+            file_list: DK 파일 경로 리스트 [path1, path2, ...]
+            mode_label: 결과 메시지에 표시할 모드 이름
+            update: True이면 결과 메시지를 'Updated'로 표시 (watch 모드)
+            
+        Returns:
+            {"message": 결과 메시지, "tdr_map": {...}} 또는 에러 메시지
+        """
+        try:
+            if not file_list:
+                return f"Error: No DK files selected"
+            
+            debug_info = []
+            if not update:
+                debug_info.append(f"{mode_label}: {len(file_list)} files selected")
+            
+            # 파일 리스트를 (inner_value, file_path) 형태로 변환
+            dk_files = []
+            for file_path in file_list:
+                if os.path.exists(file_path):
+                    inner_val = get_inner_value_from_filename(file_path)
+                    dk_files.append((inner_val, file_path))
+                else:
+                    debug_info.append(f"File not found: {file_path}")
+            
+            if not dk_files:
+                return f"Error: No valid DK files found"
+            
+            # 공통 처리 로직 호출
+            processed, tdr_map = _process_dk_files_into_workbook(
+                self.ws, dk_files, debug_info, self.inner_index["impedance"], self.cancel_token,
+                self.use_cache)
+            
+            action = "Updated" if update else "Filled"
+            result_msg = f"Success: {action} Impedance data from {processed} DK files ({mode_label})\n"
+            result_msg += "Debug:\n  " + "\n  ".join(debug_info)
+            return {"message": result_msg, "tdr_map": tdr_map}
+            
+        except Exception as e:
+            import traceback
+            return f"Error: {str(e)}\n{traceback.format_exc()}"
+    
+    def fill_dimension(self, dimension_file: str, sheet_name: str = ""):
+        """
+        Dimension 파일에서 width/thickness 데이터를 읽어서 채움
+        (파일 구조는 fill_dimension_data 참조)
+        
+        Args:
+            dimension_file: dimension 파일 경로
+            sheet_name: 사용할 시트 이름 (빈 문자열이면 자동 선택)
+            
+        Returns:
+            {"message": 결과 메시지, "dim_map": {...}} 또는 에러 메시지
+        """
+        try:
+            if not os.path.exists(dimension_file):
+                return f"Error: Dimension file not found: {dimension_file}"
+            
+            debug_info = []
+            
+            # Dimension 파일에서 DK 섹션별 데이터 읽기 (캐시 사용)
+            try:
+                dk_sections = read_dimension_sections(dimension_file, sheet_name, debug_info,
+                                                      use_cache=self.use_cache)
+            except ValueError as e:
+                return f"Error: {str(e)}"
+            
+            if not dk_sections:
+                return f"Error: No DK sections found in dimension file"
+            
+            import pandas as pd
+            ws = self.ws
+            inner_to_row = self.inner_index["inner"]
+            debug_info.append(f"Output file inner mappings: {list(inner_to_row.keys())}")
+            
+            processed = 0
+            dim_map = {}
+            
+            for inner_val, section in dk_sections.items():
+                check_cancelled(self.cancel_token)
+                # 해당 Inner의 시작 행 찾기
+                target_base_row = inner_to_row.get(inner_val)
+                if target_base_row is None:
+                    debug_info.append(f"No output row for inner={inner_val}")
+                    continue
+                
+                circuit_width_data = section["width"]  # BOTTOM 열 데이터
+                thickness_data = section["thickness"]  # CIRCUIT HIGHT 열 데이터
+                
+                # Circuit width 데이터 채우기 (Row: target_base_row + 1)
+                target_row_width = target_base_row + 1
+                for idx, val in enumerate(circuit_width_data):
+                    if val is not None:
+                        ws.cell(row=target_row_width, column=5 + idx, value=val)  # E=5
+                
+                # Thickness 데이터 채우기 (Row: target_base_row + 2)
+                target_row_thickness = target_base_row + 2
+                for idx, val in enumerate(thickness_data):
+                    if val is not None:
+                        ws.cell(row=target_row_thickness, column=5 + idx, value=val)  # E=5
+                
+                # Minimum Circuit width = Circuit width와 같은 값 (Row: target_base_row + 3)
+                target_row_minimum = target_base_row + 3
+                for idx, val in enumerate(circuit_width_data):
+                    if val is not None:
+                        ws.cell(row=target_row_minimum, column=5 + idx, value=val)  # E=5
+                
+                processed += 1
+                debug_info.append(f"Inner {inner_val}: filled width/thickness/minimum data")
+                
+                # 시각화용 평균값 저장
+                valid_widths = [v for v in circuit_width_data if v is not None]
+                valid_thicks = [v for v in thickness_data if v is not None]
+                width_avg = float(pd.Series(valid_widths).mean()) if valid_widths else None
+                thick_avg = float(pd.Series(valid_thicks).mean()) if valid_thicks else None
+                if width_avg is not None and thick_avg is not None:
+                    dim_map[inner_val] = (width_avg, thick_avg)
+            
+            result_msg = f"Success: Filled dimension data from {processed} DK sections\n"
+            result_msg += "Debug:\n  " + "\n  ".join(debug_info)
+            return {"message": result_msg, "dim_map": dim_map}
+            
+        except Exception as e:
+            import traceback
+            return f"Error: {str(e)}\n{traceback.format_exc()}"
+    
+    def fill_lslusl(self, lslusl_file: str) -> str:
+        """
+        LSLUSL 파일에서 LSL/CENTER/USL 데이터를 읽어서 AK~AM열에 채움
         
-        result_msg = f"Success: Filled LSL/USL data\n"
-        result_msg += "Debug:\n  " + "\n  ".join(debug_info)
-        return result_msg
+        Args:
+            lslusl_file: LSLUSL 파일 경로
+            
+        Returns:
+            결과 메시지
+        """
+        try:
+            if not os.path.exists(lslusl_file):
+                return f"Error: LSLUSL file not found: {lslusl_file}"
+            
+            debug_info = []
+            
+            # LSLUSL 파일 읽기
+            import pandas as pd
+            try:
+                df_lslusl = pd.read_excel(lslusl_file, sheet_name='LSLUSL', header=None)
+            except:
+                df_lslusl = pd.read_excel(lslusl_file, sheet_name=0, header=None)
+            
+            debug_info.append(f"LSLUSL sheet: {df_lslusl.shape}")
+            
+            ws = self.ws
+            inner_to_row = self.inner_index["inner"]
+            debug_info.append(f"Output file inner mappings: {list(inner_to_row.keys())}")
+            
+            processed_lslusl = 0
+            
+            # LSLUSL 데이터 처리
+            # Row 0: 헤더 (LSL, Center, USL, inner)
+            # Column 0: LSL, Column 1: Center, Column 2: USL, Column 3: inner
+            current_inner = None
+            for lsl_row in range(2, len(df_lslusl)):
+                check_cancelled(self.cancel_token)
+                # inner 열(column 3) 확인
+                inner_cell = df_lslusl.iloc[lsl_row, 3] if df_lslusl.shape[1] > 3 else None
+                if pd.notna(inner_cell):
+                    current_inner = str(inner_cell).strip().upper()
+                
+                if current_inner is None:
+                    continue
+                
+                # 해당 Inner의 시작 행 찾기
+                target_base_row = inner_to_row.get(current_inner)
+                if target_base_row is None:
+                    continue
+                
+                # LSLUSL의 행 순서: resistance, width, thickness, minimum (4행 단위)
+                row_offset_in_group = (lsl_row - 2) % 4
+                target_row = target_base_row + row_offset_in_group
+                
+                # LSL, CENTER, USL 값 가져오기
+                lsl_val = df_lslusl.iloc[lsl_row, 0]
+                center_val = df_lslusl.iloc[lsl_row, 1]
+                usl_val = df_lslusl.iloc[lsl_row, 2]
+                
+                # AK(37): LSL, AL(38): Center, AM(39): USL
+                if pd.notna(lsl_val):
+                    ws.cell(row=target_row, column=37, value=lsl_val)  # AK
+                if pd.notna(center_val):
+                    ws.cell(row=target_row, column=38, value=center_val)  # AL
+                if pd.notna(usl_val):
+                    ws.cell(row=target_row, column=39, value=usl_val)  # AM
+                
+                processed_lslusl += 1
+            
+            debug_info.append(f"LSLUSL data: {processed_lslusl} rows filled")
+            
+            # E열부터 마지막 열까지 AutoFilter 추가
+            last_col_letter = get_column_letter(ws.max_column)
+            filter_range = f"E1:{last_col_letter}{ws.max_row}"
+            ws.auto_filter.ref = filter_range
+            debug_info.append(f"AutoFilter added: {filter_range}")
+            
+            result_msg = f"Success: Filled LSL/USL data\n"
+            result_msg += "Debug:\n  " + "\n  ".join(debug_info)
+            return result_msg
+            
+        except Exception as e:
+            import traceback
+            return f"Error: {str(e)}\n{traceback.format_exc()}"
+    
+    def add_cover_page(self, operator_name: str, input_files: dict) -> str:
+        """
+        Cover Page 시트를 메모리상의 워크북에 추가 (저장은 save()에서)
         
-    except Exception as e:
-        import traceback
-        return f"Error: {str(e)}\n{traceback.format_exc()}"
+        Args:
+            operator_name: 작업자 이름
+            input_files: 입력 파일 딕셔너리 {"파일유형": "파일경로", ...}
+            
+        Returns:
+            결과 메시지
+        """
+        try:
+            write_cover_page(self.wb, operator_name, input_files, self.output_path)
+            return f"Success: Cover Page added to {os.path.basename(self.output_path)}"
+        except Exception as e:
+            return f"Error adding cover page: {str(e)}"
+    
+    def save(self) -> str:
+        """
+        워크북을 출력 파일에 한 번 저장
+        
+        Returns:
+            결과 메시지
+        """
+        check_cancelled(self.cancel_token)
+        try:
+            self.wb.save(self.output_path)
+            return f"Success: Saved {self.output_path}"
+        except Exception as e:
+            import traceback
+            return f"Error: {str(e)}\n{traceback.format_exc()}"
+    
+    def close(self):
+        """워크북 닫기"""
+        if self.wb is not None:
+            self.wb.close()
+            self.wb = None
+            self.ws = None
 
 
 def get_template_structure() -> dict:
@@ -10,6 +10,7 @@ from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
 import os
 
 from logic.file_reader import find_piece_lines
+from logic.cancellation import check_cancelled
 
 
 def auto_adjust_column_width(worksheet):
@@ -49,7 +50,7 @@ def apply_header_style(worksheet, row_number, fill_color="ED7D31", start_col=1,
         cell.font = font
 
 
-def make_input_check_pin_sheet(outfile_path: str, net_file_path: str = None) -> str:
+def make_input_check_pin_sheet(outfile_path: str, net_file_path: str = None, cancel_token=None) -> str:
     """
     DE requirement 시트에서 address 데이터를 가져와서 input check pin interm 시트를 생성합니다.
     NET 파일에서 PIECE 정보를 읽어 그룹을 구성합니다.
@@ -57,6 +58,7 @@ def make_input_check_pin_sheet(outfile_path: str, net_file_path: str = None) ->
     Args:
         outfile_path: 출력 파일 경로 (DE requirement 시트가 이미 있는 파일)
         net_file_path: NET 파일 경로 (PIECE 정보를 읽기 위함)
+        cancel_token: 취소 요청 토큰 (logic.cancellation.CancelToken, None이면 확인 안 함)
     
     Returns:
         결과 메시지
@@ -93,6 +95,7 @@ def make_input_check_pin_sheet(outfile_path: str, net_file_path: str = None) ->
         
         # 데이터 읽기 (3행부터)
         for row_idx in range(3, ws_de.max_row + 1):
+            check_cancelled(cancel_token)
             add1 = ws_de.cell(row=row_idx, column=9).value   # J_TELE_add1
             add2 = ws_de.cell(row=row_idx, column=10).value  # J_TELE_add2
             add3 = ws_de.cell(row=row_idx, column=11).value  # U0200_add1
@@ -318,6 +321,7 @@ def make_input_check_pin_sheet(outfile_path: str, net_file_path: str = None) ->
         
         # === Row 12부터: 기존 address 데이터 ===
         for row_offset, row_data in enumerate(address_data):
+            check_cancelled(cancel_token)
             row_num = 12 + row_offset
             
             # NO 컬럼 (1부터 시작)
@@ -334,6 +338,7 @@ def make_input_check_pin_sheet(outfile_path: str, net_file_path: str = None) ->
             ws_input.column_dimensions[col_letter].width = 10
         
         # 파일 저장
+        check_cancelled(cancel_token)
         wb_out.save(outfile_path)
         wb_out.close()
         
@@ -10,6 +10,7 @@ from copy import copy
 import os
 
 from logic.file_reader import parse_4w_section
+from logic.cancellation import check_cancelled
 
 
 def apply_header_style(worksheet, row_number, fill_color="ED7D31", start_col=1, end_col=None):
@@ -28,13 +29,14 @@ def apply_header_style(worksheet, row_number, fill_color="ED7D31", start_col=1,
         cell.font = font
 
 
-def make_int_med_file(net_file_path: str, output_path: str = "int_med.xlsx") -> str:
+def make_int_med_file(net_file_path: str, output_path: str = "int_med.xlsx", cancel_token=None) -> str:
     """
     NET 파일에서 #4W 섹션을 파싱하여 int_med.xlsx 파일을 생성합니다.
     
     Args:
         net_file_path: NET 파일 경로
         output_path: 출력 파일 경로 (기본값: int_med.xlsx)
+        cancel_token: 취소 요청 토큰 (logic.cancellation.CancelToken, None이면 확인 안 함)
     
     Returns:
         결과 메시지
@@ -88,6 +90,7 @@ def make_int_med_file(net_file_path: str, output_path: str = "int_med.xlsx") ->
         
         # === Row 2부터: 데이터 ===
         for row_idx in range(max_rows):
+            check_cancelled(cancel_token)
             row_num = 2 + row_idx
             
             # NO 컬럼
@@ -109,6 +112,7 @@ def make_int_med_file(net_file_path: str, output_path: str = "int_med.xlsx") ->
             ws.column_dimensions[col_letter].width = 10
         
         # 파일 저장
+        check_cancelled(cancel_token)
         wb.save(output_path)
         wb.close()
         
@@ -121,7 +125,8 @@ def make_int_med_file(net_file_path: str, output_path: str = "int_med.xlsx") ->
         return f"Error: {str(e)}\n{traceback.format_exc()}"
 
 
-def make_input_check_pin_final(outfile_path: str, int_med_path: str = "int_med.xlsx") -> str:
+def make_input_check_pin_final(outfile_path: str, int_med_path: str = "int_med.xlsx",
+                               cancel_token=None) -> str:
     """
     input check pin 시트를 outfile에 생성합니다.
     - input check pin interm 시트의 row 1-10을 복사
@@ -130,6 +135,7 @@ def make_input_check_pin_final(outfile_path: str, int_med_path: str = "int_med.x
     Args:
         outfile_path: 출력 파일 경로 (input check pin interm 시트가 있는 파일)
         int_med_path: int_med.xlsx 파일 경로
+        cancel_token: 취소 요청 토큰 (logic.cancellation.CancelToken, None이면 확인 안 함)
     
     Returns:
         결과 메시지
@@ -212,6 +218,7 @@ def make_input_check_pin_final(outfile_path: str, int_med_path: str = "int_med.x
         # int_med 데이터 복사 (row 11부터)
         int_med_rows = 0
         for row in range(1, ws_int_med.max_row + 1):
+            check_cancelled(cancel_token)
             target_row = row + 10  # row 11부터 시작
             int_med_rows += 1
             
@@ -248,6 +255,7 @@ def make_input_check_pin_final(outfile_path: str, int_med_path: str = "int_med.x
                 ws_final.column_dimensions[col_letter].width = 10
         
         # 파일 저장
+        check_cancelled(cancel_token)
         wb_out.save(outfile_path)
         wb_out.close()
         
@@ -10,6 +10,8 @@ from openpyxl.formatting.rule import FormulaRule
 from copy import copy
 import os
 
+from logic.cancellation import check_cancelled
+
 
 def get_input_check_pin_info(outfile_path: str) -> tuple:
     """
@@ -55,7 +57,7 @@ def get_input_check_pin_info(outfile_path: str) -> tuple:
         return 0, 0, 0, 0
 
 
-def make_judge_check_pin_sheet(outfile_path: str) -> str:
+def make_judge_check_pin_sheet(outfile_path: str, cancel_token=None) -> str:
     """
     Judge(check pin) 시트를 outfile에 생성합니다.
     input check pin 시트의 그룹 수와 NO 수에 맞춰 동적으로 생성합니다.
@@ -68,6 +70,7 @@ def make_judge_check_pin_sheet(outfile_path: str) -> str:
     
     Args:
         outfile_path: 출력 파일 경로
+        cancel_token: 취소 요청 토큰 (logic.cancellation.CancelToken, None이면 확인 안 함)
     
     Returns:
         결과 메시지
@@ -225,6 +228,7 @@ def make_judge_check_pin_sheet(outfile_path: str) -> str:
         input_data_start = 12  # input check pin의 데이터 시작 행
         
         for data_idx in range(num_data_rows):
+            check_cancelled(cancel_token)
             judge_row = judge_data_start + data_idx
             input_row = input_data_start + data_idx
             
@@ -272,6 +276,7 @@ def make_judge_check_pin_sheet(outfile_path: str) -> str:
             ws.column_dimensions[get_column_letter(col)].width = 8
         
         # 파일 저장
+        check_cancelled(cancel_token)
         wb.save(outfile_path)
         wb.close()
         
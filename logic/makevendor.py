@@ -8,6 +8,8 @@ from openpyxl.utils import get_column_letter
 from openpyxl.styles import PatternFill, Font
 import os
 
+from logic.cancellation import check_cancelled
+
 
 def auto_adjust_column_width(worksheet):
     """
@@ -64,7 +66,7 @@ def apply_row_style(worksheet, row_numbers, fill_color="FF0000", skip_column_a=T
             cell.font = white_font
 
 
-def make_vendor_sheet(vendorspec_path: str, outfile_path: str) -> str:
+def make_vendor_sheet(vendorspec_path: str, outfile_path: str, cancel_token=None) -> str:
     """
     vendorspec 파일에서 cover page가 아닌 sheet를 찾아서
     outfile의 'vendor' sheet로 복사
@@ -72,6 +74,7 @@ def make_vendor_sheet(vendorspec_path: str, outfile_path: str) -> str:
     Args:
         vendorspec_path: vendorspec 파일 경로
         outfile_path: 출력 파일 경로
+        cancel_token: 취소 요청 토큰 (logic.cancellation.CancelToken, None이면 확인 안 함)
         
     Returns:
         결과 메시지
@@ -113,6 +116,7 @@ def make_vendor_sheet(vendorspec_path: str, outfile_path: str) -> str:
         
         # 데이터 복사 (B1부터 시작 - A열을 비우고 B열부터 데이터 복사)
         for row_idx, row in enumerate(target_sheet.iter_rows(), 1):
+            check_cancelled(cancel_token)
             for col_idx, cell in enumerate(row, 1):
                 # col_idx + 1로 B열부터 시작
                 ws_vendor.cell(row=row_idx, column=col_idx + 1, value=cell.value)
@@ -120,6 +124,7 @@ def make_vendor_sheet(vendorspec_path: str, outfile_path: str) -> str:
         # "Design" 문자가 나오는 row 찾기
         design_row = None
         for row_idx in range(1, ws_vendor.max_row + 1):
+            check_cancelled(cancel_token)
             for col_idx in range(1, ws_vendor.max_column + 1):
                 cell_val = ws_vendor.cell(row=row_idx, column=col_idx).value
                 if cell_val and "Design" in str(cell_val):
@@ -147,6 +152,7 @@ def make_vendor_sheet(vendorspec_path: str, outfile_path: str) -> str:
         apply_row_style(ws_vendor, [1, 9], skip_column_a=True)
         
         # 파일 저장
+        check_cancelled(cancel_token)
         wb_out.save(outfile_path)
         
         # 리소스 정리
@@ -0,0 +1,225 @@
+"""
+이상치 제외 필터 모듈
+AverageIfs / Stdev ifs 계산 전에 NET별 이상치를 제외하는 필터 모음.
+모든 필터는 NET x 측정값 행렬 전체를 마스크 배열 연산으로 한 번에 처리한다.
+- iqr: Q1 - f×IQR (0 미만이면 0) < 값 < Q3 + f×IQR
+- mad: |값 - 중앙값| <= k × 1.4826 × MAD
+- sigma_clip: |값 - 평균| <= k × 표준편차 를 수렴할 때까지 반복
+- esd: Generalized ESD (Rosner) 검정, 유의 수준 α
+"""
+
+import numpy as np
+
+
+# 기본 필터와 IQR 배수 (기존 1stQuat-4IQR / 3rdQuat+4IQR)
+DEFAULT_OUTLIER_FILTER = "iqr"
+IQR_FENCE_FACTOR = 4
+
+# MAD → 정규분포 표준편차 환산 계수
+MAD_SCALE = 1.4826
+
+# sigma clipping 최대 반복 횟수
+SIGMA_CLIP_MAX_ITER = 10
+
+# Generalized ESD에서 NET별로 검사하는 최대 이상치 개수
+ESD_MAX_OUTLIERS = 10
+
+
+def sorted_row_quantile(sorted_vals: np.ndarray, counts: np.ndarray, q: float) -> np.ndarray:
+    """
+    행별 분위수 (np.percentile 기본 선형 보간과 동일)
+
+    Args:
+        sorted_vals: 행별 오름차순 정렬 배열 (NaN은 행 끝)
+        counts: 행별 유효 값 개수
+        q: 분위 (0~1)
+
+    Returns:
+        행별 분위수 (값이 없는 행은 NaN)
+    """
+    rows = np.arange(len(counts))
+    pos = q * np.maximum(counts - 1, 0)
+    lower = np.floor(pos).astype(np.int64)
+    upper = np.minimum(lower + 1, np.maximum(counts - 1, 0))
+    frac = pos - lower
+    low_vals = sorted_vals[rows, lower]
+    high_vals = sorted_vals[rows, upper]
+    result = low_vals + frac * (high_vals - low_vals)
+    result[counts == 0] = np.nan
+    return result
+
+
+def masked_stats(matrix: np.ndarray, keep: np.ndarray):
+    """
+    마스크가 True인 값만으로 행별 (개수, 평균, 표본 표준편차) 계산
+
+    Returns:
+        (count, mean, std) - 값이 1개면 std=0, 없으면 mean/std=NaN
+    """
+    count = keep.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(keep, matrix, 0.0).sum(axis=1) / count
+        dev = np.where(keep, matrix - mean[:, None], 0.0)
+        std = np.sqrt((dev * dev).sum(axis=1) / (count - 1))
+    std = np.where(count > 1, std, np.where(count == 1, 0.0, np.nan))
+    return count, mean, std
+
+
+def iqr_fence_filter(matrix: np.ndarray, valid: np.ndarray, sorted_vals: np.ndarray,
+                     factor: float):
+    """Q1 - f×IQR (0 미만이면 0) < 값 < Q3 + f×IQR (tinh LCLUCL Row 15-16과 같은 범위)"""
+    counts = valid.sum(axis=1)
+    q1 = sorted_row_quantile(sorted_vals, counts, 0.25)
+    q3 = sorted_row_quantile(sorted_vals, counts, 0.75)
+    iqr = q3 - q1
+    lower = np.maximum(0, q1 - factor * iqr)
+    upper = q3 + factor * iqr
+    with np.errstate(invalid='ignore'):
+        keep = valid & (matrix > lower[:, None]) & (matrix < upper[:, None])
+    return keep, lower, upper
+
+
+def mad_filter(matrix: np.ndarray, valid: np.ndarray, sorted_vals: np.ndarray, k: float):
+    """|값 - 중앙값| <= k × 1.4826 × MAD (MAD가 0인 NET은 모든 값 유지)"""
+    counts = valid.sum(axis=1)
+    median = sorted_row_quantile(sorted_vals, counts, 0.5)
+    abs_dev = np.abs(matrix - median[:, None])
+    mad = sorted_row_quantile(np.sort(abs_dev, axis=1), counts, 0.5)
+    half_width = np.where(mad > 0, k * MAD_SCALE * mad, np.inf)
+    lower = median - half_width
+    upper = median + half_width
+    with np.errstate(invalid='ignore'):
+        keep = valid & (abs_dev <= half_width[:, None])
+    return keep, lower, upper
+
+
+def sigma_clip_filter(matrix: np.ndarray, valid: np.ndarray, sorted_vals: np.ndarray, k: float):
+    """|값 - 평균| <= k × 표준편차 (남은 값으로 평균/표준편차를 다시 구해 반복)"""
+    keep = valid.copy()
+    for _ in range(SIGMA_CLIP_MAX_ITER):
+        _, mean, std = masked_stats(matrix, keep)
+        with np.errstate(invalid='ignore'):
+            new_keep = keep & (np.abs(matrix - mean[:, None]) <= k * std[:, None])
+        # 표준편차가 0이거나 값이 2개 미만인 NET은 더 제외하지 않음
+        new_keep = np.where((std > 0)[:, None], new_keep, keep)
+        if np.array_equal(new_keep, keep):
+            break
+        keep = new_keep
+    _, mean, std = masked_stats(matrix, keep)
+    return keep, mean - k * std, mean + k * std
+
+
+def generalized_esd_filter(matrix: np.ndarray, valid: np.ndarray, sorted_vals: np.ndarray,
+                           alpha: float):
+    """
+    Generalized ESD (Rosner) - 평균에서 가장 먼 값을 ESD_MAX_OUTLIERS번 차례로 빼면서
+    검정 통계량 R_i와 임계값 λ_i를 구하고, R_i > λ_i인 가장 큰 i까지를 이상치로 판정
+    """
+    from scipy import stats  # scipy는 이 필터를 쓸 때만 로드
+
+    n_rows = matrix.shape[0]
+    rows = np.arange(n_rows)
+    counts = valid.sum(axis=1)
+    max_outliers = min(ESD_MAX_OUTLIERS, max(matrix.shape[1] - 2, 0))
+
+    keep = valid.copy()
+    removed_idx = np.zeros((max_outliers, n_rows), dtype=np.int64)
+    exceed = np.zeros((max_outliers, n_rows), dtype=bool)
+    for step in range(max_outliers):
+        n_cur = counts - step
+        _, mean, std = masked_stats(matrix, keep)
+        abs_dev = np.where(keep, np.abs(matrix - mean[:, None]), -1.0)
+        idx = np.argmax(abs_dev, axis=1)
+        active = (n_cur > 2) & (std > 0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            r_stat = abs_dev[rows, idx] / std
+            n_safe = np.maximum(n_cur, 3)
+            t_crit = stats.t.ppf(1 - alpha / (2 * n_safe), n_safe - 2)
+            lam = (n_safe - 1) * t_crit / np.sqrt((n_safe - 2 + t_crit ** 2) * n_safe)
+        exceed[step] = active & (r_stat > lam)
+        removed_idx[step] = idx
+        keep[rows[active], idx[active]] = False
+
+    # R_i > λ_i를 만족하는 가장 큰 i → 앞에서부터 i개 제외
+    n_out = np.where(exceed.any(axis=0), max_outliers - np.argmax(exceed[::-1], axis=0), 0)
+    keep = valid.copy()
+    for step in range(max_outliers):
+        drop = step < n_out
+        keep[rows[drop], removed_idx[step, drop]] = False
+
+    with np.errstate(invalid='ignore'):
+        lower = np.where(keep, matrix, np.inf).min(axis=1)
+        upper = np.where(keep, matrix, -np.inf).max(axis=1)
+    lower[~keep.any(axis=1)] = np.nan
+    upper[~keep.any(axis=1)] = np.nan
+    return keep, lower, upper
+
+
+# 필터 이름 → 함수 / 기본 임계값 / 입력 범위 (최소, 최대, 간격) / 표시 형식
+OUTLIER_FILTERS = {
+    "iqr": {"func": iqr_fence_filter, "default": IQR_FENCE_FACTOR,
+            "range": (0.5, 10.0, 0.5), "label": "IQR fence ×{}"},
+    "mad": {"func": mad_filter, "default": 3.5,
+            "range": (1.0, 10.0, 0.5), "label": "MAD ×{}"},
+    "sigma_clip": {"func": sigma_clip_filter, "default": 3,
+                   "range": (1.0, 6.0, 0.1), "label": "sigma clip ×{}"},
+    "esd": {"func": generalized_esd_filter, "default": 0.05,
+            "range": (0.001, 0.2, 0.01), "label": "GESD α={}"},
+}
+
+
+def default_filter_threshold(method: str = DEFAULT_OUTLIER_FILTER) -> float:
+    """필터의 기본 임계값"""
+    return OUTLIER_FILTERS[method]["default"]
+
+
+def outlier_filter_label(method: str = DEFAULT_OUTLIER_FILTER, threshold=None) -> str:
+    """필터 설명 문자열 (예: "IQR fence ×4", "MAD ×3.5")"""
+    if threshold is None:
+        threshold = default_filter_threshold(method)
+    return OUTLIER_FILTERS[method]["label"].format(f"{float(threshold):g}")
+
+
+def apply_outlier_filter(matrix, method: str = DEFAULT_OUTLIER_FILTER, threshold=None,
+                         sorted_vals: np.ndarray = None) -> dict:
+    """
+    이상치 필터를 모든 NET에 한 번에 적용하고 남은 값으로 AverageIfs / Stdev ifs 계산
+
+    Args:
+        matrix: NET x 측정값 2차원 배열 (빈 값은 NaN)
+        method: OUTLIER_FILTERS 키 ("iqr", "mad", "sigma_clip", "esd")
+        threshold: 필터 임계값 (None이면 필터 기본값)
+        sorted_vals: 행별 정렬 배열 (이미 있으면 재사용)
+
+    Returns:
+        {"keep": 사용한 값 마스크, "lower"/"upper": NET별 필터 범위,
+         "retained": NET별 사용 개수, "avg_ifs", "std_ifs", "method", "threshold"}
+        (필터 후 남은 값이 없는 NET은 기존과 같이 전체 값 사용)
+    """
+    if method not in OUTLIER_FILTERS:
+        raise ValueError(f"Unknown outlier filter: {method} (available: {', '.join(OUTLIER_FILTERS)})")
+    if threshold is None:
+        threshold = default_filter_threshold(method)
+
+    matrix = np.asarray(matrix, dtype=float)
+    valid = ~np.isnan(matrix)
+    if sorted_vals is None:
+        sorted_vals = np.sort(matrix, axis=1)
+
+    keep, lower, upper = OUTLIER_FILTERS[method]["func"](matrix, valid, sorted_vals, threshold)
+
+    # 남은 값이 없으면 전체 값 사용
+    empty = ~keep.any(axis=1)
+    keep = np.where(empty[:, None], valid, keep)
+    retained, avg_ifs, std_ifs = masked_stats(matrix, keep)
+
+    return {
+        "method": method,
+        "threshold": threshold,
+        "keep": keep,
+        "lower": lower,
+        "upper": upper,
+        "retained": retained,
+        "avg_ifs": avg_ifs,
+        "std_ifs": std_ifs,
+    }
@@ -0,0 +1,204 @@
+"""
+파싱 결과 캐시 모듈
+DK 파일 / Dimension 파일에서 추출한 데이터를 로컬 JSON 파일에 저장
+파일 경로 + mtime + 크기 + 내용 해시가 같으면 파일을 다시 파싱하지 않음
+"""
+
+import hashlib
+import json
+import os
+
+from logic.config_manager import APP_DIR
+
+
+# 캐시 파일 경로 (exe와 같은 위치의 cache 폴더)
+CACHE_DIR = os.path.join(APP_DIR, "cache")
+CACHE_FILE = os.path.join(CACHE_DIR, "parse_cache.json")
+CACHE_VERSION = 1
+
+
+def _file_hash(file_path: str) -> str:
+    """
+    파일 내용의 SHA-1 해시 계산
+
+    Args:
+        file_path: 파일 경로
+
+    Returns:
+        16진수 해시 문자열
+    """
+    h = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _entry_key(file_path: str, kind: str) -> str:
+    """캐시 엔트리 키 생성: '{kind}|{정규화된 절대 경로}'"""
+    return f"{kind}|{os.path.normcase(os.path.abspath(file_path))}"
+
+
+def file_signature(file_path: str):
+    """
+    파일의 캐시 검증 정보 (mtime, 크기, 내용 해시)
+    파싱 전에 호출해서 set_cached_entry()에 넘김 - 파싱 중에 파일이 바뀌면
+    다음 조회에서 서명이 달라 다시 읽게 됨 (파싱 후에 구하면 새 서명에 옛 데이터가 저장됨)
+
+    Args:
+        file_path: 파일 경로
+
+    Returns:
+        {"mtime": float, "size": int, "sha1": str} (파일을 읽을 수 없으면 None)
+    """
+    try:
+        st = os.stat(file_path)
+        return {"mtime": st.st_mtime, "size": st.st_size, "sha1": _file_hash(file_path)}
+    except OSError:
+        return None
+
+
+def load_parse_cache(cache_file: str = CACHE_FILE) -> dict:
+    """
+    캐시 파일 로드
+
+    Args:
+        cache_file: 캐시 파일 경로
+
+    Returns:
+        캐시 딕셔너리 {"version": int, "entries": {...}, "dirty": bool}
+        (파일이 없거나 버전이 다르면 빈 캐시)
+    """
+    empty = {"version": CACHE_VERSION, "entries": {}, "dirty": False, "path": cache_file}
+    try:
+        if not os.path.exists(cache_file):
+            return empty
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get("version") != CACHE_VERSION or not isinstance(cache.get("entries"), dict):
+            return empty
+        cache["dirty"] = False
+        cache["path"] = cache_file
+        return cache
+    except Exception as e:
+        print(f"Error loading parse cache: {e}")
+        return empty
+
+
+def get_cached_entry(cache: dict, file_path: str, kind: str):
+    """
+    캐시에서 파일의 파싱 결과 조회
+    mtime/크기가 같으면 바로 반환, 다르면 내용 해시를 비교해서
+    내용이 같으면(파일만 touch된 경우) mtime을 갱신하고 반환
+
+    Args:
+        cache: load_parse_cache()로 읽은 캐시
+        file_path: 원본 파일 경로
+        kind: 데이터 종류 (예: "tdr", "dimension:B2")
+
+    Returns:
+        캐시된 데이터 (없거나 파일이 변경되었으면 None)
+    """
+    entry = cache["entries"].get(_entry_key(file_path, kind))
+    if entry is None:
+        return None
+
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+
+    if entry.get("mtime") == st.st_mtime and entry.get("size") == st.st_size:
+        return entry.get("data")
+
+    if entry.get("size") != st.st_size:
+        return None
+
+    try:
+        if _file_hash(file_path) != entry.get("sha1"):
+            return None
+    except OSError:
+        return None
+
+    # 내용은 동일 → mtime만 갱신
+    entry["mtime"] = st.st_mtime
+    cache["dirty"] = True
+    return entry.get("data")
+
+
+def set_cached_entry(cache: dict, file_path: str, kind: str, data, signature) -> None:
+    """
+    파싱 결과를 캐시에 저장 (메모리상, save_parse_cache() 호출 시 파일에 기록)
+
+    Args:
+        cache: 캐시 딕셔너리
+        file_path: 원본 파일 경로
+        kind: 데이터 종류
+        data: JSON 직렬화 가능한 데이터
+        signature: 파싱 전에 구한 file_signature() 결과 (None이면 캐시하지 않음)
+    """
+    if signature is None:
+        return
+
+    try:
+        json.dumps(data)
+    except (TypeError, ValueError):
+        # JSON으로 저장할 수 없는 값(날짜 등)이 있으면 캐시하지 않음
+        return
+
+    cache["entries"][_entry_key(file_path, kind)] = {
+        "path": os.path.abspath(file_path),
+        "mtime": signature["mtime"],
+        "size": signature["size"],
+        "sha1": signature["sha1"],
+        "data": data,
+    }
+    cache["dirty"] = True
+
+
+def save_parse_cache(cache: dict) -> bool:
+    """
+    변경된 캐시를 파일에 저장 (원본 파일이 사라진 엔트리는 정리)
+
+    Args:
+        cache: 캐시 딕셔너리
+
+    Returns:
+        저장 성공 여부 (변경 사항이 없으면 True)
+    """
+    if not cache.get("dirty"):
+        return True
+
+    try:
+        cache_file = cache.get("path", CACHE_FILE)
+        cache_dir = os.path.dirname(cache_file)
+        if cache_dir and not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+        entries = {
+            key: entry for key, entry in cache["entries"].items()
+            if os.path.exists(entry.get("path", ""))
+        }
+
+        # 임시 파일에 쓴 뒤 교체 (중간에 실패해도 기존 캐시 보존)
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"version": CACHE_VERSION, "entries": entries}, f,
+                      ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_file, cache_file)
+
+        cache["entries"] = entries
+        cache["dirty"] = False
+        return True
+    except Exception as e:
+        print(f"Error saving parse cache: {e}")
+        return False
+
+
+def to_json_value(val):
+    """numpy 스칼라 등을 JSON 저장 가능한 파이썬 기본 타입으로 변환"""
+    if val is None:
+        return None
+    if hasattr(val, "item"):
+        return val.item()
+    return val
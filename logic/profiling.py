@@ -0,0 +1,126 @@
+"""
+프로파일링 모듈
+사용자가 "Tab 3이 20분 걸렸다"고 할 때 같은 환경의 프로파일을 받을 수 있도록
+탭 실행을 cProfile로 감싸서 .prof 파일과 pstats 텍스트 요약(상위 함수)을 출력 폴더에 저장
+- 켜는 방법: UI "Profile" 체크박스, 실행 옵션 --profile, 환경 변수 DCR_PROFILE=1
+- cProfile은 호출한 스레드만 측정 (플롯 렌더링/부트스트랩 워커 프로세스는 포함되지 않음)
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import time
+from datetime import datetime
+
+
+# 프로파일링을 켜는 실행 옵션 / 환경 변수 (값이 1, true, yes, on이면 켬)
+PROFILE_FLAG = "--profile"
+PROFILE_ENV_VAR = "DCR_PROFILE"
+
+# pstats 텍스트 요약에 표시하는 함수 수 (누적 시간 순, 자체 시간 순 각각)
+PROFILE_TOP_FUNCTIONS = 40
+
+
+def profiling_requested(argv: list = None) -> bool:
+    """
+    실행 옵션 또는 환경 변수로 프로파일링이 요청되었는지 확인
+
+    Args:
+        argv: 실행 인자 리스트 (None이면 확인하지 않음)
+    """
+    if argv is not None and PROFILE_FLAG in argv:
+        return True
+    return os.environ.get(PROFILE_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def pop_profile_option(argv: list) -> bool:
+    """argv에서 --profile 옵션을 제거하고 프로파일링 요청 여부 반환 (환경 변수 포함)"""
+    requested = profiling_requested(argv)
+    while PROFILE_FLAG in argv:
+        argv.remove(PROFILE_FLAG)
+    return requested
+
+
+def write_profile(profiler: cProfile.Profile, base_path: str, title: str = "",
+                  wall_s: float = None, top: int = PROFILE_TOP_FUNCTIONS) -> tuple:
+    """
+    프로파일 결과 저장
+
+    Args:
+        profiler: 측정이 끝난 cProfile.Profile
+        base_path: 확장자 없는 저장 경로 (<base_path>.prof, <base_path>.txt)
+        title: 텍스트 요약 첫 줄에 기록할 실행 이름
+        wall_s: 전체 실행 시간 (초)
+        top: 요약에 표시할 함수 수
+
+    Returns:
+        (.prof 경로, .txt 경로)
+    """
+    prof_path = base_path + ".prof"
+    text_path = base_path + ".txt"
+    profiler.dump_stats(prof_path)
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.strip_dirs()
+    stream.write(f"DCR Format Converter - Profile {title}\n")
+    stream.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    if wall_s is not None:
+        stream.write(f"Wall time: {wall_s:.2f} s\n")
+    stream.write(f"Raw profile: {os.path.basename(prof_path)} "
+                 f"(open with: python -m pstats {os.path.basename(prof_path)}, or snakeviz)\n")
+    stream.write("\n" + "=" * 60 + f"\nTop {top} functions by cumulative time\n" + "=" * 60 + "\n")
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    stream.write("\n" + "=" * 60 + f"\nTop {top} functions by own time\n" + "=" * 60 + "\n")
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+
+    with open(text_path, 'w', encoding='utf-8') as f:
+        f.write(stream.getvalue())
+    return prof_path, text_path
+
+
+class RunProfiler:
+    """
+    탭 실행 1회 cProfile 측정 (run()을 호출한 스레드만 측정)
+
+    사용 예:
+        profiler = RunProfiler(base_path, "Tab 3")
+        try:
+            result = profiler.run(fn, *args)
+        finally:
+            profiler.save()  # 예외/취소로 끝나도 저장
+    """
+
+    def __init__(self, base_path: str, title: str = ""):
+        """
+        Args:
+            base_path: 확장자 없는 저장 경로 (<base_path>.prof, <base_path>.txt)
+            title: 텍스트 요약에 기록할 실행 이름
+        """
+        self.base_path = base_path
+        self.title = title
+        self.wall_s = None
+        self._profiler = cProfile.Profile()
+
+    def run(self, fn, *args, **kwargs):
+        """fn(*args, **kwargs)를 측정하며 실행하고 반환값 전달"""
+        started = time.perf_counter()
+        self._profiler.enable()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._profiler.disable()
+            self.wall_s = time.perf_counter() - started
+
+    def save(self) -> tuple:
+        """
+        결과 저장
+
+        Returns:
+            (.prof 경로, .txt 경로)
+
+        Raises:
+            OSError: 파일을 쓸 수 없는 경우
+        """
+        return write_profile(self._profiler, self.base_path, self.title, self.wall_s)
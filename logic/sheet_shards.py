@@ -0,0 +1,234 @@
+"""
+시트 분할 모듈
+Tab 3 결과 시트가 Excel 시트 한도(1,048,576행 × 16,384열)를 넘으면 번호가 붙은 시트로 나누어 작성하고
+"Shard index" 시트에 시트별 NET / 측정값 범위를 기록 (merged file을 직접 나누지 않아도 큰 lot 처리 가능)
+- NET 열 시트 (tinh LCLUCL, Sap xep): B열부터 NET → 시트당 최대 16,383 NET, 넘으면 "<시트> (2)" ...
+- 측정값이 행 한도를 넘으면 이어지는 시트에 계속 작성 (Row 1 NET 번호, Row 2부터 측정값)
+- 목록 시트 (NG index): 행 방향으로만 나누고 시트마다 헤더 반복
+- 나눌 필요가 없으면 기존과 같은 시트 하나 (Shard index 시트도 만들지 않음)
+- 한도는 호출할 때 모듈 변수에서 읽음 (작은 데이터로 분할을 확인할 때 낮춰서 사용)
+"""
+
+import bisect
+
+from openpyxl.styles import Font
+
+
+# Excel 시트 한도
+EXCEL_MAX_ROWS = 1_048_576
+EXCEL_MAX_COLS = 16_384
+SHEET_NAME_MAX_CHARS = 31
+
+SHARD_INDEX_SHEET_NAME = "Shard index"
+SHARD_INDEX_HEADERS = ("Sheet", "Content", "NET from", "NET to", "Measurement from", "Measurement to",
+                       "First data row")
+
+# 이어지는 측정값 시트: Row 1 NET 번호, Row 2부터 측정값
+CONTINUATION_DATA_START_ROW = 2
+
+
+def shard_sheet_name(base: str, part: int) -> str:
+    """분할 시트 이름 (첫 시트는 원래 이름, 다음부터 "<이름> (2)", 31자 한도 안에서 이름을 줄임)"""
+    if part == 0:
+        return base
+    suffix = f" ({part + 1})"
+    return base[:SHEET_NAME_MAX_CHARS - len(suffix)] + suffix
+
+
+def _split_ranges(total: int, first_size: int, size: int) -> list:
+    """0..total을 첫 구간 first_size, 다음부터 size 크기로 나눈 [start, end) 목록 (total이 0이면 빈 구간 하나)"""
+    ranges = []
+    start = 0
+    end = min(total, first_size)
+    while True:
+        ranges.append((start, end))
+        if end >= total:
+            return ranges
+        start, end = end, min(total, end + size)
+
+
+def plan_shards(content: str, row_count: int, data_start_row: int, net_count: int = None,
+                first_col: int = 2, repeat_header: bool = False) -> list:
+    """
+    시트 분할 계획
+
+    Args:
+        content: 원래 시트 이름
+        row_count: 데이터 행 수 (측정값 수, 목록 행 수)
+        data_start_row: 첫 시트의 데이터 시작 행 (위는 헤더 행)
+        net_count: NET 열 수 (None이면 목록 시트 - 행 방향으로만 분할)
+        first_col: 첫 NET 열 번호
+        repeat_header: True면 이어지는 시트에도 같은 헤더 행 (목록 시트)
+
+    Returns:
+        시트별 딕셔너리 리스트 (NET 범위 → 행 범위 순서)
+        {"sheet", "content", "net_start", "net_end" (0부터, 끝 제외, 목록 시트는 None),
+         "row_start", "row_end" (0부터, 끝 제외), "data_start_row", "header" (헤더 행이 있는 시트)}
+    """
+    if net_count is None:
+        net_ranges = [(None, None)]
+    else:
+        net_size = EXCEL_MAX_COLS - first_col + 1
+        net_ranges = _split_ranges(net_count, net_size, net_size)
+    continuation_start = data_start_row if repeat_header else CONTINUATION_DATA_START_ROW
+    first_capacity = EXCEL_MAX_ROWS - data_start_row + 1
+    capacity = EXCEL_MAX_ROWS - continuation_start + 1
+    if first_capacity < 1 or capacity < 1:
+        raise ValueError(f"Sheet '{content}': header rows exceed the Excel row limit ({EXCEL_MAX_ROWS})")
+    row_ranges = _split_ranges(row_count, first_capacity, capacity)
+
+    shards = []
+    for net_start, net_end in net_ranges:
+        for part, (row_start, row_end) in enumerate(row_ranges):
+            shards.append({
+                "sheet": shard_sheet_name(content, len(shards)),
+                "content": content,
+                "net_start": net_start,
+                "net_end": net_end,
+                "row_start": row_start,
+                "row_end": row_end,
+                "data_start_row": data_start_row if part == 0 else continuation_start,
+                "header": part == 0 or repeat_header,
+            })
+    return shards
+
+
+def create_shard_sheets(wb, shards: list) -> list:
+    """분할 계획대로 시트 생성 (여러 시트면 Shard index에 기록)"""
+    sheets = [wb.create_sheet(shard["sheet"]) for shard in shards]
+    if len(shards) > 1:
+        write_shard_index(wb, shards)
+    return sheets
+
+
+def write_shard_index(wb, shards: list) -> None:
+    """Shard index 시트에 분할 시트 목록 추가 (없으면 맨 앞에 생성)"""
+    if SHARD_INDEX_SHEET_NAME in wb.sheetnames:
+        ws = wb[SHARD_INDEX_SHEET_NAME]
+    else:
+        ws = wb.create_sheet(SHARD_INDEX_SHEET_NAME, 0)
+        header_font = Font(bold=True)
+        for col, header in enumerate(SHARD_INDEX_HEADERS, start=1):
+            ws.cell(row=1, column=col, value=header).font = header_font
+        for col_letter, width in zip("ABCDEFG", (24, 20, 10, 10, 16, 16, 14)):
+            ws.column_dimensions[col_letter].width = width
+        ws.freeze_panes = "A2"
+    for shard in shards:
+        net_from = None if shard["net_start"] is None else shard["net_start"] + 1
+        ws.append([shard["sheet"], shard["content"], net_from, shard["net_end"],
+                   shard["row_start"] + 1, shard["row_end"], shard["data_start_row"]])
+
+
+def read_shard_index(wb) -> list:
+    """Shard index 시트의 분할 시트 목록 (plan_shards 형식, 헤더 행은 NET 범위의 첫 시트, 시트가 없으면 빈 리스트)"""
+    if SHARD_INDEX_SHEET_NAME not in wb.sheetnames:
+        return []
+    shards = []
+    for row in wb[SHARD_INDEX_SHEET_NAME].iter_rows(min_row=2, max_col=len(SHARD_INDEX_HEADERS), values_only=True):
+        if not row or row[0] is None:
+            continue
+        sheet, content, net_from, net_to, row_from, row_to, data_start_row = row
+        shards.append({
+            "sheet": sheet,
+            "content": content,
+            "net_start": None if net_from is None else int(net_from) - 1,
+            "net_end": None if net_to is None else int(net_to),
+            "row_start": int(row_from) - 1,
+            "row_end": int(row_to),
+            "data_start_row": int(data_start_row),
+            "header": int(row_from) == 1,
+        })
+    return shards
+
+
+def content_shards(wb, content: str) -> list:
+    """원래 시트 이름의 분할 시트 목록 (Shard index에 없으면 빈 리스트 - 분할하지 않은 시트)"""
+    return [shard for shard in read_shard_index(wb) if shard["content"] == content]
+
+
+def remove_content_sheets(wb, content: str) -> None:
+    """원래 시트 이름의 시트(분할 시트 포함)와 Shard index 기록 삭제 (다시 작성하기 전)"""
+    index = read_shard_index(wb)
+    for name in {content} | {shard["sheet"] for shard in index if shard["content"] == content}:
+        if name in wb.sheetnames:
+            del wb[name]
+    remaining = [shard for shard in index if shard["content"] != content]
+    if len(remaining) == len(index):
+        return
+    del wb[SHARD_INDEX_SHEET_NAME]
+    if remaining:
+        write_shard_index(wb, remaining)
+
+
+class NetColumnSheets:
+    """
+    NET 열 시트 묶음 (분할된 시트에서 NET 번호로 헤더 행 셀과 측정값 위치 찾기)
+
+    사용 예:
+        sheets = NetColumnSheets.create(wb, "tinh LCLUCL", x, len(grid), TINH_DATA_START_ROW)
+        sheets.cell(row=1, net_idx=0, value=1)        # NET 1의 헤더 행 셀
+        for ws, shard in sheets.data_shards(net_idx):  # NET의 측정값이 있는 시트
+            ...
+    """
+
+    def __init__(self, sheets: list, shards: list, first_col: int = 2):
+        """
+        Args:
+            sheets: 워크시트 리스트 (shards와 같은 순서)
+            shards: plan_shards / read_shard_index 결과
+            first_col: 첫 NET 열 번호
+        """
+        self.first_col = first_col
+        self.pairs = list(zip(sheets, shards))
+        self._header_pairs = [(ws, shard) for ws, shard in self.pairs if shard["header"]]
+        self._header_starts = [shard["net_start"] for _, shard in self._header_pairs]
+        self.row_sharded = any(not shard["header"] for shard in shards)
+
+    @classmethod
+    def create(cls, wb, content: str, net_count: int, row_count: int, data_start_row: int, first_col: int = 2):
+        """분할 계획대로 시트를 만들고 이어지는 시트의 Row 1에 NET 번호 작성"""
+        shards = plan_shards(content, row_count, data_start_row, net_count, first_col)
+        sheets = cls(create_shard_sheets(wb, shards), shards, first_col)
+        header_font = Font(bold=True)
+        for ws, shard in sheets.pairs:
+            if shard["header"]:
+                continue
+            ws.cell(row=1, column=1, value="NET no").font = header_font
+            for net_idx in range(shard["net_start"], shard["net_end"]):
+                ws.cell(row=1, column=first_col + net_idx - shard["net_start"], value=net_idx + 1)
+            ws.freeze_panes = ws.cell(row=CONTINUATION_DATA_START_ROW, column=first_col)
+        return sheets
+
+    @classmethod
+    def open(cls, wb, content: str, net_count: int, data_start_row: int, first_col: int = 2):
+        """
+        저장된 결과 파일의 시트 묶음 (Shard index에 없으면 원래 이름의 시트 하나)
+
+        Args:
+            net_count: Shard index가 없을 때 NET 수
+            data_start_row: Shard index가 없을 때 데이터 시작 행
+        """
+        shards = content_shards(wb, content)
+        if not shards:
+            shards = [{"sheet": content, "content": content, "net_start": 0, "net_end": net_count,
+                       "row_start": 0, "row_end": 0, "data_start_row": data_start_row, "header": True}]
+        return cls([wb[shard["sheet"]] for shard in shards], shards, first_col)
+
+    def header_sheets(self) -> list:
+        """헤더 행이 있는 (워크시트, 분할 정보) 리스트 (NET 범위 순서)"""
+        return self._header_pairs
+
+    def locate(self, net_idx: int) -> tuple:
+        """NET의 헤더 행이 있는 (워크시트, 열 번호)"""
+        pos = bisect.bisect_right(self._header_starts, net_idx) - 1
+        ws, shard = self._header_pairs[pos]
+        return ws, self.first_col + net_idx - shard["net_start"]
+
+    def cell(self, row: int, net_idx: int, value=None):
+        """NET 열의 헤더 행 셀 (value가 None이 아니면 값 기록)"""
+        ws, col = self.locate(net_idx)
+        return ws.cell(row=row, column=col, value=value)
+
+    def data_shards(self, net_idx: int) -> list:
+        """NET의 측정값이 있는 (워크시트, 분할 정보) 리스트 (측정값 순서)"""
+        return [(ws, shard) for ws, shard in self.pairs if shard["net_start"] <= net_idx < shard["net_end"]]
@@ -1,25 +1,75 @@
 """
 시각화 모듈
 matplotlib를 사용하여 주요 분석 결과를 PNG로 저장합니다.
+
+각 플롯은 독립적인 렌더 작업(_render_* 함수 + 입력 데이터)으로 만들어지고
+Agg 백엔드 프로세스 풀에서 병렬로 렌더링됩니다.
+큰 숫자 배열은 작업마다 pickle하지 않고 공유 메모리로 전달합니다.
 """
 
+import atexit
+import hashlib
+import multiprocessing
 import os
+import shutil
+import time
+import types
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from multiprocessing import shared_memory
 from typing import Dict, List, Tuple, Optional
 
-import matplotlib
-
-# GUI 백엔드 충돌을 피하기 위해 Agg 사용
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt  # noqa: E402
-import numpy as np  # noqa: E402
-import pandas as pd  # noqa: E402
-from scipy import stats  # noqa: E402
+import numpy as np
 
+from logic.cancellation import check_cancelled
 from logic.config_manager import get_app_dir
+from logic.instrumentation import record_stage, stage
+from logic.capability import calculate_capability, limits_to_array
+from logic.parse_cache import CACHE_DIR
 from openpyxl import load_workbook
 
 
+# matplotlib / scipy.stats는 첫 플롯 때 로드 (_load_plotting)
+# 모듈 import만으로 프로그램 시작이 느려지지 않도록 함
+plt = None
+stats = None
+
+# 공통 플롯 스타일 (변경 시 플롯 캐시 키도 바뀜)
+PLOT_STYLE = 'seaborn-v0_8-whitegrid'
+PLOT_RC_PARAMS = {
+    'font.size': 10,
+    'axes.titlesize': 12,
+    'axes.labelsize': 10,
+    'figure.facecolor': 'white',
+}
+
+# 플롯 캐시: 입력 데이터/차트 종류/스타일이 같으면 다시 그리지 않고 캐시된 PNG 사용
+PLOT_CACHE_ENABLED = True
+PLOT_CACHE_DIR = os.path.join(CACHE_DIR, "plots")
+PLOT_CACHE_MAX_FILES = 1000
+PLOT_CACHE_VERSION = 1  # 렌더링 결과가 달라지는 코드 밖의 변경(라이브러리 교체 등) 시 증가
+
+
+# 렌더링 프로세스 수 (None이면 CPU 코어 수, 1이면 호출한 스레드에서 순차 렌더링)
+PLOT_MAX_WORKERS = None
+
+# 이 크기 이상의 numpy 배열은 공유 메모리로 워커에 전달
+SHM_MIN_BYTES = 64 * 1024
+
+# NET 수가 이보다 많으면 NET별 마커/막대 대신 집계(다운샘플링) 차트 사용
+LARGE_NET_THRESHOLD = 500
+
+# 집계 차트의 최대 구간 수 (구간마다 최솟값/최댓값 보존 → NET 수와 무관하게 그리는 양이 일정)
+MAX_PLOT_BUCKETS = 500
+
+# 병렬 렌더링 중 취소 요청 확인 주기 (초)
+CANCEL_POLL_SECONDS = 0.2
+
+# 렌더링 프로세스 풀 (처음 사용할 때 생성, 이후 재사용)
+_render_pool = None
+
+
 # 공통 경로 유틸
 def _get_plots_dir(output_dir: str = "") -> str:
     """
@@ -41,23 +91,625 @@ def _timestamp_label(operator: str) -> str:
     return f"{op}_{date_str}"
 
 
+def _load_plotting():
+    """matplotlib(Agg 백엔드)/scipy.stats를 처음 사용할 때 한 번만 import하고 스타일 설정"""
+    global plt, stats
+    if plt is not None:
+        return
+
+    import matplotlib
+
+    # GUI 백엔드 충돌을 피하기 위해 Agg 사용
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as _plt
+    from scipy import stats as _stats
+
+    stats = _stats
+    plt = _plt
+    _setup_style()
+
+
 # 공통 스타일 설정
 def _setup_style():
     """플롯 스타일 설정"""
-    plt.style.use('seaborn-v0_8-whitegrid')
-    plt.rcParams['font.size'] = 10
-    plt.rcParams['axes.titlesize'] = 12
-    plt.rcParams['axes.labelsize'] = 10
-    plt.rcParams['figure.facecolor'] = 'white'
+    _load_plotting()
+    plt.style.use(PLOT_STYLE)
+    for key, val in PLOT_RC_PARAMS.items():
+        plt.rcParams[key] = val
+
+
+# =========================
+# 렌더 팜 (프로세스 풀)
+# =========================
+class _SharedArray:
+    """공유 메모리에 올린 numpy 배열 참조 (워커에 pickle로 전달)"""
+    __slots__ = ("name", "shape", "dtype")
+
+    def __init__(self, name: str, shape: tuple, dtype: str):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    def __getstate__(self):
+        return (self.name, self.shape, self.dtype)
+
+    def __setstate__(self, state):
+        self.name, self.shape, self.dtype = state
+
+
+def _share_array(arr: np.ndarray, segments: list) -> _SharedArray:
+    """
+    numpy 배열을 공유 메모리에 복사하고 참조 반환
+
+    Args:
+        arr: 공유할 배열
+        segments: 생성한 SharedMemory 리스트 (호출자가 작업 종료 후 해제)
+    """
+    arr = np.ascontiguousarray(arr)
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    segments.append(shm)
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+    return _SharedArray(shm.name, arr.shape, arr.dtype.str)
+
+
+def _attach_array(ref: _SharedArray) -> np.ndarray:
+    """워커에서 공유 메모리 배열을 읽어 로컬 배열로 반환"""
+    shm = shared_memory.SharedMemory(name=ref.name)
+    try:
+        return np.ndarray(ref.shape, dtype=np.dtype(ref.dtype), buffer=shm.buf).copy()
+    finally:
+        shm.close()
+
+
+def _init_render_worker():
+    """렌더링 워커 초기화 (Agg 백엔드 + 공통 스타일)"""
+    _load_plotting()
+
+
+def _render_worker_count() -> int:
+    """렌더링 프로세스 수"""
+    return PLOT_MAX_WORKERS or os.cpu_count() or 1
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    """렌더링 프로세스 풀 반환 (없으면 생성)"""
+    global _render_pool
+    if _render_pool is None:
+        # fork는 Qt 스레드가 있는 프로세스에서 안전하지 않고 Windows와 동작을 맞추기 위해 spawn 사용
+        _render_pool = ProcessPoolExecutor(
+            max_workers=_render_worker_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_render_worker,
+        )
+    return _render_pool
+
+
+def shutdown_render_pool():
+    """렌더링 프로세스 풀 종료 (프로그램 종료 시 자동 호출)"""
+    global _render_pool
+    if _render_pool is not None:
+        _render_pool.shutdown(wait=False, cancel_futures=True)
+        _render_pool = None
+
+
+atexit.register(shutdown_render_pool)
+
+
+def _run_render_task(render, path: str, kwargs: dict) -> Optional[str]:
+    """
+    렌더 작업 1개 실행 (워커 또는 호출한 스레드에서)
+
+    Returns:
+        저장된 파일 경로 (그릴 데이터가 없으면 None)
+    """
+    _load_plotting()
+    kwargs = {k: _attach_array(v) if isinstance(v, _SharedArray) else v for k, v in kwargs.items()}
+    try:
+        saved = render(path, **kwargs)
+    finally:
+        plt.close('all')
+    return path if saved is not False else None
+
+
+def _run_render_task_timed(render, path: str, kwargs: dict) -> tuple:
+    """렌더 작업 1개 실행 후 (저장된 파일 경로, 실행 시간, CPU 시간) 반환 (워커 프로세스용)"""
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = _run_render_task(render, path, kwargs)
+    return result, time.perf_counter() - wall, time.process_time() - cpu
+
+
+def _render_serial(tasks: list, cancel_token=None) -> list:
+    """렌더 작업을 호출한 스레드에서 순차 실행 (작업별 결과 리스트)"""
+    results = []
+    for task in tasks:
+        check_cancelled(cancel_token)
+        with stage(f"plot {os.path.basename(task[1])}"):
+            results.append(_run_render_task(*task))
+    return results
+
+
+def _render_parallel(tasks: list, cancel_token=None) -> list:
+    """
+    렌더 작업을 프로세스 풀에서 병렬 실행 (작업별 결과 리스트)
+    큰 numpy 배열은 공유 메모리로 전달
+    취소 요청 시 아직 시작하지 않은 작업은 취소하고 실행 중인 작업만 기다림
+    """
+    segments = []
+    futures = []
+    try:
+        shared = {}
+        prepared = []
+        for render, path, kwargs in tasks:
+            args = {}
+            for key, val in kwargs.items():
+                if isinstance(val, np.ndarray) and val.nbytes >= SHM_MIN_BYTES:
+                    # 같은 배열은 한 번만 공유 메모리에 올림
+                    if id(val) not in shared:
+                        shared[id(val)] = _share_array(val, segments)
+                    val = shared[id(val)]
+                args[key] = val
+            prepared.append((render, path, args))
+
+        pool = _get_render_pool()
+        futures = [pool.submit(_run_render_task_timed, *task) for task in prepared]
+        not_done = set(futures)
+        while not_done:
+            if cancel_token is not None and cancel_token.cancelled:
+                for f in not_done:
+                    f.cancel()
+                check_cancelled(cancel_token)
+            _, not_done = wait(not_done, timeout=CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+        results = []
+        for (_, path, _), future in zip(prepared, futures):
+            result, wall_s, cpu_s = future.result()
+            # 워커 프로세스에서 측정한 시간 (tracemalloc 메모리는 측정 안 됨)
+            record_stage(f"plot {os.path.basename(path)}", wall_s, cpu_s, worker="process")
+            results.append(result)
+        return results
+    except BrokenProcessPool:
+        # 워커 프로세스를 띄울 수 없는 환경이면 순차 렌더링
+        shutdown_render_pool()
+        return _render_serial(tasks, cancel_token)
+    finally:
+        if futures:
+            wait(futures)
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+
+def _run_render_tasks(tasks: list, cancel_token=None) -> List[str]:
+    """
+    렌더 작업 리스트 실행
+    플롯 캐시에 같은 입력의 결과가 있으면 재사용하고, 나머지만 렌더링
+    (워커가 2개 이상이면 프로세스 풀에서 병렬로, 아니면 순차로)
+
+    Args:
+        tasks: [(render 함수, 저장 경로, kwargs), ...]
+        cancel_token: 취소 요청 토큰 (None이면 확인 안 함)
+    Returns:
+        저장된 파일 경로 리스트 (작업 순서 유지)
+    """
+    if not tasks:
+        return []
+
+    results = [None] * len(tasks)
+    pending = []  # (작업 index, 캐시 키, 작업)
+    for i, (render, path, kwargs) in enumerate(tasks):
+        key = _plot_cache_key(render, kwargs) if PLOT_CACHE_ENABLED else None
+        if key is not None:
+            hit, result = _restore_cached_plot(key, path)
+            if hit:
+                results[i] = result
+                continue
+        # 이전 실행에서 캐시와 하드링크된 파일이면 덮어쓰기 전에 연결을 끊음
+        if os.path.lexists(path):
+            os.remove(path)
+        pending.append((i, key, (render, path, kwargs)))
+
+    if pending:
+        todo = [task for _, _, task in pending]
+        with stage("render", rendered=len(todo), cached=len(tasks) - len(todo)):
+            if len(todo) == 1 or _render_worker_count() <= 1:
+                rendered = _render_serial(todo, cancel_token)
+            else:
+                rendered = _render_parallel(todo, cancel_token)
+
+        for (i, key, _), result in zip(pending, rendered):
+            results[i] = result
+            if key is not None:
+                _store_cached_plot(key, result)
+        if PLOT_CACHE_ENABLED:
+            _prune_plot_cache()
+
+    return [p for p in results if p]
+
+
+# =========================
+# 플롯 캐시 (입력 해시 → PNG)
+# =========================
+def _hash_value(h, val):
+    """렌더 입력값을 타입까지 구분하여 해시에 반영 (재귀)"""
+    if isinstance(val, np.ndarray):
+        arr = np.ascontiguousarray(val)
+        h.update(f"nd:{arr.dtype.str}:{arr.shape}:".encode())
+        h.update(arr.tobytes())
+    elif isinstance(val, (list, tuple)):
+        h.update(f"{type(val).__name__}:{len(val)}[".encode())
+        for item in val:
+            _hash_value(h, item)
+        h.update(b"]")
+    elif isinstance(val, dict):
+        h.update(f"dict:{len(val)}{{".encode())
+        for k in sorted(val, key=repr):
+            _hash_value(h, k)
+            _hash_value(h, val[k])
+        h.update(b"}")
+    elif isinstance(val, np.generic):
+        _hash_value(h, val.item())
+    else:
+        h.update(f"{type(val).__name__}:{val!r};".encode())
+
+
+def _hash_code(h, code, module_globals: dict = None, seen: set = None):
+    """
+    렌더 함수 코드(바이트코드 + 상수)를 해시에 반영 → 차트 코드가 바뀌면 캐시 무효화
+    module_globals가 있으면 코드가 참조하는 모듈 수준 함수(_minmax_downsample, limits_to_array 등)와
+    숫자/문자열 상수(MAX_PLOT_BUCKETS 등)도 재귀적으로 반영 (헬퍼만 바뀌어도 캐시 무효화)
+    """
+    if seen is None:
+        seen = set()
+    h.update(code.co_code)
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _hash_code(h, const, module_globals, seen)
+        else:
+            h.update(repr(const).encode())
+    if module_globals is None:
+        return
+    for name in code.co_names:
+        val = module_globals.get(name)
+        if isinstance(val, types.FunctionType):
+            if val.__code__ in seen:
+                continue
+            seen.add(val.__code__)
+            h.update(f"fn:{val.__module__}.{val.__qualname__}:{val.__defaults__!r}:".encode())
+            _hash_code(h, val.__code__, val.__globals__, seen)
+        elif isinstance(val, (bool, int, float, str, tuple)):
+            h.update(f"const:{name}={val!r};".encode())
+
+
+def _plot_cache_key(render, kwargs: dict) -> Optional[str]:
+    """
+    플롯 캐시 키 생성: 차트 종류(렌더 함수) + 스타일 + 입력 데이터 해시
+
+    Returns:
+        16진수 키 (해시할 수 없는 입력이면 None)
+    """
+    try:
+        h = hashlib.sha1()
+        h.update(f"v{PLOT_CACHE_VERSION}:{render.__module__}.{render.__qualname__}:".encode())
+        _hash_code(h, render.__code__, render.__globals__)
+        _hash_value(h, PLOT_STYLE)
+        _hash_value(h, PLOT_RC_PARAMS)
+        _hash_value(h, kwargs)
+        return h.hexdigest()
+    except Exception:
+        return None
+
+
+def _restore_cached_plot(key: str, path: str):
+    """
+    캐시된 플롯을 출력 경로에 하드링크(실패 시 복사)
+
+    Returns:
+        (캐시 적중 여부, 결과 경로 또는 None)
+    """
+    cached_png = os.path.join(PLOT_CACHE_DIR, key + ".png")
+    if os.path.exists(cached_png):
+        try:
+            if not (os.path.exists(path) and os.path.samefile(path, cached_png)):
+                if os.path.lexists(path):
+                    os.remove(path)
+                try:
+                    os.link(cached_png, path)
+                except OSError:
+                    shutil.copyfile(cached_png, path)
+            os.utime(cached_png)  # 최근 사용 표시 (정리 순서에 사용)
+            return True, path
+        except OSError:
+            return False, None
+
+    # 그릴 데이터가 없어서 파일을 만들지 않은 작업
+    if os.path.exists(os.path.join(PLOT_CACHE_DIR, key + ".none")):
+        return True, None
+    return False, None
+
+
+def _store_cached_plot(key: str, result: Optional[str]):
+    """렌더링 결과를 플롯 캐시에 저장 (하드링크, 실패 시 복사)"""
+    try:
+        os.makedirs(PLOT_CACHE_DIR, exist_ok=True)
+        if result is None:
+            open(os.path.join(PLOT_CACHE_DIR, key + ".none"), 'w').close()
+            return
+        cached_png = os.path.join(PLOT_CACHE_DIR, key + ".png")
+        if os.path.exists(cached_png):
+            return
+        try:
+            os.link(result, cached_png)
+        except OSError:
+            shutil.copyfile(result, cached_png)
+    except OSError as e:
+        print(f"Error saving plot cache: {e}")
+
+
+def _prune_plot_cache():
+    """플롯 캐시 파일이 PLOT_CACHE_MAX_FILES를 넘으면 오래 사용하지 않은 것부터 삭제"""
+    try:
+        entries = [e for e in os.scandir(PLOT_CACHE_DIR) if e.is_file()]
+    except OSError:
+        return
+    if len(entries) <= PLOT_CACHE_MAX_FILES:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    for entry in entries[:len(entries) - PLOT_CACHE_MAX_FILES]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _render_table(path: str, columns: list, rows: list, title: str,
+                  figsize: tuple, fontsize: int, scale: tuple):
+    """요약 테이블 렌더링 (헤더 파란색 배경 + 흰색 글씨)"""
+    fig, ax = plt.subplots(figsize=figsize)
+    ax.axis('off')
+
+    table = ax.table(
+        cellText=rows,
+        colLabels=columns,
+        cellLoc='center',
+        loc='center',
+        colColours=['#4472C4'] * len(columns)
+    )
+    table.auto_set_font_size(False)
+    table.set_fontsize(fontsize)
+    table.scale(*scale)
+
+    # 헤더 텍스트 흰색
+    for i in range(len(columns)):
+        table[(0, i)].set_text_props(color='white', fontweight='bold')
+
+    ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200, bbox_inches='tight')
+    plt.close()
+
+
+# =========================
+# 대용량 NET 집계 유틸
+# =========================
+def _bucket_starts(n: int, max_buckets: int = MAX_PLOT_BUCKETS) -> np.ndarray:
+    """0..n-1 인덱스를 최대 max_buckets개 연속 구간으로 나눈 구간 시작 인덱스"""
+    return np.unique(np.linspace(0, n, min(n, max_buckets) + 1).astype(int)[:-1])
+
+
+def _minmax_downsample(y, max_buckets: int = MAX_PLOT_BUCKETS):
+    """
+    구간마다 최솟값/최댓값 위치만 남기는 다운샘플링 (스파이크 보존)
+
+    Args:
+        y: NET 순서대로의 값 (NaN은 제외)
+        max_buckets: 구간 수
+    Returns:
+        (x: 1부터 시작하는 NET 번호, y) - x 오름차순
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    x_idx = np.nonzero(~np.isnan(y))[0]
+    y_val = y[x_idx]
+    if n <= 2 * max_buckets:
+        return x_idx + 1, y_val
+
+    bucket = x_idx * max_buckets // n
+    order = np.lexsort((y_val, bucket))  # 구간 오름차순, 구간 안에서 값 오름차순
+    b_sorted = bucket[order]
+    boundary = b_sorted[1:] != b_sorted[:-1]
+    first = np.r_[True, boundary]   # 구간별 최솟값
+    last = np.r_[boundary, True]    # 구간별 최댓값
+    keep = np.unique(np.concatenate([order[first], order[last]]))
+    return x_idx[keep] + 1, y_val[keep]
+
+
+def _bucket_envelope(low, high, max_buckets: int = MAX_PLOT_BUCKETS):
+    """
+    구간별 (low 최솟값, high 최댓값) 포락선 - fill_between 용
+
+    Returns:
+        (x: 구간 중심 NET 번호, low 최솟값, high 최댓값)
+    """
+    low = np.asarray(low, dtype=float)
+    high = np.asarray(high, dtype=float)
+    n = len(low)
+    starts = _bucket_starts(n, max_buckets)
+    ends = np.r_[starts[1:], n]
+    x = (starts + ends - 1) / 2 + 1
+    return x, np.fmin.reduceat(low, starts), np.fmax.reduceat(high, starts)
+
+
+def _bar_collection(ax, left, width, heights, colors, **kwargs):
+    """막대 여러 개를 PolyCollection 하나로 그림 (막대마다 Rectangle을 만들지 않음)"""
+    from matplotlib.collections import PolyCollection
+
+    left = np.asarray(left, dtype=float)
+    right = left + np.asarray(width, dtype=float)
+    heights = np.asarray(heights, dtype=float)
+    zeros = np.zeros_like(heights)
+    verts = np.stack([
+        np.column_stack([left, zeros]),
+        np.column_stack([left, heights]),
+        np.column_stack([right, heights]),
+        np.column_stack([right, zeros]),
+    ], axis=1)
+    coll = PolyCollection(verts, facecolors=colors, **kwargs)
+    ax.add_collection(coll)
+    ax.autoscale_view()
+    return coll
 
 
 # =========================
 # Tab1: DCR Format
 # =========================
+def _render_dcr_vendor_spec(path: str, nets: list, mins: list, typs: list, maxs: list):
+    """막대 차트: NET별 Min/Typ/Max 저항 스펙 (NET이 많으면 구간별 범위 차트)"""
+    fig, ax = plt.subplots(figsize=(14, 6))
+
+    if len(nets) > LARGE_NET_THRESHOLD:
+        # NET별 막대 대신 구간별 Min~Max 범위 + Typ 선 (NET 이름 대신 번호 축)
+        x_env, lo, hi = _bucket_envelope(mins, maxs)
+        ax.fill_between(x_env, lo, hi, color='#5B9BD5', alpha=0.3, label='Min-Max')
+        for vals, color, name in ((mins, '#5B9BD5', 'Min'), (typs, '#70AD47', 'Typ'), (maxs, '#ED7D31', 'Max')):
+            x_ds, y_ds = _minmax_downsample(vals)
+            ax.plot(x_ds, y_ds, color=color, linewidth=1, label=name)
+        ax.set_title(f"DCR Vendor Spec by NET (Min/Typ/Max, {len(nets):,} NETs)", fontsize=14, fontweight='bold')
+        ax.set_xlabel("NET No")
+    else:
+        x = np.arange(len(nets))
+        width = 0.25
+
+        ax.bar(x - width, mins, width, label='Min', color='#5B9BD5', edgecolor='black')
+        ax.bar(x, typs, width, label='Typ', color='#70AD47', edgecolor='black')
+        ax.bar(x + width, maxs, width, label='Max', color='#ED7D31', edgecolor='black')
+
+        ax.set_xticks(x)
+        ax.set_xticklabels([n[:15] for n in nets], rotation=45, ha='right', fontsize=8)
+        ax.set_title("DCR Vendor Spec by NET (Min/Typ/Max)", fontsize=14, fontweight='bold')
+        ax.set_xlabel("NET Name")
+    ax.set_ylabel("Resistance Value")
+    ax.legend()
+    ax.grid(True, axis='y', linestyle='--', alpha=0.4)
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200)
+    plt.close()
+
+
+def _render_dcr_spec_range(path: str, nets: list, ranges: list):
+    """스펙 범위 차트 (Max - Min)"""
+    fig, ax = plt.subplots(figsize=(12, 6))
+    if len(nets) > LARGE_NET_THRESHOLD:
+        # 구간별 최대 범위를 막대 하나로 (PolyCollection)
+        ranges = np.asarray(ranges, dtype=float)
+        starts = _bucket_starts(len(ranges))
+        widths = np.diff(np.r_[starts, len(ranges)])
+        heights = np.fmax.reduceat(ranges, starts)
+        colors = plt.cm.viridis(np.linspace(0, 1, len(starts)))
+        _bar_collection(ax, starts + 0.5, widths, heights, colors, edgecolors='none')
+        ax.set_title(f"DCR Spec Range by NET (Max - Min, {len(nets):,} NETs)", fontsize=14, fontweight='bold')
+        ax.set_xlabel("NET No")
+    else:
+        colors = plt.cm.viridis(np.linspace(0, 1, len(ranges)))
+        ax.bar(range(len(ranges)), ranges, color=colors, edgecolor='black')
+        ax.set_xticks(range(len(nets)))
+        ax.set_xticklabels([n[:10] for n in nets], rotation=45, ha='right', fontsize=8)
+        ax.set_title("DCR Spec Range by NET (Max - Min)", fontsize=14, fontweight='bold')
+        ax.set_xlabel("NET Name")
+    ax.set_ylabel("Spec Range")
+    ax.grid(True, axis='y', linestyle='--', alpha=0.4)
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200)
+    plt.close()
+
+
+def _render_dcr_part_dist(path: str, parts: list, counts: list):
+    """파이 차트: DE Requirement Part별 Pin 분포"""
+    fig, ax = plt.subplots(figsize=(10, 6))
+    colors = plt.cm.Set2(np.linspace(0, 1, len(parts)))
+
+    wedges, texts, autotexts = ax.pie(counts, labels=parts, colors=colors, autopct='%1.1f%%',
+                                      shadow=True, startangle=90)
+    ax.set_title("Part Distribution in DE Requirement", fontsize=14, fontweight='bold')
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200)
+    plt.close()
+
+
+def _render_dcr_judge(path: str, pass_count: int, fail_count: int):
+    """Judge(check pin) Pass/Fail 파이 + 막대 차트"""
+    total = pass_count + fail_count
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+
+    # 파이 차트
+    sizes = [pass_count, fail_count]
+    labels = ['Pass', 'Fail']
+    colors = ['#70AD47', '#C00000']
+    explode = (0, 0.1) if fail_count > 0 else (0, 0)
+
+    ax1.pie(sizes, explode=explode, labels=labels, colors=colors, autopct='%1.1f%%',
+           shadow=True, startangle=90)
+    ax1.set_title(f"DCR Judge Results\n(Total: {total})", fontsize=12, fontweight='bold')
+
+    # 막대 차트
+    ax2.bar(['Pass', 'Fail'], [pass_count, fail_count], color=colors, edgecolor='black')
+    ax2.set_title("Pass/Fail Count", fontsize=12, fontweight='bold')
+    ax2.set_ylabel("Count")
+
+    for i, (count, pct) in enumerate(zip([pass_count, fail_count],
+                                          [pass_count/total*100, fail_count/total*100])):
+        ax2.annotate(f'{count:,}\n({pct:.1f}%)',
+                    xy=(i, count), xytext=(0, 5),
+                    textcoords="offset points", ha='center', va='bottom', fontsize=10)
+    ax2.grid(True, axis='y', linestyle='--', alpha=0.4)
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200)
+    plt.close()
+
+
+def _render_dcr_analysis(path: str, dcr_values: np.ndarray):
+    """DCR 시트 값 히스토그램 + Box Plot"""
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+
+    # 히스토그램
+    ax1.hist(dcr_values, bins=30, color='steelblue', edgecolor='black', alpha=0.7)
+    ax1.axvline(np.mean(dcr_values), color='red', linestyle='--', linewidth=2,
+               label=f'Mean: {np.mean(dcr_values):.4f}')
+    ax1.set_title("DCR Values Distribution", fontsize=12, fontweight='bold')
+    ax1.set_xlabel("Value")
+    ax1.set_ylabel("Frequency")
+    ax1.legend()
+    ax1.grid(True, linestyle='--', alpha=0.4)
+
+    # Box Plot
+    bp = ax2.boxplot(dcr_values, vert=True, patch_artist=True)
+    bp['boxes'][0].set_facecolor('#5B9BD5')
+    bp['boxes'][0].set_alpha(0.7)
+    ax2.set_title("DCR Values Box Plot", fontsize=12, fontweight='bold')
+    ax2.set_ylabel("Value")
+    ax2.grid(True, axis='y', linestyle='--', alpha=0.4)
+
+    # 통계 정보 추가
+    stats_text = f"Count: {len(dcr_values)}\nMean: {np.mean(dcr_values):.4f}\n"
+    stats_text += f"Std: {np.std(dcr_values):.4f}\nMin: {np.min(dcr_values):.4f}\nMax: {np.max(dcr_values):.4f}"
+    ax2.text(1.3, np.mean(dcr_values), stats_text, fontsize=9, verticalalignment='center',
+            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+
+    plt.suptitle("DCR Sheet Analysis", fontsize=14, fontweight='bold')
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200)
+    plt.close()
+
+
 def save_dcr_plots_from_file(
     output_file: str,
     operator: str = "",
     output_dir: str = "",
+    cancel_token=None,
 ) -> List[str]:
     """
     DCR Format 결과 파일에서 통계 플롯 생성
@@ -66,41 +718,42 @@ def save_dcr_plots_from_file(
         output_file: 생성된 DCR_format_yamaha 파일 경로
         operator: 작업자 이름
         output_dir: 외부에서 지정한 출력 디렉토리
+        cancel_token: 취소 요청 토큰 (None이면 확인 안 함)
     Returns:
         저장된 파일 경로 리스트
     """
-    _setup_style()
-    saved_paths = []
     plots_dir = _get_plots_dir(output_dir)
     label = _timestamp_label(operator)
+    tasks = []
 
     if not os.path.exists(output_file):
-        return saved_paths
+        return []
 
     try:
         wb = load_workbook(output_file, data_only=True)
     except Exception:
-        return saved_paths
+        return []
 
     # 1) Vendor Sheet 분석: NET별 저항 스펙 (Min/Typ/Max)
     if "vendorspec" in wb.sheetnames:
         ws = wb["vendorspec"]
         net_data = []
-        
-        # A열: NET, 스펙 데이터 찾기 (row 2부터)
-        for row in range(2, min(ws.max_row + 1, 102)):  # 최대 100개 NET
-            net_name = ws.cell(row=row, column=1).value
+
+        # A열: NET, 스펙 데이터 찾기 (row 2부터, 전체 NET)
+        for row_values in ws.iter_rows(min_row=2, values_only=True):
+            net_name = row_values[0] if row_values else None
             if net_name is None:
                 continue
-            
+
             # 저항 스펙 컬럼 찾기 (보통 Min, Typ, Max)
             min_val = None
             typ_val = None
             max_val = None
-            
-            # 각 셀에서 숫자 데이터 찾기
-            for col in range(2, min(ws.max_column + 1, 20)):
-                cell_val = ws.cell(row=row, column=col).value
+
+            # 각 셀에서 숫자 데이터 찾기 (앞에서부터 숫자 3개)
+            for cell_val in row_values[1:]:
+                if max_val is not None:
+                    break
                 if cell_val is not None:
                     try:
                         val = float(cell_val)
@@ -112,7 +765,7 @@ def save_dcr_plots_from_file(
                             max_val = val
                     except (ValueError, TypeError):
                         pass
-            
+
             if min_val is not None or typ_val is not None or max_val is not None:
                 net_data.append({
                     'NET': str(net_name),
@@ -120,94 +773,48 @@ def save_dcr_plots_from_file(
                     'Typ': typ_val if typ_val else 0,
                     'Max': max_val if max_val else 0
                 })
-        
+
         if net_data:
-            # 막대 차트: NET별 Min/Typ/Max 저항 스펙
-            fig, ax = plt.subplots(figsize=(14, 6))
-            
-            x = np.arange(len(net_data))
-            width = 0.25
-            
-            mins = [d['Min'] for d in net_data]
-            typs = [d['Typ'] for d in net_data]
-            maxs = [d['Max'] for d in net_data]
-            
-            ax.bar(x - width, mins, width, label='Min', color='#5B9BD5', edgecolor='black')
-            ax.bar(x, typs, width, label='Typ', color='#70AD47', edgecolor='black')
-            ax.bar(x + width, maxs, width, label='Max', color='#ED7D31', edgecolor='black')
-            
-            ax.set_xticks(x)
-            ax.set_xticklabels([d['NET'][:15] for d in net_data], rotation=45, ha='right', fontsize=8)
-            ax.set_title("DCR Vendor Spec by NET (Min/Typ/Max)", fontsize=14, fontweight='bold')
-            ax.set_xlabel("NET Name")
-            ax.set_ylabel("Resistance Value")
-            ax.legend()
-            ax.grid(True, axis='y', linestyle='--', alpha=0.4)
-            
-            path = os.path.join(plots_dir, f"DCR_VendorSpec_{label}.png")
-            plt.tight_layout()
-            plt.savefig(path, dpi=200)
-            plt.close()
-            saved_paths.append(path)
-
-            # 스펙 범위 차트 (Max - Min)
-            ranges = [d['Max'] - d['Min'] for d in net_data]
-            fig, ax = plt.subplots(figsize=(12, 6))
-            colors = plt.cm.viridis(np.linspace(0, 1, len(ranges)))
-            ax.bar(range(len(ranges)), ranges, color=colors, edgecolor='black')
-            ax.set_xticks(range(len(net_data)))
-            ax.set_xticklabels([d['NET'][:10] for d in net_data], rotation=45, ha='right', fontsize=8)
-            ax.set_title("DCR Spec Range by NET (Max - Min)", fontsize=14, fontweight='bold')
-            ax.set_xlabel("NET Name")
-            ax.set_ylabel("Spec Range")
-            ax.grid(True, axis='y', linestyle='--', alpha=0.4)
-            
-            path = os.path.join(plots_dir, f"DCR_SpecRange_{label}.png")
-            plt.tight_layout()
-            plt.savefig(path, dpi=200)
-            plt.close()
-            saved_paths.append(path)
+            nets = [d['NET'] for d in net_data]
+            tasks.append((_render_dcr_vendor_spec,
+                          os.path.join(plots_dir, f"DCR_VendorSpec_{label}.png"),
+                          {"nets": nets,
+                           "mins": [d['Min'] for d in net_data],
+                           "typs": [d['Typ'] for d in net_data],
+                           "maxs": [d['Max'] for d in net_data]}))
+            tasks.append((_render_dcr_spec_range,
+                          os.path.join(plots_dir, f"DCR_SpecRange_{label}.png"),
+                          {"nets": nets, "ranges": [d['Max'] - d['Min'] for d in net_data]}))
 
     # 2) DE Requirement 분석: Part별 Pin 분포
     if "DE requirement" in wb.sheetnames:
         ws = wb["DE requirement"]
         part_pins = {}  # {part_name: pin_count}
         nets = []
-        
+
         for row in range(3, ws.max_row + 1):
             net = ws.cell(row=row, column=2).value
             part1 = ws.cell(row=row, column=3).value
             part2 = ws.cell(row=row, column=5).value
-            
+
             if net:
                 nets.append(str(net))
             if part1:
                 part_pins[str(part1)] = part_pins.get(str(part1), 0) + 1
             if part2:
                 part_pins[str(part2)] = part_pins.get(str(part2), 0) + 1
-        
+
         if part_pins:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            parts = list(part_pins.keys())
-            counts = list(part_pins.values())
-            colors = plt.cm.Set2(np.linspace(0, 1, len(parts)))
-            
-            wedges, texts, autotexts = ax.pie(counts, labels=parts, colors=colors, autopct='%1.1f%%',
-                                              shadow=True, startangle=90)
-            ax.set_title("Part Distribution in DE Requirement", fontsize=14, fontweight='bold')
-            
-            path = os.path.join(plots_dir, f"DCR_PartDist_{label}.png")
-            plt.tight_layout()
-            plt.savefig(path, dpi=200)
-            plt.close()
-            saved_paths.append(path)
+            tasks.append((_render_dcr_part_dist,
+                          os.path.join(plots_dir, f"DCR_PartDist_{label}.png"),
+                          {"parts": list(part_pins.keys()), "counts": list(part_pins.values())}))
 
     # 3) Judge(check pin) 분석: Pass/Fail 통계
     if "Judge(check pin)" in wb.sheetnames:
         ws = wb["Judge(check pin)"]
         pass_count = 0
         fail_count = 0
-        
+
         # Judge 컬럼 찾기 (보통 마지막 컬럼에 Judge 결과)
         for row in range(2, ws.max_row + 1):
             for col in range(1, ws.max_column + 1):
@@ -218,44 +825,17 @@ def save_dcr_plots_from_file(
                         pass_count += 1
                     elif val_str in ['FAIL', 'NG', 'X', 'BAD']:
                         fail_count += 1
-        
-        total = pass_count + fail_count
-        if total > 0:
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
-            
-            # 파이 차트
-            sizes = [pass_count, fail_count]
-            labels = ['Pass', 'Fail']
-            colors = ['#70AD47', '#C00000']
-            explode = (0, 0.1) if fail_count > 0 else (0, 0)
-            
-            ax1.pie(sizes, explode=explode, labels=labels, colors=colors, autopct='%1.1f%%',
-                   shadow=True, startangle=90)
-            ax1.set_title(f"DCR Judge Results\n(Total: {total})", fontsize=12, fontweight='bold')
-            
-            # 막대 차트
-            ax2.bar(['Pass', 'Fail'], [pass_count, fail_count], color=colors, edgecolor='black')
-            ax2.set_title("Pass/Fail Count", fontsize=12, fontweight='bold')
-            ax2.set_ylabel("Count")
-            
-            for i, (count, pct) in enumerate(zip([pass_count, fail_count], 
-                                                  [pass_count/total*100, fail_count/total*100])):
-                ax2.annotate(f'{count:,}\n({pct:.1f}%)',
-                            xy=(i, count), xytext=(0, 5),
-                            textcoords="offset points", ha='center', va='bottom', fontsize=10)
-            ax2.grid(True, axis='y', linestyle='--', alpha=0.4)
-            
-            path = os.path.join(plots_dir, f"DCR_JudgeResult_{label}.png")
-            plt.tight_layout()
-            plt.savefig(path, dpi=200)
-            plt.close()
-            saved_paths.append(path)
+
+        if pass_count + fail_count > 0:
+            tasks.append((_render_dcr_judge,
+                          os.path.join(plots_dir, f"DCR_JudgeResult_{label}.png"),
+                          {"pass_count": pass_count, "fail_count": fail_count}))
 
     # 4) DCR Sheet 분석: 데이터 요약
     if "DCR" in wb.sheetnames:
         ws = wb["DCR"]
         dcr_values = []
-        
+
         # 숫자 데이터 수집
         for row in range(2, ws.max_row + 1):
             for col in range(1, ws.max_column + 1):
@@ -267,95 +847,159 @@ def save_dcr_plots_from_file(
                             dcr_values.append(val)
                     except (ValueError, TypeError):
                         pass
-        
+
         if dcr_values:
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-            
-            # 히스토그램
-            ax1.hist(dcr_values, bins=30, color='steelblue', edgecolor='black', alpha=0.7)
-            ax1.axvline(np.mean(dcr_values), color='red', linestyle='--', linewidth=2, 
-                       label=f'Mean: {np.mean(dcr_values):.4f}')
-            ax1.set_title("DCR Values Distribution", fontsize=12, fontweight='bold')
-            ax1.set_xlabel("Value")
-            ax1.set_ylabel("Frequency")
-            ax1.legend()
-            ax1.grid(True, linestyle='--', alpha=0.4)
-            
-            # Box Plot
-            bp = ax2.boxplot(dcr_values, vert=True, patch_artist=True)
-            bp['boxes'][0].set_facecolor('#5B9BD5')
-            bp['boxes'][0].set_alpha(0.7)
-            ax2.set_title("DCR Values Box Plot", fontsize=12, fontweight='bold')
-            ax2.set_ylabel("Value")
-            ax2.grid(True, axis='y', linestyle='--', alpha=0.4)
-            
-            # 통계 정보 추가
-            stats_text = f"Count: {len(dcr_values)}\nMean: {np.mean(dcr_values):.4f}\n"
-            stats_text += f"Std: {np.std(dcr_values):.4f}\nMin: {np.min(dcr_values):.4f}\nMax: {np.max(dcr_values):.4f}"
-            ax2.text(1.3, np.mean(dcr_values), stats_text, fontsize=9, verticalalignment='center',
-                    bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-            
-            plt.suptitle("DCR Sheet Analysis", fontsize=14, fontweight='bold')
-            
-            path = os.path.join(plots_dir, f"DCR_Analysis_{label}.png")
-            plt.tight_layout()
-            plt.savefig(path, dpi=200)
-            plt.close()
-            saved_paths.append(path)
+            tasks.append((_render_dcr_analysis,
+                          os.path.join(plots_dir, f"DCR_Analysis_{label}.png"),
+                          {"dcr_values": np.asarray(dcr_values, dtype=float)}))
 
     # 5) 전체 요약 테이블
-    summary_data = []
-    
+    summary_rows = []
+
     # 각 시트별 정보 수집
     for sheet_name in wb.sheetnames:
         ws = wb[sheet_name]
         row_count = ws.max_row - 1 if ws.max_row > 1 else 0
         col_count = ws.max_column
-        summary_data.append({
-            'Sheet': sheet_name,
-            'Rows': row_count,
-            'Columns': col_count
-        })
-    
-    if summary_data:
-        fig, ax = plt.subplots(figsize=(10, len(summary_data) * 0.5 + 2))
-        ax.axis('off')
-        
-        df = pd.DataFrame(summary_data)
-        table = ax.table(
-            cellText=df.values,
-            colLabels=df.columns,
-            cellLoc='center',
-            loc='center',
-            colColours=['#4472C4'] * len(df.columns)
-        )
-        table.auto_set_font_size(False)
-        table.set_fontsize(10)
-        table.scale(1.2, 1.5)
-        
-        for i in range(len(df.columns)):
-            table[(0, i)].set_text_props(color='white', fontweight='bold')
-        
-        ax.set_title("DCR File Sheet Summary", fontsize=14, fontweight='bold', pad=20)
-        
-        path = os.path.join(plots_dir, f"DCR_Summary_{label}.png")
-        plt.tight_layout()
-        plt.savefig(path, dpi=200, bbox_inches='tight')
-        plt.close()
-        saved_paths.append(path)
+        summary_rows.append([sheet_name, row_count, col_count])
+
+    if summary_rows:
+        tasks.append((_render_table,
+                      os.path.join(plots_dir, f"DCR_Summary_{label}.png"),
+                      {"columns": ['Sheet', 'Rows', 'Columns'], "rows": summary_rows,
+                       "title": "DCR File Sheet Summary",
+                       "figsize": (10, len(summary_rows) * 0.5 + 2),
+                       "fontsize": 10, "scale": (1.2, 1.5)}))
 
     wb.close()
-    return saved_paths
+    return _run_render_tasks(tasks, cancel_token)
 
 
 # =========================
 # Tab2: Form Measurement
 # =========================
+def _render_form_tdr_box(path: str, inners: list, data: list):
+    """TDR Box Plot (Inner별)"""
+    fig, ax = plt.subplots(figsize=(12, 6))
+    bp = ax.boxplot(data, showfliers=True, patch_artist=True)
+    ax.set_xticks(range(1, len(inners) + 1))
+    ax.set_xticklabels(inners)
+
+    # 색상 설정
+    colors = plt.cm.Set3(np.linspace(0, 1, len(data)))
+    for patch, color in zip(bp['boxes'], colors):
+        patch.set_facecolor(color)
+        patch.set_alpha(0.7)
+
+    ax.set_title("TDR Distribution by Inner", fontsize=14, fontweight='bold')
+    ax.set_xlabel("Inner")
+    ax.set_ylabel("TDR Value")
+    ax.grid(True, axis="y", linestyle="--", alpha=0.5)
+
+    # 평균선 추가
+    means = [np.mean(d) for d in data]
+    ax.scatter(range(1, len(means)+1), means, color='red', marker='D', s=50, zorder=5, label='Mean')
+    ax.legend()
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200)
+    plt.close()
+
+
+def _render_form_tdr_violin(path: str, inners: list, data: list):
+    """TDR Violin Plot (분포 시각화)"""
+    fig, ax = plt.subplots(figsize=(12, 6))
+    parts = ax.violinplot(data, showmeans=True, showmedians=True)
+
+    # 색상 설정
+    colors = plt.cm.Pastel1(np.linspace(0, 1, len(data)))
+    for i, pc in enumerate(parts['bodies']):
+        pc.set_facecolor(colors[i])
+        pc.set_alpha(0.7)
+
+    ax.set_xticks(range(1, len(inners)+1))
+    ax.set_xticklabels(inners)
+    ax.set_title("TDR Distribution (Violin Plot)", fontsize=14, fontweight='bold')
+    ax.set_xlabel("Inner")
+    ax.set_ylabel("TDR Value")
+    ax.grid(True, axis="y", linestyle="--", alpha=0.5)
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200)
+    plt.close()
+
+
+def _render_form_dimension(path: str, inners: list, width_vals: list, thick_vals: list):
+    """Dimension Trend (Width & Thickness)"""
+    x = np.arange(len(inners))
+    bar_width = 0.35
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+    bars1 = ax.bar(x - bar_width/2, width_vals, bar_width, label="Width (um)", color='#5B9BD5', edgecolor='black')
+    bars2 = ax.bar(x + bar_width/2, thick_vals, bar_width, label="Thickness (um)", color='#70AD47', edgecolor='black')
+
+    # 값 표시
+    for bar in bars1:
+        height = bar.get_height()
+        ax.annotate(f'{height:.1f}',
+                   xy=(bar.get_x() + bar.get_width()/2, height),
+                   xytext=(0, 3), textcoords="offset points",
+                   ha='center', va='bottom', fontsize=8)
+    for bar in bars2:
+        height = bar.get_height()
+        ax.annotate(f'{height:.1f}',
+                   xy=(bar.get_x() + bar.get_width()/2, height),
+                   xytext=(0, 3), textcoords="offset points",
+                   ha='center', va='bottom', fontsize=8)
+
+    ax.set_xticks(x)
+    ax.set_xticklabels(inners)
+    ax.set_title("Dimension Trend by Inner", fontsize=14, fontweight='bold')
+    ax.set_xlabel("Inner")
+    ax.set_ylabel("Value (um)")
+    ax.legend()
+    ax.grid(True, axis="y", linestyle="--", alpha=0.4)
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200)
+    plt.close()
+
+
+def _render_form_tdr_distribution(path: str, all_tdr: np.ndarray):
+    """TDR 전체 데이터 히스토그램 + 정규분포 피팅"""
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # 히스토그램
+    n, bins, patches = ax.hist(all_tdr, bins=30, density=True, alpha=0.7,
+                               color='steelblue', edgecolor='black')
+
+    # 정규분포 피팅
+    mu, std = stats.norm.fit(all_tdr)
+    x_fit = np.linspace(min(all_tdr), max(all_tdr), 100)
+    y_fit = stats.norm.pdf(x_fit, mu, std)
+    ax.plot(x_fit, y_fit, 'r-', linewidth=2, label=f'Normal Fit (μ={mu:.3f}, σ={std:.3f})')
+
+    ax.axvline(mu, color='red', linestyle='--', alpha=0.8, label=f'Mean: {mu:.3f}')
+    ax.axvline(mu - 3*std, color='orange', linestyle=':', alpha=0.8, label=f'-3σ: {mu-3*std:.3f}')
+    ax.axvline(mu + 3*std, color='orange', linestyle=':', alpha=0.8, label=f'+3σ: {mu+3*std:.3f}')
+
+    ax.set_title("TDR All Data Distribution with Normal Fit", fontsize=14, fontweight='bold')
+    ax.set_xlabel("TDR Value")
+    ax.set_ylabel("Density")
+    ax.legend(loc='upper right')
+    ax.grid(True, linestyle="--", alpha=0.4)
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200)
+    plt.close()
+
+
 def save_form_plots_from_workbook(
     tdr_map: Dict[str, List[float]],
     dim_map: Dict[str, Tuple[float, float]],
     operator: str = "",
     output_dir: str = "",
+    cancel_token=None,
 ) -> List[str]:
     """
     Form Measurement 결과에서 추출한 TDR/치수 데이터를 시각화하여 PNG 저장
@@ -364,201 +1008,377 @@ def save_form_plots_from_workbook(
         tdr_map: {inner: [tdr values...]}
         dim_map: {inner: (width_avg, thickness_avg)}
         output_dir: 외부에서 지정한 출력 디렉토리
+        cancel_token: 취소 요청 토큰 (None이면 확인 안 함)
     Returns:
         저장된 파일 경로 리스트
     """
-    _setup_style()
-    saved_paths = []
     plots_dir = _get_plots_dir(output_dir)
     label = _timestamp_label(operator)
+    tasks = []
 
-    # 1) TDR Box Plot
-    if tdr_map:
-        inners = list(tdr_map.keys())
-        data = [tdr_map[k] for k in inners if tdr_map[k]]
-        if data:
-            fig, ax = plt.subplots(figsize=(12, 6))
-            bp = ax.boxplot(data, labels=inners, showfliers=True, patch_artist=True)
-            
-            # 색상 설정
-            colors = plt.cm.Set3(np.linspace(0, 1, len(data)))
-            for patch, color in zip(bp['boxes'], colors):
-                patch.set_facecolor(color)
-                patch.set_alpha(0.7)
-            
-            ax.set_title("TDR Distribution by Inner", fontsize=14, fontweight='bold')
-            ax.set_xlabel("Inner")
-            ax.set_ylabel("TDR Value")
-            ax.grid(True, axis="y", linestyle="--", alpha=0.5)
-            
-            # 평균선 추가
-            means = [np.mean(d) for d in data]
-            ax.scatter(range(1, len(means)+1), means, color='red', marker='D', s=50, zorder=5, label='Mean')
-            ax.legend()
-            
-            path = os.path.join(plots_dir, f"Form_TDR_BoxPlot_{label}.png")
-            plt.tight_layout()
-            plt.savefig(path, dpi=200)
-            plt.close()
-            saved_paths.append(path)
-
-    # 2) TDR Violin Plot (분포 시각화)
-    if tdr_map:
-        inners = list(tdr_map.keys())
-        data = [tdr_map[k] for k in inners if tdr_map[k]]
-        if data and len(data) > 0:
-            fig, ax = plt.subplots(figsize=(12, 6))
-            parts = ax.violinplot(data, showmeans=True, showmedians=True)
-            
-            # 색상 설정
-            colors = plt.cm.Pastel1(np.linspace(0, 1, len(data)))
-            for i, pc in enumerate(parts['bodies']):
-                pc.set_facecolor(colors[i])
-                pc.set_alpha(0.7)
-            
-            ax.set_xticks(range(1, len(inners)+1))
-            ax.set_xticklabels(inners)
-            ax.set_title("TDR Distribution (Violin Plot)", fontsize=14, fontweight='bold')
-            ax.set_xlabel("Inner")
-            ax.set_ylabel("TDR Value")
-            ax.grid(True, axis="y", linestyle="--", alpha=0.5)
-            
-            path = os.path.join(plots_dir, f"Form_TDR_Violin_{label}.png")
-            plt.tight_layout()
-            plt.savefig(path, dpi=200)
-            plt.close()
-            saved_paths.append(path)
-
-    # 3) TDR Statistics Summary Table
-    if tdr_map:
-        inners = list(tdr_map.keys())
-        data = [tdr_map[k] for k in inners if tdr_map[k]]
-        if data:
-            stats_data = []
-            for inner, values in zip(inners, data):
-                if values:
-                    stats_data.append({
-                        'Inner': inner,
-                        'Count': len(values),
-                        'Min': f"{np.min(values):.3f}",
-                        'Max': f"{np.max(values):.3f}",
-                        'Mean': f"{np.mean(values):.3f}",
-                        'Median': f"{np.median(values):.3f}",
-                        'Std': f"{np.std(values):.3f}",
-                        'Range': f"{np.max(values) - np.min(values):.3f}"
-                    })
-            
-            if stats_data:
-                fig, ax = plt.subplots(figsize=(14, len(stats_data) * 0.6 + 2))
-                ax.axis('off')
-                
-                df = pd.DataFrame(stats_data)
-                table = ax.table(
-                    cellText=df.values,
-                    colLabels=df.columns,
-                    cellLoc='center',
-                    loc='center',
-                    colColours=['#4472C4'] * len(df.columns)
-                )
-                table.auto_set_font_size(False)
-                table.set_fontsize(10)
-                table.scale(1.2, 1.5)
-                
-                # 헤더 텍스트 흰색
-                for i in range(len(df.columns)):
-                    table[(0, i)].set_text_props(color='white', fontweight='bold')
-                
-                ax.set_title("TDR Statistics Summary", fontsize=14, fontweight='bold', pad=20)
-                
-                path = os.path.join(plots_dir, f"Form_TDR_Stats_{label}.png")
-                plt.tight_layout()
-                plt.savefig(path, dpi=200, bbox_inches='tight')
-                plt.close()
-                saved_paths.append(path)
+    # 데이터가 있는 Inner만 사용 (라벨과 데이터 개수를 맞춤)
+    tdr_inners = [k for k in tdr_map if tdr_map[k]] if tdr_map else []
+    tdr_data = [tdr_map[k] for k in tdr_inners]
+
+    if tdr_data:
+        # 1) TDR Box Plot
+        tasks.append((_render_form_tdr_box,
+                      os.path.join(plots_dir, f"Form_TDR_BoxPlot_{label}.png"),
+                      {"inners": tdr_inners, "data": tdr_data}))
+
+        # 2) TDR Violin Plot (분포 시각화)
+        tasks.append((_render_form_tdr_violin,
+                      os.path.join(plots_dir, f"Form_TDR_Violin_{label}.png"),
+                      {"inners": tdr_inners, "data": tdr_data}))
+
+        # 3) TDR Statistics Summary Table
+        stats_rows = []
+        for inner, values in zip(tdr_inners, tdr_data):
+            stats_rows.append([
+                inner,
+                len(values),
+                f"{np.min(values):.3f}",
+                f"{np.max(values):.3f}",
+                f"{np.mean(values):.3f}",
+                f"{np.median(values):.3f}",
+                f"{np.std(values):.3f}",
+                f"{np.max(values) - np.min(values):.3f}",
+            ])
+        tasks.append((_render_table,
+                      os.path.join(plots_dir, f"Form_TDR_Stats_{label}.png"),
+                      {"columns": ['Inner', 'Count', 'Min', 'Max', 'Mean', 'Median', 'Std', 'Range'],
+                       "rows": stats_rows,
+                       "title": "TDR Statistics Summary",
+                       "figsize": (14, len(stats_rows) * 0.6 + 2),
+                       "fontsize": 10, "scale": (1.2, 1.5)}))
 
     # 4) Dimension Trend (Width & Thickness) - 개선된 버전
     if dim_map:
         inners = list(dim_map.keys())
-        width_vals = [dim_map[k][0] for k in inners]
-        thick_vals = [dim_map[k][1] for k in inners]
-
-        x = np.arange(len(inners))
-        bar_width = 0.35
-
-        fig, ax = plt.subplots(figsize=(12, 6))
-        bars1 = ax.bar(x - bar_width/2, width_vals, bar_width, label="Width (um)", color='#5B9BD5', edgecolor='black')
-        bars2 = ax.bar(x + bar_width/2, thick_vals, bar_width, label="Thickness (um)", color='#70AD47', edgecolor='black')
-        
-        # 값 표시
-        for bar in bars1:
-            height = bar.get_height()
-            ax.annotate(f'{height:.1f}',
-                       xy=(bar.get_x() + bar.get_width()/2, height),
-                       xytext=(0, 3), textcoords="offset points",
-                       ha='center', va='bottom', fontsize=8)
-        for bar in bars2:
-            height = bar.get_height()
-            ax.annotate(f'{height:.1f}',
-                       xy=(bar.get_x() + bar.get_width()/2, height),
-                       xytext=(0, 3), textcoords="offset points",
-                       ha='center', va='bottom', fontsize=8)
-        
-        ax.set_xticks(x)
-        ax.set_xticklabels(inners)
-        ax.set_title("Dimension Trend by Inner", fontsize=14, fontweight='bold')
-        ax.set_xlabel("Inner")
-        ax.set_ylabel("Value (um)")
-        ax.legend()
-        ax.grid(True, axis="y", linestyle="--", alpha=0.4)
-        
-        path = os.path.join(plots_dir, f"Form_Dimension_{label}.png")
-        plt.tight_layout()
-        plt.savefig(path, dpi=200)
-        plt.close()
-        saved_paths.append(path)
+        tasks.append((_render_form_dimension,
+                      os.path.join(plots_dir, f"Form_Dimension_{label}.png"),
+                      {"inners": inners,
+                       "width_vals": [dim_map[k][0] for k in inners],
+                       "thick_vals": [dim_map[k][1] for k in inners]}))
 
     # 5) TDR All Data Histogram (전체 분포)
-    if tdr_map:
-        all_tdr = []
-        for values in tdr_map.values():
-            if values:
-                all_tdr.extend(values)
-        
-        if all_tdr:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            
-            # 히스토그램
-            n, bins, patches = ax.hist(all_tdr, bins=30, density=True, alpha=0.7, 
-                                       color='steelblue', edgecolor='black')
-            
-            # 정규분포 피팅
-            mu, std = stats.norm.fit(all_tdr)
-            x_fit = np.linspace(min(all_tdr), max(all_tdr), 100)
-            y_fit = stats.norm.pdf(x_fit, mu, std)
-            ax.plot(x_fit, y_fit, 'r-', linewidth=2, label=f'Normal Fit (μ={mu:.3f}, σ={std:.3f})')
-            
-            ax.axvline(mu, color='red', linestyle='--', alpha=0.8, label=f'Mean: {mu:.3f}')
-            ax.axvline(mu - 3*std, color='orange', linestyle=':', alpha=0.8, label=f'-3σ: {mu-3*std:.3f}')
-            ax.axvline(mu + 3*std, color='orange', linestyle=':', alpha=0.8, label=f'+3σ: {mu+3*std:.3f}')
-            
-            ax.set_title("TDR All Data Distribution with Normal Fit", fontsize=14, fontweight='bold')
-            ax.set_xlabel("TDR Value")
-            ax.set_ylabel("Density")
-            ax.legend(loc='upper right')
-            ax.grid(True, linestyle="--", alpha=0.4)
-            
-            path = os.path.join(plots_dir, f"Form_TDR_Distribution_{label}.png")
-            plt.tight_layout()
-            plt.savefig(path, dpi=200)
-            plt.close()
-            saved_paths.append(path)
-
-    return saved_paths
+    if tdr_data:
+        all_tdr = np.asarray([v for values in tdr_data for v in values], dtype=float)
+        tasks.append((_render_form_tdr_distribution,
+                      os.path.join(plots_dir, f"Form_TDR_Distribution_{label}.png"),
+                      {"all_tdr": all_tdr}))
+
+    return _run_render_tasks(tasks, cancel_token)
 
 
 # =========================
 # Tab3: LSL/USL 계산
 # =========================
+def _render_lslusl_control(path: str, means: np.ndarray, lsl_values: list, usl_values: list):
+    """Control Chart: NET별 평균 + LSL/USL (NET이 많으면 구간별 최솟값/최댓값 보존 다운샘플링)"""
+    n = len(means)
+    x = np.arange(n) + 1
+    has_limits = bool(lsl_values and usl_values)
+    lsl = limits_to_array(lsl_values, n)
+    usl = limits_to_array(usl_values, n)
+    fig, ax = plt.subplots(figsize=(14, 6))
+
+    if n > LARGE_NET_THRESHOLD:
+        x_ds, m_ds = _minmax_downsample(means)
+        ax.plot(x_ds, m_ds, linewidth=1, label="Mean", color='#2E75B6')
+        if has_limits:
+            x_env, lo, hi = _bucket_envelope(lsl, usl)
+            ax.fill_between(x_env, lo, hi, alpha=0.2, color='green', label='Spec Range')
+            ax.plot(*_minmax_downsample(lsl), linestyle="--", color="red", linewidth=1, label="LSL")
+            ax.plot(*_minmax_downsample(usl), linestyle="--", color="green", linewidth=1, label="USL")
+    else:
+        # 평균 플롯
+        ax.plot(x, means, marker="o", linewidth=2, markersize=4, label="Mean", color='#2E75B6')
+
+        # LSL/USL 영역 채우기
+        if has_limits:
+            ax.fill_between(x, lsl_values, usl_values, alpha=0.2, color='green', label='Spec Range')
+            ax.plot(x, lsl_values, linestyle="--", color="red", linewidth=1.5, label="LSL")
+            ax.plot(x, usl_values, linestyle="--", color="green", linewidth=1.5, label="USL")
+
+    # 벗어난 포인트 강조 (벡터 비교)
+    if has_limits:
+        out_of_spec = (means < lsl) | (means > usl)
+        if out_of_spec.any():
+            if n > LARGE_NET_THRESHOLD:
+                x_out, y_out = _minmax_downsample(np.where(out_of_spec, means, np.nan))
+            else:
+                x_out, y_out = x[out_of_spec], means[out_of_spec]
+            ax.scatter(x_out, y_out, color='red', s=100, zorder=5, marker='x',
+                       label=f'Out of Spec ({int(out_of_spec.sum()):,})' if n > LARGE_NET_THRESHOLD else 'Out of Spec')
+
+    ax.set_title("NET-wise Mean with LSL/USL Control Chart", fontsize=14, fontweight='bold')
+    ax.set_xlabel("NET No")
+    ax.set_ylabel("Value")
+    ax.grid(True, linestyle="--", alpha=0.4)
+    ax.legend(loc='upper right')
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200)
+    plt.close()
+
+
+def _render_lslusl_distribution(path: str, matrix: np.ndarray, lsl_values: list, usl_values: list):
+    """전체 데이터 히스토그램 (정규분포 오버레이)"""
+    all_values = matrix.flatten()
+    all_values = all_values[~np.isnan(all_values)]
+
+    if len(all_values) == 0:
+        return False
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+
+    n, bins, patches = ax.hist(all_values, bins=50, density=True, alpha=0.7,
+                               color='steelblue', edgecolor='black')
+
+    # 정규분포 피팅
+    mu, std = stats.norm.fit(all_values)
+    x_fit = np.linspace(min(all_values), max(all_values), 100)
+    y_fit = stats.norm.pdf(x_fit, mu, std)
+    ax.plot(x_fit, y_fit, 'r-', linewidth=2, label=f'Normal Fit\nμ={mu:.4f}\nσ={std:.4f}')
+
+    # 전체 LSL/USL 평균
+    if lsl_values and usl_values:
+        avg_lsl = np.mean(lsl_values)
+        avg_usl = np.mean(usl_values)
+        ax.axvline(avg_lsl, color='red', linestyle='--', linewidth=2, label=f'Avg LSL: {avg_lsl:.4f}')
+        ax.axvline(avg_usl, color='green', linestyle='--', linewidth=2, label=f'Avg USL: {avg_usl:.4f}')
+
+    ax.set_title("All Measurements Distribution with Normal Fit", fontsize=14, fontweight='bold')
+    ax.set_xlabel("Value")
+    ax.set_ylabel("Density")
+    ax.legend(loc='upper right')
+    ax.grid(True, linestyle="--", alpha=0.4)
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200)
+    plt.close()
+
+
+def _render_lslusl_scatter(path: str, matrix: np.ndarray, means: np.ndarray,
+                           lsl_values: list, usl_values: list):
+    """Scatter Plot (NET별 측정값 분포, NET이 많으면 NET 구간 x 값 구간 밀도 히트맵)"""
+    n = len(matrix)
+    fig, ax = plt.subplots(figsize=(14, 6))
+
+    if n > LARGE_NET_THRESHOLD:
+        valid = ~np.isnan(matrix)
+        rows = np.broadcast_to(np.arange(1, n + 1)[:, None], matrix.shape)[valid]
+        vals = matrix[valid]
+        if len(vals):
+            v_min, v_max = float(vals.min()), float(vals.max())
+            if v_min == v_max:
+                v_min, v_max = v_min - 0.5, v_max + 0.5
+            hist, x_edges, y_edges = np.histogram2d(
+                rows, vals, bins=(min(n, MAX_PLOT_BUCKETS), 200),
+                range=((0.5, n + 0.5), (v_min, v_max)))
+            im = ax.imshow(np.ma.masked_equal(hist.T, 0), origin='lower', aspect='auto',
+                           extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]),
+                           cmap='Blues', interpolation='nearest')
+            fig.colorbar(im, ax=ax, label='Count')
+        ax.plot(*_minmax_downsample(means), 'r-', linewidth=1, label='Mean', zorder=5)
+        if lsl_values and usl_values:
+            ax.plot(*_minmax_downsample(limits_to_array(lsl_values, n)), 'g--', linewidth=1, label='LSL')
+            ax.plot(*_minmax_downsample(limits_to_array(usl_values, n)), 'b--', linewidth=1, label='USL')
+        ax.set_title(f"Measurement Density by NET ({n:,} NETs)", fontsize=14, fontweight='bold')
+    else:
+        for net_idx in range(n):
+            values = matrix[net_idx]
+            values = values[~np.isnan(values)]
+            x_scatter = np.full(len(values), net_idx + 1)
+            ax.scatter(x_scatter, values, alpha=0.3, s=10)
+
+        # 평균선
+        ax.plot(range(1, len(means)+1), means, 'r-', linewidth=2, label='Mean', zorder=5)
+
+        # LSL/USL
+        if lsl_values and usl_values:
+            ax.plot(range(1, len(lsl_values)+1), lsl_values, 'g--', linewidth=1.5, label='LSL')
+            ax.plot(range(1, len(usl_values)+1), usl_values, 'b--', linewidth=1.5, label='USL')
+        ax.set_title("Measurement Scatter Plot by NET", fontsize=14, fontweight='bold')
+
+    ax.set_xlabel("NET No")
+    ax.set_ylabel("Value")
+    ax.legend(loc='upper right')
+    ax.grid(True, linestyle="--", alpha=0.4)
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200)
+    plt.close()
+
+
+def _render_lslusl_ppk(path: str, ppk_values: np.ndarray):
+    """Ppk 지표 차트 (전체 표준편차 기준, logic.capability에서 계산한 값 - 측정 순서와 무관)"""
+    ppk_values = np.asarray(ppk_values, dtype=float)
+    n = len(ppk_values)
+
+    valid_mask = ~np.isnan(ppk_values)
+    valid_ppk = ppk_values[valid_mask]
+
+    if len(valid_ppk) == 0:
+        return False
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+
+    def ppk_colors(values):
+        return np.where(values >= 1.33, 'green', np.where(values >= 1.0, 'orange', 'red'))
+
+    # Ppk by NET
+    if n > LARGE_NET_THRESHOLD:
+        # 구간별 최저 Ppk (가장 나쁜 NET) 막대
+        starts = _bucket_starts(n)
+        widths = np.diff(np.r_[starts, n])
+        worst = np.fmin.reduceat(ppk_values, starts)
+        has_value = ~np.isnan(worst)
+        _bar_collection(ax1, starts[has_value] + 0.5, widths[has_value], worst[has_value],
+                        ppk_colors(worst[has_value]), edgecolors='none')
+        ax1.set_title(f"Ppk by NET (worst per bin, {n:,} NETs, overall σ)", fontsize=12, fontweight='bold')
+    else:
+        valid_idx = np.nonzero(valid_mask)[0]
+        ax1.bar(valid_idx + 1, valid_ppk, color=ppk_colors(valid_ppk), edgecolor='black')
+        ax1.set_title("Ppk by NET (overall σ)", fontsize=12, fontweight='bold')
+    ax1.axhline(y=1.33, color='green', linestyle='--', label='Ppk ≥ 1.33 (Excellent)')
+    ax1.axhline(y=1.0, color='orange', linestyle='--', label='Ppk ≥ 1.0 (Acceptable)')
+    ax1.set_xlabel("NET No")
+    ax1.set_ylabel("Ppk")
+    ax1.legend(loc='upper right', fontsize=8)
+    ax1.grid(True, axis='y', linestyle='--', alpha=0.4)
+
+    # Ppk 분포 히스토그램
+    ax2.hist(valid_ppk, bins=20, color='steelblue', edgecolor='black', alpha=0.7)
+    ax2.axvline(1.33, color='green', linestyle='--', linewidth=2, label='Ppk=1.33')
+    ax2.axvline(1.0, color='orange', linestyle='--', linewidth=2, label='Ppk=1.0')
+    ax2.axvline(np.mean(valid_ppk), color='red', linestyle='-', linewidth=2,
+               label=f'Mean Ppk={np.mean(valid_ppk):.3f}')
+    ax2.set_title("Ppk Distribution (overall σ)", fontsize=12, fontweight='bold')
+    ax2.set_xlabel("Ppk")
+    ax2.set_ylabel("Count")
+    ax2.legend(loc='upper right', fontsize=8)
+    ax2.grid(True, linestyle='--', alpha=0.4)
+
+    plt.suptitle("Process Capability Analysis", fontsize=14, fontweight='bold')
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200)
+    plt.close()
+
+
+def _render_lslusl_pass_fail(path: str, matrix: np.ndarray, lsl_values: list, usl_values: list):
+    """Pass/Fail 파이 + 막대 차트"""
+    # 측정값 전체를 NET별 LSL/USL과 한 번에 비교 (LSL/USL이 없는 NET은 제외)
+    lsl = limits_to_array(lsl_values, len(matrix))[:, None]
+    usl = limits_to_array(usl_values, len(matrix))[:, None]
+    judged = ~np.isnan(matrix) & ~np.isnan(lsl) & ~np.isnan(usl)
+    with np.errstate(invalid='ignore'):
+        passed = judged & (matrix >= lsl) & (matrix <= usl)
+    pass_count = int(passed.sum())
+    fail_count = int(judged.sum()) - pass_count
+
+    total = pass_count + fail_count
+    if total == 0:
+        return False
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+
+    # 파이 차트
+    sizes = [pass_count, fail_count]
+    labels = ['Pass', 'Fail']
+    colors = ['#70AD47', '#C00000']
+    explode = (0, 0.1)
+
+    ax1.pie(sizes, explode=explode, labels=labels, colors=colors, autopct='%1.1f%%',
+           shadow=True, startangle=90)
+    ax1.set_title(f"Pass/Fail Ratio\n(Total: {total:,} measurements)", fontsize=12, fontweight='bold')
+
+    # 막대 차트
+    ax2.bar(['Pass', 'Fail'], [pass_count, fail_count], color=colors, edgecolor='black')
+    ax2.set_title("Pass/Fail Count", fontsize=12, fontweight='bold')
+    ax2.set_ylabel("Count")
+
+    for i, (count, pct) in enumerate(zip([pass_count, fail_count], [pass_count/total*100, fail_count/total*100])):
+        ax2.annotate(f'{count:,}\n({pct:.1f}%)',
+                    xy=(i, count), xytext=(0, 5),
+                    textcoords="offset points", ha='center', va='bottom', fontsize=10)
+
+    ax2.grid(True, axis='y', linestyle='--', alpha=0.4)
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200)
+    plt.close()
+
+
+def _render_lslusl_hist(path: str, values: np.ndarray, net_no: int, rank: int,
+                        lsl: Optional[float], usl: Optional[float],
+                        mu: float, std_val: float, ppk: Optional[float]):
+    """NET 1개의 히스토그램 + 정규분포 + LSL/USL + Ppk (평균/전체 표준편차/Ppk는 미리 계산한 값, 곡선과 Ppk가 같은 σ)"""
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # 히스토그램
+    n, bins, patches = ax.hist(values, bins=30, alpha=0.7, color="steelblue",
+                               edgecolor="black", density=True)
+
+    # 정규분포 곡선
+    if std_val > 0:
+        x_fit = np.linspace(min(values), max(values), 100)
+        y_fit = stats.norm.pdf(x_fit, mu, std_val)
+        ax.plot(x_fit, y_fit, 'r-', linewidth=2, label=f'Normal (μ={mu:.4f}, σ={std_val:.4f})')
+
+    # LSL/USL 선
+    if lsl is not None:
+        ax.axvline(lsl, color="red", linestyle="--", linewidth=2, label=f"LSL={lsl:.4f}")
+    if usl is not None:
+        ax.axvline(usl, color="green", linestyle="--", linewidth=2, label=f"USL={usl:.4f}")
+
+    # Ppk (정규분포 곡선과 같은 전체 표준편차 기준)
+    if ppk is not None:
+        ax.text(0.02, 0.98, f'Ppk: {ppk:.3f}', transform=ax.transAxes,
+               fontsize=12, verticalalignment='top', fontweight='bold',
+               bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+
+    ax.set_title(f"NET {net_no} Distribution (Rank #{rank} by Std)", fontsize=14, fontweight='bold')
+    ax.set_xlabel("Value")
+    ax.set_ylabel("Density")
+    ax.grid(True, linestyle="--", alpha=0.4)
+    ax.legend(loc='upper right')
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200)
+    plt.close()
+
+
+def _render_lslusl_range(path: str, means: np.ndarray, mins: np.ndarray, maxs: np.ndarray):
+    """Min/Max Range Chart (NET이 많으면 구간별 포락선 + 최솟값/최댓값 보존 다운샘플링)"""
+    fig, ax = plt.subplots(figsize=(14, 6))
+
+    if len(means) > LARGE_NET_THRESHOLD:
+        x_env, lo, hi = _bucket_envelope(mins, maxs)
+        ax.fill_between(x_env, lo, hi, alpha=0.3, color='blue', label='Min-Max Range')
+        ax.plot(*_minmax_downsample(means), 'r-', linewidth=1, label='Mean')
+        ax.plot(*_minmax_downsample(mins), 'b--', linewidth=1, alpha=0.7, label='Min')
+        ax.plot(*_minmax_downsample(maxs), 'g--', linewidth=1, alpha=0.7, label='Max')
+    else:
+        x = np.arange(len(means)) + 1
+        ax.fill_between(x, mins, maxs, alpha=0.3, color='blue', label='Min-Max Range')
+        ax.plot(x, means, 'r-', linewidth=2, marker='o', markersize=3, label='Mean')
+        ax.plot(x, mins, 'b--', linewidth=1, alpha=0.7, label='Min')
+        ax.plot(x, maxs, 'g--', linewidth=1, alpha=0.7, label='Max')
+
+    ax.set_title("NET-wise Min/Max Range with Mean", fontsize=14, fontweight='bold')
+    ax.set_xlabel("NET No")
+    ax.set_ylabel("Value")
+    ax.legend(loc='upper right')
+    ax.grid(True, linestyle="--", alpha=0.4)
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=200)
+    plt.close()
+
+
 def save_lslusl_plots_from_data(
     data_df,
     lsl_values: List[float],
@@ -566,6 +1386,8 @@ def save_lslusl_plots_from_data(
     operator: str = "",
     top_k: int = 5,
     output_dir: str = "",
+    capability: Optional[dict] = None,
+    cancel_token=None,
 ) -> List[str]:
     """
     LSL/USL 계산 결과를 시각화하여 PNG 저장
@@ -575,343 +1397,100 @@ def save_lslusl_plots_from_data(
         lsl_values/usl_values: 각 NET별 LSL/USL 값 (길이 = NET 수)
         top_k: 표준편차 기준 상위 NET 개수
         output_dir: 외부에서 지정한 출력 디렉토리
+        capability: logic.capability.calculate_capability() 결과
+                    (같은 LSL/USL로 이미 계산했으면 전달 → 다시 계산하지 않음)
+        cancel_token: 취소 요청 토큰 (None이면 확인 안 함)
     Returns:
         저장된 파일 경로 리스트
     """
-    _setup_style()
-    saved_paths = []
     plots_dir = _get_plots_dir(output_dir)
     label = _timestamp_label(operator)
 
+    import pandas as pd
     if not isinstance(data_df, pd.DataFrame) or data_df.empty:
-        return saved_paths
+        return []
+
+    # 측정값 행렬 (NET x 측정값) - 여러 렌더 작업이 공유 메모리로 함께 사용
+    matrix = data_df.to_numpy(dtype=float)
 
     # NET별 통계 계산
-    means = data_df.mean(axis=1, skipna=True)
+    means = data_df.mean(axis=1, skipna=True).to_numpy()
     stds = data_df.std(axis=1, skipna=True)
-    mins = data_df.min(axis=1, skipna=True)
-    maxs = data_df.max(axis=1, skipna=True)
+    mins = data_df.min(axis=1, skipna=True).to_numpy()
+    maxs = data_df.max(axis=1, skipna=True).to_numpy()
 
-    # 1) Control Chart: NET별 평균 + LSL/USL (개선)
-    x = np.arange(len(means)) + 1
-    fig, ax = plt.subplots(figsize=(14, 6))
-    
-    # 평균 플롯
-    ax.plot(x, means, marker="o", linewidth=2, markersize=4, label="Mean", color='#2E75B6')
-    
-    # LSL/USL 영역 채우기
-    if lsl_values and usl_values:
-        ax.fill_between(x, lsl_values, usl_values, alpha=0.2, color='green', label='Spec Range')
-        ax.plot(x, lsl_values, linestyle="--", color="red", linewidth=1.5, label="LSL")
-        ax.plot(x, usl_values, linestyle="--", color="green", linewidth=1.5, label="USL")
-    
-    # 벗어난 포인트 강조
-    if lsl_values and usl_values:
-        out_of_spec = []
-        for i, (m, l, u) in enumerate(zip(means, lsl_values, usl_values)):
-            if m < l or m > u:
-                out_of_spec.append(i)
-        if out_of_spec:
-            ax.scatter([x[i] for i in out_of_spec], [means.iloc[i] for i in out_of_spec],
-                      color='red', s=100, zorder=5, marker='x', label='Out of Spec')
-    
-    ax.set_title("NET-wise Mean with LSL/USL Control Chart", fontsize=14, fontweight='bold')
-    ax.set_xlabel("NET No")
-    ax.set_ylabel("Value")
-    ax.grid(True, linestyle="--", alpha=0.4)
-    ax.legend(loc='upper right')
-    
-    path = os.path.join(plots_dir, f"LSLUSL_Control_{label}.png")
-    plt.tight_layout()
-    plt.savefig(path, dpi=200)
-    plt.close()
-    saved_paths.append(path)
-
-    # 2) 전체 데이터 히스토그램 (정규분포 오버레이)
-    all_values = data_df.values.flatten()
-    all_values = all_values[~np.isnan(all_values)]
-    
-    if len(all_values) > 0:
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        n, bins, patches = ax.hist(all_values, bins=50, density=True, alpha=0.7,
-                                   color='steelblue', edgecolor='black')
-        
-        # 정규분포 피팅
-        mu, std = stats.norm.fit(all_values)
-        x_fit = np.linspace(min(all_values), max(all_values), 100)
-        y_fit = stats.norm.pdf(x_fit, mu, std)
-        ax.plot(x_fit, y_fit, 'r-', linewidth=2, label=f'Normal Fit\nμ={mu:.4f}\nσ={std:.4f}')
-        
-        # 전체 LSL/USL 평균
-        if lsl_values and usl_values:
-            avg_lsl = np.mean(lsl_values)
-            avg_usl = np.mean(usl_values)
-            ax.axvline(avg_lsl, color='red', linestyle='--', linewidth=2, label=f'Avg LSL: {avg_lsl:.4f}')
-            ax.axvline(avg_usl, color='green', linestyle='--', linewidth=2, label=f'Avg USL: {avg_usl:.4f}')
-        
-        ax.set_title("All Measurements Distribution with Normal Fit", fontsize=14, fontweight='bold')
-        ax.set_xlabel("Value")
-        ax.set_ylabel("Density")
-        ax.legend(loc='upper right')
-        ax.grid(True, linestyle="--", alpha=0.4)
-        
-        path = os.path.join(plots_dir, f"LSLUSL_Distribution_{label}.png")
-        plt.tight_layout()
-        plt.savefig(path, dpi=200)
-        plt.close()
-        saved_paths.append(path)
-
-    # 3) Scatter Plot (NET별 측정값 분포)
-    fig, ax = plt.subplots(figsize=(14, 6))
-    
-    for net_idx in range(len(data_df)):
-        values = data_df.iloc[net_idx].dropna().values
-        x_scatter = np.full(len(values), net_idx + 1)
-        ax.scatter(x_scatter, values, alpha=0.3, s=10)
-    
-    # 평균선
-    ax.plot(range(1, len(means)+1), means, 'r-', linewidth=2, label='Mean', zorder=5)
-    
-    # LSL/USL
-    if lsl_values and usl_values:
-        ax.plot(range(1, len(lsl_values)+1), lsl_values, 'g--', linewidth=1.5, label='LSL')
-        ax.plot(range(1, len(usl_values)+1), usl_values, 'b--', linewidth=1.5, label='USL')
-    
-    ax.set_title("Measurement Scatter Plot by NET", fontsize=14, fontweight='bold')
-    ax.set_xlabel("NET No")
-    ax.set_ylabel("Value")
-    ax.legend(loc='upper right')
-    ax.grid(True, linestyle="--", alpha=0.4)
-    
-    path = os.path.join(plots_dir, f"LSLUSL_Scatter_{label}.png")
-    plt.tight_layout()
-    plt.savefig(path, dpi=200)
-    plt.close()
-    saved_paths.append(path)
+    lsl_usl = {"lsl_values": lsl_values, "usl_values": usl_values}
+    if capability is None:
+        capability = calculate_capability(matrix, lsl_values, usl_values)
+    tasks = [
+        # 1) Control Chart: NET별 평균 + LSL/USL (개선)
+        (_render_lslusl_control, os.path.join(plots_dir, f"LSLUSL_Control_{label}.png"),
+         {"means": means, **lsl_usl}),
+        # 2) 전체 데이터 히스토그램 (정규분포 오버레이)
+        (_render_lslusl_distribution, os.path.join(plots_dir, f"LSLUSL_Distribution_{label}.png"),
+         {"matrix": matrix, **lsl_usl}),
+        # 3) Scatter Plot (NET별 측정값 분포)
+        (_render_lslusl_scatter, os.path.join(plots_dir, f"LSLUSL_Scatter_{label}.png"),
+         {"matrix": matrix, "means": means, **lsl_usl}),
+    ]
 
-    # 4) Cpk/Ppk 지표 차트
     if lsl_values and usl_values:
-        cpk_values = []
-        ppk_values = []
-        
-        for net_idx in range(len(data_df)):
-            values = data_df.iloc[net_idx].dropna().values
-            if len(values) > 1 and net_idx < len(lsl_values):
-                mean = np.mean(values)
-                std = np.std(values)
-                lsl = lsl_values[net_idx]
-                usl = usl_values[net_idx]
-                
-                if std > 0:
-                    cpu = (usl - mean) / (3 * std)
-                    cpl = (mean - lsl) / (3 * std)
-                    cpk = min(cpu, cpl)
-                    cpk_values.append(cpk)
-                else:
-                    cpk_values.append(np.nan)
-            else:
-                cpk_values.append(np.nan)
-        
-        cpk_values = np.array(cpk_values)
-        valid_cpk = cpk_values[~np.isnan(cpk_values)]
-        
-        if len(valid_cpk) > 0:
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-            
-            # Cpk by NET
-            colors = ['green' if c >= 1.33 else 'orange' if c >= 1.0 else 'red' for c in cpk_values if not np.isnan(c)]
-            valid_idx = [i for i, c in enumerate(cpk_values) if not np.isnan(c)]
-            ax1.bar(np.array(valid_idx) + 1, valid_cpk, color=colors, edgecolor='black')
-            ax1.axhline(y=1.33, color='green', linestyle='--', label='Cpk ≥ 1.33 (Excellent)')
-            ax1.axhline(y=1.0, color='orange', linestyle='--', label='Cpk ≥ 1.0 (Acceptable)')
-            ax1.set_title("Cpk by NET", fontsize=12, fontweight='bold')
-            ax1.set_xlabel("NET No")
-            ax1.set_ylabel("Cpk")
-            ax1.legend(loc='upper right', fontsize=8)
-            ax1.grid(True, axis='y', linestyle='--', alpha=0.4)
-            
-            # Cpk 분포 히스토그램
-            ax2.hist(valid_cpk, bins=20, color='steelblue', edgecolor='black', alpha=0.7)
-            ax2.axvline(1.33, color='green', linestyle='--', linewidth=2, label='Cpk=1.33')
-            ax2.axvline(1.0, color='orange', linestyle='--', linewidth=2, label='Cpk=1.0')
-            ax2.axvline(np.mean(valid_cpk), color='red', linestyle='-', linewidth=2, 
-                       label=f'Mean Cpk={np.mean(valid_cpk):.3f}')
-            ax2.set_title("Cpk Distribution", fontsize=12, fontweight='bold')
-            ax2.set_xlabel("Cpk")
-            ax2.set_ylabel("Count")
-            ax2.legend(loc='upper right', fontsize=8)
-            ax2.grid(True, linestyle='--', alpha=0.4)
-            
-            plt.suptitle("Process Capability Analysis", fontsize=14, fontweight='bold')
-            
-            path = os.path.join(plots_dir, f"LSLUSL_Cpk_{label}.png")
-            plt.tight_layout()
-            plt.savefig(path, dpi=200)
-            plt.close()
-            saved_paths.append(path)
-
-    # 5) Pass/Fail 파이 차트
-    if lsl_values and usl_values:
-        pass_count = 0
-        fail_count = 0
-        
-        for net_idx in range(len(data_df)):
-            values = data_df.iloc[net_idx].dropna().values
-            if net_idx < len(lsl_values):
-                lsl = lsl_values[net_idx]
-                usl = usl_values[net_idx]
-                for v in values:
-                    if lsl <= v <= usl:
-                        pass_count += 1
-                    else:
-                        fail_count += 1
-        
-        total = pass_count + fail_count
-        if total > 0:
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
-            
-            # 파이 차트
-            sizes = [pass_count, fail_count]
-            labels = ['Pass', 'Fail']
-            colors = ['#70AD47', '#C00000']
-            explode = (0, 0.1)
-            
-            ax1.pie(sizes, explode=explode, labels=labels, colors=colors, autopct='%1.1f%%',
-                   shadow=True, startangle=90)
-            ax1.set_title(f"Pass/Fail Ratio\n(Total: {total:,} measurements)", fontsize=12, fontweight='bold')
-            
-            # 막대 차트
-            ax2.bar(['Pass', 'Fail'], [pass_count, fail_count], color=colors, edgecolor='black')
-            ax2.set_title("Pass/Fail Count", fontsize=12, fontweight='bold')
-            ax2.set_ylabel("Count")
-            
-            for i, (count, pct) in enumerate(zip([pass_count, fail_count], [pass_count/total*100, fail_count/total*100])):
-                ax2.annotate(f'{count:,}\n({pct:.1f}%)',
-                            xy=(i, count), xytext=(0, 5),
-                            textcoords="offset points", ha='center', va='bottom', fontsize=10)
-            
-            ax2.grid(True, axis='y', linestyle='--', alpha=0.4)
-            
-            path = os.path.join(plots_dir, f"LSLUSL_PassFail_{label}.png")
-            plt.tight_layout()
-            plt.savefig(path, dpi=200)
-            plt.close()
-            saved_paths.append(path)
+        # 4) Ppk 지표 차트 (전체 표준편차 기준, 파일 이름은 기존과 같음)
+        tasks.append((_render_lslusl_ppk, os.path.join(plots_dir, f"LSLUSL_Cpk_{label}.png"),
+                      {"ppk_values": capability["Ppk"]}))
+        # 5) Pass/Fail 파이 차트
+        tasks.append((_render_lslusl_pass_fail, os.path.join(plots_dir, f"LSLUSL_PassFail_{label}.png"),
+                      {"matrix": matrix, **lsl_usl}))
 
     # 6) Statistics Summary Table
-    stats_data = []
-    for net_idx in range(min(20, len(data_df))):  # 최대 20개 NET만
-        values = data_df.iloc[net_idx].dropna().values
+    stats_rows = []
+    for net_idx in range(min(20, len(matrix))):  # 최대 20개 NET만
+        values = matrix[net_idx]
+        values = values[~np.isnan(values)]
         if len(values) > 0:
             lsl = lsl_values[net_idx] if lsl_values and net_idx < len(lsl_values) else None
             usl = usl_values[net_idx] if usl_values and net_idx < len(usl_values) else None
-            
-            stats_data.append({
-                'NET': net_idx + 1,
-                'Count': len(values),
-                'Min': f"{np.min(values):.4f}",
-                'Max': f"{np.max(values):.4f}",
-                'Mean': f"{np.mean(values):.4f}",
-                'Std': f"{np.std(values):.4f}",
-                'LSL': f"{lsl:.4f}" if lsl else "N/A",
-                'USL': f"{usl:.4f}" if usl else "N/A"
-            })
-    
-    if stats_data:
-        fig, ax = plt.subplots(figsize=(14, len(stats_data) * 0.4 + 2))
-        ax.axis('off')
-        
-        df = pd.DataFrame(stats_data)
-        table = ax.table(
-            cellText=df.values,
-            colLabels=df.columns,
-            cellLoc='center',
-            loc='center',
-            colColours=['#4472C4'] * len(df.columns)
-        )
-        table.auto_set_font_size(False)
-        table.set_fontsize(9)
-        table.scale(1.2, 1.4)
-        
-        for i in range(len(df.columns)):
-            table[(0, i)].set_text_props(color='white', fontweight='bold')
-        
-        ax.set_title("NET Statistics Summary (First 20 NETs)", fontsize=14, fontweight='bold', pad=20)
-        
-        path = os.path.join(plots_dir, f"LSLUSL_Stats_{label}.png")
-        plt.tight_layout()
-        plt.savefig(path, dpi=200, bbox_inches='tight')
-        plt.close()
-        saved_paths.append(path)
+
+            stats_rows.append([
+                net_idx + 1,
+                len(values),
+                f"{np.min(values):.4f}",
+                f"{np.max(values):.4f}",
+                f"{np.mean(values):.4f}",
+                f"{np.std(values):.4f}",
+                f"{lsl:.4f}" if lsl else "N/A",
+                f"{usl:.4f}" if usl else "N/A",
+            ])
+
+    if stats_rows:
+        tasks.append((_render_table, os.path.join(plots_dir, f"LSLUSL_Stats_{label}.png"),
+                      {"columns": ['NET', 'Count', 'Min', 'Max', 'Mean', 'Std', 'LSL', 'USL'],
+                       "rows": stats_rows,
+                       "title": "NET Statistics Summary (First 20 NETs)",
+                       "figsize": (14, len(stats_rows) * 0.4 + 2),
+                       "fontsize": 9, "scale": (1.2, 1.4)}))
 
     # 7) 히스토그램: 표준편차 상위 top_k NET (개선)
     std_sorted = stds.sort_values(ascending=False).head(top_k)
     for rank, (net_idx, _) in enumerate(std_sorted.items(), 1):
-        values = data_df.loc[net_idx].dropna().values
+        values = data_df.loc[net_idx].dropna().to_numpy(dtype=float)
         if len(values) == 0:
             continue
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        # 히스토그램
-        n, bins, patches = ax.hist(values, bins=30, alpha=0.7, color="steelblue", 
-                                   edgecolor="black", density=True)
-        
-        # 정규분포 피팅
-        mu, std_val = stats.norm.fit(values)
-        x_fit = np.linspace(min(values), max(values), 100)
-        y_fit = stats.norm.pdf(x_fit, mu, std_val)
-        ax.plot(x_fit, y_fit, 'r-', linewidth=2, label=f'Normal (μ={mu:.4f}, σ={std_val:.4f})')
-        
-        # LSL/USL 선
+
         lsl = lsl_values[net_idx] if lsl_values and net_idx < len(lsl_values) else None
         usl = usl_values[net_idx] if usl_values and net_idx < len(usl_values) else None
-        if lsl is not None:
-            ax.axvline(lsl, color="red", linestyle="--", linewidth=2, label=f"LSL={lsl:.4f}")
-        if usl is not None:
-            ax.axvline(usl, color="green", linestyle="--", linewidth=2, label=f"USL={usl:.4f}")
-        
-        # Cpk 계산
-        if lsl is not None and usl is not None and std_val > 0:
-            cpu = (usl - mu) / (3 * std_val)
-            cpl = (mu - lsl) / (3 * std_val)
-            cpk = min(cpu, cpl)
-            ax.text(0.02, 0.98, f'Cpk: {cpk:.3f}', transform=ax.transAxes, 
-                   fontsize=12, verticalalignment='top', fontweight='bold',
-                   bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-        
-        ax.set_title(f"NET {net_idx + 1} Distribution (Rank #{rank} by Std)", fontsize=14, fontweight='bold')
-        ax.set_xlabel("Value")
-        ax.set_ylabel("Density")
-        ax.grid(True, linestyle="--", alpha=0.4)
-        ax.legend(loc='upper right')
-        
-        path = os.path.join(plots_dir, f"LSLUSL_Hist_NET{net_idx + 1}_{label}.png")
-        plt.tight_layout()
-        plt.savefig(path, dpi=200)
-        plt.close()
-        saved_paths.append(path)
+        ppk = capability["Ppk"][net_idx]
+        std_val = capability["std"][net_idx]
+        tasks.append((_render_lslusl_hist,
+                      os.path.join(plots_dir, f"LSLUSL_Hist_NET{net_idx + 1}_{label}.png"),
+                      {"values": values, "net_no": net_idx + 1, "rank": rank,
+                       "lsl": lsl, "usl": usl,
+                       "mu": float(capability["mean"][net_idx]),
+                       "std_val": 0.0 if np.isnan(std_val) else float(std_val),
+                       "ppk": None if np.isnan(ppk) else float(ppk)}))
 
     # 8) Min/Max Range Chart
-    fig, ax = plt.subplots(figsize=(14, 6))
-    
-    x = np.arange(len(means)) + 1
-    ax.fill_between(x, mins, maxs, alpha=0.3, color='blue', label='Min-Max Range')
-    ax.plot(x, means, 'r-', linewidth=2, marker='o', markersize=3, label='Mean')
-    ax.plot(x, mins, 'b--', linewidth=1, alpha=0.7, label='Min')
-    ax.plot(x, maxs, 'g--', linewidth=1, alpha=0.7, label='Max')
-    
-    ax.set_title("NET-wise Min/Max Range with Mean", fontsize=14, fontweight='bold')
-    ax.set_xlabel("NET No")
-    ax.set_ylabel("Value")
-    ax.legend(loc='upper right')
-    ax.grid(True, linestyle="--", alpha=0.4)
-    
-    path = os.path.join(plots_dir, f"LSLUSL_Range_{label}.png")
-    plt.tight_layout()
-    plt.savefig(path, dpi=200)
-    plt.close()
-    saved_paths.append(path)
+    tasks.append((_render_lslusl_range, os.path.join(plots_dir, f"LSLUSL_Range_{label}.png"),
+                  {"means": means, "mins": mins, "maxs": maxs}))
 
-    return saved_paths
+    return _run_render_tasks(tasks, cancel_token)
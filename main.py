@@ -3,22 +3,96 @@ DCR Format Converter
 메인 진입점
 """
 
-import sys
-from PySide6.QtWidgets import QApplication
-from ui.main_window import MainWindow
+import time
+
+# 시작 시간 측정 기준점 (다른 import보다 먼저 기록)
+_START_TIME = time.perf_counter()
+
+import json  # noqa: E402
+import multiprocessing  # noqa: E402
+import sys  # noqa: E402
+from PySide6.QtCore import QObject, QEvent, QTimer  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+from logic.instrumentation import pop_track_memory_option  # noqa: E402
+from logic.profiling import pop_profile_option  # noqa: E402
+from ui.main_window import MainWindow  # noqa: E402
+
+_IMPORT_DONE_TIME = time.perf_counter()
+
+# 시작 시간 벤치마크 옵션: --startup-benchmark [결과 파일]
+# 첫 화면이 그려지면 측정 결과(JSON 한 줄)를 출력/기록하고 종료 (startup_benchmark.py에서 사용)
+STARTUP_BENCHMARK_FLAG = "--startup-benchmark"
+
+
+class _FirstPaintTimer(QObject):
+    """메인 창의 첫 Paint 이벤트까지 걸린 시간을 기록하고 앱 종료"""
+
+    def __init__(self, app, timings: dict, result_file: str = ""):
+        super().__init__()
+        self.app = app
+        self.timings = timings
+        self.result_file = result_file
+        self.done = False
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and not self.done:
+            self.done = True
+            self.timings["first_paint_s"] = round(time.perf_counter() - _START_TIME, 4)
+            line = json.dumps(self.timings)
+            if self.result_file:
+                # --windowed exe에는 stdout이 없으므로 파일에 기록
+                with open(self.result_file, 'a', encoding='utf-8') as f:
+                    f.write(line + "\n")
+            else:
+                print(line, flush=True)
+            QTimer.singleShot(0, self.app.quit)
+        return False
+
+
+def _pop_benchmark_option(argv: list):
+    """
+    argv에서 벤치마크 옵션 제거
+
+    Returns:
+        (벤치마크 모드 여부, 결과 파일 경로)
+    """
+    if STARTUP_BENCHMARK_FLAG not in argv:
+        return False, ""
+    idx = argv.index(STARTUP_BENCHMARK_FLAG)
+    del argv[idx]
+    result_file = ""
+    if idx < len(argv) and not argv[idx].startswith("-"):
+        result_file = argv.pop(idx)
+    return True, result_file
 
 
 def main():
     """애플리케이션 메인 함수"""
+    benchmark, result_file = _pop_benchmark_option(sys.argv)
+    # 프로파일링 모드: --profile 또는 환경 변수 DCR_PROFILE=1 (실행 중 UI 체크박스로도 변경 가능)
+    profile = pop_profile_option(sys.argv)
+    # 단계별 메모리 기록: --track-memory 또는 환경 변수 DCR_TRACK_MEMORY=1 (UI 체크박스로도 변경 가능)
+    track_memory = pop_track_memory_option(sys.argv)
     app = QApplication(sys.argv)
-    
+
     # 메인 윈도우 생성 및 표시
-    window = MainWindow()
+    window = MainWindow(profile=profile, track_memory=track_memory)
+
+    if benchmark:
+        timings = {
+            "import_s": round(_IMPORT_DONE_TIME - _START_TIME, 4),
+            "window_s": round(time.perf_counter() - _START_TIME, 4),
+        }
+        paint_timer = _FirstPaintTimer(app, timings, result_file)
+        window.installEventFilter(paint_timer)
+
     window.show()
-    
+
     # 이벤트 루프 실행
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
+    # exe(PyInstaller)에서 플롯 렌더링 프로세스가 메인 창을 다시 띄우지 않도록 처리
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,388 @@
+"""
+파이프라인 벤치마크
+synthetic_data.py로 만든 데이터 세트(규모별)에 Tab 1 / Tab 2 / Tab 3 로직을 UI와 같은 순서로 실행하고
+탭 전체와 단계별(parse_4w_section, make_dcr_sheet, read_tdr_data_from_dk_file, calculate_lsl_usl_full 내부 단계 등)
+실행 시간 / CPU 시간 / 최대 메모리를 측정하여 JSON으로 기록하고 저장된 기준(baseline)과 비교
+
+- 단계 측정은 logic.instrumentation 단계 기록을 그대로 사용 (calculate_lsl_usl_full의 read / reshape / save / plots 등 포함,
+  plots 단계가 save_lslusl_plots_from_data 호출)
+- 시간은 측정 전 --warmup회 실행 후 --repeat회 실행의 중앙값 (tracemalloc 없이), 최대 메모리는 tracemalloc을 켠 별도 1회 실행
+  (파이썬/numpy 할당 기준, 플롯 렌더링 워커 프로세스는 포함되지 않음)
+- 파싱 캐시 / 플롯 캐시는 끄고 측정 (항상 처음 실행하는 상태)
+- 결과: output/benchmarks/pipeline_latest.json (마지막 결과), pipeline.jsonl (누적 기록)
+- 기준: output/benchmarks/pipeline_baseline.json (--update-baseline으로 저장, 이 PC 기준)
+  기준보다 --threshold 비율 이상 느려지거나 메모리가 늘어난 단계가 있으면 종료 코드 1
+
+사용 예:
+    python pipeline_benchmark.py --update-baseline
+    python pipeline_benchmark.py
+    python pipeline_benchmark.py --sizes 1 10 100 --repeat 1
+    python pipeline_benchmark.py --tabs 3 --threshold 0.1
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+BENCHMARK_DIR = os.path.join(APP_DIR, "output", "benchmarks")
+DATASET_DIR = os.path.join(BENCHMARK_DIR, "datasets")
+LATEST_FILE = os.path.join(BENCHMARK_DIR, "pipeline_latest.json")
+HISTORY_FILE = os.path.join(BENCHMARK_DIR, "pipeline.jsonl")
+BASELINE_FILE = os.path.join(BENCHMARK_DIR, "pipeline_baseline.json")
+
+# 기본 데이터 세트 규모 (샘플 NET 수의 배수) / 반복 횟수
+DEFAULT_SIZES = (1, 10)
+DEFAULT_REPEAT = 3
+# 측정 전 실행 횟수 (모듈 import, 플롯 렌더링 프로세스 풀 시작 비용이 첫 탭 측정에 들어가지 않도록)
+DEFAULT_WARMUP = 1
+DATASET_SEED = 0
+
+# 회귀 판정: 기준 대비 비율 증가 + 최소 절대 증가량 (짧은 단계의 측정 잡음 제외)
+REGRESSION_THRESHOLD = 0.20
+REGRESSION_MIN_SECONDS = 0.05
+REGRESSION_MIN_MB = 1.0
+
+BENCH_OPERATOR = "BENCH"
+
+
+def _check(result, name: str):
+    """로직 함수의 "Error..." 결과 메시지를 예외로 변환 (벤치마크 실행 중단)"""
+    message = result.get("message", "") if isinstance(result, dict) else result
+    if isinstance(message, str) and message.startswith("Error"):
+        raise RuntimeError(f"{name}: {message.splitlines()[0]}")
+    return result
+
+
+def run_tab1(files: dict, work_dir: str):
+    """Tab 1: NET 파일 파싱 + Step 1-9 (vendor → DE requirement → ... → DCR → 표지 → 플롯)"""
+    from logic.instrumentation import stage
+    from logic.file_reader import find_piece_lines, parse_4w_section
+    from logic.makevendor import make_vendor_sheet
+    from logic.make_de_requirement import make_de_requirement_sheet
+    from logic.make_input_check_pin import make_input_check_pin_sheet
+    from logic.make_int_med import make_int_med_file, make_input_check_pin_final
+    from logic.make_judge_check_pin import make_judge_check_pin_sheet
+    from logic.make_dcr import make_dcr_sheet
+    from logic.cover_page import add_cover_page
+    from logic.visualizer import save_dcr_plots_from_file
+
+    outfile = os.path.join(work_dir, "DCR_format_yamaha_bench.xlsx")
+    int_med = os.path.join(work_dir, "int_med.xlsx")
+    net_file = files["net_file"]
+    with stage("parse_4w_section"):
+        parse_4w_section(net_file)
+    with stage("find_piece_lines"):
+        find_piece_lines(net_file)
+    with stage("make_vendor_sheet"):
+        _check(make_vendor_sheet(files["vendorspec_file"], outfile), "make_vendor_sheet")
+    with stage("make_de_requirement_sheet"):
+        _check(make_de_requirement_sheet(files["partpin_file"], outfile), "make_de_requirement_sheet")
+    with stage("make_input_check_pin_sheet"):
+        _check(make_input_check_pin_sheet(outfile, net_file), "make_input_check_pin_sheet")
+    with stage("make_int_med_file"):
+        _check(make_int_med_file(net_file, int_med), "make_int_med_file")
+    with stage("make_input_check_pin_final"):
+        _check(make_input_check_pin_final(outfile, int_med), "make_input_check_pin_final")
+    with stage("make_judge_check_pin_sheet"):
+        _check(make_judge_check_pin_sheet(outfile), "make_judge_check_pin_sheet")
+    with stage("make_dcr_sheet"):
+        _check(make_dcr_sheet(outfile), "make_dcr_sheet")
+    with stage("add_cover_page"):
+        _check(add_cover_page(outfile, BENCH_OPERATOR, {"NET File": net_file}), "add_cover_page")
+    with stage("save_dcr_plots_from_file"):
+        save_dcr_plots_from_file(outfile, BENCH_OPERATOR, output_dir=work_dir)
+
+
+def run_tab2(files: dict, work_dir: str):
+    """Tab 2: DK/Dimension 파일 단독 읽기 + Form measurement 세션 (템플릿 → TDR → 치수 → 표지 → 저장 → 플롯)"""
+    from logic.instrumentation import stage
+    from logic.make_form_measurement import (FormMeasurementSession, read_dimension_sections,
+                                             read_tdr_data_from_dk_file)
+    from logic.visualizer import save_form_plots_from_workbook
+
+    dk_files = files["dk_files"]
+    with stage("read_tdr_data_from_dk_file", files=len(dk_files)):
+        for path in dk_files:
+            read_tdr_data_from_dk_file(path)
+    with stage("read_dimension_sections"):
+        read_dimension_sections(files["dimension_file"], use_cache=False)
+
+    session = FormMeasurementSession(os.path.join(work_dir, "Form_measurement_result_bench.xlsx"),
+                                     use_cache=False)
+    try:
+        with stage("create_from_template"):
+            _check(session.create_from_template(), "create_from_template")
+        with stage("fill_impedance"):
+            tdr_map = _check(session.fill_impedance_from_files(dk_files), "fill_impedance").get("tdr_map", {})
+        with stage("fill_dimension"):
+            dim_map = _check(session.fill_dimension(files["dimension_file"]), "fill_dimension").get("dim_map", {})
+        with stage("add_cover_page"):
+            _check(session.add_cover_page(BENCH_OPERATOR, {"Etching Directory": files["etching_dir"]}),
+                   "add_cover_page")
+        with stage("save"):
+            _check(session.save(), "save")
+    finally:
+        session.close()
+    with stage("save_form_plots_from_workbook"):
+        save_form_plots_from_workbook(tdr_map, dim_map, BENCH_OPERATOR, output_dir=work_dir)
+
+
+def run_tab3(files: dict, work_dir: str):
+    """Tab 3: calculate_lsl_usl_full (내부 단계: read, filter, reshape, 시트 작성, save, DCR update, plots)"""
+    from logic.instrumentation import stage
+    from logic.calculate_lsl_usl import calculate_lsl_usl_full
+
+    # DCR 파일은 실행 중 수정되므로 작업 폴더에 복사해서 사용
+    dcr_file = os.path.join(work_dir, os.path.basename(files["dcr_file"]))
+    shutil.copy2(files["dcr_file"], dcr_file)
+    with stage("calculate_lsl_usl_full"):
+        _check(calculate_lsl_usl_full(files["merged_file"], dcr_file,
+                                      os.path.join(work_dir, "Calculate_3Sigma_LSLUSL_bench.xlsx"),
+                                      operator=BENCH_OPERATOR, output_dir=work_dir),
+               "calculate_lsl_usl_full")
+
+
+TAB_RUNNERS = {1: ("Tab 1", run_tab1), 2: ("Tab 2", run_tab2), 3: ("Tab 3", run_tab3)}
+
+
+def prepare_dataset(scale: float) -> dict:
+    """
+    규모별 합성 데이터 세트 준비 (같은 파라미터로 이미 만든 세트가 있으면 다시 만들지 않음)
+
+    Returns:
+        synthetic_data manifest 딕셔너리
+    """
+    from synthetic_data import SAMPLE_NETS, generate_dataset
+
+    nets = max(2, int(round(SAMPLE_NETS * scale)))
+    output_dir = os.path.join(DATASET_DIR, f"x{scale:g}")
+    manifest_path = os.path.join(output_dir, "manifest.json")
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        params = manifest.get("parameters", {})
+        if (params.get("nets") == nets and params.get("seed") == DATASET_SEED and
+                all(os.path.exists(p) for p in manifest.get("files", {}).values())):
+            return manifest
+    return generate_dataset(output_dir, nets=nets, seed=DATASET_SEED)
+
+
+def run_pass(files: dict, tabs: list, track_memory: bool) -> list:
+    """
+    선택한 탭을 한 번씩 실행하고 단계 기록 반환 (탭마다 새 작업 폴더)
+
+    Returns:
+        logic.instrumentation 단계 기록 리스트
+    """
+    from logic.instrumentation import stage, start_recording, stop_recording
+
+    start_recording("", track_memory=track_memory)
+    try:
+        for tab in tabs:
+            name, runner = TAB_RUNNERS[tab]
+            work_dir = tempfile.mkdtemp(prefix="dcr_bench_")
+            try:
+                with stage(name):
+                    runner(files, work_dir)
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+    finally:
+        recorder = stop_recording()
+    return recorder.records if recorder is not None else []
+
+
+def _stage_key(path: str) -> str:
+    """단계 경로에서 실행마다 달라지는 플롯 파일명의 작업자/날짜 부분 제거 (기준과 비교할 수 있도록)"""
+    return re.sub(rf"_{BENCH_OPERATOR}_\d{{8}}", "", path)
+
+
+def summarize_runs(time_runs: list, memory_run: list) -> dict:
+    """
+    단계 경로별 측정 요약
+
+    Args:
+        time_runs: 시간 측정 실행별 단계 기록 리스트
+        memory_run: tracemalloc 실행의 단계 기록 (없으면 빈 리스트)
+
+    Returns:
+        {단계 경로: {"wall_s", "wall_min_s", "cpu_s", "peak_mb"}} (실행 순서 유지)
+    """
+    walls = {}
+    cpus = {}
+    starts = {}
+    for records in time_runs:
+        for r in records:
+            path = _stage_key(r["stage"])
+            walls.setdefault(path, []).append(r["wall_s"])
+            if r.get("cpu_s") is not None:
+                cpus.setdefault(path, []).append(r["cpu_s"])
+            starts.setdefault(path, r["start"] or "~")
+    peaks = {_stage_key(r["stage"]): r.get("peak_mb") for r in memory_run}
+
+    # 기록은 단계가 끝날 때 추가되므로 (하위 단계가 먼저) 상위 단계부터 시작 시각 순으로 정렬
+    # (워커 프로세스에서 측정한 플롯 단계는 시작 시각이 없어 같은 상위 단계의 마지막)
+    def order(path):
+        parts = path.split("/")
+        return [starts.get("/".join(parts[:i + 1]), "~") for i in range(len(parts))]
+
+    summary = {}
+    for path in sorted(walls, key=order):
+        summary[path] = {
+            "wall_s": round(statistics.median(walls[path]), 4),
+            "wall_min_s": round(min(walls[path]), 4),
+            "cpu_s": round(statistics.median(cpus[path]), 4) if path in cpus else None,
+            "peak_mb": peaks.get(path),
+        }
+    return summary
+
+
+def compare_with_baseline(result: dict, baseline: dict, threshold: float) -> list:
+    """
+    기준 결과와 비교
+
+    Returns:
+        [(규모, 단계 경로, 항목, 기준 값, 현재 값, 변화율), ...] - 회귀(느려짐/메모리 증가)만
+    """
+    regressions = []
+    for size, current in result["sizes"].items():
+        base = baseline.get("sizes", {}).get(size)
+        if not base:
+            continue
+        for path, stats in current["stages"].items():
+            base_stats = base["stages"].get(path)
+            if not base_stats:
+                continue
+            for key, min_delta in (("wall_s", REGRESSION_MIN_SECONDS), ("peak_mb", REGRESSION_MIN_MB)):
+                old, new = base_stats.get(key), stats.get(key)
+                if old is None or new is None or old <= 0:
+                    continue
+                if new > old * (1 + threshold) and new - old >= min_delta:
+                    regressions.append((size, path, key, old, new, new / old - 1))
+    return regressions
+
+
+def _git_revision() -> str:
+    """현재 커밋 (git이 없으면 빈 문자열)"""
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=APP_DIR, capture_output=True,
+                             text=True, timeout=10)
+        return out.stdout.strip() if out.returncode == 0 else ""
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def print_summary(size: str, stages: dict, baseline_stages: dict):
+    """규모별 단계 측정 결과 표 출력 (기준이 있으면 변화율 포함)"""
+    print(f"\n[{size}]")
+    for path, stats in stages.items():
+        indent = "  " * path.count("/")
+        line = f"  {indent}{path.rsplit('/', 1)[-1]:<{44 - len(indent)}} {stats['wall_s']:>9.3f}s"
+        if stats.get("peak_mb") is not None:
+            line += f" {stats['peak_mb']:>9.1f}MB"
+        base = baseline_stages.get(path)
+        if base and base.get("wall_s"):
+            line += f"  ({(stats['wall_s'] / base['wall_s'] - 1) * 100:+.0f}% vs baseline)"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time Tab 1-3 pipelines per stage on synthetic datasets")
+    parser.add_argument("--sizes", type=float, nargs="+", default=list(DEFAULT_SIZES),
+                        help="dataset sizes as multiples of the sample NET count (default: 1 10)")
+    parser.add_argument("--tabs", type=int, nargs="+", choices=sorted(TAB_RUNNERS), default=sorted(TAB_RUNNERS),
+                        help="tabs to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per size (median)")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP,
+                        help="untimed runs before the first size (default: 1)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak memory run")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON to compare with")
+    parser.add_argument("--update-baseline", action="store_true", help="save this result as the baseline")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="regression threshold as a fraction (default: 0.20 = 20%% slower)")
+    parser.add_argument("--no-record", action="store_true", help="do not write the result/history files")
+    args = parser.parse_args()
+
+    sys.path.insert(0, APP_DIR)
+    import logic.visualizer as visualizer
+    # 캐시를 끄고 항상 처음 실행하는 상태로 측정 (파싱 캐시는 run_tab2에서 use_cache=False)
+    visualizer.PLOT_CACHE_ENABLED = False
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    result = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+        "tabs": args.tabs,
+        "sizes": {},
+    }
+    try:
+        for scale in args.sizes:
+            manifest = prepare_dataset(scale)
+            size = f"x{scale:g}"
+            print(f"Dataset {size}: {manifest['parameters']['nets']} NETs x {manifest['parameters']['pieces']} pieces "
+                  f"x {manifest['parameters']['sets']} sets")
+            if not result["sizes"]:
+                for _ in range(args.warmup):
+                    run_pass(manifest["files"], args.tabs, track_memory=False)
+            time_runs = []
+            for i in range(args.repeat):
+                time_runs.append(run_pass(manifest["files"], args.tabs, track_memory=False))
+                print(f"  run {i + 1}/{args.repeat} done")
+            memory_run = [] if args.no_memory else run_pass(manifest["files"], args.tabs, track_memory=True)
+            stages = summarize_runs(time_runs, memory_run)
+            result["sizes"][size] = {"dataset": manifest["parameters"], "stages": stages}
+            print_summary(size, stages, baseline.get("sizes", {}).get(size, {}).get("stages", {}))
+    finally:
+        from logic.visualizer import shutdown_render_pool
+        shutdown_render_pool()
+
+    if not args.no_record:
+        os.makedirs(BENCHMARK_DIR, exist_ok=True)
+        with open(LATEST_FILE, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        with open(HISTORY_FILE, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(result) + "\n")
+        print(f"\nRecorded: {LATEST_FILE}")
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"Baseline saved: {args.baseline}")
+        return 0
+
+    if not baseline:
+        print("No baseline to compare with (run with --update-baseline to create one)")
+        return 0
+    regressions = compare_with_baseline(result, baseline, args.threshold)
+    print("\n" + "=" * 50)
+    print(f"Compared with baseline {baseline.get('timestamp', '')} {baseline.get('revision', '')} "
+          f"(threshold {args.threshold * 100:.0f}%)")
+    print("=" * 50)
+    if not regressions:
+        print("No regressions")
+        return 0
+    for size, path, key, old, new, change in regressions:
+        unit = "s" if key == "wall_s" else "MB"
+        print(f"  REGRESSION [{size}] {path} {key}: {old:.3f}{unit} -> {new:.3f}{unit} ({change * 100:+.0f}%)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+프로그램 시작 시간 벤치마크
+main.py(또는 빌드된 exe)를 --startup-benchmark 옵션으로 여러 번 실행하여
+import 완료 / 메인 윈도우 생성 / 첫 화면 그리기까지 걸린 시간을 측정하고
+결과를 output/benchmarks/startup.jsonl에 누적 기록
+
+사용 예:
+    python startup_benchmark.py
+    python startup_benchmark.py --runs 10
+    python startup_benchmark.py --exe dist/DCR_Converter.exe
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY_FILE = os.path.join(APP_DIR, "output", "benchmarks", "startup.jsonl")
+METRICS = ("import_s", "window_s", "first_paint_s", "process_s")
+
+
+def run_once(command: list, timeout: float) -> dict:
+    """
+    프로그램을 한 번 실행하여 시작 시간 측정
+
+    Args:
+        command: 실행 명령 (벤치마크 옵션 제외)
+        timeout: 최대 대기 시간 (초)
+
+    Returns:
+        {"import_s", "window_s", "first_paint_s", "process_s"} 딕셔너리
+    """
+    fd, result_file = tempfile.mkstemp(suffix=".jsonl")
+    os.close(fd)
+    try:
+        start = time.perf_counter()
+        subprocess.run(command + ["--startup-benchmark", result_file],
+                       cwd=APP_DIR, timeout=timeout, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        # 프로세스 시작(exe 압축 해제 포함)부터 종료까지 걸린 전체 시간
+        process_s = time.perf_counter() - start
+
+        with open(result_file, 'r', encoding='utf-8') as f:
+            lines = [line for line in f.read().splitlines() if line.strip()]
+        if not lines:
+            raise RuntimeError("No benchmark result written (window was not painted)")
+        result = json.loads(lines[-1])
+        result["process_s"] = round(process_s, 4)
+        return result
+    finally:
+        os.remove(result_file)
+
+
+def summarize(runs: list) -> dict:
+    """측정 결과별 min/median/max 계산"""
+    summary = {}
+    for key in METRICS:
+        values = [r[key] for r in runs if key in r]
+        if values:
+            summary[key] = {
+                "min": round(min(values), 4),
+                "median": round(statistics.median(values), 4),
+                "max": round(max(values), 4),
+            }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure time from launch to first window paint")
+    parser.add_argument("--runs", type=int, default=5, help="number of launches (default: 5)")
+    parser.add_argument("--exe", default="", help="built exe to measure instead of main.py")
+    parser.add_argument("--timeout", type=float, default=120, help="timeout per launch in seconds")
+    parser.add_argument("--no-record", action="store_true", help="do not append to the history file")
+    args = parser.parse_args()
+
+    if args.exe:
+        command = [os.path.abspath(args.exe)]
+        target = os.path.basename(args.exe)
+    else:
+        command = [sys.executable, os.path.join(APP_DIR, "main.py")]
+        target = "main.py"
+
+    runs = []
+    for i in range(args.runs):
+        result = run_once(command, args.timeout)
+        runs.append(result)
+        print(f"Run {i + 1}/{args.runs}: " +
+              ", ".join(f"{k}={result[k]:.3f}" for k in METRICS if k in result))
+
+    summary = summarize(runs)
+    print("\n" + "=" * 50)
+    print(f"Startup benchmark: {target} ({args.runs} runs)")
+    print("=" * 50)
+    for key, stat in summary.items():
+        print(f"  {key:<14} min {stat['min']:.3f}s  median {stat['median']:.3f}s  max {stat['max']:.3f}s")
+
+    if not args.no_record:
+        os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
+        record = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "target": target,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": args.runs,
+            "summary": summary,
+        }
+        with open(HISTORY_FILE, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + "\n")
+        print(f"\nRecorded: {HISTORY_FILE}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
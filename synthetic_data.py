@@ -0,0 +1,503 @@
+"""
+합성 입력 데이터 생성기
+샘플(301_3sigma CAL)과 같은 형식의 입력 파일 세트를 원하는 규모로 생성하여
+파이프라인 스트레스 테스트 / 벤치마크에 사용 (같은 seed면 같은 파일 생성)
+
+생성 파일 (출력 폴더 기준):
+    synthetic.NET              PIECE 줄 P개 + #4W 그룹 P개 (그룹마다 NET N개)     → Tab 1
+    vendorspec.xlsx            Cover page + 규격 시트 (NET별 Nominal/USL/LSL, mΩ)  → Tab 1
+    partpin.xlsx               Pin location / Address image 시트 + continuity 시트 → Tab 1
+    etching/DK<inner>.xlsx     'Form kq' 시트 TDR 값 32개                          → Tab 2 (Manual mode)
+    dimension.xlsx             B2 시트 DK 섹션별 width/thickness 10개              → Tab 2
+    DCR_format_yamaha.xlsx     vendor + DCR 시트 (Tab 1 결과와 같은 구조)          → Tab 3
+    merged_file.xlsx           Method별 세트 M개 × NET N개 행, piece P개 열 (Ω)     → Tab 3
+    manifest.json              생성 파라미터 / 파일 경로 / 주입한 이상치·문자 수
+
+사용 예:
+    python synthetic_data.py output/synthetic/x10 --scale 10
+    python synthetic_data.py output/synthetic/big --nets 3400 --pieces 28 --sets 8 --methods 3 1
+    python synthetic_data.py output/synthetic/dirty --outlier-rate 0.01 --non-numeric-rate 0.005
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+from openpyxl import Workbook
+
+
+# 샘플 제품 규모 (7S3493: PIECE 14개, #4W 그룹당 NET 34개) - --scale은 NET 수에 곱함
+SAMPLE_NETS = 34
+SAMPLE_PIECES = 14
+SAMPLE_SETS = 4
+
+# 부품 이름 (partpin / DE requirement / DCR 시트의 part1, part2)
+PART1_NAME = "J_TELE"
+PART2_NAME = "U0200"
+
+# Form measurement 템플릿의 Inner 순서 (DK 파일 이름: DK1.5.xlsx, DK CENTER.xlsx, ...)
+DK_INNERS = ("1.5", "1.6", "1.7", "1.9", "CENTER", "2.1", "2.3", "2.4", "2.5")
+
+# NET 종류별 Nominal 저항 범위 (mΩ)와 비율 - 샘플 vendor 시트 분포 (신호선 / 전원 / GND)
+NOMINAL_CLASSES = (((1200, 2100), 0.7), ((100, 350), 0.25), ((15, 30), 0.05))
+
+# ERS 규격 = Nominal × 배수 (샘플 vendor 시트 USL/LSL 비율)
+ERS_USL_RATIO = 1.8
+ERS_LSL_RATIO = 0.62
+
+# 측정값 상대 표준편차 / piece별, 세트별, Method별 편차 (Nominal 대비)
+MEASUREMENT_REL_SIGMA = 0.02
+PIECE_REL_SIGMA = 0.01
+SET_REL_SIGMA = 0.005
+METHOD_REL_OFFSET = 0.03
+
+# 이상치: 측정값 × 배수 (단선/접촉 불량 쪽 큰 값, 단락 쪽 작은 값)
+OUTLIER_HIGH_FACTORS = (3.0, 20.0)
+OUTLIER_LOW_FACTORS = (0.02, 0.3)
+
+# 숫자 대신 주입하는 측정기 문자열
+NON_NUMERIC_TOKENS = ("OPEN", "SHORT", "OVER", "----", "NG", "N/A")
+
+# DK 'Form kq' 시트 TDR 값 (Ω), Dimension width/thickness (um)
+TDR_NOMINAL = 86.0
+TDR_SIGMA = 1.0
+TDR_POINTS = 32
+DIM_WIDTH_NOMINAL = 35.0
+DIM_THICKNESS_NOMINAL = 12.0
+DIM_REL_SIGMA = 0.03
+DIM_POINTS = 10
+
+
+class Injector:
+    """측정값 셀에 이상치 / 숫자가 아닌 문자열을 확률적으로 주입하고 개수를 셈"""
+
+    def __init__(self, rng, outlier_rate: float = 0.0, non_numeric_rate: float = 0.0):
+        self.rng = rng
+        self.outlier_rate = outlier_rate
+        self.non_numeric_rate = non_numeric_rate
+        self.outliers = 0
+        self.non_numeric = 0
+
+    def apply(self, values: np.ndarray) -> np.ndarray:
+        """
+        숫자 배열에 주입 (원본은 변경하지 않음)
+
+        Returns:
+            object 배열 (주입한 셀은 이상치 숫자 또는 문자열)
+        """
+        cells = values.astype(object)
+        if self.outlier_rate > 0:
+            mask = self.rng.random(values.shape) < self.outlier_rate
+            count = int(mask.sum())
+            if count:
+                high = self.rng.random(count) < 0.5
+                factors = np.where(high, self.rng.uniform(*OUTLIER_HIGH_FACTORS, count),
+                                   self.rng.uniform(*OUTLIER_LOW_FACTORS, count))
+                cells[mask] = values[mask] * factors
+                self.outliers += count
+        if self.non_numeric_rate > 0:
+            mask = self.rng.random(values.shape) < self.non_numeric_rate
+            count = int(mask.sum())
+            if count:
+                cells[mask] = self.rng.choice(NON_NUMERIC_TOKENS, count)
+                self.non_numeric += count
+        return cells
+
+
+def _cell(val):
+    """numpy 값을 openpyxl에 쓸 수 있는 파이썬 값으로 변환"""
+    if isinstance(val, np.generic):
+        return val.item()
+    return val
+
+
+def build_layout(nets: int, pieces: int, rng) -> dict:
+    """
+    NET / 핀 / 테스터 주소 배치 생성 (모든 파일이 같은 배치를 사용하도록 한 번만 계산)
+
+    주소 규칙 (샘플과 같은 형태):
+    - piece p의 part1 핀 n: j_start(p) + 2(n-1), +1 (4-wire force/sense 쌍)
+    - piece p의 part2 핀 m: u_start(p) + 2(m-1), +1 (part2 주소는 1024 경계 이후)
+    - part2 핀 번호는 NET 순서와 다르게 섞음 (vendor/DE requirement 조회 경로 검증)
+
+    Args:
+        nets: NET 수 (N)
+        pieces: piece 수 (P, NET 파일의 PIECE 줄 / #4W 그룹 수)
+        rng: numpy Generator
+
+    Returns:
+        배치 딕셔너리 (net_names, part2_pins, nominal_mohm, j_starts, u_starts, ...)
+    """
+    stride = 2 * nets + 2  # piece당 주소 범위 (샘플처럼 여유 주소 포함)
+    u_base = 1024 * int(np.ceil((pieces * stride + 1) / 1024)) + 1
+
+    classes = [c for c, _ in NOMINAL_CLASSES]
+    weights = np.array([w for _, w in NOMINAL_CLASSES])
+    picks = rng.choice(len(classes), nets, p=weights / weights.sum())
+    nominal = np.array([rng.uniform(*classes[k]) for k in picks])
+
+    net_names = [f"SYN_NET_{n + 1:05d}" for n in range(nets)]
+    if nets > 1:
+        # 마지막 NET은 GND-SUS (Tab 3에서 고정 규격 0-50 mΩ 사용)
+        net_names[-1] = "GND_SUS"
+        nominal[-1] = rng.uniform(*NOMINAL_CLASSES[-1][0])
+
+    return {
+        "nets": nets,
+        "pieces": pieces,
+        "net_names": net_names,
+        "part1_pins": list(range(1, nets + 1)),
+        "part2_pins": [int(v) + 1 for v in rng.permutation(nets)],
+        "nominal_mohm": nominal,
+        "j_starts": [1 + p * stride for p in range(pieces)],
+        "u_starts": [u_base + p * stride for p in range(pieces)],
+    }
+
+
+def _pin_addresses(layout: dict, net_idx: int, piece: int) -> tuple:
+    """NET의 piece별 4-wire 주소 (part2 주소 쌍, part1 주소 쌍)"""
+    j = layout["j_starts"][piece] + 2 * (layout["part1_pins"][net_idx] - 1)
+    u = layout["u_starts"][piece] + 2 * (layout["part2_pins"][net_idx] - 1)
+    return u, u + 1, j, j + 1
+
+
+def write_net_file(path: str, layout: dict) -> str:
+    """
+    NET 파일 생성 (PIECE 줄, 그룹별 NET= 연결, #4W 섹션의 EXR4W 줄)
+
+    Returns:
+        저장한 파일 경로
+    """
+    nets, pieces = layout["nets"], layout["pieces"]
+    lines = []
+    for p in range(pieces):
+        j0, u0 = layout["j_starts"][p], layout["u_starts"][p]
+        lines.append(f"PIECE:{j0},{j0 + 2 * nets - 1},{u0},{u0 + 2 * nets - 1}")
+    lines.append("")
+    for p in range(pieces):
+        lines.append(f"#Gr{p + 1:02d}")
+        for n in range(nets):
+            u1, u2, j1, j2 = _pin_addresses(layout, n, p)
+            lines.append(f"NET={j1},{j2},{u1},{u2}.")
+        lines.append("")
+    lines.append("#4W")
+    for p in range(pieces):
+        lines.append(f"#Gr{p + 1:02d}")
+        for n in range(nets):
+            lines.append("EXR4W:{},{},{},{}.".format(*_pin_addresses(layout, n, p)))
+        lines.append("")
+    lines.append("%END")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    return path
+
+
+def _vendor_rows(layout: dict) -> list:
+    """vendor 규격 시트 행 (샘플 vendorspec과 같은 열: Design ... Nominal, USL, LSL, Samples)"""
+    rows = [
+        [],
+        ["Project", "SYN"],
+        ["Design", "synthetic"],
+        ["Board", "000-00000"],
+        ["Version", "1.0.0"],
+        ["Vendor", ""],
+        ["Date", datetime.now().strftime("%m/%d/%Y")],
+        [],
+        ["Design", "APN", "Net Name", "Net Id", "Unique Net Id", "Pin 1", "Pin 2",
+         "X1", "Y1", "Layer1", "X2", "Y2", "Layer2", "Nominal Sim (mΩ)", "USL (mΩ)", "LSL (mΩ)", "Samples"],
+    ]
+    for n, name in enumerate(layout["net_names"]):
+        nominal = float(layout["nominal_mohm"][n])
+        rows.append([
+            "SYN/synthetic", "000-00000", name, n + 1, f"000-00000_net{n + 1}",
+            f"{PART1_NAME}.{layout['part1_pins'][n]}", f"{PART2_NAME}.{layout['part2_pins'][n]}",
+            "0", "0", "BOTTOM", "0", "0", "ISL2",
+            nominal, nominal * ERS_USL_RATIO, nominal * ERS_LSL_RATIO, "-",
+        ])
+    return rows
+
+
+def write_vendor_workbook(path: str, layout: dict) -> str:
+    """vendorspec 파일 생성 (Cover page + 규격 시트)"""
+    wb = Workbook(write_only=True)
+    cover = wb.create_sheet("Cover page")
+    cover.append(["Synthetic vendor spec", f"{layout['nets']} nets"])
+    spec = wb.create_sheet("Resistance spec")
+    for row in _vendor_rows(layout):
+        spec.append(row)
+    wb.save(path)
+    return path
+
+
+def write_partpin_workbook(path: str, layout: dict) -> str:
+    """
+    partpin 파일 생성
+    - 첫 번째 시트: Pin location (A열부터), Address image (G열부터, piece 1 주소)
+    - 두 번째 시트: continuity 표 (continuity, NET, part, pin, part, pin)
+    """
+    nets = layout["nets"]
+    pins = [(PART1_NAME, pin, n) for n, pin in enumerate(layout["part1_pins"])]
+    pins += [(PART2_NAME, pin, n) for n, pin in enumerate(layout["part2_pins"])]
+
+    wb = Workbook(write_only=True)
+    ws_pin = wb.create_sheet("pin")
+    ws_pin.append(["Pin location", None, None, None, None, None, "Address image"])
+    ws_pin.append(["part", "pin", "X", "Y", None, None, "part", "pin", "address", "address"])
+    for idx, (part, pin, n) in enumerate(pins):
+        u1, u2, j1, j2 = _pin_addresses(layout, n, 0)
+        addr = (j1, j2) if part == PART1_NAME else (u1, u2)
+        ws_pin.append([part, pin, round(0.3 * (idx % nets), 4), -10.0 if part == PART1_NAME else -1.3,
+                       None, None, part, pin, addr[0], addr[1]])
+
+    ws_cont = wb.create_sheet("Sheet2")
+    ws_cont.append(["continuity", "NET", "part", "pin", "part", "pin"])
+    for n, name in enumerate(layout["net_names"]):
+        ws_cont.append(["C", name, PART1_NAME, layout["part1_pins"][n],
+                        PART2_NAME, layout["part2_pins"][n]])
+    wb.save(path)
+    return path
+
+
+def write_dcr_workbook(path: str, layout: dict) -> str:
+    """
+    DCR 파일 생성 (Tab 1 결과와 같은 구조의 vendor / DCR 시트 - Tab 3 단독 실행용)
+    - vendor: vendorspec 규격 시트를 B열부터 복사한 형태 (A열 = G&H)
+    - DCR: Row 4부터 No, Net name, pin1/pin2, ERS 규격, 그룹별 4-wire 주소
+    """
+    wb = Workbook(write_only=True)
+    ws_vendor = wb.create_sheet("vendor")
+    for row_idx, row in enumerate(_vendor_rows(layout), 1):
+        head = f"=G{row_idx}&H{row_idx}" if row_idx >= 10 else None
+        ws_vendor.append([head] + row)
+
+    ws_dcr = wb.create_sheet("DCR")
+    ws_dcr.append([None] * 15 + ["when submit, please delete these info"])
+    ws_dcr.append([None, None, None, "RGO NET name and pin assign", None, None, None, None,
+                   "ERS spec", None, None, "3 sigma spec", None, "On machine", None,
+                   "our jig pin No correlated with RGO assignment"])
+    groups = []
+    for p in range(layout["pieces"]):
+        groups += [f"Gr{p + 1}", None, None, None]
+    ws_dcr.append(["", "", "No", "Net name", "pin1", "", "pin2", "", "Nominal", "LSL", "USL",
+                   "LSL", "USL", "LSL", "USL"] + groups)
+    for n, name in enumerate(layout["net_names"]):
+        row = 4 + n
+        nominal = float(layout["nominal_mohm"][n])
+        addresses = []
+        for p in range(layout["pieces"]):
+            addresses += list(_pin_addresses(layout, n, p))
+        ws_dcr.append([f"=Q{row}&S{row}", f'=E{row}&"."&F{row}&G{row}&"."&H{row}', n + 1, name,
+                       PART1_NAME, layout["part1_pins"][n], PART2_NAME, layout["part2_pins"][n],
+                       nominal, nominal * ERS_LSL_RATIO, nominal * ERS_USL_RATIO,
+                       None, None, None, None] + addresses)
+    wb.save(path)
+    return path
+
+
+def write_merged_file(path: str, layout: dict, sets: int, methods, rng, injector: Injector) -> str:
+    """
+    merged measurement 파일 생성 (Tab 3 입력)
+    - Row 1: 헤더 (PinA, PinB, StatementID, Method, Threshold L, Threshold U, piece 열)
+    - Method마다 세트 M개 × NET N개 행 (행 순서: 세트 → NET), G열부터 piece P개 측정값 (Ω)
+
+    Args:
+        sets: 세트 수 (M)
+        methods: Method 값 목록
+        injector: 측정값 이상치/문자열 주입기
+    """
+    nets, pieces = layout["nets"], layout["pieces"]
+    nominal_ohm = layout["nominal_mohm"] / 1000.0
+    piece_effect = rng.normal(0.0, PIECE_REL_SIGMA, pieces)
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("merged")
+    ws.append(["PinA", "PinB", "StatementID", "Method", "Threshold L", "Threshold U"] +
+              [f"P{p + 1}" for p in range(pieces)])
+    for m_idx, method in enumerate(methods):
+        method_effect = METHOD_REL_OFFSET * m_idx
+        for s in range(sets):
+            set_effect = rng.normal(0.0, SET_REL_SIGMA)
+            rel = (1.0 + method_effect + set_effect + piece_effect[None, :] +
+                   rng.normal(0.0, MEASUREMENT_REL_SIGMA, (nets, pieces)))
+            values = injector.apply(nominal_ohm[:, None] * rel)
+            for n in range(nets):
+                u1, _, j1, _ = _pin_addresses(layout, n, 0)
+                ws.append([j1, u1, f"S{n + 1}", method,
+                           round(nominal_ohm[n] * ERS_LSL_RATIO, 6), round(nominal_ohm[n] * ERS_USL_RATIO, 6)] +
+                          [_cell(v) for v in values[n]])
+    wb.save(path)
+    return path
+
+
+def write_dk_files(etching_dir: str, count: int, rng, injector: Injector) -> list:
+    """
+    DK 파일 생성 ('Form kq' 시트: Row 11 헤더 STT/TDR, Row 13-44 TDR 값 32개)
+    이름은 템플릿 Inner 순서(DK_INNERS)를 먼저 쓰고, 더 많으면 2.6, 2.7, ... 로 이어감
+
+    Returns:
+        생성한 파일 경로 리스트
+    """
+    os.makedirs(etching_dir, exist_ok=True)
+    paths = []
+    for k in range(count):
+        inner = DK_INNERS[k] if k < len(DK_INNERS) else f"{2.5 + 0.1 * (k - len(DK_INNERS) + 1):.1f}"
+        name = f"DK {inner}.xlsx" if not inner[0].isdigit() else f"DK{inner}.xlsx"
+        tdr = injector.apply(rng.normal(TDR_NOMINAL, TDR_SIGMA, (TDR_POINTS, 3)))
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Form kq")
+        ws.append([None, "SEI ELECTRONIC COMPONENTS(VIET NAM)LTD."])
+        ws.append([None, "Quality Assurance Section"])
+        ws.append([None, "Impedance measurment  result"])
+        ws.append([])
+        ws.append([None, "Item code:", None, "SYN"])
+        ws.append([None, "Lot:", None, f"00001 DK{inner}"])
+        for _ in range(4):
+            ws.append([])
+        ws.append(["ID BL", "STT", "TDR", None, None, None, None, "Insertion Loss"])
+        ws.append([None, None, 1, 2, 3])
+        for i in range(TDR_POINTS):
+            ws.append([None, i + 1] + [_cell(v) for v in tdr[i]] + ["_", "_"])
+        path = os.path.join(etching_dir, name)
+        wb.save(path)
+        paths.append(path)
+    return paths
+
+
+def write_dimension_file(path: str, inners, rng, injector: Injector) -> str:
+    """
+    Dimension 파일 생성 (B2 시트)
+    - Row 6: DK 섹션 헤더 (DK 1.5, ...), 섹션마다 TOP / BOTTOM / CIRCUIT HIGHT 3개 열
+    - Row 35-44: 1-10번 측정값 (BOTTOM = circuit width, CIRCUIT HIGHT = thickness)
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("B2")
+    header = [None]
+    sub_header = [None]
+    for inner in inners:
+        header += [f"DK {inner}", None, None]
+        sub_header += ["TOP", "BOTTOM", "CIRCUIT HIGHT"]
+
+    widths = rng.normal(DIM_WIDTH_NOMINAL, DIM_WIDTH_NOMINAL * DIM_REL_SIGMA, (DIM_POINTS, len(inners) * 2))
+    thickness = rng.normal(DIM_THICKNESS_NOMINAL, DIM_THICKNESS_NOMINAL * DIM_REL_SIGMA,
+                           (DIM_POINTS, len(inners)))
+    values = np.empty((DIM_POINTS, len(inners) * 3))
+    values[:, 0::3] = widths[:, 0::2]   # TOP
+    values[:, 1::3] = widths[:, 1::2]   # BOTTOM
+    values[:, 2::3] = thickness         # CIRCUIT HIGHT
+    cells = injector.apply(values)
+
+    ws.append([None, "Dimension measurement (synthetic)"])
+    for _ in range(4):
+        ws.append([])
+    ws.append(header)
+    ws.append(sub_header)
+    for _ in range(7, 34):
+        ws.append([])
+    for i in range(DIM_POINTS):
+        ws.append([i + 1] + [_cell(v) for v in cells[i]])
+    wb.save(path)
+    return path
+
+
+def generate_dataset(output_dir: str, nets: int = SAMPLE_NETS, pieces: int = SAMPLE_PIECES,
+                     sets: int = SAMPLE_SETS, methods=(3,), dk_files: int = len(DK_INNERS),
+                     outlier_rate: float = 0.0, non_numeric_rate: float = 0.0, seed: int = 0) -> dict:
+    """
+    합성 입력 파일 세트 생성
+
+    Args:
+        output_dir: 출력 폴더 (없으면 생성, 같은 이름의 파일은 덮어씀)
+        nets: NET 수 (N)
+        pieces: piece 수 (P)
+        sets: Method별 세트 수 (M)
+        methods: merged file Method 값 목록 (Tab 3 기준 Method 3 포함 권장)
+        dk_files: DK 파일 수
+        outlier_rate: 측정값 셀 중 이상치로 바꿀 비율 (0-1)
+        non_numeric_rate: 측정값 셀 중 문자열로 바꿀 비율 (0-1)
+        seed: 난수 seed
+
+    Returns:
+        manifest 딕셔너리 (manifest.json에도 저장)
+    """
+    if nets < 2 or pieces < 1 or sets < 1:
+        raise ValueError("nets must be >= 2, pieces and sets must be >= 1")
+    os.makedirs(output_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    injector = Injector(rng, outlier_rate, non_numeric_rate)
+    layout = build_layout(nets, pieces, rng)
+    methods = list(methods)
+
+    files = {
+        "net_file": write_net_file(os.path.join(output_dir, "synthetic.NET"), layout),
+        "vendorspec_file": write_vendor_workbook(os.path.join(output_dir, "vendorspec.xlsx"), layout),
+        "partpin_file": write_partpin_workbook(os.path.join(output_dir, "partpin.xlsx"), layout),
+        "dcr_file": write_dcr_workbook(os.path.join(output_dir, "DCR_format_yamaha.xlsx"), layout),
+        "merged_file": write_merged_file(os.path.join(output_dir, "merged_file.xlsx"),
+                                         layout, sets, methods, rng, injector),
+    }
+    etching_dir = os.path.join(output_dir, "etching")
+    dk_paths = write_dk_files(etching_dir, dk_files, rng, injector)
+    inners = [os.path.splitext(os.path.basename(p))[0].replace("DK", "").strip() for p in dk_paths]
+    files["etching_dir"] = etching_dir
+    # etching 폴더 스캔은 측정기 출력(.xls)만 인식하므로 .xlsx DK 파일은 경로 목록으로 전달 (Manual mode)
+    files["dk_files"] = dk_paths
+    files["dimension_file"] = write_dimension_file(os.path.join(output_dir, "dimension.xlsx"),
+                                                   inners, rng, injector)
+
+    manifest = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "parameters": {
+            "nets": nets, "pieces": pieces, "sets": sets, "methods": methods, "dk_files": dk_files,
+            "outlier_rate": outlier_rate, "non_numeric_rate": non_numeric_rate, "seed": seed,
+        },
+        "measurements": {
+            "merged_rows": len(methods) * sets * nets,
+            "merged_cells": len(methods) * sets * nets * pieces,
+            "per_net_method3": sets * pieces,
+        },
+        "injected": {"outliers": injector.outliers, "non_numeric": injector.non_numeric},
+        "files": {key: [os.path.abspath(p) for p in path] if isinstance(path, list) else os.path.abspath(path)
+                  for key, path in files.items()},
+    }
+    with open(os.path.join(output_dir, "manifest.json"), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic NET/vendor/partpin/DK/dimension/merged inputs")
+    parser.add_argument("output_dir", help="folder for the generated files")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help=f"multiply the sample NET count ({SAMPLE_NETS}) by this factor")
+    parser.add_argument("--nets", type=int, default=0, help="NET count N (overrides --scale)")
+    parser.add_argument("--pieces", type=int, default=SAMPLE_PIECES, help="piece count P")
+    parser.add_argument("--sets", type=int, default=SAMPLE_SETS, help="measurement sets per Method M")
+    parser.add_argument("--methods", type=int, nargs="+", default=[3], help="Method values in the merged file")
+    parser.add_argument("--dk-files", type=int, default=len(DK_INNERS), help="number of DK files")
+    parser.add_argument("--outlier-rate", type=float, default=0.0, help="fraction of values made outliers")
+    parser.add_argument("--non-numeric-rate", type=float, default=0.0,
+                        help="fraction of values replaced by strings (OPEN, NG, ...)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    nets = args.nets or max(2, int(round(SAMPLE_NETS * args.scale)))
+    manifest = generate_dataset(args.output_dir, nets=nets, pieces=args.pieces, sets=args.sets,
+                                methods=args.methods, dk_files=args.dk_files,
+                                outlier_rate=args.outlier_rate, non_numeric_rate=args.non_numeric_rate,
+                                seed=args.seed)
+    params = manifest["parameters"]
+    print(f"Synthetic dataset: {params['nets']} NETs x {params['pieces']} pieces x "
+          f"{params['sets']} sets, Methods {params['methods']}")
+    print(f"Merged file: {manifest['measurements']['merged_rows']} rows, "
+          f"{manifest['measurements']['merged_cells']} values "
+          f"(outliers {manifest['injected']['outliers']}, non-numeric {manifest['injected']['non_numeric']})")
+    for key, path in manifest["files"].items():
+        print(f"  {key:<16} {f'{len(path)} files' if isinstance(path, list) else path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,28 +5,33 @@ Material Design 스타일 탭 기반 인터페이스 제공
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QPushButton, QLineEdit, QTextEdit,
+    QTabWidget, QPushButton, QLineEdit, QPlainTextEdit,
     QLabel, QFileDialog, QGroupBox, QInputDialog, QMessageBox,
-    QFrame, QSizePolicy, QApplication, QComboBox,
-    QRadioButton, QButtonGroup, QListWidget, QAbstractItemView
+    QFrame, QSizePolicy, QComboBox,
+    QRadioButton, QButtonGroup, QListWidget, QAbstractItemView,
+    QDoubleSpinBox, QCheckBox
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QThreadPool, Signal
 from PySide6.QtGui import QFont, QColor, QPalette, QPixmap
-import pandas as pd
 from datetime import datetime
 import os
 
-from logic.file_reader import read_net_file, read_xlsx_file
+from logic.file_reader import read_net_file, read_xlsx_file, list_excel_sheet_names
 from logic.makevendor import make_vendor_sheet
 from logic.make_de_requirement import make_de_requirement_sheet
 from logic.make_input_check_pin import make_input_check_pin_sheet
 from logic.make_int_med import make_int_med_file, make_input_check_pin_final
 from logic.make_judge_check_pin import make_judge_check_pin_sheet
 from logic.make_dcr import make_dcr_sheet
-from logic.make_form_measurement import create_form_measurement_file, fill_impedance_data, fill_impedance_data_from_files, fill_dimension_data, fill_lslusl_data
-from logic.visualizer import save_dcr_plots_from_file, save_form_plots_from_workbook, save_lslusl_plots_from_data
-from logic.calculate_lsl_usl import calculate_lsl_usl_full
+from logic.make_form_measurement import FormMeasurementSession
+from logic.make_form_measurement import snapshot_dk_files, find_changed_dk_files, update_impedance_data
+from logic.visualizer import save_dcr_plots_from_file, save_form_plots_from_workbook
 from logic.config_manager import save_file_paths, load_file_paths, get_app_dir
+from logic.cancellation import OperationCancelled, OutputRollback, check_cancelled
+from logic.instrumentation import memory_tracking_requested, stage, start_recording, stop_recording
+from logic.profiling import RunProfiler, profiling_requested
+from ui.progress_log import ProgressLogSink
+from ui.worker import PipelineWorker
 
 
 # Material Design 스타일 시트
@@ -148,6 +153,20 @@ QPushButton#auto_execute_btn:pressed {
     background-color: #1B5E20;
 }
 
+QPushButton#cancel_btn {
+    background-color: #C62828;
+    font-size: 11pt;
+    padding: 12px 24px;
+}
+
+QPushButton#cancel_btn:hover {
+    background-color: #B71C1C;
+}
+
+QPushButton#cancel_btn:disabled {
+    background-color: #BDBDBD;
+}
+
 QPushButton#execute_btn {
     background-color: #1976D2;
     font-size: 10pt;
@@ -191,7 +210,7 @@ QTabBar::tab:hover:!selected {
 }
 
 /* 텍스트 출력 영역 */
-QTextEdit {
+QPlainTextEdit {
     border: 1px solid #E0E0E0;
     border-radius: 4px;
     padding: 8px;
@@ -267,8 +286,23 @@ class MainWindow(QMainWindow):
     PROGRAMMER = "Sangwoo Kim"
     ACKNOWLEDGMENTS = "Lots of help from Opus4.5 and Gemini"
     
-    def __init__(self):
+    # Tab 2 watch 모드 폴링 주기 (ms)
+    ETCHING_WATCH_INTERVAL_MS = 2000
+    
+    # 진행 로그 (타임스탬프 포함 메시지, 탭 인덱스) - 워커 스레드에서 보내도 GUI 스레드에서 표시
+    progress_message = Signal(str, object)
+    # 탭 전환 요청 (Auto Execute 워커에서 사용)
+    tab_requested = Signal(int)
+    
+    def __init__(self, profile: bool = None, track_memory: bool = None):
+        """
+        Args:
+            profile: 프로파일링 체크박스 초기값 (None이면 환경 변수 DCR_PROFILE로 결정)
+            track_memory: 메모리 기록 체크박스 초기값 (None이면 환경 변수 DCR_TRACK_MEMORY로 결정)
+        """
         super().__init__()
+        self.profile_on_start = profiling_requested() if profile is None else profile
+        self.track_memory_on_start = memory_tracking_requested() if track_memory is None else track_memory
         self.setWindowTitle(f"{self.PROGRAM_NAME} v{self.VERSION}")
         self.setMinimumSize(1000, 1000)
         self.resize(1100, 1100)  # 초기 크기 설정
@@ -293,49 +327,199 @@ class MainWindow(QMainWindow):
         self.item_code = config.get("item_code", "")
         self.output_base_dir = config.get("output_base_dir", "")
         
-        # 진행 상황 로그
-        self.progress_logs = []
+        # 진행 상황 로그 (탭 로그 창에 추가로만 표시, 로그 파일에 이어서 기록)
+        self.progress_log = ProgressLogSink(self)
         self.current_progress_timer = None
+        self.progress_message.connect(self._append_progress)
+        
+        # 탭 실행 워커 (한 번에 하나만 실행)
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        self._pipeline_worker = None
+        self._pipeline_callbacks = (None, None, None)
+        self._log_base_path = ""  # 현재 로그 파일 경로 (확장자 제외, 단계 기록/프로파일 파일 이름에 사용)
         
         self._setup_ui()
         self._load_saved_paths()
+        self.tab_requested.connect(self.tab_widget.setCurrentIndex)
+        for tab_index, view in enumerate((self.output_text, self.form_output_text, self.lsl_output_text)):
+            self.progress_log.add_view(tab_index, view)
     
     def _log_progress(self, message: str, tab_index: int = None):
         """
-        실시간 진행 상황 로그 추가 및 UI 업데이트
+        실시간 진행 상황 로그 추가 (워커 스레드에서도 호출 가능)
         
         Args:
             message: 로그 메시지
             tab_index: 업데이트할 탭 인덱스 (None이면 현재 선택된 탭)
         """
         timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
-        self.progress_logs.append(log_entry)
-        
+        self.progress_message.emit(f"[{timestamp}] {message}", tab_index)
+    
+    def _append_progress(self, log_entry: str, tab_index):
+        """진행 로그 추가 (GUI 스레드, 로그 창 표시는 타이머로 묶어서 처리)"""
         if tab_index is None:
             tab_index = self.tab_widget.currentIndex()
-            
-        # 모든 로그를 합쳐서 현재 탭의 텍스트 에디터 업데이트
-        full_log = "\n".join(self.progress_logs)
-        
-        if tab_index == 0 and hasattr(self, 'output_text'):
-            self.output_text.setText(full_log)
-            self.output_text.verticalScrollBar().setValue(self.output_text.verticalScrollBar().maximum())
-        elif tab_index == 1 and hasattr(self, 'form_output_text'):
-            self.form_output_text.setText(full_log)
-            self.form_output_text.verticalScrollBar().setValue(self.form_output_text.verticalScrollBar().maximum())
-        elif tab_index == 2 and hasattr(self, 'lsl_output_text'):
-            self.lsl_output_text.setText(full_log)
-            self.lsl_output_text.verticalScrollBar().setValue(self.lsl_output_text.verticalScrollBar().maximum())
-            
-        QApplication.processEvents()
+        self.progress_log.append(log_entry, tab_index)
     
     def _clear_progress(self):
         """진행 로그 초기화"""
-        self.progress_logs = []
+        self.progress_log.clear()
+    
+    def _start_pipeline(self, fn, *args, on_finished=None, on_failed=None, on_cancelled=None) -> bool:
+        """
+        탭 실행 함수를 워커 스레드에서 시작 (실행 중에는 Execute 버튼 비활성화, Cancel 버튼 활성화)
+        
+        Args:
+            fn: 워커에서 실행할 함수 (로그는 _log_progress, 위젯 접근 금지)
+                cancel_token 키워드 인자를 받아 단계 함수에 전달해야 함
+            *args: fn 인자
+            on_finished: 완료 후 GUI 스레드에서 호출 (fn 반환값 전달)
+            on_failed: 예외 발생 후 GUI 스레드에서 호출 (traceback 문자열 전달)
+            on_cancelled: Cancel 버튼으로 중단된 후 GUI 스레드에서 호출
+            
+        Returns:
+            시작 여부 (이미 실행 중이면 False)
+        """
+        if self._pipeline_busy():
+            return False
+        
+        # 프로파일링 모드: 실행 함수를 cProfile로 감싸서 로그 파일 옆에 결과 저장
+        if self.profile_check.isChecked() and self._log_base_path:
+            profiler = RunProfiler(self._log_base_path + "_profile", fn.__name__.strip("_"))
+            args = (profiler, fn) + args
+            fn = self._run_profiled
+        
+        worker = PipelineWorker(fn, *args)
+        worker.signals.finished.connect(self._on_pipeline_finished)
+        worker.signals.failed.connect(self._on_pipeline_failed)
+        worker.signals.cancelled.connect(self._on_pipeline_cancelled)
+        self._pipeline_worker = worker
+        self._pipeline_callbacks = (on_finished, on_failed, on_cancelled)
+        self._set_pipeline_running(True)
+        self.thread_pool.start(worker)
+        return True
+    
+    def _pipeline_busy(self) -> bool:
+        """이미 실행 중인 작업이 있으면 로그를 남기고 True"""
+        if self._pipeline_worker is None:
+            return False
+        self._log_progress("Another task is still running. Please wait until it finishes.")
+        return True
     
-    def _save_log_file(self, log_content: str, tab_name: str = ""):
-        """로그를 파일로 저장 (output 폴더 내 plain ASCII .dat 파일)"""
+    def _end_pipeline(self):
+        """워커 종료 처리 후 (완료 콜백, 실패 콜백, 취소 콜백) 반환"""
+        callbacks = self._pipeline_callbacks
+        self._pipeline_worker = None
+        self._pipeline_callbacks = (None, None, None)
+        self._set_pipeline_running(False)
+        return callbacks
+    
+    def _on_pipeline_finished(self, result):
+        """워커 완료 (GUI 스레드)"""
+        on_finished, _, _ = self._end_pipeline()
+        if on_finished:
+            on_finished(result)
+        # 중간에 멈춘 실행도 단계 기록/로그 파일은 닫음
+        self._finish_stage_recording()
+        self.progress_log.close_file()
+    
+    def _on_pipeline_failed(self, error_text: str):
+        """워커에서 처리되지 않은 예외 발생 (GUI 스레드)"""
+        _, on_failed, _ = self._end_pipeline()
+        self._log_progress(f"Error: Unexpected exception\n{error_text}")
+        if on_failed:
+            on_failed(error_text)
+        self._finish_stage_recording()
+        self.progress_log.close_file()
+    
+    def _on_pipeline_cancelled(self):
+        """워커가 취소 요청으로 중단됨 (GUI 스레드, 출력 파일은 워커에서 이미 복원)"""
+        _, _, on_cancelled = self._end_pipeline()
+        self._log_progress("Cancelled by user.")
+        if on_cancelled:
+            on_cancelled()
+        self._finish_stage_recording()
+        self.progress_log.close_file()
+    
+    def _cancel_pipeline(self):
+        """Cancel 버튼 클릭 - 실행 중인 작업에 취소 요청 (다음 확인 지점에서 중단)"""
+        if self._pipeline_worker is None:
+            return
+        self._pipeline_worker.cancel()
+        self.cancel_btn.setEnabled(False)
+        self._log_progress("Cancelling... (partial outputs will be rolled back)")
+    
+    def _set_pipeline_running(self, running: bool):
+        """실행 중에는 모든 Execute 버튼 비활성화, Cancel 버튼 활성화"""
+        for name in ('execute_btn', 'form_execute_btn', 'lsl_execute_btn', 'auto_execute_btn'):
+            button = getattr(self, name, None)
+            if button is not None:
+                button.setEnabled(not running)
+        if hasattr(self, 'cancel_btn'):
+            self.cancel_btn.setEnabled(running)
+    
+    def _run_profiled(self, profiler, fn, *args, **kwargs):
+        """탭 실행 함수를 cProfile로 측정하며 실행 (워커 스레드, 예외/취소로 끝나도 결과 저장)"""
+        try:
+            return profiler.run(fn, *args, **kwargs)
+        finally:
+            try:
+                paths = profiler.save()
+                self._log_progress("Profile saved: " + ", ".join(f"output/{os.path.basename(p)}" for p in paths))
+            except OSError as e:
+                self._log_progress(f"Failed to save profile: {str(e)}")
+    
+    def _run_with_rollback(self, steps, args: dict, output_files: list, tab_index: int, cancel_token=None,
+                           output_patterns: list = ()):
+        """
+        탭 실행 단계를 출력 파일 보호 상태로 실행 (워커 스레드)
+        취소되면 출력 파일을 실행 전 상태로 되돌리고 새로 생긴 플롯 파일은 삭제한 뒤 OperationCancelled 전달
+        
+        Args:
+            steps: 단계 실행 함수 (args, cancel_token)
+            args: steps 인자 딕셔너리 ("output_dir" 포함)
+            output_files: 실행 중 생성/수정되는 파일 경로 리스트
+            tab_index: 로그를 남길 탭 인덱스
+            cancel_token: 취소 요청 토큰
+            output_patterns: 실행 전에는 이름을 알 수 없는 출력 파일의 glob 패턴 리스트
+            
+        Returns:
+            steps 반환값
+        """
+        rollback = OutputRollback()
+        try:
+            for path in output_files:
+                rollback.protect_file(path)
+            for pattern in output_patterns:
+                rollback.protect_pattern(pattern)
+            rollback.protect_dir(os.path.join(args["output_dir"], "plots"))
+            with stage(f"Tab {tab_index + 1}"):
+                return steps(args, cancel_token)
+        except OperationCancelled:
+            restored = rollback.rollback()
+            self._log_progress("", tab_index=tab_index)
+            self._log_progress(f"Cancelled: rolled back {len(restored)} output file(s)", tab_index=tab_index)
+            for path in restored:
+                self._log_progress(f"  - {os.path.basename(path)}", tab_index=tab_index)
+            raise
+        finally:
+            rollback.discard()
+    
+    def closeEvent(self, event):
+        """실행 중인 작업이 있으면 창을 닫지 않음 (출력 파일이 쓰는 도중 깨지지 않도록)"""
+        if self._pipeline_worker is not None:
+            QMessageBox.information(self, "Task Running",
+                                    "A task is still running. Please wait until it finishes.")
+            event.ignore()
+            return
+        super().closeEvent(event)
+    
+    def _start_log_file(self):
+        """
+        로그 파일 기록 시작 (output 폴더 내 plain ASCII .dat 파일)
+        실행 중 로그 항목을 파일에 이어서 기록하고 _save_log_file()에서 닫음
+        """
         try:
             output_dir = self._get_output_dir()
                 
@@ -349,18 +533,41 @@ class MainWindow(QMainWindow):
             log_filename = f"log_{operator}_{date_str}.dat"
             log_path = os.path.join(output_dir, log_filename)
             
-            # 로그 파일 저장
-            with open(log_path, 'w', encoding='ascii', errors='replace') as f:
-                f.write(f"DCR Format Converter - Log File\n")
-                f.write(f"{'=' * 60}\n")
-                f.write(f"Operator: {operator}\n")
-                f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"{'=' * 60}\n\n")
-                f.write(log_content)
+            header = (f"DCR Format Converter - Log File\n"
+                      f"{'=' * 60}\n"
+                      f"Operator: {operator}\n"
+                      f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                      f"{'=' * 60}\n\n")
+            self.progress_log.start_file(log_path, header)
             
-            return f"Log saved: output/{log_filename}"
+            # 단계별 실행 시간/메모리 기록: 로그 파일 옆 JSONL (log_{Operator}_{date}_stages.jsonl)
+            self._log_base_path = os.path.splitext(log_path)[0]
+            start_recording(self._log_base_path + "_stages.jsonl",
+                            track_memory=self.track_memory_check.isChecked())
+        except Exception as e:
+            self._log_progress(f"Failed to save log: {str(e)}")
+    
+    def _finish_stage_recording(self):
+        """단계 기록 종료 후 실행 시간이 긴 단계 요약을 로그에 추가 (기록 중이 아니면 아무것도 안 함)"""
+        recorder = stop_recording()
+        if recorder is None or not recorder.records:
+            return
+        self._log_progress("Stage timings (slowest first):")
+        for line in recorder.summary_lines():
+            self._log_progress(f"  {line}")
+        if recorder.path:
+            self._log_progress(f"Stage timings saved: output/{os.path.basename(recorder.path)}")
+    
+    def _save_log_file(self):
+        """기록 중인 로그 파일을 닫고 결과 메시지 반환 (단계 기록 요약도 로그 파일에 포함)"""
+        self._finish_stage_recording()
+        try:
+            log_path = self.progress_log.close_file()
         except Exception as e:
             return f"Failed to save log: {str(e)}"
+        if not log_path:
+            return "Failed to save log: log file was not opened"
+        return f"Log saved: output/{os.path.basename(log_path)}"
     
     def _get_output_dir(self) -> str:
         """
@@ -513,6 +720,30 @@ class MainWindow(QMainWindow):
         self.auto_execute_btn.setToolTip("Executes all tabs sequentially (Tab1 → Tab2 → Tab3).\nThis may take several minutes. Please wait patiently.")
         self.auto_execute_btn.clicked.connect(self._auto_execute_all)
         operator_layout.addWidget(self.auto_execute_btn)
+        
+        # Cancel 버튼 (실행 중에만 활성화)
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setObjectName("cancel_btn")
+        self.cancel_btn.setToolTip("Stops the running task and rolls back its partial output files.")
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self._cancel_pipeline)
+        operator_layout.addWidget(self.cancel_btn)
+        
+        # 프로파일링 모드 (실행 옵션 --profile / 환경 변수 DCR_PROFILE=1로도 켤 수 있음)
+        self.profile_check = QCheckBox("Profile")
+        self.profile_check.setToolTip(
+            "Profiles each run with cProfile and saves log_*_profile.prof and a text summary\n"
+            "of the slowest functions next to the log file (attach them to performance reports).")
+        self.profile_check.setChecked(self.profile_on_start)
+        operator_layout.addWidget(self.profile_check)
+        
+        # 단계별 최대 메모리 기록 (실행 옵션 --track-memory / 환경 변수 DCR_TRACK_MEMORY=1로도 켤 수 있음)
+        self.track_memory_check = QCheckBox("Track memory")
+        self.track_memory_check.setToolTip(
+            "Records the tracemalloc peak memory of each stage in log_*_stages.jsonl\n"
+            "(slows allocation-heavy stages such as plotting; timings are always recorded).")
+        self.track_memory_check.setChecked(self.track_memory_on_start)
+        operator_layout.addWidget(self.track_memory_check)
         common_layout.addLayout(operator_layout)
         
         # Row 2: Item Name + Item Code
@@ -684,7 +915,7 @@ class MainWindow(QMainWindow):
         # 출력 텍스트박스
         output_group = QGroupBox("Output Log")
         output_layout = QVBoxLayout(output_group)
-        self.output_text = QTextEdit()
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
         self.output_text.setPlaceholderText("Execution log will be displayed here...")
         self.output_text.setMinimumHeight(350)  # 로그 창 높이 확대
@@ -752,9 +983,7 @@ class MainWindow(QMainWindow):
             self.dimension_file_edit.setText(self.dimension_file_path)
             # 시트 목록 로드
             try:
-                xl = pd.ExcelFile(self.dimension_file_path)
-                sheet_names = xl.sheet_names
-                xl.close()
+                sheet_names = list_excel_sheet_names(self.dimension_file_path)
                 self.dimension_sheet_combo.blockSignals(True)
                 self.dimension_sheet_combo.clear()
                 self.dimension_sheet_combo.addItems(sheet_names)
@@ -887,10 +1116,26 @@ class MainWindow(QMainWindow):
         self._log_progress("Naming rule: {OriginalName}_{Operator}_{Date}.xlsx")
     
     def _execute(self, for_auto_execute=False):
-        """Execute 버튼 클릭 - 모든 시트 순차적 생성"""
+        """Execute 버튼 클릭 - 모든 시트를 워커 스레드에서 순차적으로 생성"""
+        if self._pipeline_busy():
+            return
         if not for_auto_execute:
             self._clear_progress()
         
+        args = self._prepare_dcr_format()
+        if args is None:
+            return
+        if not for_auto_execute:
+            self._start_log_file()
+        self._start_pipeline(self._run_dcr_format, args, on_finished=self._finish_dcr_format)
+    
+    def _prepare_dcr_format(self):
+        """
+        Tab 1 실행 입력값 확인 (GUI 스레드)
+        
+        Returns:
+            _run_dcr_format 인자 딕셔너리 (Operator가 없으면 None)
+        """
         # 출력 파일 경로 자동 생성 (DCR_format_yamaha_{Operator}_{Date}.xlsx)
         current_outfile = self._get_output_filename("DCR_format_yamaha.xlsx")
         
@@ -898,7 +1143,33 @@ class MainWindow(QMainWindow):
         operator = self.operator_input.text().strip()
         if not operator:
             QMessageBox.warning(self, "Warning", "Please enter operator name before executing.")
-            return
+            return None
+        
+        return {
+            "current_outfile": current_outfile,
+            "operator": operator,
+            "output_dir": self._get_output_dir(),
+        }
+    
+    def _run_dcr_format(self, args: dict, cancel_token=None):
+        """
+        Tab 1 실행 (워커 스레드, 취소 시 출력 파일/int_med.xlsx/새 플롯 복원)
+        
+        Returns:
+            출력 파일 경로 (중간에 입력 파일이 없어 멈추면 None)
+        """
+        return self._run_with_rollback(self._run_dcr_format_steps, args,
+                                       [args["current_outfile"], "int_med.xlsx"], 0, cancel_token)
+    
+    def _run_dcr_format_steps(self, args: dict, cancel_token=None):
+        """
+        Tab 1 시트 생성 단계 실행 (워커 스레드)
+        
+        Returns:
+            출력 파일 경로 (중간에 입력 파일이 없어 멈추면 None)
+        """
+        current_outfile = args["current_outfile"]
+        operator = args["operator"]
         
         self._log_progress(f"Starting DCR format conversion...")
         self._log_progress(f"Operator: {operator}")
@@ -912,12 +1183,13 @@ class MainWindow(QMainWindow):
         
         if not self.xlsx_file_path:
             self._log_progress("Error: Please select vendorspec file first")
-            return
+            return None
         
         self._log_progress(f"Source: {self.xlsx_file_path}")
         self._log_progress(f"Output: {current_outfile}")
         
-        result1 = make_vendor_sheet(self.xlsx_file_path, current_outfile)
+        with stage("Step 1 vendor sheet"):
+            result1 = make_vendor_sheet(self.xlsx_file_path, current_outfile, cancel_token=cancel_token)
         self._log_progress(result1)
         self._log_progress("")
         
@@ -928,10 +1200,11 @@ class MainWindow(QMainWindow):
         
         if not self.partpin_file_path:
             self._log_progress("Error: Please select partpin file first")
-            return
+            return None
         
         self._log_progress(f"Source: {self.partpin_file_path}")
-        result2 = make_de_requirement_sheet(self.partpin_file_path, current_outfile)
+        with stage("Step 2 DE requirement"):
+            result2 = make_de_requirement_sheet(self.partpin_file_path, current_outfile, cancel_token=cancel_token)
         self._log_progress(result2)
         self._log_progress("")
         
@@ -941,7 +1214,8 @@ class MainWindow(QMainWindow):
         self._log_progress("=" * 60)
         
         self._log_progress(f"Processing input check pin sheet...")
-        result3 = make_input_check_pin_sheet(current_outfile, self.net_file_path)
+        with stage("Step 3 input check pin"):
+            result3 = make_input_check_pin_sheet(current_outfile, self.net_file_path, cancel_token=cancel_token)
         self._log_progress(result3)
         self._log_progress("")
         
@@ -952,10 +1226,11 @@ class MainWindow(QMainWindow):
         
         if not self.net_file_path:
             self._log_progress("Error: Please select NET file first")
-            return
+            return None
         
         self._log_progress(f"Processing NET file for int_med.xlsx...")
-        result4 = make_int_med_file(self.net_file_path, "int_med.xlsx")
+        with stage("Step 4 int_med"):
+            result4 = make_int_med_file(self.net_file_path, "int_med.xlsx", cancel_token=cancel_token)
         self._log_progress(result4)
         self._log_progress("")
         
@@ -965,7 +1240,8 @@ class MainWindow(QMainWindow):
         self._log_progress("=" * 60)
         
         self._log_progress(f"Merging input check pin data...")
-        result5 = make_input_check_pin_final(current_outfile, "int_med.xlsx")
+        with stage("Step 5 input check pin final"):
+            result5 = make_input_check_pin_final(current_outfile, "int_med.xlsx", cancel_token=cancel_token)
         self._log_progress(result5)
         self._log_progress("")
         
@@ -975,7 +1251,8 @@ class MainWindow(QMainWindow):
         self._log_progress("=" * 60)
         
         self._log_progress(f"Creating Judge(check pin) sheet...")
-        result6 = make_judge_check_pin_sheet(current_outfile)
+        with stage("Step 6 Judge(check pin)"):
+            result6 = make_judge_check_pin_sheet(current_outfile, cancel_token=cancel_token)
         self._log_progress(result6)
         self._log_progress("")
         
@@ -985,7 +1262,8 @@ class MainWindow(QMainWindow):
         self._log_progress("=" * 60)
         
         self._log_progress(f"Creating DCR sheet...")
-        result7 = make_dcr_sheet(current_outfile)
+        with stage("Step 7 DCR sheet"):
+            result7 = make_dcr_sheet(current_outfile, cancel_token=cancel_token)
         self._log_progress(result7)
         self._log_progress("")
         
@@ -995,16 +1273,18 @@ class MainWindow(QMainWindow):
         self._log_progress("=" * 60)
         
         self._log_progress(f"Adding cover page...")
+        check_cancelled(cancel_token)
         from logic.cover_page import add_cover_page
-        result8 = add_cover_page(
-            current_outfile,
-            operator,
-            {
-                "NET File": self.net_file_path,
-                "Vendorspec File": self.xlsx_file_path,
-                "Partpin File": self.partpin_file_path
-            }
-        )
+        with stage("Step 8 cover page"):
+            result8 = add_cover_page(
+                current_outfile,
+                operator,
+                {
+                    "NET File": self.net_file_path,
+                    "Vendorspec File": self.xlsx_file_path,
+                    "Partpin File": self.partpin_file_path
+                }
+            )
         self._log_progress(result8)
         self._log_progress("")
         
@@ -1015,7 +1295,9 @@ class MainWindow(QMainWindow):
         
         self._log_progress(f"Generating plots from output file...")
         try:
-            plots = save_dcr_plots_from_file(current_outfile, operator, output_dir=self._get_output_dir())
+            with stage("Step 9 plots"):
+                plots = save_dcr_plots_from_file(current_outfile, operator, output_dir=args["output_dir"],
+                                                 cancel_token=cancel_token)
             if plots:
                 self._log_progress(f"Generated {len(plots)} plots:")
                 for p in plots:
@@ -1030,10 +1312,16 @@ class MainWindow(QMainWindow):
         self._log_progress("All steps completed successfully!")
         self._log_progress(f"Output saved to: {current_outfile}")
         self._log_progress("=" * 60)
+        return current_outfile
+    
+    def _finish_dcr_format(self, current_outfile, for_auto_execute=False):
+        """Tab 1 완료 처리 (GUI 스레드)"""
+        if current_outfile is None:
+            return
         
         # 개별 실행인 경우에만 로그 저장
         if not for_auto_execute:
-            log_result = self._save_log_file("\n".join(self.progress_logs), "")
+            log_result = self._save_log_file()
             self._log_progress(log_result)
         
         # 출력 파일 경로 업데이트 (DCR 파일 경로 저장 - 이후 탭에서 참조용)
@@ -1082,9 +1370,16 @@ class MainWindow(QMainWindow):
         etching_browse_btn = QPushButton("Browse")
         etching_browse_btn.setObjectName("browse_btn")
         etching_browse_btn.clicked.connect(self._browse_etching_directory)
+        self.etching_watch_btn = QPushButton("Watch")
+        self.etching_watch_btn.setObjectName("browse_btn")
+        self.etching_watch_btn.setCheckable(True)
+        self.etching_watch_btn.setToolTip("Watch the etching directory for new/modified DK*.xls / DK*.xlsx files\n"
+                                          "and update the last Form Measurement Result incrementally.")
+        self.etching_watch_btn.toggled.connect(self._toggle_etching_watch)
         auto_layout.addWidget(etching_label)
         auto_layout.addWidget(self.etching_dir_edit)
         auto_layout.addWidget(etching_browse_btn)
+        auto_layout.addWidget(self.etching_watch_btn)
         etching_mode_layout.addWidget(self.etching_auto_widget)
         
         # --- 수동 모드 위젯 ---
@@ -1204,7 +1499,7 @@ class MainWindow(QMainWindow):
         # 출력 텍스트 영역
         output_log_group = QGroupBox("Output Log")
         output_log_layout = QVBoxLayout(output_log_group)
-        self.form_output_text = QTextEdit()
+        self.form_output_text = QPlainTextEdit()
         self.form_output_text.setReadOnly(True)
         self.form_output_text.setPlaceholderText("Execution log will be displayed here...")
         self.form_output_text.setMinimumHeight(350)  # 로그 창 높이 확대
@@ -1269,9 +1564,7 @@ class MainWindow(QMainWindow):
         )
         if file_path:
             try:
-                xl = pd.ExcelFile(file_path)
-                sheet_names = xl.sheet_names
-                xl.close()
+                sheet_names = list_excel_sheet_names(file_path)
                 
                 self.dimension_file_edit.setText(file_path)
                 
@@ -1314,16 +1607,105 @@ class MainWindow(QMainWindow):
             self._save_config()
 
     def _execute_form_measurement(self, for_auto_execute=False):
-        """Form Measurement Result 파일 생성 실행"""
+        """Form Measurement Result 파일 생성을 워커 스레드에서 실행 (실행 중에는 watch 폴링 중지)"""
+        if self._pipeline_busy():
+            return
         if not for_auto_execute:
             self._clear_progress()
-            
-        # 출력 파일 경로 자동 생성 (Form_measurement_result_{Operator}_{Date}.xlsx)
-        output_path = self._get_output_filename("Form_measurement_result.xlsx")
         
-        etching_dir = self.etching_dir_edit.text()
+        args = self._prepare_form_measurement()
+        if not for_auto_execute:
+            self._start_log_file()
+        self._form_running = True
+        if not self._start_pipeline(self._run_form_measurement, args,
+                                    on_finished=self._finish_form_measurement,
+                                    on_failed=self._on_form_measurement_failed,
+                                    on_cancelled=self._on_form_measurement_cancelled):
+            self._form_running = False
+    
+    def _prepare_form_measurement(self) -> dict:
+        """
+        Tab 2 실행 입력값 수집 (GUI 스레드)
+        Dimension 파일 시트 선택 대화상자도 여기서 처리
+        
+        Returns:
+            _run_form_measurement 인자 딕셔너리
+        """
         dimension_file = self.dimension_file_edit.text()
-        lslusl_file = self.lslusl_file_edit.text()
+        is_auto_mode = self.etching_auto_radio.isChecked()
+        sheet_name, sheet_error = self._select_dimension_sheet(dimension_file) if dimension_file else ("", "")
+        return {
+            # 출력 파일 경로 자동 생성 (Form_measurement_result_{Operator}_{Date}.xlsx)
+            "output_path": self._get_output_filename("Form_measurement_result.xlsx"),
+            "etching_dir": self.etching_dir_edit.text(),
+            "dimension_file": dimension_file,
+            "sheet_name": sheet_name,
+            "sheet_error": sheet_error,
+            "lslusl_file": self.lslusl_file_edit.text(),
+            "is_auto_mode": is_auto_mode,
+            "file_list": [] if is_auto_mode else
+                         [self.etching_file_list.item(i).text() for i in range(self.etching_file_list.count())],
+            "operator": self.operator_input.text().strip() if hasattr(self, 'operator_input') else "",
+            "output_dir": self._get_output_dir(),
+        }
+    
+    def _select_dimension_sheet(self, dimension_file: str):
+        """
+        Dimension 파일 시트 결정 (저장된 시트가 없고 시트가 여러 개면 사용자 선택)
+        
+        Returns:
+            (시트 이름, 오류 메시지) - 취소/오류 시 시트 이름은 None
+        """
+        sheet_name = self.dimension_sheet_name if hasattr(self, 'dimension_sheet_name') else ""
+        if sheet_name:
+            return sheet_name, ""
+        try:
+            sheet_names = list_excel_sheet_names(dimension_file)
+            
+            if len(sheet_names) > 1:
+                selected_sheet, ok = QInputDialog.getItem(
+                    self,
+                    "Select Sheet",
+                    f"Multiple sheets found ({len(sheet_names)}).\nSelect sheet:",
+                    sheet_names,
+                    0,
+                    False
+                )
+                if ok and selected_sheet:
+                    sheet_name = selected_sheet
+                    self.dimension_sheet_name = sheet_name
+                    self._save_config()
+                else:
+                    return None, "Cancelled: User did not select a sheet."
+            elif len(sheet_names) == 1:
+                sheet_name = sheet_names[0]
+                self.dimension_sheet_name = sheet_name
+                self._save_config()
+        except Exception as e:
+            return None, f"Error reading dimension file sheets: {e}"
+        return sheet_name, ""
+
+    def _run_form_measurement(self, args: dict, cancel_token=None):
+        """
+        Tab 2 실행 (워커 스레드, 취소 시 출력 파일/새 플롯 복원)
+        
+        Returns:
+            watch 모드용 결과 딕셔너리 (중간에 멈추면 None)
+        """
+        return self._run_with_rollback(self._run_form_measurement_steps, args,
+                                       [args["output_path"]], 1, cancel_token)
+    
+    def _run_form_measurement_steps(self, args: dict, cancel_token=None):
+        """
+        Form Measurement Result 파일 생성 단계 실행 (워커 스레드)
+        
+        Returns:
+            watch 모드용 결과 딕셔너리 (중간에 멈추면 None)
+        """
+        output_path = args["output_path"]
+        etching_dir = args["etching_dir"]
+        dimension_file = args["dimension_file"]
+        lslusl_file = args["lslusl_file"]
         
         # === Step 1: 템플릿 복사하여 출력 파일 생성 ===
         self._log_progress("=" * 60, tab_index=1)
@@ -1331,15 +1713,22 @@ class MainWindow(QMainWindow):
         self._log_progress("=" * 60, tab_index=1)
         self._log_progress(f"Output: {output_path}", tab_index=1)
         
-        result1 = create_form_measurement_file(output_path)
-        self._log_progress(result1 if isinstance(result1, str) else result1.get("message", ""), tab_index=1)
+        # 모든 단계를 하나의 워크북 세션에서 처리하고 마지막에 한 번만 저장
+        session = FormMeasurementSession(output_path, cancel_token=cancel_token)
+        with stage("create from template"):
+            result1 = session.create_from_template()
+        self._log_progress(result1, tab_index=1)
         self._log_progress("", tab_index=1)
+        if result1.startswith("Error"):
+            return None
         
         tdr_map = {}
         dim_map = {}
+        # watch 모드 기준 스냅샷 (읽기 전에 찍어서 실행 중 추가된 파일도 감지)
+        watch_snapshot = snapshot_dk_files(etching_dir) if etching_dir else {}
 
         # === Step 2: DK 파일에서 Impedance 데이터 ===
-        is_auto_mode = self.etching_auto_radio.isChecked()
+        is_auto_mode = args["is_auto_mode"]
         
         if is_auto_mode:
             # 자동 모드: 디렉토리 스캔
@@ -1349,7 +1738,8 @@ class MainWindow(QMainWindow):
                 self._log_progress("=" * 60, tab_index=1)
                 self._log_progress(f"Etching Directory: {etching_dir}", tab_index=1)
                 
-                result2 = fill_impedance_data(output_path, etching_dir)
+                with stage("fill impedance"):
+                    result2 = session.fill_impedance(etching_dir)
                 if isinstance(result2, dict):
                     tdr_map = result2.get("tdr_map", {})
                     self._log_progress(result2.get("message", ""), tab_index=1)
@@ -1359,18 +1749,18 @@ class MainWindow(QMainWindow):
                 self._log_progress("Note: No etching directory selected. Skipping DK file processing.", tab_index=1)
         else:
             # 수동 모드: 사용자가 선택한 파일 리스트
-            file_count = self.etching_file_list.count()
-            if file_count > 0:
+            file_list = args["file_list"]
+            if file_list:
                 self._log_progress("=" * 60, tab_index=1)
                 self._log_progress("[ Step 2: Fill Impedance Data from DK Files (Manual Mode) ]", tab_index=1)
                 self._log_progress("=" * 60, tab_index=1)
                 
-                file_list = [self.etching_file_list.item(i).text() for i in range(file_count)]
                 self._log_progress(f"Selected {len(file_list)} files:", tab_index=1)
                 for fp in file_list:
                     self._log_progress(f"  - {os.path.basename(fp)}", tab_index=1)
                 
-                result2 = fill_impedance_data_from_files(output_path, file_list)
+                with stage("fill impedance"):
+                    result2 = session.fill_impedance_from_files(file_list)
                 if isinstance(result2, dict):
                     tdr_map = result2.get("tdr_map", {})
                     self._log_progress(result2.get("message", ""), tab_index=1)
@@ -1388,39 +1778,17 @@ class MainWindow(QMainWindow):
             self._log_progress("=" * 60, tab_index=1)
             self._log_progress(f"Dimension File: {dimension_file}", tab_index=1)
             
-            sheet_name = self.dimension_sheet_name if hasattr(self, 'dimension_sheet_name') else ""
-            if not sheet_name:
-                try:
-                    xl = pd.ExcelFile(dimension_file)
-                    sheet_names = xl.sheet_names
-                    xl.close()
-                    
-                    if len(sheet_names) > 1:
-                        selected_sheet, ok = QInputDialog.getItem(
-                            self,
-                            "Select Sheet",
-                            f"Multiple sheets found ({len(sheet_names)}).\nSelect sheet:",
-                            sheet_names,
-                            0,
-                            False
-                        )
-                        if ok and selected_sheet:
-                            sheet_name = selected_sheet
-                            self.dimension_sheet_name = sheet_name
-                            self._save_config()
-                        else:
-                            self._log_progress("Cancelled: User did not select a sheet.", tab_index=1)
-                            return
-                    elif len(sheet_names) == 1:
-                        sheet_name = sheet_names[0]
-                        self.dimension_sheet_name = sheet_name
-                        self._save_config()
-                except Exception as e:
-                    self._log_progress(f"Error reading dimension file sheets: {e}", tab_index=1)
-                    return
+            # 시트는 실행 전에 GUI 스레드에서 결정 (선택 취소/오류면 여기까지 저장하고 중단)
+            sheet_name = args["sheet_name"]
+            if sheet_name is None:
+                self._log_progress(args["sheet_error"], tab_index=1)
+                self._log_progress(session.save(), tab_index=1)
+                session.close()
+                return None
             
             self._log_progress(f"Sheet: {sheet_name}", tab_index=1)
-            result3 = fill_dimension_data(output_path, dimension_file, sheet_name)
+            with stage("fill dimension"):
+                result3 = session.fill_dimension(dimension_file, sheet_name)
             if isinstance(result3, dict):
                 dim_map = result3.get("dim_map", {})
                 self._log_progress(result3.get("message", ""), tab_index=1)
@@ -1438,7 +1806,8 @@ class MainWindow(QMainWindow):
             self._log_progress("=" * 60, tab_index=1)
             self._log_progress(f"LSLUSL File: {lslusl_file}", tab_index=1)
             
-            result4 = fill_lslusl_data(output_path, lslusl_file)
+            with stage("fill LSL/USL"):
+                result4 = session.fill_lslusl(lslusl_file)
             self._log_progress(result4, tab_index=1)
         else:
             self._log_progress("Note: No LSLUSL file selected. Skipping LSL/USL processing.", tab_index=1)
@@ -1450,19 +1819,26 @@ class MainWindow(QMainWindow):
         self._log_progress("=" * 60, tab_index=1)
         self._log_progress(f"Adding cover page...", tab_index=1)
         
-        operator = self.operator_input.text().strip() if hasattr(self, 'operator_input') else ""
-        from logic.cover_page import add_cover_page
-        result5 = add_cover_page(
-            output_path,
-            operator,
-            {
-                "Etching Directory": etching_dir,
-                "Dimension File": dimension_file,
-                "LSLUSL File": lslusl_file
-            }
-        )
+        operator = args["operator"]
+        with stage("cover page"):
+            result5 = session.add_cover_page(
+                operator,
+                {
+                    "Etching Directory": etching_dir,
+                    "Dimension File": dimension_file,
+                    "LSLUSL File": lslusl_file
+                }
+            )
         self._log_progress(result5, tab_index=1)
         
+        # === 파일 저장 (1회) ===
+        with stage("save"):
+            result_save = session.save()
+        session.close()
+        self._log_progress(result_save, tab_index=1)
+        if result_save.startswith("Error"):
+            return None
+        
         self._log_progress("", tab_index=1)
         self._log_progress("=" * 60, tab_index=1)
         self._log_progress("Form Measurement Result file created successfully!", tab_index=1)
@@ -1471,7 +1847,9 @@ class MainWindow(QMainWindow):
 
         # === Visualization (PNG 저장) ===
         try:
-            plots = save_form_plots_from_workbook(tdr_map, dim_map, operator, output_dir=self._get_output_dir())
+            with stage("plots"):
+                plots = save_form_plots_from_workbook(tdr_map, dim_map, operator, output_dir=args["output_dir"],
+                                                      cancel_token=cancel_token)
             if plots:
                 for p in plots:
                     self._log_progress(f"Plot saved: {p}", tab_index=1)
@@ -1480,14 +1858,151 @@ class MainWindow(QMainWindow):
         except Exception as e:
             self._log_progress(f"Warning: Plot generation failed - {e}", tab_index=1)
         
+        return {
+            "output_path": output_path,
+            "tdr_map": tdr_map,
+            "watch_snapshot": watch_snapshot if is_auto_mode else {},
+        }
+    
+    def _finish_form_measurement(self, result, for_auto_execute=False):
+        """Tab 2 완료 처리 (GUI 스레드)"""
+        self._form_running = False
+        if result is None:
+            return
+        
         # 개별 실행인 경우에만 로그 저장
         if not for_auto_execute:
-            log_result = self._save_log_file("\n".join(self.progress_logs), "")
+            log_result = self._save_log_file()
             self._log_progress(log_result, tab_index=1)
         
         # 출력 경로 업데이트
         # self.form_out_path_edit.setText(output_path) # 에디트 박스 제거됨
         self._save_config()
+        
+        # watch 모드에서 증분 업데이트할 대상 저장
+        self.form_output_path = result["output_path"]
+        self.form_tdr_map = dict(result["tdr_map"])
+        self.etching_watch_ingested = result["watch_snapshot"]
+        self.etching_watch_previous = dict(self.etching_watch_ingested)
+    
+    def _on_form_measurement_failed(self, error_text: str):
+        """Tab 2 예외 처리 (watch 폴링 재개)"""
+        self._form_running = False
+    
+    def _on_form_measurement_cancelled(self):
+        """Tab 2 취소 처리 (watch 폴링 재개)"""
+        self._form_running = False
+
+
+    def _toggle_etching_watch(self, checked):
+        """Etching 디렉토리 watch 모드 시작/중지"""
+        if not checked:
+            if getattr(self, 'etching_watch_timer', None):
+                self.etching_watch_timer.stop()
+                self._log_progress("Watch mode stopped.", tab_index=1)
+            return
+        
+        etching_dir = self.etching_dir_edit.text()
+        output_path = getattr(self, 'form_output_path', "")
+        if not etching_dir or not os.path.isdir(etching_dir):
+            QMessageBox.warning(self, "Warning", "Please select an etching directory first.")
+            self.etching_watch_btn.setChecked(False)
+            return
+        if not output_path or not os.path.exists(output_path):
+            QMessageBox.warning(self, "Warning", "Please execute Tab 2 once before starting watch mode.")
+            self.etching_watch_btn.setChecked(False)
+            return
+        
+        if not getattr(self, 'etching_watch_ingested', None):
+            self.etching_watch_ingested = snapshot_dk_files(etching_dir)
+        self.etching_watch_previous = dict(self.etching_watch_ingested)
+        
+        if not getattr(self, 'etching_watch_timer', None):
+            self.etching_watch_timer = QTimer(self)
+            self.etching_watch_timer.timeout.connect(self._poll_etching_directory)
+        self.etching_watch_timer.start(self.ETCHING_WATCH_INTERVAL_MS)
+        
+        self._log_progress("=" * 60, tab_index=1)
+        self._log_progress(f"Watch mode started: {etching_dir}", tab_index=1)
+        self._log_progress(f"Target: {output_path}", tab_index=1)
+        self._log_progress("=" * 60, tab_index=1)
+    
+    def _poll_etching_directory(self):
+        """Watch 모드 폴링: 새로 생기거나 수정된 DK 파일만 출력 파일에 반영 (갱신은 워커 스레드)"""
+        # Tab 2 실행 중이거나 다른 작업이 실행 중이면 다음 폴링에서 다시 확인
+        if getattr(self, '_form_running', False) or self._pipeline_worker is not None:
+            return
+        
+        etching_dir = self.etching_dir_edit.text()
+        output_path = getattr(self, 'form_output_path', "")
+        if not etching_dir or not output_path:
+            return
+        
+        current = snapshot_dk_files(etching_dir)
+        changed = find_changed_dk_files(self.etching_watch_ingested, self.etching_watch_previous, current)
+        self.etching_watch_previous = current
+        if not changed:
+            return
+        
+        self._log_progress(f"Watch: {len(changed)} new/modified DK file(s) detected", tab_index=1)
+        for fp in changed:
+            self._log_progress(f"  - {os.path.basename(fp)}", tab_index=1)
+        
+        args = {
+            "output_path": output_path,
+            "output_dir": self._get_output_dir(),
+            "changed": changed,
+            "snapshot": {fp: current[fp] for fp in changed},
+            "tdr_map": dict(self.form_tdr_map),
+            "operator": self.operator_input.text().strip() if hasattr(self, 'operator_input') else "",
+        }
+        self._form_running = True
+        if not self._start_pipeline(self._run_watch_update, args,
+                                    on_finished=self._finish_watch_update,
+                                    on_failed=self._on_form_measurement_failed,
+                                    on_cancelled=self._on_form_measurement_cancelled):
+            self._form_running = False
+    
+    def _run_watch_update(self, args: dict, cancel_token=None):
+        """
+        Watch 모드 증분 업데이트 (워커 스레드, 취소 시 출력 파일/새 플롯 복원)
+        
+        Returns:
+            {"tdr_map": 갱신된 Inner의 TDR 값, "snapshot": 반영한 DK 파일 상태} (갱신 실패 시 None)
+        """
+        return self._run_with_rollback(self._run_watch_update_steps, args,
+                                       [args["output_path"]], 1, cancel_token)
+    
+    def _run_watch_update_steps(self, args: dict, cancel_token=None):
+        """Watch 모드 증분 업데이트 단계 실행 (워커 스레드, 위젯/watch 상태는 완료 콜백에서 갱신)"""
+        with stage("update impedance"):
+            result = update_impedance_data(args["output_path"], args["changed"], cancel_token=cancel_token)
+        if not isinstance(result, dict):
+            # 출력 파일이 열려 있는 경우 등 - 다음 폴링에서 재시도
+            self._log_progress(result, tab_index=1)
+            return None
+        self._log_progress(result.get("message", ""), tab_index=1)
+        
+        # TDR 플롯만 갱신 (Dimension 플롯은 변경 없음)
+        tdr_map = dict(args["tdr_map"])
+        tdr_map.update(result.get("tdr_map", {}))
+        try:
+            with stage("plots"):
+                plots = save_form_plots_from_workbook(tdr_map, {}, args["operator"], output_dir=args["output_dir"],
+                                                      cancel_token=cancel_token)
+            self._log_progress(f"Watch: {len(plots)} TDR plots updated", tab_index=1)
+        except Exception as e:
+            self._log_progress(f"Warning: Plot generation failed - {e}", tab_index=1)
+        
+        return {"tdr_map": result.get("tdr_map", {}), "snapshot": args["snapshot"]}
+    
+    def _finish_watch_update(self, result):
+        """Watch 모드 증분 업데이트 완료 (GUI 스레드, 반영한 파일과 TDR 값 기록)"""
+        self._form_running = False
+        if result is None:
+            return
+        self.form_tdr_map.update(result["tdr_map"])
+        self.etching_watch_ingested.update(result["snapshot"])
 
     def _create_lsl_usl_tab(self):
         """calculate LSL USL 탭 생성"""
@@ -1542,23 +2057,102 @@ class MainWindow(QMainWindow):
         output_file_layout.addWidget(self.lsl_outfile_info_label)
         output_file_layout.addStretch()
         
+        # 부트스트랩 신뢰구간 (선택 사항, NET 수가 많으면 시간이 걸림)
+        self.lsl_bootstrap_check = QCheckBox("Bootstrap CIs")
+        self.lsl_bootstrap_check.setToolTip(
+            "Add bootstrap confidence intervals for AverageIfs, Stdev ifs, LSL and USL (fixed seed).")
+        output_file_layout.addWidget(self.lsl_bootstrap_check)
+        
+        # Method별 통계 시트 (비우면 파일에 있는 모든 Method)
+        methods_label = QLabel("Methods:")
+        self.lsl_methods_edit = QLineEdit()
+        self.lsl_methods_edit.setPlaceholderText("All")
+        self.lsl_methods_edit.setFixedWidth(100)
+        self.lsl_methods_edit.setToolTip(
+            "Comma-separated Method values for extra 'tinh LCLUCL M<Method>' sheets (blank = all). "
+            "Method 3 always drives the limits.")
+        output_file_layout.addWidget(methods_label)
+        output_file_layout.addWidget(self.lsl_methods_edit)
+        
+        # 컬럼 형식 내보내기 (측정값 행렬 + NET별 통계, SPC 도구용)
+        columnar_label = QLabel("Export:")
+        self.lsl_columnar_combo = QComboBox()
+        for label_text, fmt in (("xlsx only", ""), ("+ NPZ", "npz"), ("+ Parquet", "parquet"), ("+ CSV", "csv")):
+            self.lsl_columnar_combo.addItem(label_text, fmt)
+        self.lsl_columnar_combo.setToolTip(
+            "Also write the measurement matrix and per-NET statistics next to the result file, "
+            "one pair per Method (_M<Method> for Methods other than 3; "
+            "Parquet needs pyarrow or fastparquet, otherwise CSV is written).")
+        self.lsl_columnar_combo.currentIndexChanged.connect(self._on_lsl_columnar_changed)
+        self.lsl_skip_sap_xep_check = QCheckBox("Skip Sap xep")
+        self.lsl_skip_sap_xep_check.setToolTip(
+            "Do not write the 'Sap xep' sheet (copy of the measurement matrix) - use the exported file instead.")
+        self.lsl_skip_sap_xep_check.setEnabled(False)
+        output_file_layout.addWidget(columnar_label)
+        output_file_layout.addWidget(self.lsl_columnar_combo)
+        output_file_layout.addWidget(self.lsl_skip_sap_xep_check)
+        
         layout.addWidget(output_file_group)
         
         # 실행 버튼
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
-        execute_btn = QPushButton("Execute")
-        execute_btn.setObjectName("execute_btn")
-        execute_btn.setToolTip("Calculate LSL/USL statistics. This may take a while for large files.")
-        execute_btn.clicked.connect(self._execute_lsl_usl)
-        btn_layout.addWidget(execute_btn)
+        self.lsl_execute_btn = QPushButton("Execute")
+        self.lsl_execute_btn.setObjectName("execute_btn")
+        self.lsl_execute_btn.setToolTip("Calculate LSL/USL statistics. This may take a while for large files.")
+        self.lsl_execute_btn.clicked.connect(self._execute_lsl_usl)
+        btn_layout.addWidget(self.lsl_execute_btn)
         btn_layout.addStretch()
         layout.addLayout(btn_layout)
         
+        # What-if 한계값 시뮬레이션 그룹 (Execute 완료 후 활성화)
+        whatif_group = QGroupBox("What-if Limits")
+        whatif_layout = QVBoxLayout(whatif_group)
+        
+        param_layout = QHBoxLayout()
+        # 이상치 필터 (AverageIfs/Stdev ifs 계산 범위)
+        self.outlier_filter_combo = QComboBox()
+        for label_text, method in (("IQR Fence", "iqr"), ("Median/MAD", "mad"),
+                                   ("Sigma Clipping", "sigma_clip"), ("Generalized ESD", "esd")):
+            self.outlier_filter_combo.addItem(label_text, method)
+        self.outlier_filter_combo.setEnabled(False)
+        self.outlier_filter_combo.currentIndexChanged.connect(self._on_outlier_filter_changed)
+        param_layout.addWidget(QLabel("Outlier Filter:"))
+        param_layout.addWidget(self.outlier_filter_combo)
+        
+        self.sigma_k_spin = self._create_limit_spin(1.0, 6.0, 0.1, 3.0)
+        self.filter_threshold_spin = self._create_limit_spin(0.5, 10.0, 0.5, 4.0)
+        self.filter_threshold_spin.setDecimals(3)
+        self.guard_band_spin = self._create_limit_spin(0.0, 50.0, 0.5, 5.0)
+        for label_text, spin in (("Threshold:", self.filter_threshold_spin),
+                                 ("Sigma (k):", self.sigma_k_spin),
+                                 ("Guard Band (mΩ):", self.guard_band_spin)):
+            param_layout.addWidget(QLabel(label_text))
+            param_layout.addWidget(spin)
+        param_layout.addStretch()
+        
+        load_limits_btn = QPushButton("Load Result")
+        load_limits_btn.setToolTip("Load the existing LSL/USL output file for what-if simulation.")
+        load_limits_btn.clicked.connect(lambda: self._load_limit_session())
+        param_layout.addWidget(load_limits_btn)
+        
+        self.apply_limits_btn = QPushButton("Apply Limits")
+        self.apply_limits_btn.setToolTip("Write the simulated limits to the LSL/USL output and DCR files.")
+        self.apply_limits_btn.setEnabled(False)
+        self.apply_limits_btn.clicked.connect(self._apply_limit_session)
+        param_layout.addWidget(self.apply_limits_btn)
+        whatif_layout.addLayout(param_layout)
+        
+        self.whatif_summary_label = QLabel("Execute or load a result to simulate limits.")
+        self.whatif_summary_label.setStyleSheet("color: #666666; font-style: italic;")
+        self.whatif_summary_label.setWordWrap(True)
+        whatif_layout.addWidget(self.whatif_summary_label)
+        layout.addWidget(whatif_group)
+        
         # 출력 텍스트
         output_log_group = QGroupBox("Output Log")
         output_log_layout = QVBoxLayout(output_log_group)
-        self.lsl_output_text = QTextEdit()
+        self.lsl_output_text = QPlainTextEdit()
         self.lsl_output_text.setReadOnly(True)
         self.lsl_output_text.setPlaceholderText("Execution log will be displayed here...")
         self.lsl_output_text.setMinimumHeight(350)  # 로그 창 높이 확대
@@ -1567,6 +2161,109 @@ class MainWindow(QMainWindow):
         
         self.tab_widget.addTab(tab, "calculate LSL USL")
     
+    def _create_limit_spin(self, minimum: float, maximum: float, step: float, value: float) -> QDoubleSpinBox:
+        """What-if 파라미터 입력 상자 생성 (세션 로드 전에는 비활성화)"""
+        spin = QDoubleSpinBox()
+        spin.setRange(minimum, maximum)
+        spin.setSingleStep(step)
+        spin.setDecimals(2)
+        spin.setValue(value)
+        spin.setEnabled(False)
+        spin.valueChanged.connect(self._simulate_limits)
+        return spin
+    
+    def _load_limit_session(self, output_file: str = "", dcr_file: str = ""):
+        """LSL/USL 결과 파일로 what-if 세션 생성"""
+        if not output_file:
+            output_file = self._get_output_filename("Calculate_3Sigma_LSLUSL.xlsx", suffix_type="final")
+        if not dcr_file:
+            dcr_file = getattr(self, 'dcr_output_path', "")
+        session = self._open_limit_session(output_file, dcr_file)
+        if session is not None:
+            self._activate_limit_session(session)
+    
+    def _open_limit_session(self, output_file: str, dcr_file: str):
+        """
+        what-if 세션 로드 (위젯 접근 없음 - 워커 스레드에서도 호출 가능)
+        
+        Returns:
+            LimitSimulationSession (실패하면 None)
+        """
+        if not os.path.exists(output_file):
+            self._log_progress(f"Error: LSL/USL output not found at {output_file}. Please execute Tab 3 first.", tab_index=2)
+            return None
+        
+        # numpy/openpyxl 기반 세션은 필요할 때 로드
+        from logic.limit_simulator import LimitSimulationSession
+        session = LimitSimulationSession(output_file, dcr_file if dcr_file and os.path.exists(dcr_file) else "")
+        result = session.load()
+        self._log_progress(result, tab_index=2)
+        if not result.startswith("Success"):
+            return None
+        return session
+    
+    def _activate_limit_session(self, session):
+        """로드한 what-if 세션으로 파라미터 입력 상자 초기화 (결과 파일에 적용된 파라미터, GUI 스레드)"""
+        self.limit_session = session
+        parameters = session.parameters
+        self.outlier_filter_combo.blockSignals(True)
+        self.outlier_filter_combo.setCurrentIndex(
+            max(self.outlier_filter_combo.findData(parameters["outlier_filter"]), 0))
+        self.outlier_filter_combo.blockSignals(False)
+        self.outlier_filter_combo.setEnabled(True)
+        self._set_filter_threshold_range()
+        spins = ((self.sigma_k_spin, parameters["sigma_k"]),
+                 (self.filter_threshold_spin, parameters["filter_threshold"]),
+                 (self.guard_band_spin, parameters["guard_band"]))
+        for spin, value in spins:
+            spin.blockSignals(True)
+            spin.setValue(value)
+            spin.blockSignals(False)
+        for spin in (self.sigma_k_spin, self.filter_threshold_spin, self.guard_band_spin):
+            spin.setEnabled(True)
+        self.apply_limits_btn.setEnabled(True)
+        self._simulate_limits()
+    
+    def _set_filter_threshold_range(self):
+        """선택한 이상치 필터의 임계값 범위와 기본값으로 입력 상자 설정"""
+        from logic.outlier_filters import OUTLIER_FILTERS
+        filter_info = OUTLIER_FILTERS[self.outlier_filter_combo.currentData()]
+        minimum, maximum, step = filter_info["range"]
+        spin = self.filter_threshold_spin
+        spin.blockSignals(True)
+        spin.setRange(minimum, maximum)
+        spin.setSingleStep(step)
+        spin.setValue(filter_info["default"])
+        spin.blockSignals(False)
+    
+    def _on_outlier_filter_changed(self, *_):
+        """이상치 필터 변경 시 임계값을 기본값으로 바꾸고 다시 시뮬레이션"""
+        self._set_filter_threshold_range()
+        self._simulate_limits()
+    
+    def _limit_parameters(self) -> tuple:
+        """What-if 입력값 (sigma_k, filter_threshold, guard_band, outlier_filter)"""
+        return (self.sigma_k_spin.value(), self.filter_threshold_spin.value(),
+                self.guard_band_spin.value(), self.outlier_filter_combo.currentData())
+    
+    def _simulate_limits(self, *_):
+        """현재 파라미터로 수율/NG 재계산 (파일 변경 없음)"""
+        session = getattr(self, 'limit_session', None)
+        if session is None:
+            return
+        result = session.simulate(*self._limit_parameters())
+        self.whatif_summary_label.setText(session.summary(result))
+    
+    def _apply_limit_session(self):
+        """현재 파라미터를 결과 파일과 DCR 파일에 기록"""
+        session = getattr(self, 'limit_session', None)
+        if session is None:
+            return
+        self._log_progress("-" * 60, tab_index=2)
+        self._log_progress("[ Apply What-if Limits ]", tab_index=2)
+        result = session.commit(*self._limit_parameters())
+        self._log_progress(result, tab_index=2)
+    
     def _browse_merged_file(self):
         """Merged 파일 선택"""
         start_path = self.merged_file_edit.text() if self.merged_file_edit.text() else ""
@@ -1598,17 +2295,72 @@ class MainWindow(QMainWindow):
         pass
     
     def _execute_lsl_usl(self, for_auto_execute=False):
-        """LSL/USL 계산 실행"""
+        """LSL/USL 계산을 워커 스레드에서 실행"""
+        if self._pipeline_busy():
+            return
         if not for_auto_execute:
             self._clear_progress()
+        
+        args = self._prepare_lsl_usl()
+        if not for_auto_execute:
+            self._start_log_file()
+        self._start_pipeline(self._run_lsl_usl, args, on_finished=self._finish_lsl_usl)
+    
+    def _prepare_lsl_usl(self, dcr_file: str = "") -> dict:
+        """
+        Tab 3 실행 입력값 수집 (GUI 스레드)
+        
+        Args:
+            dcr_file: DCR 파일 경로 (비우면 Tab 1 출력 파일 사용)
             
-        merged_file = self.merged_file_edit.text()
+        Returns:
+            _run_lsl_usl 인자 딕셔너리
+        """
         # DCR 파일은 Tab 1의 출력 파일을 자동으로 사용 (설정된 게 없으면 기본 파일명 사용)
-        dcr_file = getattr(self, 'dcr_output_path', "output/DCR_format_yamaha.xlsx")
-        # operator는 항상 미리 확보 (dcr_file 존재 여부와 무관)
-        operator = self.operator_input.text().strip()
+        if not dcr_file:
+            dcr_file = getattr(self, 'dcr_output_path', "output/DCR_format_yamaha.xlsx")
+        
+        # 부트스트랩 재표본 수 상수만 필요 (계산 모듈은 워커에서 로드)
+        from logic.bootstrap import BOOTSTRAP_RESAMPLES
+        return {
+            "merged_file": self.merged_file_edit.text(),
+            "dcr_file": dcr_file,
+            # operator는 항상 미리 확보 (dcr_file 존재 여부와 무관)
+            "operator": self.operator_input.text().strip(),
+            # Tab3 출력 파일은 Calculate_3Sigma_LSLUSL_final.xlsx 로 고정
+            "output_file": self._get_output_filename("Calculate_3Sigma_LSLUSL.xlsx", suffix_type="final"),
+            "output_dir": self._get_output_dir(),
+            "bootstrap_resamples": BOOTSTRAP_RESAMPLES if self.lsl_bootstrap_check.isChecked() else 0,
+            "methods": [m.strip() for m in self.lsl_methods_edit.text().split(",") if m.strip()] or None,
+            "columnar_format": self.lsl_columnar_combo.currentData(),
+            "write_sap_xep": not (self.lsl_columnar_combo.currentData() and self.lsl_skip_sap_xep_check.isChecked()),
+        }
+    
+    def _on_lsl_columnar_changed(self, *_):
+        """컬럼 형식 내보내기를 켰을 때만 Sap xep 생략 선택 가능"""
+        self.lsl_skip_sap_xep_check.setEnabled(bool(self.lsl_columnar_combo.currentData()))
+    
+    def _run_lsl_usl(self, args: dict, cancel_token=None):
+        """
+        Tab 3 실행 (워커 스레드, 취소 시 출력 파일/DCR 파일/새 플롯 복원)
         
-        # 파일이 실제로 존재하지 않으면 기본 경로 시도
+        Returns:
+            what-if 세션 (LimitSimulationSession, 계산 실패 시 None)
+        """
+        dcr_file = self._resolve_dcr_file(args["dcr_file"], args["operator"])
+        output_files = [args["output_file"], dcr_file]
+        output_patterns = []
+        if args["columnar_format"]:
+            from logic.columnar_export import columnar_paths, method_columnar_pattern, resolve_columnar_format
+            columnar_format = resolve_columnar_format(args["columnar_format"])
+            output_files.extend(columnar_paths(args["output_file"], columnar_format).values())
+            # 다른 Method 파일 (Method 목록은 merged file을 읽어야 알 수 있음)
+            output_patterns.append(method_columnar_pattern(args["output_file"], columnar_format))
+        return self._run_with_rollback(self._run_lsl_usl_steps, args, output_files, 2, cancel_token,
+                                       output_patterns)
+    
+    def _resolve_dcr_file(self, dcr_file: str, operator: str) -> str:
+        """Tab 3 DCR 파일 경로 (파일이 실제로 존재하지 않으면 기본 경로 시도)"""
         if not os.path.exists(dcr_file):
              # 현재 날짜와 Operator 이름이 포함된 최신 파일을 찾거나 기본 이름 사용
              date_str = datetime.now().strftime("%Y%m%d")
@@ -1616,17 +2368,28 @@ class MainWindow(QMainWindow):
              possible_path = os.path.join("output", possible_name)
              if os.path.exists(possible_path):
                  dcr_file = possible_path
+        return dcr_file
+    
+    def _run_lsl_usl_steps(self, args: dict, cancel_token=None):
+        """
+        LSL/USL 계산 단계 실행 (워커 스레드)
+        
+        Returns:
+            what-if 세션 (LimitSimulationSession, 계산 실패 시 None)
+        """
+        merged_file = args["merged_file"]
+        operator = args["operator"]
+        dcr_file = self._resolve_dcr_file(args["dcr_file"], operator)
         
         if not merged_file:
             self._log_progress("Error: Please select a merged file.", tab_index=2)
-            return
+            return None
         
         if not os.path.exists(dcr_file):
             self._log_progress(f"Error: DCR file not found at {dcr_file}. Please execute Tab 1 first.", tab_index=2)
-            return
+            return None
         
-        # Tab3 출력 파일은 Calculate_3Sigma_LSLUSL_final.xlsx 로 고정
-        output_file = self._get_output_filename("Calculate_3Sigma_LSLUSL.xlsx", suffix_type="final")
+        output_file = args["output_file"]
         
         self._log_progress("=" * 60, tab_index=2)
         self._log_progress("[ Calculate LSL/USL Statistics ]", tab_index=2)
@@ -1637,7 +2400,15 @@ class MainWindow(QMainWindow):
         self._log_progress("-" * 60, tab_index=2)
         self._log_progress("Processing... This may take a while for large files.", tab_index=2)
         
-        result = calculate_lsl_usl_full(merged_file, dcr_file, output_file, operator=operator)
+        # pandas 기반 계산 모듈은 처음 실행할 때 로드 (프로그램 시작 시간 단축)
+        from logic.calculate_lsl_usl import calculate_lsl_usl_full
+        # 통계 플롯(공정 능력 지수 포함)도 계산 과정에서 함께 생성
+        with stage("calculate"):
+            result = calculate_lsl_usl_full(merged_file, dcr_file, output_file, operator=operator,
+                                            output_dir=args["output_dir"],
+                                            bootstrap_resamples=args["bootstrap_resamples"],
+                                            methods=args["methods"], columnar_format=args["columnar_format"],
+                                            write_sap_xep=args["write_sap_xep"], cancel_token=cancel_token)
         self._log_progress("", tab_index=2)
         self._log_progress(result, tab_index=2)
         
@@ -1647,87 +2418,40 @@ class MainWindow(QMainWindow):
         self._log_progress("[ Add Cover Page ]", tab_index=2)
         self._log_progress("=" * 60, tab_index=2)
         self._log_progress(f"Adding cover page...", tab_index=2)
+        check_cancelled(cancel_token)
         
-        operator = self.operator_input.text().strip() if hasattr(self, 'operator_input') else ""
         from logic.cover_page import add_cover_page
-        result_cover = add_cover_page(
-            output_file,
-            operator,
-            {
-                "Merged File": merged_file,
-                "DCR File": dcr_file
-            }
-        )
+        with stage("cover page"):
+            result_cover = add_cover_page(
+                output_file,
+                operator,
+                {
+                    "Merged File": merged_file,
+                    "DCR File": dcr_file
+                }
+            )
         self._log_progress(result_cover, tab_index=2)
         
-        # === Generate Statistical Plots ===
-        self._log_progress("", tab_index=2)
-        self._log_progress("=" * 60, tab_index=2)
-        self._log_progress("[ Generate Statistical Plots ]", tab_index=2)
-        self._log_progress("=" * 60, tab_index=2)
-        
-        try:
-            # 출력 파일에서 데이터를 읽어 플롯 생성
-            from openpyxl import load_workbook
-            import pandas as pd
-            import numpy as np
-            
-            wb = load_workbook(output_file, data_only=True)
-            
-            # 'tinh LCLUCL' 시트에서 데이터 추출 (행=NET, 열=측정값)
-            if "tinh LCLUCL" in wb.sheetnames:
-                ws = wb["tinh LCLUCL"]
-                data_rows = []
-                lsl_list = []
-                usl_list = []
-                
-                # 데이터 읽기 (행 2부터, A열=NET, B~끝=측정값)
-                for row in range(2, ws.max_row + 1):
-                    row_data = []
-                    for col in range(2, ws.max_column + 1):
-                        val = ws.cell(row=row, column=col).value
-                        if val is not None:
-                            try:
-                                row_data.append(float(val))
-                            except (ValueError, TypeError):
-                                pass
-                    if row_data:
-                        data_rows.append(row_data)
-                        # LSL/USL 계산 (평균 ± 3σ)
-                        arr = np.array(row_data)
-                        avg = np.mean(arr)
-                        std = np.std(arr)
-                        lsl_list.append(max(0, avg - 3 * std))
-                        usl_list.append(avg + 3 * std)
-                
-                if data_rows:
-                    data_df = pd.DataFrame(data_rows)
-                    plots = save_lslusl_plots_from_data(data_df, lsl_list, usl_list, operator, output_dir=self._get_output_dir())
-                    if plots:
-                        self._log_progress(f"Generated {len(plots)} plots:", tab_index=2)
-                        for p in plots:
-                            self._log_progress(f"  - {os.path.basename(p)}", tab_index=2)
-                    else:
-                        self._log_progress("No plots generated (insufficient data)", tab_index=2)
-                else:
-                    self._log_progress("No data found in 'tinh LCLUCL' sheet for plotting", tab_index=2)
-            else:
-                self._log_progress("Sheet 'tinh LCLUCL' not found - skipping plot generation", tab_index=2)
-            
-            wb.close()
-        except Exception as e:
-            self._log_progress(f"Warning: Plot generation failed - {str(e)}", tab_index=2)
-        
         self._log_progress("", tab_index=2)
         self._log_progress("=" * 60, tab_index=2)
         self._log_progress("LSL/USL calculation completed!", tab_index=2)
         self._log_progress(f"Output saved to: {output_file}", tab_index=2)
         self._log_progress("=" * 60, tab_index=2)
         
+        # what-if 한계값 시뮬레이션 준비 (정렬 배열은 한 번만 생성)
+        if result.startswith("Success"):
+            with stage("what-if session"):
+                return self._open_limit_session(output_file, dcr_file)
+        return None
+    
+    def _finish_lsl_usl(self, session, for_auto_execute=False):
+        """Tab 3 완료 처리 (GUI 스레드)"""
+        if session is not None:
+            self._activate_limit_session(session)
+        
         # 만약 개별 실행인 경우에만 여기서 로그 저장 (Auto Execute가 아니면)
         if not for_auto_execute:
-            all_logs = "\n".join(self.progress_logs)
-            log_result = self._save_log_file(all_logs, "")
+            log_result = self._save_log_file()
             self._log_progress(log_result, tab_index=2)
         
         # 출력 경로 업데이트
@@ -1736,6 +2460,8 @@ class MainWindow(QMainWindow):
     
     def _auto_execute_all(self):
         """모든 탭 자동 실행"""
+        if self._pipeline_busy():
+            return
         # Operator 이름 확인
         operator = self.operator_input.text().strip()
         if not operator:
@@ -1758,70 +2484,92 @@ class MainWindow(QMainWindow):
         if reply != QMessageBox.Yes:
             return
         
-        # 버튼 비활성화
-        self.auto_execute_btn.setEnabled(False)
-        self.auto_execute_btn.setText("Executing...")
-        QApplication.processEvents()
+        # 입력값은 GUI 스레드에서 미리 수집 (Tab 3은 Tab 1의 출력 파일을 DCR 파일로 사용)
+        self._clear_progress()
+        dcr_args = self._prepare_dcr_format()
+        if dcr_args is None:
+            return
+        form_args = self._prepare_form_measurement()
+        lsl_args = self._prepare_lsl_usl(dcr_file=dcr_args["current_outfile"])
+        self._start_log_file()
+        
+        # 실행 중에는 watch 폴링 중지, 버튼은 _start_pipeline에서 비활성화
+        self._form_running = True
+        if self._start_pipeline(self._run_auto_execute, dcr_args, form_args, lsl_args,
+                                on_finished=self._finish_auto_execute,
+                                on_failed=self._on_auto_execute_failed,
+                                on_cancelled=self._on_auto_execute_cancelled):
+            self.auto_execute_btn.setText("Executing...")
+        else:
+            self._form_running = False
+    
+    def _run_auto_execute(self, dcr_args: dict, form_args: dict, lsl_args: dict, cancel_token=None):
+        """
+        Tab 1 → Tab 2 → Tab 3 순차 실행 (워커 스레드, 탭 전환은 시그널로 요청)
+        취소되면 실행 중이던 탭의 출력만 되돌림 (이미 끝난 탭의 출력은 유지)
         
-        try:
-            # Tab 1 실행
-            self._clear_progress()
-            self._log_progress("=" * 60)
-            self._log_progress("AUTO EXECUTE: Starting Tab 1 (make DCR format)")
-            self._log_progress("=" * 60)
-            self.tab_widget.setCurrentIndex(0)
-            QApplication.processEvents()
-            
-            self._execute(for_auto_execute=True)
-            
-            # Tab 2 실행
-            self._log_progress("")
-            self._log_progress("=" * 60)
-            self._log_progress("AUTO EXECUTE: Starting Tab 2 (Form Measurement Result)")
-            self._log_progress("=" * 60)
-            self.tab_widget.setCurrentIndex(1)
-            QApplication.processEvents()
-            
-            self._execute_form_measurement(for_auto_execute=True)
-            
-            # Tab 3 실행
-            self._log_progress("")
-            self._log_progress("=" * 60)
-            self._log_progress("AUTO EXECUTE: Starting Tab 3 (calculate LSL USL)")
-            self._log_progress("=" * 60)
-            self.tab_widget.setCurrentIndex(2)
-            QApplication.processEvents()
-            
-            # DCR 파일을 Tab 1의 출력 파일로 설정
-            if hasattr(self, 'dcr_output_path') and self.dcr_output_path:
-                dcr_file_for_lsl = self.dcr_output_path
-            else:
-                # Tab 1이 실행되지 않았을 경우를 대비해 추정 경로 사용
-                operator = self.operator_input.text().strip()
-                date_str = datetime.now().strftime("%Y%m%d")
-                dcr_file_for_lsl = os.path.join("output", f"DCR_format_yamaha_{operator}_{date_str}.xlsx")
-            
-            self._execute_lsl_usl(for_auto_execute=True)
-            
-            # 전체 로그 저장 (한 번만)
-            all_logs = "\n".join(self.progress_logs)
-            log_result = self._save_log_file(all_logs, "")
-            self._log_progress(log_result)
-            
-            # 완료 메시지
-            QMessageBox.information(
-                self,
-                "Auto Execute Complete",
-                "All tabs have been executed successfully!"
-            )
-            
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"An error occurred during auto execution:\n{str(e)}"
-            )
-        finally:
-            # 버튼 다시 활성화
-            self.auto_execute_btn.setEnabled(True)
-            self.auto_execute_btn.setText("Auto Execute All")
+        Returns:
+            (Tab 1 결과, Tab 2 결과, Tab 3 결과)
+        """
+        # Tab 1 실행
+        self._log_progress("=" * 60)
+        self._log_progress("AUTO EXECUTE: Starting Tab 1 (make DCR format)")
+        self._log_progress("=" * 60)
+        self.tab_requested.emit(0)
+        
+        dcr_result = self._run_dcr_format(dcr_args, cancel_token)
+        check_cancelled(cancel_token)
+        
+        # Tab 2 실행
+        self._log_progress("")
+        self._log_progress("=" * 60)
+        self._log_progress("AUTO EXECUTE: Starting Tab 2 (Form Measurement Result)")
+        self._log_progress("=" * 60)
+        self.tab_requested.emit(1)
+        
+        form_result = self._run_form_measurement(form_args, cancel_token)
+        check_cancelled(cancel_token)
+        
+        # Tab 3 실행
+        self._log_progress("")
+        self._log_progress("=" * 60)
+        self._log_progress("AUTO EXECUTE: Starting Tab 3 (calculate LSL USL)")
+        self._log_progress("=" * 60)
+        self.tab_requested.emit(2)
+        
+        lsl_result = self._run_lsl_usl(lsl_args, cancel_token)
+        return dcr_result, form_result, lsl_result
+    
+    def _finish_auto_execute(self, results):
+        """Auto Execute 완료 처리 (GUI 스레드)"""
+        dcr_result, form_result, lsl_result = results
+        self._finish_dcr_format(dcr_result, for_auto_execute=True)
+        self._finish_form_measurement(form_result, for_auto_execute=True)
+        self._finish_lsl_usl(lsl_result, for_auto_execute=True)
+        
+        # 전체 로그 저장 (한 번만)
+        log_result = self._save_log_file()
+        self._log_progress(log_result)
+        self.auto_execute_btn.setText("Auto Execute All")
+        
+        # 완료 메시지
+        QMessageBox.information(
+            self,
+            "Auto Execute Complete",
+            "All tabs have been executed successfully!"
+        )
+    
+    def _on_auto_execute_cancelled(self):
+        """Auto Execute 취소 처리 (GUI 스레드)"""
+        self._form_running = False
+        self.auto_execute_btn.setText("Auto Execute All")
+    
+    def _on_auto_execute_failed(self, error_text: str):
+        """Auto Execute 예외 처리 (GUI 스레드)"""
+        self._form_running = False
+        self.auto_execute_btn.setText("Auto Execute All")
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"An error occurred during auto execution:\n{error_text.strip().splitlines()[-1]}"
+        )
@@ -0,0 +1,107 @@
+"""
+진행 로그 모듈
+로그 항목을 append-only로 모아 두고 타이머로 묶어서 탭별 QPlainTextEdit에 추가로만 표시
+(전체 로그를 매번 다시 그리지 않음, 블록 수 제한) - 같은 항목을 .dat 로그 파일에도 이어서 기록
+"""
+
+from PySide6.QtCore import QObject, QTimer
+
+
+# 로그 창에 유지하는 최대 줄(블록) 수 - 넘으면 오래된 줄부터 삭제
+LOG_MAX_BLOCKS = 20000
+
+# 로그 메시지를 모아서 표시하는 주기 (ms)
+LOG_FLUSH_INTERVAL_MS = 100
+
+
+class ProgressLogSink(QObject):
+    """
+    진행 로그 저장소 (GUI 스레드 전용)
+    - append(): 항목 추가 후 플러시 타이머 예약 (O(1))
+    - flush(): 항목을 받은 탭의 로그 창에 아직 표시하지 않은 항목만 한 번에 추가, 로그 파일에 기록
+    - 각 탭 로그 창은 clear() 이후의 전체 로그를 보여줌 (기존 동작과 동일)
+    """
+
+    def __init__(self, parent=None, flush_interval_ms: int = LOG_FLUSH_INTERVAL_MS):
+        super().__init__(parent)
+        self.entries = []
+        self._views = {}  # 탭 인덱스 → QPlainTextEdit
+        self._shown = {}  # 탭 인덱스 → 로그 창에 표시한 항목 수 (None이면 창을 비우고 다시 표시)
+        self._dirty = set()
+        self._file = None
+        self._file_path = ""
+        self._file_written = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(flush_interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def add_view(self, tab_index: int, view):
+        """탭 로그 창 등록 (QPlainTextEdit)"""
+        view.setMaximumBlockCount(LOG_MAX_BLOCKS)
+        self._views[tab_index] = view
+        self._shown[tab_index] = None
+
+    def append(self, entry: str, tab_index: int):
+        """로그 항목 추가 (표시/파일 기록은 다음 플러시에서)"""
+        self.entries.append(entry)
+        self._dirty.add(tab_index)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def clear(self):
+        """로그 초기화 - 각 탭 로그 창은 다음 항목을 받을 때 비우고 새로 표시"""
+        self.flush()
+        self.entries = []
+        self._file_written = 0
+        for tab_index in self._shown:
+            self._shown[tab_index] = None
+
+    def flush(self):
+        """대기 중인 항목을 로그 창과 로그 파일에 추가"""
+        self._timer.stop()
+        for tab_index in self._dirty:
+            view = self._views.get(tab_index)
+            if view is None:
+                continue
+            shown = self._shown[tab_index]
+            if shown is None:
+                view.clear()
+                shown = max(0, len(self.entries) - LOG_MAX_BLOCKS)
+            if shown < len(self.entries):
+                view.appendPlainText("\n".join(self.entries[shown:]))
+                view.verticalScrollBar().setValue(view.verticalScrollBar().maximum())
+            self._shown[tab_index] = len(self.entries)
+        self._dirty.clear()
+
+        if self._file is not None and self._file_written < len(self.entries):
+            self._file.write("\n".join(self.entries[self._file_written:]) + "\n")
+            self._file.flush()
+            self._file_written = len(self.entries)
+
+    def start_file(self, path: str, header: str):
+        """
+        로그 파일 기록 시작 (이전 파일은 닫음) - clear() 이후 항목부터 이어서 기록
+
+        Raises:
+            OSError: 파일을 열 수 없는 경우
+        """
+        self.close_file()
+        self._file = open(path, 'w', encoding='ascii', errors='replace')
+        self._file.write(header)
+        self._file_path = path
+        self._file_written = 0
+
+    def close_file(self) -> str:
+        """
+        남은 항목을 기록하고 로그 파일 닫기
+
+        Returns:
+            닫은 파일 경로 (열린 파일이 없으면 빈 문자열)
+        """
+        if self._file is None:
+            return ""
+        self.flush()
+        self._file.close()
+        self._file = None
+        return self._file_path
@@ -0,0 +1,54 @@
+"""
+백그라운드 작업 모듈
+탭 실행 단계(엑셀 입출력, 통계 계산, 플롯 생성)를 QThreadPool 워커 스레드에서 실행하고
+결과/예외를 시그널로 GUI 스레드에 전달 (실행 중에도 창이 응답하고 다시 그려짐)
+Cancel 버튼은 작업 함수에 전달한 CancelToken으로 취소 요청 (logic.cancellation)
+"""
+
+import traceback
+
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
+
+from logic.cancellation import CancelToken, OperationCancelled
+
+
+class WorkerSignals(QObject):
+    """
+    워커 → GUI 스레드 시그널
+    GUI 스레드에서 생성되므로 연결된 슬롯은 큐 연결로 GUI 스레드에서 실행됨
+    """
+    finished = Signal(object)  # 작업 함수 반환값
+    failed = Signal(str)  # 예외 traceback 문자열
+    cancelled = Signal()  # 취소 요청으로 중단됨 (OperationCancelled)
+
+
+class PipelineWorker(QRunnable):
+    """작업 함수 하나를 워커 스레드에서 실행 (fn에는 cancel_token 키워드 인자가 추가로 전달됨)"""
+
+    def __init__(self, fn, *args, **kwargs):
+        """
+        Args:
+            fn: 워커 스레드에서 실행할 함수 (위젯에 직접 접근하지 않아야 함)
+            *args, **kwargs: fn 인자
+        """
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.cancel_token = CancelToken()
+        self.signals = WorkerSignals()
+
+    def cancel(self):
+        """취소 요청 (GUI 스레드에서 호출, 작업 함수가 다음 확인 지점에서 중단)"""
+        self.cancel_token.cancel()
+
+    @Slot()
+    def run(self):
+        try:
+            result = self.fn(*self.args, cancel_token=self.cancel_token, **self.kwargs)
+        except OperationCancelled:
+            self.signals.cancelled.emit()
+        except Exception:
+            self.signals.failed.emit(traceback.format_exc())
+        else:
+            self.signals.finished.emit(result)